@@ -0,0 +1,551 @@
+"""Offline reports over Asset Manager (MVC) data from a WXR export or a mysqldump.
+
+Reports are computed locally, so they do not load production. The input is streamed, and the
+main process only cuts it into pieces that are parsed in a process pool:
+- WXR files are cut into chunks of whole items of a few MB.
+- SQL dumps are cut into INSERT statements.
+Legacy serialized history is unserialized in the workers too.
+
+Assets, their current meta and every status and assignee change from the history are
+collected into NumPy arrays. All aggregation is then done on whole arrays.
+
+History is read from the plugin's history table in SQL dumps, and from the legacy
+serialized history meta in either format. Changes are recognised by the plugin's English
+history notes, which are stored HTML-escaped, e.g.
+'Status changed from &quot;Assigned&quot; to &quot;Returned&quot;'.
+
+Reports:
+    status  Published assets per status at the end of each month, rebuilt from the status changes.
+    churn   Assignee changes per month, the assignees gaining and losing most assets, and current holders.
+    age     Asset age by purchase date, bucketed by year and summarised per status.
+
+Usage:
+    python analyze_assets.py export.xml
+    python analyze_assets.py dump.sql --table-prefix wp_ --report status --report age --json
+
+Requires NumPy (pip install numpy).
+"""
+
+import argparse
+import functools
+import html
+import json
+import os
+import re
+import sys
+import time
+import xml.etree.ElementTree as ET
+from array import array
+from multiprocessing import Pool
+
+import asset_schema
+import wp_sql
+
+try:
+    import numpy as np
+except ImportError:  # Reported in main(), so --help still works without NumPy
+    np = None
+
+REPORTS = ("status", "churn", "age")
+NOTE_RE = re.compile(r'(Status|Issued To) changed from "(.*?)" to "(.*?)"(?=; |$)')
+EVENT_KINDS = {"Status": 0, "Issued To": 1}
+WANTED_META = {asset_schema.meta_key(field): field for field in ("status", "issued_to", "date_purchased")}
+ZERO_DATETIME = "0000-00-00 00:00:00"
+WXR_CHUNK_BYTES = 4 << 20
+WXR_ITEM_END = b"</item>"
+
+# Column order of tables dumped without a column list (mysqldump's default)
+DEFAULT_COLUMNS = {
+    "posts": wp_sql.POST_COLUMNS,
+    "postmeta": ("meta_id", "post_id", "meta_key", "meta_value"),
+    "history": ("id", "asset_id", "user_id", "created_at", "note"),
+}
+INSERT_RE = re.compile(r"INSERT\s+(?:IGNORE\s+)?INTO\s+`?(\w+)`?\s*(?:\(([^)]*)\))?\s*VALUES\s*", re.IGNORECASE)
+VALUE_PATTERN = r"('[^'\\]*(?:\\.[^'\\]*)*'|NULL|[^,()'\s]+)"
+DATE_RE = re.compile(r"\d{4}-\d\d-\d\d(?: \d\d:\d\d:\d\d)?$")
+UNESCAPE_RE = re.compile(r"\\(.)", re.DOTALL)
+UNESCAPES = {"0": "\x00", "n": "\n", "r": "\r", "t": "\t", "Z": "\x1a", "b": "\b"}
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def parse_note(note):
+    """(kind, from, to) for every status or assignee change in a history note.
+
+    The plugin esc_html()s the whole note, quotes included, so it is unescaped before matching.
+    The same notes recur across assets, so results are cached.
+    """
+    return tuple((EVENT_KINDS[match.group(1)], match.group(2), match.group(3))
+                 for match in NOTE_RE.finditer(html.unescape(note)))
+
+
+def history_events(asset_id, date, note):
+    return [(asset_id, date, kind, old, new) for kind, old, new in parse_note(note)]
+
+
+def legacy_history_events(asset_id, serialized):
+    """Events from the legacy serialized history meta; unreadable values are skipped."""
+    try:
+        entries = asset_schema.php_unserialize(serialized)
+    except (ValueError, IndexError):
+        return []
+    events = []
+    for entry in (entries.values() if isinstance(entries, dict) else []):
+        if isinstance(entry, dict) and entry.get("date") and entry.get("note"):
+            events.extend(history_events(asset_id, entry["date"], entry["note"]))
+    return events
+
+
+class AssetData:
+    """Columnar accumulator for assets, their current meta and history events."""
+
+    def __init__(self):
+        self.asset_ids = array("q")
+        self.created = []
+        self.meta = {field: (array("q"), []) for field in WANTED_META.values()}
+        self.event_assets = array("q")
+        self.event_times = []
+        self.event_kinds = array("b")
+        self.event_from = array("l")
+        self.event_to = array("l")
+        self.labels = ({}, {})  # Interned status labels and assignee names, by event kind
+        for status in asset_schema.STATUS_OPTIONS:
+            self.intern(0, status)
+
+    def intern(self, kind, label):
+        codes = self.labels[kind]
+        if label not in codes:
+            codes[label] = len(codes)
+        return codes[label]
+
+    def add(self, assets, meta, events):
+        """Adds the (assets, meta, events) parsed by a worker."""
+        for asset_id, created in assets:
+            self.asset_ids.append(asset_id)
+            self.created.append(created)
+        for asset_id, field, value in meta:
+            ids, values = self.meta[field]
+            ids.append(asset_id)
+            values.append(value)
+        if not events:
+            return
+        asset_ids, times, kinds, old, new = zip(*events)
+        self.event_assets.extend(asset_ids)
+        self.event_times.extend(times)
+        self.event_kinds.extend(kinds)
+        labels = self.labels
+        self.event_from.extend([labels[kind].setdefault(label, len(labels[kind])) for kind, label in zip(kinds, old)])
+        self.event_to.extend([labels[kind].setdefault(label, len(labels[kind])) for kind, label in zip(kinds, new)])
+
+
+def local_name(tag):
+    return tag.rsplit("}", 1)[-1]
+
+
+def wxr_chunks(path):
+    """Yields (opening <rss> tag, items) tasks, cutting the file after an </item>.
+
+    The main process only finds the cuts; items are parsed in the workers.
+    """
+    with open(path, "rb") as f:
+        rss_open = None
+        pending = b""
+        while True:
+            block = f.read(WXR_CHUNK_BYTES)
+            buffer = pending + block
+            if rss_open is None:
+                first = buffer.find(b"<item")
+                if first < 0:
+                    if not block:
+                        return
+                    pending = buffer
+                    continue
+                match = re.search(rb"<rss\b[^>]*>", buffer[:first])
+                rss_open = match.group() if match else b"<rss>"
+                buffer = buffer[first:]
+            cut = buffer.rfind(WXR_ITEM_END)
+            if cut >= 0:
+                cut += len(WXR_ITEM_END)
+                yield rss_open, buffer[:cut]
+                buffer = buffer[cut:]
+            if not block:
+                return
+            pending = buffer
+
+
+def parse_wxr_chunk(task):
+    """Worker: parses the items of one WXR chunk into (assets, meta, events), like parse_insert()."""
+    rss_open, items = task
+    assets, meta, events = [], [], []
+    for item in ET.fromstring(rss_open + items + b"</rss>"):
+        if item.tag != "item":
+            continue
+        fields = {}
+        item_meta = []
+        for child in item:
+            name = local_name(child.tag)
+            if name == "postmeta":
+                key = value = ""
+                for part in child:
+                    part_name = local_name(part.tag)
+                    if part_name == "meta_key":
+                        key = part.text or ""
+                    elif part_name == "meta_value":
+                        value = part.text or ""
+                item_meta.append((key, value))
+            elif name in ("post_id", "post_type", "status", "post_date"):
+                fields[name] = child.text or ""
+
+        if fields.get("post_type") == asset_schema.POST_TYPE and fields.get("status") == "publish":
+            asset_id = int(fields["post_id"])
+            assets.append((asset_id, fields.get("post_date", ZERO_DATETIME)))
+            for key, value in item_meta:
+                if key in WANTED_META:
+                    meta.append((asset_id, WANTED_META[key], value))
+                elif key == asset_schema.HISTORY_META_KEY:
+                    events.extend(legacy_history_events(asset_id, value))
+    return assets, meta, events
+
+
+def read_wxr(path, data, workers):
+    with Pool(max(1, workers)) as pool:
+        for parsed in pool.imap(parse_wxr_chunk, wxr_chunks(path)):
+            data.add(*parsed)
+
+
+@functools.lru_cache()
+def row_re(width):
+    """Matches one row of an INSERT with width values, capturing each value as written."""
+    return re.compile(r"\(\s*" + r"\s*,\s*".join([VALUE_PATTERN] * width) + r"\s*\)")
+
+
+def sql_value(token):
+    """A value as written in a dump: a quoted string, NULL or a bare number."""
+    if token[:1] != "'":
+        return None if token == "NULL" else token
+    token = token[1:-1]
+    if "\\" in token:
+        token = UNESCAPE_RE.sub(lambda m: UNESCAPES.get(m.group(1), m.group(1)), token)
+    return token
+
+
+def parse_insert(task):
+    """Worker: parses one INSERT statement into the parts the reports need.
+
+    Returns (assets, meta, events): assets as (id, post_date), meta as (post_id, field, value)
+    and events as (asset_id, date, kind, from, to). Rows are matched whole, and only the
+    columns the reports need are unquoted.
+    """
+    kind, columns, values_text = task
+    rows = row_re(len(columns)).findall(values_text)
+    if len(columns) == 1:
+        rows = [(row,) for row in rows]
+    position = {name: i for i, name in enumerate(columns)}
+    assets, meta, events = [], [], []
+    if kind == "posts":
+        i_id, i_date, i_status, i_type = (position[c] for c in ("ID", "post_date", "post_status", "post_type"))
+        post_type, publish = f"'{asset_schema.POST_TYPE}'", "'publish'"
+        for row in rows:
+            if row[i_type] == post_type and row[i_status] == publish:
+                assets.append((int(row[i_id].strip("'")), sql_value(row[i_date])))
+    elif kind == "postmeta":
+        i_post, i_key, i_value = position["post_id"], position["meta_key"], position["meta_value"]
+        wanted = {f"'{key}'": field for key, field in WANTED_META.items()}
+        history_key = f"'{asset_schema.HISTORY_META_KEY}'"
+        for row in rows:
+            key = row[i_key]
+            if key in wanted:
+                meta.append((int(row[i_post].strip("'")), wanted[key], sql_value(row[i_value]) or ""))
+            elif key == history_key:
+                value = sql_value(row[i_value])
+                if value:
+                    events.extend(legacy_history_events(int(row[i_post].strip("'")), value))
+    elif kind == "history":
+        i_asset, i_date, i_note = position["asset_id"], position["created_at"], position["note"]
+        for row in rows:
+            events.extend(history_events(int(row[i_asset].strip("'")), sql_value(row[i_date]), sql_value(row[i_note]) or ""))
+    return assets, meta, events
+
+
+def sql_statements(path, tables):
+    """Yields (kind, columns, values text) for the INSERT statements of the wanted tables.
+
+    Dumps escape newlines inside strings, so a statement ends at the first line ending in ';'.
+    """
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        buffer = []
+        for line in f:
+            if not buffer and not line.lstrip()[:6].upper() == "INSERT":
+                continue
+            buffer.append(line)
+            if not line.rstrip().endswith(";"):
+                continue
+            statement = "".join(buffer)
+            buffer = []
+            match = INSERT_RE.match(statement.lstrip())
+            if not match or match.group(1) not in tables:
+                continue
+            kind = tables[match.group(1)]
+            columns = tuple(c.strip(" `") for c in match.group(2).split(",")) if match.group(2) else DEFAULT_COLUMNS[kind]
+            yield kind, columns, statement.lstrip()[match.end():]
+
+
+def read_sql(path, data, table_prefix, workers):
+    tables = {
+        f"{table_prefix}posts": "posts",
+        f"{table_prefix}postmeta": "postmeta",
+        f"{table_prefix}{asset_schema.HISTORY_TABLE}": "history",
+    }
+    with Pool(max(1, workers)) as pool:
+        for parsed in pool.imap(parse_insert, sql_statements(path, tables)):
+            data.add(*parsed)
+
+
+def to_datetimes(values, unit):
+    """Converts MySQL date strings to datetime64, with zero, empty or malformed dates as NaT."""
+    length = 10 if unit == "D" else 19
+    cleaned = [v[:length].replace(" ", "T") if DATE_RE.match(v) and not v.startswith("0000") else "NaT" for v in values]
+    return np.array(cleaned, dtype=f"datetime64[{unit}]")
+
+
+def first_values_for(asset_ids, meta_ids, meta_values, fill):
+    """Aligns meta values to asset_ids (sorted), keeping the first row per asset as get_post_meta() does."""
+    result = np.full(len(asset_ids), fill, dtype=meta_values.dtype)
+    if len(meta_ids) and len(asset_ids):
+        unique_ids, first = np.unique(meta_ids, return_index=True)
+        positions = np.searchsorted(asset_ids, unique_ids)
+        positions = np.minimum(positions, len(asset_ids) - 1)
+        found = asset_ids[positions] == unique_ids
+        result[positions[found]] = meta_values[first[found]]
+    return result
+
+
+def build_arrays(data):
+    """Turns the accumulated columns into sorted, aligned NumPy arrays."""
+    asset_ids = np.frombuffer(data.asset_ids, dtype=np.int64) if len(data.asset_ids) else np.zeros(0, np.int64)
+    order = np.argsort(asset_ids, kind="stable")
+    asset_ids = asset_ids[order]
+    created = to_datetimes(data.created, "s")[order]
+
+    status_ids, status_values = data.meta["status"]
+    status_codes = np.array([data.intern(0, value) for value in status_values], dtype=np.int64)
+    status = first_values_for(asset_ids, np.array(status_ids, dtype=np.int64), status_codes, data.intern(0, ""))
+
+    issued_ids, issued_values = data.meta["issued_to"]
+    issued = np.array([int(v) if v.isdigit() else 0 for v in issued_values], dtype=np.int64)
+    issued_to = first_values_for(asset_ids, np.array(issued_ids, dtype=np.int64), issued, 0)
+
+    purchased_ids, purchased_values = data.meta["date_purchased"]
+    purchased = first_values_for(asset_ids, np.array(purchased_ids, dtype=np.int64), to_datetimes(purchased_values, "D"), np.datetime64("NaT"))
+
+    events = {
+        "asset": np.array(data.event_assets, dtype=np.int64),
+        "time": to_datetimes(data.event_times, "s"),
+        "kind": np.array(data.event_kinds, dtype=np.int8),
+        "from": np.array(data.event_from, dtype=np.int64),
+        "to": np.array(data.event_to, dtype=np.int64),
+    }
+    # Keep events of the published assets with a valid date, ordered by asset and time
+    keep = np.isin(events["asset"], asset_ids) & ~np.isnat(events["time"])
+    events = {key: values[keep] for key, values in events.items()}
+    order = np.lexsort((events["time"], events["asset"]))
+    events = {key: values[order] for key, values in events.items()}
+    events["index"] = np.searchsorted(asset_ids, events["asset"])
+
+    return {"ids": asset_ids, "created": created, "status": status, "issued_to": issued_to, "purchased": purchased, "events": events}
+
+
+def report_status(arrays, labels, as_of, months):
+    """Assets per status at the end of each month, up to the month of as_of.
+
+    Counts are built from monthly deltas: +1 for the initial status in the month an asset was
+    created, and -1/+1 for every status change. A running sum over the months gives the counts.
+    The current meta status is authoritative, so where the history ends at another status a
+    closing change to it is added in the last month (unless as_of cuts the history short).
+    """
+    status, events = arrays["status"], arrays["events"]
+    end = as_of.astype("datetime64[M]")
+    created_month = arrays["created"].astype("datetime64[M]")
+    created_month[np.isnat(created_month)] = end
+    exists = created_month <= end
+
+    status_events = (events["kind"] == 0) & exists[events["index"]]
+    cut = np.zeros(len(status), dtype=bool)
+    cut[events["index"][status_events & (events["time"] > as_of)]] = True
+    status_events &= events["time"] <= as_of
+    ev_index, ev_time, ev_from, ev_to = (events[key][status_events] for key in ("index", "time", "from", "to"))
+
+    start = created_month[exists].min() if exists.any() else end
+    month_count = int((end - start).astype(int)) + 1
+    deltas = np.zeros((month_count, len(labels)), dtype=np.int64)
+
+    # Initial status: the "from" of the first change, or the current status if there is none.
+    # Events are ordered by asset, so the first and last change of each asset are found by np.unique.
+    initial = status.copy()
+    changed, first = np.unique(ev_index, return_index=True)
+    last = np.r_[first[1:], len(ev_index)][:len(first)] - 1
+    initial[changed] = ev_from[first]
+    np.add.at(deltas, ((created_month[exists] - start).astype(int), initial[exists]), 1)
+
+    ev_month = np.maximum(ev_time.astype("datetime64[M]"), created_month[ev_index])
+    ev_offset = (ev_month - start).astype(int)
+    np.add.at(deltas, (ev_offset, ev_from), -1)
+    np.add.at(deltas, (ev_offset, ev_to), 1)
+
+    closing = (ev_to[last] != status[changed]) & ~cut[changed]
+    np.add.at(deltas[-1], ev_to[last[closing]], -1)
+    np.add.at(deltas[-1], status[changed[closing]], 1)
+    counts = deltas.cumsum(axis=0)
+
+    names = sorted(labels, key=labels.get)
+    used = [code for code in range(len(labels)) if counts[:, code].any()]
+    shown = slice(max(0, month_count - months), month_count)
+    return {
+        "statuses": [names[code] or "(none)" for code in used],
+        "months": np.arange(start, end + 1)[shown].astype(str).tolist(),
+        "counts": counts[shown][:, used].tolist(),
+    }
+
+
+def report_churn(arrays, names, top):
+    events = arrays["events"]
+    assignee = events["kind"] == 1
+    ev_time, ev_from, ev_to = (events[key][assignee] for key in ("time", "from", "to"))
+    labels = sorted(names, key=names.get)
+
+    per_month = {}
+    if len(ev_time):
+        months, counts = np.unique(ev_time.astype("datetime64[M]"), return_counts=True)
+        per_month = dict(zip(months.astype(str).tolist(), counts.tolist()))
+
+    gains = np.bincount(ev_to, minlength=len(labels))
+    losses = np.bincount(ev_from, minlength=len(labels))
+    unassigned = names.get("Unassigned", -1)
+    movement = gains + losses
+    if unassigned >= 0:
+        movement[unassigned] = -1
+    ranked = np.argsort(-movement, kind="stable")[:top]
+
+    holders, held = np.unique(arrays["issued_to"][arrays["issued_to"] > 0], return_counts=True)
+    order = np.argsort(-held, kind="stable")[:top]
+    return {
+        "changes_per_month": per_month,
+        "total_changes": int(len(ev_time)),
+        "top_movers": [{"name": labels[i], "gained": int(gains[i]), "lost": int(losses[i])} for i in ranked if movement[i] > 0],
+        "top_holders": [{"user_id": int(holders[i]), "assets": int(held[i])} for i in order],
+    }
+
+
+def report_age(arrays, labels, as_of):
+    purchased = arrays["purchased"]
+    known = ~np.isnat(purchased) & (purchased <= as_of.astype("datetime64[D]"))
+    age_days = (as_of.astype("datetime64[D]") - purchased[known]).astype(np.int64)
+    age_years = np.clip(age_days // 365, 0, None)
+    buckets = np.bincount(age_years) if len(age_years) else np.zeros(0, np.int64)
+
+    names = sorted(labels, key=labels.get)
+    status = arrays["status"][known]
+    per_status = []
+    for code in np.unique(status):
+        ages = age_days[status == code] / 365.25
+        per_status.append({
+            "status": names[code] or "(none)",
+            "assets": int(len(ages)),
+            "mean_years": round(float(ages.mean()), 2),
+            "median_years": round(float(np.median(ages)), 2),
+            "p90_years": round(float(np.percentile(ages, 90)), 2),
+        })
+    return {
+        "assets_with_purchase_date": int(known.sum()),
+        "assets_without_purchase_date": int(np.isnat(purchased).sum()),
+        "by_year": {f"{year}-{year + 1}": int(count) for year, count in enumerate(buckets.tolist())},
+        "by_status": per_status,
+    }
+
+
+def print_table(headers, rows):
+    widths = [max(len(str(h)), *(len(str(r[i])) for r in rows)) if rows else len(str(h)) for i, h in enumerate(headers)]
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    for row in rows:
+        print("  ".join(str(v).rjust(w) if isinstance(v, (int, float)) else str(v).ljust(w) for v, w in zip(row, widths)))
+    print()
+
+
+def print_reports(results):
+    if "status" in results:
+        report = results["status"]
+        print("Published assets per status at month end")
+        print_table(["Month"] + report["statuses"], [[m] + c for m, c in zip(report["months"], report["counts"])])
+    if "churn" in results:
+        report = results["churn"]
+        print(f"Assignee changes: {report['total_changes']}")
+        print_table(["Month", "Changes"], list(report["changes_per_month"].items())[-12:])
+        print("Assignees gaining and losing most assets")
+        print_table(["Assignee", "Gained", "Lost"], [[r["name"], r["gained"], r["lost"]] for r in report["top_movers"]])
+        print("Current holders")
+        print_table(["User ID", "Assets"], [[r["user_id"], r["assets"]] for r in report["top_holders"]])
+    if "age" in results:
+        report = results["age"]
+        print(f"Asset age by purchase date ({report['assets_without_purchase_date']} assets without a date)")
+        print_table(["Years", "Assets"], list(report["by_year"].items()))
+        print_table(["Status", "Assets", "Mean", "Median", "P90"],
+                    [[r["status"], r["assets"], r["mean_years"], r["median_years"], r["p90_years"]] for r in report["by_status"]])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline asset reports from a WXR export or a SQL dump.")
+    parser.add_argument("input", help="WXR (.xml) or SQL dump (.sql) file")
+    parser.add_argument("--input-format", choices=("wxr", "sql"), help="Input format (default: from the file extension)")
+    parser.add_argument("--table-prefix", default="wp_", help="Table prefix in SQL dumps (default: wp_)")
+    parser.add_argument("--report", action="append", choices=REPORTS, help="Report to run; repeat for several (default: all)")
+    parser.add_argument("--as-of", help="Reference date YYYY-MM-DD for ages and the last month (default: latest date in the data)")
+    parser.add_argument("--months", type=int, default=24, help="Months shown in the status report (default: 24)")
+    parser.add_argument("--top", type=int, default=10, help="Rows in the churn rankings (default: 10)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Processes parsing the input (default: CPU count)")
+    parser.add_argument("--json", action="store_true", help="Print the reports as JSON")
+    args = parser.parse_args(argv)
+
+    if np is None:
+        print("analyze_assets.py requires NumPy: pip install numpy", file=sys.stderr)
+        return 1
+    input_format = args.input_format or ("sql" if args.input.lower().endswith(".sql") else "wxr")
+    reports = args.report or list(REPORTS)
+
+    started = time.monotonic()
+    data = AssetData()
+    try:
+        if input_format == "wxr":
+            read_wxr(args.input, data, args.workers)
+        else:
+            read_sql(args.input, data, args.table_prefix, args.workers)
+    except (OSError, ET.ParseError) as e:
+        print(f"Could not read {args.input}: {e}", file=sys.stderr)
+        return 1
+    arrays = build_arrays(data)
+    parsed = time.monotonic()
+
+    if args.as_of:
+        as_of = np.datetime64(args.as_of, "s")
+    else:
+        # max() of an array with a NaT is NaT; assets without a creation date would blank the whole report
+        candidates = [values[~np.isnat(values)].max() for values in (arrays["created"], arrays["events"]["time"]) if (~np.isnat(values)).any()]
+        as_of = max(candidates) if candidates else np.datetime64("today", "s")
+
+    results = {}
+    if "status" in reports:
+        results["status"] = report_status(arrays, data.labels[0], as_of, max(1, args.months))
+    if "churn" in reports:
+        results["churn"] = report_churn(arrays, data.labels[1], max(1, args.top))
+    if "age" in reports:
+        results["age"] = report_age(arrays, data.labels[0], as_of)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_reports(results)
+    print(f"{len(arrays['ids'])} assets, {len(arrays['events']['asset'])} history changes; "
+          f"read in {parsed - started:.1f}s, reports in {time.monotonic() - parsed:.2f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""Names shared by the Python tools and the Asset Manager (MVC) plugin.
+
+These mirror the constants and Asset_Model properties in the PHP templates of
+create_plugin_zip.py and have to be kept in step with them.
+"""
+
+import html
+
+POST_TYPE = "asset_mvc"
+TAXONOMY = "asset_category_mvc"
+META_PREFIX = "_asset_manager_mvc_"
+HISTORY_META_KEY = META_PREFIX + "history"  # Legacy serialized history, before the history table
+REST_NAMESPACE = "asset-manager-mvc/v1"
+HISTORY_TABLE = "asset_mvc_history"  # Without the table prefix
+INDEX_TABLE = "asset_mvc_index"  # Without the table prefix
+CHANGES_TABLE = "asset_mvc_changes"  # Without the table prefix
+ROLLUP_OPTION = "asset_manager_mvc_dashboard_rollup"
+
+# Asset_Model::$fields, in the same order
+FIELDS = (
+    "asset_tag", "model", "serial_number", "brand", "supplier",
+    "date_purchased", "issued_to", "status", "description",
+)
+
+# Asset_Model::get_field_labels()
+FIELD_LABELS = {
+    "asset_tag": "Asset Tag", "serial_number": "Serial Number", "brand": "Brand", "model": "Model",
+    "supplier": "Supplier", "date_purchased": "Date Purchased", "issued_to": "Issued To", "status": "Status",
+    "description": "Description", "asset_category": "Category",
+}
+
+# Asset_Model::$status_options, in the same order
+STATUS_OPTIONS = (
+    "Unassigned", "Assigned", "Returned", "For Repair", "Repairing", "Archived", "Disposed",
+)
+
+
+def meta_key(field):
+    """Returns the post meta key of an asset field."""
+    return META_PREFIX + field
+
+
+def esc_html(text):
+    """Escapes text the way WordPress's esc_html() does."""
+    return html.escape(text, quote=True).replace("&#x27;", "&#039;")
+
+
+def change_note(label, old, new):
+    """A history note for one field change, as Asset_Model stores it.
+
+    The plugin builds it with sprintf(esc_html__('%1$s changed from "%2$s" to "%3$s"'), ...)
+    and escapes every value, so the quotes are stored as &quot;. Notes of one save are
+    joined with '; '.
+    """
+    return f"{esc_html(label)} changed from &quot;{esc_html(old)}&quot; to &quot;{esc_html(new)}&quot;"
+
+
+def php_serialize(value):
+    """Serializes str, int, bool, None, list and dict values the way PHP's serialize() does.
+
+    Used for meta values that the plugin stores as arrays, such as the legacy history.
+    String lengths are byte lengths of the UTF-8 encoding, as in PHP.
+    """
+    if value is None:
+        return "N;"
+    if isinstance(value, bool):
+        return f"b:{int(value)};"
+    if isinstance(value, int):
+        return f"i:{value};"
+    if isinstance(value, str):
+        return f's:{len(value.encode("utf-8"))}:"{value}";'
+    if isinstance(value, (list, tuple)):
+        value = dict(enumerate(value))
+    if isinstance(value, dict):
+        items = "".join(php_serialize(key) + php_serialize(item) for key, item in value.items())
+        return f"a:{len(value)}:{{{items}}}"
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def php_unserialize(text):
+    """Parses a value produced by PHP's serialize(): arrays become dicts, objects are not supported.
+
+    Raises ValueError on malformed input.
+    """
+    data = text.encode("utf-8") if isinstance(text, str) else text
+    value, end = _php_unserialize_at(data, 0)
+    if end != len(data):
+        raise ValueError("Trailing data after serialized value")
+    return value
+
+
+def _php_unserialize_at(data, pos):
+    kind = data[pos:pos + 1]
+    if kind == b"N":
+        return None, pos + 2
+    if kind in (b"i", b"b", b"d"):
+        end = data.index(b";", pos)
+        raw = data[pos + 2:end].decode("ascii")
+        value = int(raw) if kind == b"i" else (raw == "1" if kind == b"b" else float(raw))
+        return value, end + 1
+    if kind == b"s":
+        colon = data.index(b":", pos + 2)
+        length = int(data[pos + 2:colon])
+        start = colon + 2  # Skip ':"'
+        return data[start:start + length].decode("utf-8", "replace"), start + length + 2  # Skip '";'
+    if kind == b"a":
+        colon = data.index(b":", pos + 2)
+        count = int(data[pos + 2:colon])
+        pos = colon + 2  # Skip ':{'
+        result = {}
+        for _ in range(count):
+            key, pos = _php_unserialize_at(data, pos)
+            result[key], pos = _php_unserialize_at(data, pos)
+        return result, pos + 1  # Skip '}'
+    raise ValueError(f"Unsupported serialized type {kind!r} at offset {pos}")
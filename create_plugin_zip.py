@@ -1,6 +1,19 @@
+import argparse
+import hashlib
+import json
 import os
+import re
+import shutil
+import stat
+import sys
+import time
 import zipfile
+import zlib
 import textwrap
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Pool
+
+import vendor_bundle
 
 # --- File Contents ---
 
@@ -22,17 +35,32 @@ define('ASSET_MANAGER_MVC_VERSION', '1.9.0');
 define('ASSET_MANAGER_MVC_POST_TYPE', 'asset_mvc');
 define('ASSET_MANAGER_MVC_TAXONOMY', 'asset_category_mvc');
 define('ASSET_MANAGER_MVC_META_PREFIX', '_asset_manager_mvc_');
+define('ASSET_MANAGER_MVC_ROLLUP_OPTION', 'asset_manager_mvc_dashboard_rollup');
+define('ASSET_MANAGER_MVC_ROLLUP_CRON_HOOK', 'asset_manager_mvc_rebuild_dashboard_rollup');
+define('ASSET_MANAGER_MVC_EXPORT_CRON_HOOK', 'asset_manager_mvc_process_export_job');
+define('ASSET_MANAGER_MVC_MIGRATION_CRON_HOOK', 'asset_manager_mvc_migrate_history');
+define('ASSET_MANAGER_MVC_INDEX_CRON_HOOK', 'asset_manager_mvc_rebuild_index');
+define('ASSET_MANAGER_MVC_PRUNE_CRON_HOOK', 'asset_manager_mvc_prune_changes');
+define('ASSET_MANAGER_MVC_DB_VERSION', '3');
+define('ASSET_MANAGER_MVC_HISTORY_TABLE', 'asset_mvc_history'); // Without the $wpdb->prefix
+define('ASSET_MANAGER_MVC_INDEX_TABLE', 'asset_mvc_index'); // Without the $wpdb->prefix
+define('ASSET_MANAGER_MVC_CHANGES_TABLE', 'asset_mvc_changes'); // Without the $wpdb->prefix
+define('ASSET_MANAGER_MVC_REST_NAMESPACE', 'asset-manager-mvc/v1');
 define('ASSET_MANAGER_MVC_PATH', plugin_dir_path(__FILE__));
 define('ASSET_MANAGER_MVC_URL', plugin_dir_url(__FILE__));
 
 // --- Autoloader (Simplified for example) ---
 // In a real plugin, use a PSR-4 autoloader (e.g., via Composer)
 require_once ASSET_MANAGER_MVC_PATH . 'includes/core/class-plugin-core.php';
+require_once ASSET_MANAGER_MVC_PATH . 'includes/core/class-schema.php';
+require_once ASSET_MANAGER_MVC_PATH . 'includes/core/class-cli-command.php';
 require_once ASSET_MANAGER_MVC_PATH . 'includes/models/class-asset-model.php';
+require_once ASSET_MANAGER_MVC_PATH . 'includes/models/class-export-job-model.php';
 require_once ASSET_MANAGER_MVC_PATH . 'includes/controllers/class-setup-controller.php';
 require_once ASSET_MANAGER_MVC_PATH . 'includes/controllers/class-asset-controller.php';
 require_once ASSET_MANAGER_MVC_PATH . 'includes/controllers/class-dashboard-controller.php';
 require_once ASSET_MANAGER_MVC_PATH . 'includes/controllers/class-export-controller.php';
+require_once ASSET_MANAGER_MVC_PATH . 'includes/controllers/class-rest-controller.php';
 // Add other controllers and models as needed
 
 /**
@@ -53,6 +81,10 @@ function asset_manager_mvc_activate() {
     // Instantiate SetupController directly or through Plugin_Core if preferred for activation tasks
     $setup_controller = new AssetManagerMvc\\Controllers\\Setup_Controller();
     $setup_controller->activate();
+
+    // Create or upgrade the custom tables and queue the move of legacy history into them
+    $schema = new AssetManagerMvc\\Core\\Schema(new AssetManagerMvc\\Models\\Asset_Model());
+    $schema->install();
     flush_rewrite_rules(); // Important after CPT and taxonomy registration
 }
 register_activation_hook(__FILE__, 'asset_manager_mvc_activate');
@@ -62,6 +94,11 @@ register_activation_hook(__FILE__, 'asset_manager_mvc_activate');
  * (Optional: Add any cleanup logic here)
  */
 function asset_manager_mvc_deactivate() {
+    wp_clear_scheduled_hook(ASSET_MANAGER_MVC_ROLLUP_CRON_HOOK);
+    wp_unschedule_hook(ASSET_MANAGER_MVC_EXPORT_CRON_HOOK);
+    wp_unschedule_hook(ASSET_MANAGER_MVC_MIGRATION_CRON_HOOK);
+    wp_unschedule_hook(ASSET_MANAGER_MVC_INDEX_CRON_HOOK);
+    wp_clear_scheduled_hook(ASSET_MANAGER_MVC_PRUNE_CRON_HOOK);
     flush_rewrite_rules();
 }
 register_deactivation_hook(__FILE__, 'asset_manager_mvc_deactivate');
@@ -77,7 +114,9 @@ use AssetManagerMvc\\Controllers\\Setup_Controller;
 use AssetManagerMvc\\Controllers\\Asset_Controller;
 use AssetManagerMvc\\Controllers\\Dashboard_Controller;
 use AssetManagerMvc\\Controllers\\Export_Controller;
+use AssetManagerMvc\\Controllers\\Rest_Controller;
 use AssetManagerMvc\\Models\\Asset_Model;
+use AssetManagerMvc\\Models\\Export_Job_Model;
 
 if (!defined('ABSPATH')) exit;
 
@@ -94,12 +133,19 @@ class Plugin_Core {
      */
     private $asset_model;
 
+    /**
+     * Export Job Model instance.
+     * @var Export_Job_Model
+     */
+    private $export_job_model;
+
     /**
      * Constructor.
      * Initializes models.
      */
     public function __construct() {
         $this->asset_model = new Asset_Model();
+        $this->export_job_model = new Export_Job_Model();
     }
 
     /**
@@ -107,6 +153,14 @@ class Plugin_Core {
      */
     public function run() {
         $this->load_dependencies();
+
+        $schema = new Schema($this->asset_model);
+        $schema->register_hooks();
+
+        if (defined('WP_CLI') && WP_CLI) {
+            \\WP_CLI::add_command('asset-mvc', new Cli_Command($this->asset_model));
+        }
+
         $this->initialize_controllers();
     }
 
@@ -143,8 +197,372 @@ class Plugin_Core {
         $dashboard_controller = new Dashboard_Controller($this->asset_model);
         $dashboard_controller->register_hooks();
 
-        $export_controller = new Export_Controller($this->asset_model);
+        $export_controller = new Export_Controller($this->asset_model, $this->export_job_model);
         $export_controller->register_hooks();
+
+        $rest_controller = new Rest_Controller($this->asset_model);
+        $rest_controller->register_hooks();
+    }
+}
+"""
+
+# Schema Class: includes/core/class-schema.php
+schema_php_content = """<?php
+// File: includes/core/class-schema.php
+
+namespace AssetManagerMvc\\Core;
+
+use AssetManagerMvc\\Models\\Asset_Model;
+
+if (!defined('ABSPATH')) exit;
+
+/**
+ * Schema Class
+ *
+ * Creates and upgrades the plugin's custom tables and migrates existing data into them.
+ * The history table holds one row per change; the index table one row per asset, with the
+ * attributes the admin list filters and sorts on as typed, indexed columns. The changes table is
+ * the sequenced feed that sync clients read through the REST API.
+ */
+class Schema {
+
+    /**
+     * Asset Model instance.
+     * @var Asset_Model
+     */
+    private $asset_model;
+
+    /**
+     * Option holding the installed schema version.
+     * @var string
+     */
+    private $version_option = 'asset_manager_mvc_db_version';
+
+    /**
+     * Number of assets whose legacy history is moved per batch.
+     * @var int
+     */
+    private $migration_batch_size = 100;
+
+    /**
+     * Number of assets written to the index per batch.
+     * @var int
+     */
+    private $index_batch_size = 500;
+
+    /**
+     * Seconds a single migration run may spend before handing over to the next cron tick.
+     * @var int
+     */
+    private $migration_seconds = 20;
+
+    /**
+     * Days change feed entries are kept. Clients further behind must resynchronize in full.
+     * @var int
+     */
+    private $change_retention_days = 30;
+
+    /**
+     * Constructor.
+     * @param Asset_Model $asset_model Instance of the Asset Model.
+     */
+    public function __construct(Asset_Model $asset_model) {
+        $this->asset_model = $asset_model;
+    }
+
+    /**
+     * Registers WordPress hooks.
+     */
+    public function register_hooks() {
+        // Plugin updates do not run the activation hook, so check the schema version on admin requests too
+        add_action('admin_init', [$this, 'maybe_upgrade']);
+        add_action(ASSET_MANAGER_MVC_MIGRATION_CRON_HOOK, [$this, 'migrate_history']);
+        add_action(ASSET_MANAGER_MVC_INDEX_CRON_HOOK, [$this, 'rebuild_index']);
+        add_action(ASSET_MANAGER_MVC_PRUNE_CRON_HOOK, [$this, 'prune_changes']);
+    }
+
+    /**
+     * Creates or updates the custom tables and schedules the history migration and index build.
+     */
+    public function install() {
+        global $wpdb;
+        require_once ABSPATH . 'wp-admin/includes/upgrade.php';
+
+        $table = $wpdb->prefix . ASSET_MANAGER_MVC_HISTORY_TABLE;
+        $index_table = $wpdb->prefix . ASSET_MANAGER_MVC_INDEX_TABLE;
+        $changes_table = $wpdb->prefix . ASSET_MANAGER_MVC_CHANGES_TABLE;
+        $charset_collate = $wpdb->get_charset_collate();
+
+        // dbDelta() is picky: two spaces after PRIMARY KEY, one column or key per line
+        dbDelta("CREATE TABLE {$table} (
+  id bigint(20) unsigned NOT NULL AUTO_INCREMENT,
+  asset_id bigint(20) unsigned NOT NULL,
+  user_id bigint(20) unsigned NOT NULL DEFAULT 0,
+  created_at datetime NOT NULL DEFAULT '0000-00-00 00:00:00',
+  note text NOT NULL,
+  PRIMARY KEY  (id),
+  KEY asset_created (asset_id,created_at)
+) {$charset_collate};
+CREATE TABLE {$index_table} (
+  asset_id bigint(20) unsigned NOT NULL,
+  asset_tag varchar(191) NOT NULL DEFAULT '',
+  serial_number varchar(191) NOT NULL DEFAULT '',
+  brand varchar(191) NOT NULL DEFAULT '',
+  model varchar(191) NOT NULL DEFAULT '',
+  status varchar(32) NOT NULL DEFAULT '',
+  issued_to bigint(20) unsigned NOT NULL DEFAULT 0,
+  category bigint(20) unsigned NOT NULL DEFAULT 0,
+  date_purchased date DEFAULT NULL,
+  PRIMARY KEY  (asset_id),
+  KEY asset_tag (asset_tag),
+  KEY serial_number (serial_number),
+  KEY brand (brand),
+  KEY model (model),
+  KEY status (status),
+  KEY issued_to (issued_to),
+  KEY category (category),
+  KEY date_purchased (date_purchased)
+) {$charset_collate};
+CREATE TABLE {$changes_table} (
+  seq bigint(20) unsigned NOT NULL AUTO_INCREMENT,
+  asset_id bigint(20) unsigned NOT NULL,
+  action varchar(20) NOT NULL DEFAULT '',
+  changed_at datetime NOT NULL DEFAULT '0000-00-00 00:00:00',
+  PRIMARY KEY  (seq),
+  KEY changed_at (changed_at)
+) {$charset_collate};");
+
+        update_option($this->version_option, ASSET_MANAGER_MVC_DB_VERSION);
+
+        if (!wp_next_scheduled(ASSET_MANAGER_MVC_MIGRATION_CRON_HOOK, [0])) {
+            wp_schedule_single_event(time(), ASSET_MANAGER_MVC_MIGRATION_CRON_HOOK, [0]);
+        }
+        // Rebuilding is idempotent, so it is safe to run after every schema change
+        if (!wp_next_scheduled(ASSET_MANAGER_MVC_INDEX_CRON_HOOK, [0])) {
+            wp_schedule_single_event(time(), ASSET_MANAGER_MVC_INDEX_CRON_HOOK, [0]);
+        }
+        if (!wp_next_scheduled(ASSET_MANAGER_MVC_PRUNE_CRON_HOOK)) {
+            wp_schedule_event(time() + DAY_IN_SECONDS, 'daily', ASSET_MANAGER_MVC_PRUNE_CRON_HOOK);
+        }
+    }
+
+    /**
+     * Runs install() when the stored schema version differs from the plugin's.
+     */
+    public function maybe_upgrade() {
+        if (get_option($this->version_option) !== ASSET_MANAGER_MVC_DB_VERSION) {
+            $this->install();
+        }
+    }
+
+    /**
+     * Cron callback: moves serialized history into the history table in ID order, continuing
+     * after the given asset. Reschedules itself with the last processed ID until all are done.
+     * @param int $after_id ID of the last asset processed by the previous run.
+     */
+    public function migrate_history($after_id = 0) {
+        $deadline = time() + $this->migration_seconds;
+        do {
+            $batch = $this->asset_model->migrate_legacy_history((int) $after_id, $this->migration_batch_size);
+            $after_id = $batch['cursor'];
+        } while ($after_id && time() < $deadline);
+
+        if ($after_id) {
+            wp_schedule_single_event(time(), ASSET_MANAGER_MVC_MIGRATION_CRON_HOOK, [$after_id]);
+        }
+    }
+
+    /**
+     * Cron callback: rebuilds the asset index in ID order, continuing after the given asset.
+     * Reschedules itself with the last indexed ID until all assets are done.
+     * @param int $after_id ID of the last asset indexed by the previous run.
+     */
+    public function rebuild_index($after_id = 0) {
+        $deadline = time() + $this->migration_seconds;
+        do {
+            $batch = $this->asset_model->rebuild_asset_index((int) $after_id, $this->index_batch_size);
+            $after_id = $batch['cursor'];
+        } while ($after_id && time() < $deadline);
+
+        if ($after_id) {
+            wp_schedule_single_event(time(), ASSET_MANAGER_MVC_INDEX_CRON_HOOK, [$after_id]);
+        }
+    }
+
+    /**
+     * Cron callback: drops change feed entries older than the retention period.
+     */
+    public function prune_changes() {
+        $this->asset_model->prune_change_log(gmdate('Y-m-d H:i:s', time() - $this->change_retention_days * DAY_IN_SECONDS));
+    }
+}
+"""
+
+# CLI Command: includes/core/class-cli-command.php
+cli_command_php_content = """<?php
+// File: includes/core/class-cli-command.php
+
+namespace AssetManagerMvc\\Core;
+
+use AssetManagerMvc\\Models\\Asset_Model;
+
+if (!defined('ABSPATH')) exit;
+
+/**
+ * Manages Asset Manager (MVC) data from WP-CLI.
+ *
+ * Registered as `wp asset-mvc` when WP-CLI is loaded.
+ */
+class Cli_Command {
+
+    /**
+     * Asset Model instance.
+     * @var Asset_Model
+     */
+    private $asset_model;
+
+    /**
+     * Constructor.
+     * @param Asset_Model $asset_model Instance of the Asset Model.
+     */
+    public function __construct(Asset_Model $asset_model) {
+        $this->asset_model = $asset_model;
+    }
+
+    /**
+     * Rebuilds the asset index table from post meta and categories.
+     *
+     * ## OPTIONS
+     *
+     * [--batch-size=<number>]
+     * : Number of assets per batch.
+     * ---
+     * default: 500
+     * ---
+     *
+     * ## EXAMPLES
+     *
+     *     wp asset-mvc rebuild-index
+     *
+     * @subcommand rebuild-index
+     */
+    public function rebuild_index($args, $assoc_args) {
+        $batch_size = isset($assoc_args['batch-size']) ? max(1, absint($assoc_args['batch-size'])) : 500;
+
+        $indexed = 0;
+        $failed = 0;
+        $after_id = 0;
+        do {
+            $batch = $this->asset_model->rebuild_asset_index($after_id, $batch_size);
+            $after_id = $batch['cursor'];
+            $indexed += $batch['indexed'];
+            $failed += $batch['failed'];
+            if ($batch['indexed']) {
+                \\WP_CLI::log(sprintf('Indexed %d assets (up to ID %d).', $indexed, $after_id));
+            }
+        } while ($after_id);
+
+        if ($failed) {
+            \\WP_CLI::warning(sprintf('Could not index %d assets; see the PHP error log.', $failed));
+        }
+        \\WP_CLI::success(sprintf('Asset index rebuilt: %d assets.', $indexed));
+    }
+
+    /**
+     * Applies one status, assignee or category change to many assets.
+     *
+     * ## OPTIONS
+     *
+     * <id>...
+     * : IDs of the assets to update.
+     *
+     * [--status=<status>]
+     * : New status.
+     *
+     * [--issued-to=<user-id>]
+     * : ID of the user to assign, or 0 to unassign.
+     *
+     * [--category=<term-id>]
+     * : ID of the category, or 0 for none.
+     *
+     * [--chunk-size=<number>]
+     * : Number of assets per transaction.
+     * ---
+     * default: 500
+     * ---
+     *
+     * ## EXAMPLES
+     *
+     *     wp asset-mvc bulk-update $(wp post list --post_type=asset_mvc --format=ids) --status=Returned --issued-to=0
+     *
+     * @subcommand bulk-update
+     */
+    public function bulk_update($args, $assoc_args) {
+        $changes = [];
+        if (isset($assoc_args['status'])) {
+            if (!in_array($assoc_args['status'], $this->asset_model->get_status_options(), true)) {
+                \\WP_CLI::error(sprintf('Invalid status "%s".', $assoc_args['status']));
+            }
+            $changes['status'] = $assoc_args['status'];
+        }
+        if (isset($assoc_args['issued-to'])) {
+            $changes['issued_to'] = absint($assoc_args['issued-to']);
+        }
+        if (isset($assoc_args['category'])) {
+            $changes['category'] = absint($assoc_args['category']);
+        }
+        if (empty($changes)) {
+            \\WP_CLI::error('Pass at least one of --status, --issued-to or --category.');
+        }
+        $chunk_size = isset($assoc_args['chunk-size']) ? max(1, absint($assoc_args['chunk-size'])) : 500;
+
+        $started = microtime(true);
+        $result = $this->asset_model->bulk_update($args, $changes, $chunk_size);
+        $seconds = max(0.001, microtime(true) - $started);
+
+        \\WP_CLI::success(sprintf(
+            'Updated %d assets, %d unchanged, %d failed (%.0f assets/s).',
+            $result['updated'],
+            $result['unchanged'],
+            $result['failed'],
+            ($result['updated'] + $result['unchanged']) / $seconds
+        ));
+    }
+
+    /**
+     * Moves serialized asset history from post meta into the history table.
+     *
+     * ## OPTIONS
+     *
+     * [--batch-size=<number>]
+     * : Number of assets per batch.
+     * ---
+     * default: 100
+     * ---
+     *
+     * ## EXAMPLES
+     *
+     *     wp asset-mvc migrate-history
+     *
+     * @subcommand migrate-history
+     */
+    public function migrate_history($args, $assoc_args) {
+        $batch_size = isset($assoc_args['batch-size']) ? max(1, absint($assoc_args['batch-size'])) : 100;
+
+        $migrated = 0;
+        $failed = 0;
+        $after_id = 0;
+        do {
+            $batch = $this->asset_model->migrate_legacy_history($after_id, $batch_size);
+            $migrated += $batch['migrated'];
+            $failed += $batch['failed'];
+            $after_id = $batch['cursor'];
+        } while ($after_id);
+
+        if ($failed) {
+            \\WP_CLI::warning(sprintf('Could not migrate the history of %d assets; see the PHP error log.', $failed));
+        }
+        \\WP_CLI::success(sprintf('Migrated the history of %d assets.', $migrated));
     }
 }
 """
@@ -171,6 +589,26 @@ class Asset_Model {
 
     private $status_options = ['Unassigned', 'Assigned', 'Returned', 'For Repair', 'Repairing', 'Archived', 'Disposed'];
 
+    /**
+     * Option holding the time of the last change that does not touch post_modified (meta, terms).
+     * @var string
+     */
+    private $last_change_option = 'asset_manager_mvc_last_change';
+
+    /**
+     * Option holding the highest change feed sequence number removed by pruning.
+     * @var string
+     */
+    private $pruned_seq_option = 'asset_manager_mvc_changes_pruned_seq';
+
+    /**
+     * Seconds the change feed trails behind the newest entries.
+     * Sequence numbers are allocated on insert, so a concurrent writer may still commit a lower number;
+     * the lag keeps readers from moving their cursor past it.
+     * @var int
+     */
+    private $change_feed_lag = 2;
+
     /**
      * Get the defined asset fields.
      * @return array
@@ -268,21 +706,26 @@ class Asset_Model {
 
     /**
      * Saves asset meta data and updates history.
+     *
+     * Current values are loaded with one meta read and diffed in memory. All changed keys are then
+     * written with one DELETE and one multi-row INSERT inside a transaction, together with the history
+     * entry. Assignee and category names for the history note are resolved with one lookup each.
      * @param int $post_id The ID of the asset post.
      * @param array $data The data to save (typically from $_POST).
      * @return array Changes made for history logging.
      */
     public function save_asset_data($post_id, array $data) {
         $changes = [];
-        $current_history = get_post_meta($post_id, ASSET_MANAGER_MVC_META_PREFIX . 'history', true) ?: [];
-        if (!is_array($current_history)) $current_history = [];
-        
         $field_labels = $this->get_field_labels();
+        $old_values = $this->get_asset_meta($post_id);
+        $new_values = [];
+        $rollup_before = [];
+        $rollup_after = [];
 
         foreach ($this->fields as $field_key) {
             $meta_key = ASSET_MANAGER_MVC_META_PREFIX . $field_key;
             $new_value_raw = isset($data[$meta_key]) ? $data[$meta_key] : null;
-            $old_value = get_post_meta($post_id, $meta_key, true);
+            $old_value = $old_values[$field_key];
             $new_value_sanitized = '';
 
             switch ($field_key) {
@@ -311,320 +754,2693 @@ class Asset_Model {
             $old_value_comparable = ($field_key === 'issued_to') ? absint($old_value) : trim((string)$old_value);
             $new_value_comparable = ($field_key === 'issued_to') ? $new_value_sanitized : trim((string)$new_value_sanitized);
 
+            if ($field_key === 'status' || $field_key === 'issued_to') {
+                $rollup_before[$field_key] = ($field_key === 'issued_to') ? $old_value_comparable : (string)$old_value;
+                $rollup_after[$field_key] = ($field_key === 'issued_to') ? $new_value_comparable : (string)$new_value_sanitized;
+            }
 
             if ($new_value_comparable !== $old_value_comparable) {
-                update_post_meta($post_id, $meta_key, $new_value_sanitized);
-                $label = $field_labels[$field_key];
-
-                if ($field_key === 'description') {
-                    $changes[] = sprintf(esc_html__('%1$s changed.', 'asset-manager-mvc'), esc_html($label));
-                } elseif ($field_key === 'issued_to') {
-                    $old_user_display = __('Unassigned', 'asset-manager-mvc');
-                    if (!empty($old_value_comparable)) {
-                        $old_user_data = get_userdata($old_value_comparable);
-                        $old_user_display = $old_user_data ? $old_user_data->display_name : sprintf(__('Unknown User (ID: %s)', 'asset-manager-mvc'), $old_value_comparable);
-                    }
-                    $new_user_display = __('Unassigned', 'asset-manager-mvc');
-                    if (!empty($new_value_comparable)) {
-                        $new_user_data = get_userdata($new_value_comparable);
-                        $new_user_display = $new_user_data ? $new_user_data->display_name : sprintf(__('Unknown User (ID: %s)', 'asset-manager-mvc'), $new_value_comparable);
-                    }
-                    $changes[] = sprintf(esc_html__('%1$s changed from "%2$s" to "%3$s"', 'asset-manager-mvc'), esc_html($label), esc_html($old_user_display), esc_html($new_user_display));
-                } else {
-                     $changes[] = sprintf(esc_html__('%1$s changed from "%2$s" to "%3$s"', 'asset-manager-mvc'), esc_html($label), esc_html((string)$old_value), esc_html((string)$new_value_sanitized));
-                }
+                $new_values[$meta_key] = $new_value_sanitized;
             }
         }
 
         // Handle Category
         $category_post_key = ASSET_MANAGER_MVC_META_PREFIX . 'asset_category';
+        $old_term_id = 0;
+        $new_term_id = 0;
         if (isset($data[$category_post_key])) {
             $new_term_id = absint($data[$category_post_key]);
             $old_terms = wp_get_post_terms($post_id, ASSET_MANAGER_MVC_TAXONOMY, ['fields' => 'ids']);
-            $old_term_id = !empty($old_terms) && isset($old_terms[0]) ? absint($old_terms[0]) : 0;
+            $old_terms = (!empty($old_terms) && !is_wp_error($old_terms)) ? $old_terms : [];
+            $old_term_id = isset($old_terms[0]) ? absint($old_terms[0]) : 0;
+            // A changed category replaces all of the asset's terms; the rollup counts every one of them
+            $rollup_before['category'] = $this->sorted_term_ids($old_terms);
+            $rollup_after['category'] = $this->sorted_term_ids([$new_term_id]);
+        }
 
-            if ($new_term_id !== $old_term_id) {
-                 wp_set_post_terms($post_id, ($new_term_id ? [$new_term_id] : []), ASSET_MANAGER_MVC_TAXONOMY, false);
-                 $old_term_obj = $old_term_id ? get_term($old_term_id, ASSET_MANAGER_MVC_TAXONOMY) : null;
-                 $new_term_obj = $new_term_id ? get_term($new_term_id, ASSET_MANAGER_MVC_TAXONOMY) : null;
-                 $old_term_name = ($old_term_obj && !is_wp_error($old_term_obj)) ? $old_term_obj->name : __('None', 'asset-manager-mvc');
-                 $new_term_name = ($new_term_obj && !is_wp_error($new_term_obj)) ? $new_term_obj->name : __('None', 'asset-manager-mvc');
-                 $changes[] = sprintf(esc_html__('Category changed from "%1$s" to "%2$s"', 'asset-manager-mvc'), esc_html($old_term_name), esc_html($new_term_name));
+        if (empty($new_values) && $new_term_id === $old_term_id) {
+            // The post itself (title, content) may still have changed
+            $this->log_changes([$post_id], 'updated');
+            return $changes;
+        }
+
+        // Resolve every name the history note needs in one lookup per kind
+        $issued_to_key = ASSET_MANAGER_MVC_META_PREFIX . 'issued_to';
+        $user_names = isset($new_values[$issued_to_key])
+            ? $this->get_user_display_names([$old_values['issued_to'], $new_values[$issued_to_key]])
+            : [];
+        $term_names = [];
+        if ($new_term_id !== $old_term_id) {
+            $terms = get_terms([
+                'taxonomy' => ASSET_MANAGER_MVC_TAXONOMY,
+                'include' => array_filter([$old_term_id, $new_term_id]),
+                'hide_empty' => false,
+            ]);
+            if (!is_wp_error($terms)) {
+                foreach ($terms as $term) {
+                    $term_names[(int) $term->term_id] = $term->name;
+                }
+            }
+        }
+
+        foreach ($this->fields as $field_key) {
+            $meta_key = ASSET_MANAGER_MVC_META_PREFIX . $field_key;
+            if (!array_key_exists($meta_key, $new_values)) {
+                continue;
             }
+            $label = $field_labels[$field_key];
+            $old_value = $old_values[$field_key];
+            $new_value = $new_values[$meta_key];
+
+            if ($field_key === 'description') {
+                $changes[] = sprintf(esc_html__('%1$s changed.', 'asset-manager-mvc'), esc_html($label));
+            } elseif ($field_key === 'issued_to') {
+                $changes[] = sprintf(
+                    esc_html__('%1$s changed from "%2$s" to "%3$s"', 'asset-manager-mvc'),
+                    esc_html($label),
+                    esc_html($this->describe_user(absint($old_value), $user_names)),
+                    esc_html($this->describe_user($new_value, $user_names))
+                );
+            } else {
+                $changes[] = sprintf(esc_html__('%1$s changed from "%2$s" to "%3$s"', 'asset-manager-mvc'), esc_html($label), esc_html((string)$old_value), esc_html((string)$new_value));
+            }
+        }
+
+        if ($new_term_id !== $old_term_id) {
+            $old_term_name = isset($term_names[$old_term_id]) ? $term_names[$old_term_id] : __('None', 'asset-manager-mvc');
+            $new_term_name = isset($term_names[$new_term_id]) ? $term_names[$new_term_id] : __('None', 'asset-manager-mvc');
+            $changes[] = sprintf(esc_html__('Category changed from "%1$s" to "%2$s"', 'asset-manager-mvc'), esc_html($old_term_name), esc_html($new_term_name));
         }
 
-        if (!empty($changes)) {
-            $history_entry = ['date' => current_time('mysql'), 'user' => get_current_user_id(), 'note' => implode('; ', $changes)];
-            $current_history[] = $history_entry;
-            update_post_meta($post_id, ASSET_MANAGER_MVC_META_PREFIX . 'history', $current_history);
+        global $wpdb;
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+        $wpdb->query('START TRANSACTION');
+        $saved = $this->write_meta_batch($post_id, $new_values);
+        if ($saved && $new_term_id !== $old_term_id) {
+            // In the transaction, so the category note is only kept if the category was set
+            $term_ids = wp_set_post_terms($post_id, ($new_term_id ? [$new_term_id] : []), ASSET_MANAGER_MVC_TAXONOMY, false);
+            $saved = $term_ids !== false && !is_wp_error($term_ids);
+        }
+        if (!$saved || !$this->add_history_entry($post_id, implode('; ', $changes))) {
+            // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+            $wpdb->query('ROLLBACK');
+            wp_cache_delete($post_id, 'post_meta');
+            if ($new_term_id !== $old_term_id) {
+                clean_object_term_cache($post_id, ASSET_MANAGER_MVC_POST_TYPE);
+            }
+            return [];
+        }
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+        $wpdb->query('COMMIT');
+        $this->touch_inventory();
+        $this->sync_asset_index($post_id);
+        $this->log_changes([$post_id], 'updated');
+
+        // Only published assets are counted on the dashboard; status transitions are handled separately.
+        if (get_post_status($post_id) === 'publish') {
+            $this->apply_dashboard_delta($rollup_before, $rollup_after);
         }
         return $changes;
     }
 
     /**
-     * Retrieves asset history.
-     * @param int $post_id The ID of the asset post.
-     * @return array Asset history entries.
+     * Applies one change set to many assets.
+     *
+     * Each chunk is read with one query per kind (posts, meta, categories) and written in one transaction
+     * with multi-row statements for meta, category relationships and history. The asset index and the
+     * dashboard rollup are then updated once per chunk, and post_modified is bumped for the changed assets.
+     * save_post and the per-key meta actions do not fire.
+     * @param int[] $post_ids IDs of the assets to update. IDs of other post types are ignored.
+     * @param array $changes Any of 'status' (one of get_status_options()), 'issued_to' (user ID, 0 to unassign)
+     *                       and 'category' (term ID, 0 for none).
+     * @param int $chunk_size Assets per transaction.
+     * @return array ['updated' => int, 'unchanged' => int, 'failed' => int]
      */
-    public function get_asset_history($post_id) {
-        $history = get_post_meta($post_id, ASSET_MANAGER_MVC_META_PREFIX . 'history', true);
-        return (empty($history) || !is_array($history)) ? [] : array_reverse($history);
-    }
+    public function bulk_update(array $post_ids, array $changes, $chunk_size = 500) {
+        $result = ['updated' => 0, 'unchanged' => 0, 'failed' => 0];
+        $post_ids = array_values(array_unique(array_filter(array_map('absint', $post_ids))));
+
+        $terms = [];
+        $all_terms = get_terms(['taxonomy' => ASSET_MANAGER_MVC_TAXONOMY, 'hide_empty' => false]);
+        if (!is_wp_error($all_terms)) {
+            foreach ($all_terms as $term) {
+                $terms[(int) $term->term_id] = $term;
+            }
+        }
+
+        $valid_changes = [];
+        if (isset($changes['status']) && in_array($changes['status'], $this->status_options, true)) {
+            $valid_changes['status'] = $changes['status'];
+        }
+        if (isset($changes['issued_to'])) {
+            $valid_changes['issued_to'] = absint($changes['issued_to']);
+        }
+        if (isset($changes['category']) && (absint($changes['category']) === 0 || isset($terms[absint($changes['category'])]))) {
+            $valid_changes['category'] = absint($changes['category']);
+        }
+        if (empty($valid_changes) || empty($post_ids)) {
+            return $result;
+        }
+
+        foreach (array_chunk($post_ids, max(1, (int) $chunk_size)) as $chunk) {
+            $chunk_result = $this->bulk_update_chunk($chunk, $valid_changes, $terms);
+            foreach ($chunk_result as $key => $count) {
+                $result[$key] += $count;
+            }
+        }
 
+        if ($result['updated']) {
+            $this->touch_inventory();
+        }
+        return $result;
+    }
 
     /**
-     * Retrieves data for the dashboard charts.
-     * @return array Data for status, user, and category charts.
+     * Applies a validated change set to one chunk of assets. See bulk_update().
+     * @param int[] $post_ids IDs of the assets in the chunk.
+     * @param array $changes Validated changes.
+     * @param \\WP_Term[] $terms All asset categories, keyed by term ID.
+     * @return array ['updated' => int, 'unchanged' => int, 'failed' => int]
      */
-    public function get_dashboard_data() {
-        $status_data = [];
-        $user_data = [];
-        $category_data_counts = [];
+    private function bulk_update_chunk(array $post_ids, array $changes, array $terms) {
+        global $wpdb;
+        $ids_sql = implode(',', $post_ids);
+
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching, WordPress.DB.PreparedSQL.InterpolatedNotPrepared
+        $posts = $wpdb->get_results($wpdb->prepare(
+            "SELECT ID, post_title, post_status, post_modified FROM {$wpdb->posts} WHERE ID IN ({$ids_sql}) AND post_type = %s",
+            ASSET_MANAGER_MVC_POST_TYPE
+        ), OBJECT_K);
+        if (empty($posts)) {
+            return ['updated' => 0, 'unchanged' => 0, 'failed' => 0];
+        }
 
-        // Initialize status data
-        foreach ($this->status_options as $status_opt) {
-            $status_data[$status_opt] = 0;
+        // Current values: the first meta row per key and the first category by name, as the edit form shows
+        // them, plus every category for the dashboard rollup
+        $current = [];
+        foreach ($posts as $post_id => $post) {
+            $current[$post_id] = ['status' => '', 'issued_to' => 0, 'category' => 0, 'term_ids' => [], 'tt_ids' => []];
+        }
+        $ids_sql = implode(',', array_keys($posts));
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching, WordPress.DB.PreparedSQL.InterpolatedNotPrepared
+        $meta_rows = $wpdb->get_results($wpdb->prepare(
+            "SELECT post_id, meta_key, meta_value FROM {$wpdb->postmeta}
+             WHERE post_id IN ({$ids_sql}) AND meta_key IN (%s, %s) ORDER BY meta_id DESC",
+            ASSET_MANAGER_MVC_META_PREFIX . 'status',
+            ASSET_MANAGER_MVC_META_PREFIX . 'issued_to'
+        ));
+        $prefix_length = strlen(ASSET_MANAGER_MVC_META_PREFIX);
+        foreach ($meta_rows as $meta_row) {
+            // Rows come newest first, so the oldest row per key is written last and wins
+            $field_key = substr($meta_row->meta_key, $prefix_length);
+            $current[$meta_row->post_id][$field_key] = ($field_key === 'issued_to') ? absint($meta_row->meta_value) : (string) $meta_row->meta_value;
+        }
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching, WordPress.DB.PreparedSQL.InterpolatedNotPrepared
+        $term_rows = $wpdb->get_results($wpdb->prepare(
+            "SELECT tr.object_id, tt.term_id, tt.term_taxonomy_id
+             FROM {$wpdb->term_relationships} tr
+             INNER JOIN {$wpdb->term_taxonomy} tt ON tt.term_taxonomy_id = tr.term_taxonomy_id
+             INNER JOIN {$wpdb->terms} t ON t.term_id = tt.term_id
+             WHERE tt.taxonomy = %s AND tr.object_id IN ({$ids_sql})
+             ORDER BY t.name ASC",
+            ASSET_MANAGER_MVC_TAXONOMY
+        ));
+        foreach ($term_rows as $term_row) {
+            if (empty($current[$term_row->object_id]['tt_ids'])) {
+                $current[$term_row->object_id]['category'] = (int) $term_row->term_id;
+            }
+            $current[$term_row->object_id]['term_ids'][] = (int) $term_row->term_id;
+            $current[$term_row->object_id]['tt_ids'][] = (int) $term_row->term_taxonomy_id;
         }
-        $status_data[__('Unknown', 'asset-manager-mvc')] = 0;
 
-        // Initialize category data
-        $all_categories = get_terms(['taxonomy' => ASSET_MANAGER_MVC_TAXONOMY, 'hide_empty' => false]);
-        if (is_array($all_categories)) {
-            foreach ($all_categories as $cat_term) {
-                if (is_object($cat_term) && property_exists($cat_term, 'name')) {
-                    $category_data_counts[esc_html($cat_term->name)] = 0;
-                }
+        // Diff in memory
+        $changed = [];
+        $user_ids = isset($changes['issued_to']) ? [$changes['issued_to']] : [];
+        foreach ($current as $post_id => $values) {
+            $after = array_merge(array_intersect_key($values, ['status' => 1, 'issued_to' => 1, 'category' => 1]), $changes);
+            if ($after['status'] !== $values['status'] || $after['issued_to'] !== $values['issued_to'] || $after['category'] !== $values['category']) {
+                $changed[$post_id] = $after;
+                $user_ids[] = $values['issued_to'];
             }
         }
-        $category_data_counts[__('Uncategorized', 'asset-manager-mvc')] = 0;
-        $user_data[__('Unassigned', 'asset-manager-mvc')] = 0;
+        $unchanged = count($current) - count($changed);
+        if (empty($changed)) {
+            return ['updated' => 0, 'unchanged' => $unchanged, 'failed' => 0];
+        }
 
-        $assets_query = new \\WP_Query([
-            'post_type' => ASSET_MANAGER_MVC_POST_TYPE,
-            'posts_per_page' => -1,
-        ]);
+        $field_labels = $this->get_field_labels();
+        $user_names = isset($changes['issued_to']) ? $this->get_user_display_names($user_ids) : [];
+        $term_name = function($term_id) use ($terms) {
+            return isset($terms[$term_id]) ? $terms[$term_id]->name : __('None', 'asset-manager-mvc');
+        };
 
-        if ($assets_query->have_posts()) {
-            while ($assets_query->have_posts()) {
-                $assets_query->the_post();
-                $post_id = get_the_ID();
-
-                // Status
-                $status_val = get_post_meta($post_id, ASSET_MANAGER_MVC_META_PREFIX . 'status', true);
-                $display_status = '';
-                if (empty($status_val)) {
-                    $display_status = 'Unassigned';
-                } elseif (in_array($status_val, $this->status_options, true)) {
-                    $display_status = $status_val;
-                } else {
-                    $display_status = __('Unknown', 'asset-manager-mvc');
+        $meta_keys = [];
+        foreach (['status', 'issued_to'] as $field_key) {
+            if (isset($changes[$field_key])) {
+                $meta_keys[$field_key] = ASSET_MANAGER_MVC_META_PREFIX . $field_key;
+            }
+        }
+        $meta_rows = [];
+        $history = [];
+        $relink_ids = [];
+        $old_tt_ids = [];
+        foreach ($changed as $post_id => $after) {
+            $before = $current[$post_id];
+            $notes = [];
+            foreach ($meta_keys as $field_key => $meta_key) {
+                array_push($meta_rows, $post_id, $meta_key, (string) $after[$field_key]);
+                if ($after[$field_key] === $before[$field_key]) {
+                    continue;
                 }
-                if (!isset($status_data[$display_status])) $status_data[$display_status] = 0;
-                $status_data[$display_status]++;
+                $old_display = ($field_key === 'issued_to') ? $this->describe_user($before[$field_key], $user_names) : $before[$field_key];
+                $new_display = ($field_key === 'issued_to') ? $this->describe_user($after[$field_key], $user_names) : $after[$field_key];
+                $notes[] = sprintf(esc_html__('%1$s changed from "%2$s" to "%3$s"', 'asset-manager-mvc'), esc_html($field_labels[$field_key]), esc_html($old_display), esc_html($new_display));
+            }
+            if ($after['category'] !== $before['category']) {
+                $relink_ids[] = $post_id;
+                $old_tt_ids = array_merge($old_tt_ids, $before['tt_ids']);
+                $notes[] = sprintf(esc_html__('Category changed from "%1$s" to "%2$s"', 'asset-manager-mvc'), esc_html($term_name($before['category'])), esc_html($term_name($after['category'])));
+            }
+            $history[] = [$post_id, implode('; ', $notes)];
+        }
 
-                // User
-                $user_id = get_post_meta($post_id, ASSET_MANAGER_MVC_META_PREFIX . 'issued_to', true);
-                $user_name_key = __('Unassigned', 'asset-manager-mvc');
-                if ($user_id) {
-                    $user = get_userdata($user_id);
-                    $user_name_key = $user ? esc_html($user->display_name) : sprintf(__('Unknown User (ID: %d)', 'asset-manager-mvc'), $user_id);
-                }
-                if (!isset($user_data[$user_name_key])) $user_data[$user_name_key] = 0;
-                $user_data[$user_name_key]++;
-
-                // Category
-                $terms = get_the_terms($post_id, ASSET_MANAGER_MVC_TAXONOMY);
-                $category_name_key = __('Uncategorized', 'asset-manager-mvc');
-                if (!empty($terms) && !is_wp_error($terms) && isset($terms[0]->name)) {
-                     $category_name_key = esc_html($terms[0]->name);
+        $changed_sql = implode(',', array_keys($changed));
+        $ok = true;
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+        $wpdb->query('START TRANSACTION');
+
+        if ($meta_keys) {
+            // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching, WordPress.DB.PreparedSQL.InterpolatedNotPrepared
+            $ok = $ok && false !== $wpdb->query($wpdb->prepare(
+                "DELETE FROM {$wpdb->postmeta} WHERE post_id IN ({$changed_sql}) AND meta_key IN (" . implode(',', array_fill(0, count($meta_keys), '%s')) . ')',
+                array_values($meta_keys)
+            ));
+            // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+            $ok = $ok && false !== $wpdb->query($wpdb->prepare(
+                "INSERT INTO {$wpdb->postmeta} (post_id, meta_key, meta_value) VALUES "
+                    . implode(', ', array_fill(0, count($meta_rows) / 3, '(%d, %s, %s)')),
+                $meta_rows
+            ));
+        }
+
+        $new_tt_id = (!empty($changes['category']) && isset($terms[$changes['category']])) ? (int) $terms[$changes['category']]->term_taxonomy_id : 0;
+        if ($relink_ids) {
+            $relink_sql = implode(',', $relink_ids);
+            if ($old_tt_ids) {
+                $old_tt_sql = implode(',', array_unique($old_tt_ids));
+                // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching, WordPress.DB.PreparedSQL.InterpolatedNotPrepared
+                $ok = $ok && false !== $wpdb->query(
+                    "DELETE FROM {$wpdb->term_relationships} WHERE object_id IN ({$relink_sql}) AND term_taxonomy_id IN ({$old_tt_sql})"
+                );
+            }
+            if ($new_tt_id) {
+                $relationship_rows = [];
+                foreach ($relink_ids as $post_id) {
+                    $relationship_rows[] = sprintf('(%d, %d, 0)', $post_id, $new_tt_id);
                 }
-                if (!isset($category_data_counts[$category_name_key])) $category_data_counts[$category_name_key] = 0;
-                $category_data_counts[$category_name_key]++;
+                // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching, WordPress.DB.PreparedSQL.InterpolatedNotPrepared
+                $ok = $ok && false !== $wpdb->query(
+                    "INSERT IGNORE INTO {$wpdb->term_relationships} (object_id, term_taxonomy_id, term_order) VALUES " . implode(', ', $relationship_rows)
+                );
             }
-            wp_reset_postdata();
         }
-        return [
-            'status' => array_filter($status_data, function($count){ return $count >= 0; }),
-            'users' => array_filter($user_data, function($count){ return $count > 0; }),
-            'categories' => array_filter($category_data_counts, function($count){ return $count > 0; })
-        ];
-    }
 
-    /**
-     * Get all assets for PDF export.
-     * @return \\WP_Query
-     */
-    public function get_all_assets_for_export() {
-        return new \\WP_Query([
-            'post_type' => ASSET_MANAGER_MVC_POST_TYPE,
-            'posts_per_page' => -1,
-            'orderby' => 'title',
-            'order' => 'ASC'
-        ]);
-    }
-}
-"""
+        // Bump the modification time, as wp_update_post() would, so clients syncing by modified date pick the change up
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching, WordPress.DB.PreparedSQL.InterpolatedNotPrepared
+        $ok = $ok && false !== $wpdb->query($wpdb->prepare(
+            "UPDATE {$wpdb->posts} SET post_modified = %s, post_modified_gmt = %s WHERE ID IN ({$changed_sql})",
+            current_time('mysql'),
+            current_time('mysql', true)
+        ));
 
-# Setup Controller: includes/controllers/class-setup-controller.php
-setup_controller_php_content = """<?php
-// File: includes/controllers/class-setup-controller.php
+        $ok = $ok && $this->add_history_entries($history);
 
-namespace AssetManagerMvc\\Controllers;
+        if (!$ok) {
+            // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+            $wpdb->query('ROLLBACK');
+            return ['updated' => 0, 'unchanged' => $unchanged, 'failed' => count($changed)];
+        }
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+        $wpdb->query('COMMIT');
 
-if (!defined('ABSPATH')) exit;
+        foreach (array_keys($changed) as $post_id) {
+            wp_cache_delete($post_id, 'posts');
+            wp_cache_delete($post_id, 'post_meta');
+        }
+        if ($relink_ids) {
+            clean_object_term_cache($relink_ids, ASSET_MANAGER_MVC_POST_TYPE);
+            $count_tt_ids = array_unique(array_filter(array_merge($old_tt_ids, [$new_tt_id])));
+            if ($count_tt_ids) {
+                wp_update_term_count_now($count_tt_ids, ASSET_MANAGER_MVC_TAXONOMY);
+            }
+        }
 
-/**
- * Setup_Controller Class
- *
- * Handles plugin setup tasks like CPT and taxonomy registration.
- */
-class Setup_Controller {
+        $this->write_index_rows($this->get_assets_data(array_intersect_key($posts, $changed)));
+
+        // Only published assets are counted on the dashboard
+        $deltas = [];
+        foreach ($changed as $post_id => $after) {
+            if ($posts[$post_id]->post_status === 'publish') {
+                $before = array_intersect_key($current[$post_id], $after);
+                // Relinked assets lose all their categories for the new one
+                $before['category'] = $this->sorted_term_ids($current[$post_id]['term_ids']);
+                $after['category'] = in_array($post_id, $relink_ids, true) ? $this->sorted_term_ids([$after['category']]) : $before['category'];
+                $deltas[] = [$before, $after];
+            }
+        }
+        $this->apply_dashboard_deltas($deltas);
+        $this->log_changes(array_keys($changed), 'updated');
+
+        return ['updated' => count($changed), 'unchanged' => $unchanged, 'failed' => 0];
+    }
 
     /**
-     * Registers WordPress hooks.
+     * Replaces several meta keys of a post with one DELETE and one multi-row INSERT.
+     *
+     * Must run inside the caller's transaction. Unlike update_post_meta() this does not fire the
+     * per-key meta actions; the post's meta cache is cleared instead.
+     * @param int $post_id The ID of the asset post.
+     * @param array $values Values keyed by full meta key, as passed to update_post_meta() (slashed).
+     * @return bool Whether both statements succeeded.
      */
-    public function register_hooks() {
-        add_action('init', [$this, 'register_asset_post_type']);
-        add_action('init', [$this, 'register_asset_taxonomy']);
-        // add_action('init', [$this, 'register_shortcodes']); // Placeholder
+    private function write_meta_batch($post_id, array $values) {
+        global $wpdb;
+        if (empty($values)) {
+            return true;
+        }
+
+        $key_placeholders = implode(',', array_fill(0, count($values), '%s'));
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching, WordPress.DB.PreparedSQL.InterpolatedNotPrepared
+        $deleted = $wpdb->query($wpdb->prepare(
+            "DELETE FROM {$wpdb->postmeta} WHERE post_id = %d AND meta_key IN ({$key_placeholders})",
+            array_merge([$post_id], array_keys($values))
+        ));
+
+        $row_placeholders = [];
+        $args = [];
+        foreach ($values as $meta_key => $value) {
+            $row_placeholders[] = '(%d, %s, %s)';
+            array_push($args, $post_id, $meta_key, maybe_serialize(wp_unslash($value)));
+        }
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+        $inserted = $wpdb->query($wpdb->prepare(
+            "INSERT INTO {$wpdb->postmeta} (post_id, meta_key, meta_value) VALUES " . implode(', ', $row_placeholders),
+            $args
+        ));
+
+        wp_cache_delete($post_id, 'post_meta');
+        return $deleted !== false && $inserted !== false;
+    }
+
+    /**
+     * Display label for a user in history notes.
+     * @param int $user_id The user ID, or 0 for none.
+     * @param array $user_names Display names keyed by user ID, as returned by get_user_display_names().
+     * @return string
+     */
+    private function describe_user($user_id, array $user_names) {
+        if (empty($user_id)) {
+            return __('Unassigned', 'asset-manager-mvc');
+        }
+        return isset($user_names[$user_id]) ? $user_names[$user_id] : sprintf(__('Unknown User (ID: %s)', 'asset-manager-mvc'), $user_id);
+    }
+
+    /**
+     * Appends an entry to an asset's history.
+     * @param int $post_id The ID of the asset post.
+     * @param string $note Description of the change.
+     * @param int|null $user_id User who made the change. Defaults to the current user.
+     * @return bool Whether the entry was stored.
+     */
+    public function add_history_entry($post_id, $note, $user_id = null) {
+        global $wpdb;
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery
+        return (bool) $wpdb->insert(
+            $this->get_history_table(),
+            [
+                'asset_id' => (int) $post_id,
+                'user_id' => $user_id === null ? get_current_user_id() : (int) $user_id,
+                'created_at' => current_time('mysql'),
+                'note' => (string) $note,
+            ],
+            ['%d', '%d', '%s', '%s']
+        );
+    }
+
+    /**
+     * Appends history entries for many assets with one multi-row INSERT, attributed to the current user.
+     * @param array $entries List of [post ID, note] pairs.
+     * @return bool Whether the entries were stored.
+     */
+    private function add_history_entries(array $entries) {
+        global $wpdb;
+        if (empty($entries)) {
+            return true;
+        }
+
+        $user_id = get_current_user_id();
+        $created_at = current_time('mysql');
+        $placeholders = [];
+        $args = [];
+        foreach ($entries as $entry) {
+            $placeholders[] = '(%d, %d, %s, %s)';
+            array_push($args, $entry[0], $user_id, $created_at, $entry[1]);
+        }
+
+        $table = $this->get_history_table();
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+        return false !== $wpdb->query($wpdb->prepare(
+            "INSERT INTO {$table} (asset_id, user_id, created_at, note) VALUES " . implode(', ', $placeholders),
+            $args
+        ));
+    }
+
+    /**
+     * Retrieves one page of asset history, newest first.
+     * @param int $post_id The ID of the asset post.
+     * @param int $page 1-based page number.
+     * @param int $per_page Entries per page.
+     * @return array ['entries' => array of ['date', 'user', 'note'], 'total' => int].
+     */
+    public function get_asset_history($post_id, $page = 1, $per_page = 20) {
+        global $wpdb;
+        $table = $this->get_history_table();
+
+        // Assets the background migration has not reached yet are moved on first view
+        $this->migrate_post_history($post_id);
+
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+        $total = (int) $wpdb->get_var($wpdb->prepare(
+            "SELECT COUNT(*) FROM {$table} WHERE asset_id = %d",
+            $post_id
+        ));
+        if ($total === 0) {
+            return ['entries' => [], 'total' => 0];
+        }
+
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+        $rows = $wpdb->get_results($wpdb->prepare(
+            "SELECT user_id, created_at, note FROM {$table}
+             WHERE asset_id = %d
+             ORDER BY created_at DESC, id DESC
+             LIMIT %d OFFSET %d",
+            $post_id,
+            $per_page,
+            (max(1, (int) $page) - 1) * $per_page
+        ), ARRAY_A);
+
+        $entries = [];
+        foreach ($rows as $row) {
+            $entries[] = ['date' => $row['created_at'], 'user' => (int) $row['user_id'], 'note' => $row['note']];
+        }
+        return ['entries' => $entries, 'total' => $total];
+    }
+
+    /**
+     * Deletes all history entries of an asset.
+     * @param int $post_id The ID of the asset post.
+     */
+    public function delete_asset_history($post_id) {
+        global $wpdb;
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+        $wpdb->delete($this->get_history_table(), ['asset_id' => (int) $post_id], ['%d']);
+    }
+
+    /**
+     * Moves the legacy serialized history of one batch of assets, in ID order, into the history
+     * table. Call repeatedly with the returned cursor until it is 0.
+     *
+     * An asset that fails is logged and skipped, so it does not hold up the rest. Its history
+     * stays in the meta and is retried when it is next viewed or the migration runs again.
+     * @param int $after_id Migrate assets with an ID greater than this.
+     * @param int $limit Number of assets per batch.
+     * @return array ['cursor' => last processed ID, or 0 when done, 'migrated' => int, 'failed' => int].
+     */
+    public function migrate_legacy_history($after_id = 0, $limit = 100) {
+        global $wpdb;
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+        $post_ids = array_map('intval', $wpdb->get_col($wpdb->prepare(
+            "SELECT DISTINCT post_id FROM {$wpdb->postmeta} WHERE meta_key = %s AND post_id > %d ORDER BY post_id ASC LIMIT %d",
+            ASSET_MANAGER_MVC_META_PREFIX . 'history',
+            $after_id,
+            absint($limit)
+        )));
+        if (empty($post_ids)) {
+            return ['cursor' => 0, 'migrated' => 0, 'failed' => 0];
+        }
+
+        update_meta_cache('post', $post_ids);
+        $failed = 0;
+        foreach ($post_ids as $post_id) {
+            if (!$this->migrate_post_history($post_id)) {
+                $failed++;
+                // phpcs:ignore WordPress.PHP.DevelopmentFunctions.error_log_error_log
+                error_log(sprintf('Asset Manager (MVC): could not migrate the history of asset %d: %s', $post_id, $wpdb->last_error));
+            }
+        }
+        return [
+            'cursor' => count($post_ids) < $limit ? 0 : end($post_ids),
+            'migrated' => count($post_ids) - $failed,
+            'failed' => $failed,
+        ];
+    }
+
+    /**
+     * Moves one asset's serialized history meta into the history table.
+     *
+     * The inserts and the meta deletion run in one transaction, so an interrupted
+     * migration never leaves entries both in the table and in the meta.
+     * @param int $post_id The ID of the asset post.
+     * @return bool Whether the asset has no legacy history left.
+     */
+    private function migrate_post_history($post_id) {
+        global $wpdb;
+        $meta_key = ASSET_MANAGER_MVC_META_PREFIX . 'history';
+        if (!metadata_exists('post', $post_id, $meta_key)) {
+            return true;
+        }
+
+        $history = get_post_meta($post_id, $meta_key, true);
+        $history = is_array($history) ? array_values($history) : [];
+        $table = $this->get_history_table();
+        $created = get_post_field('post_date', $post_id);
+
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+        $wpdb->query('START TRANSACTION');
+        foreach (array_chunk($history, 500) as $chunk) {
+            $placeholders = [];
+            $args = [];
+            foreach ($chunk as $entry) {
+                $placeholders[] = '(%d, %d, %s, %s)';
+                $args[] = $post_id;
+                $args[] = isset($entry['user']) ? absint($entry['user']) : 0;
+                $args[] = $this->normalize_history_date(isset($entry['date']) ? $entry['date'] : '', $created);
+                $args[] = isset($entry['note']) ? (string) $entry['note'] : '';
+            }
+            // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+            $inserted = $wpdb->query($wpdb->prepare(
+                "INSERT INTO {$table} (asset_id, user_id, created_at, note) VALUES " . implode(', ', $placeholders),
+                $args
+            ));
+            if ($inserted === false) {
+                // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+                $wpdb->query('ROLLBACK');
+                return false;
+            }
+        }
+        delete_post_meta($post_id, $meta_key);
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+        $wpdb->query('COMMIT');
+        return true;
+    }
+
+    /**
+     * A legacy history date as a valid 'Y-m-d H:i:s' value for the history table.
+     *
+     * Missing, zero or unparseable dates, which strict SQL modes reject, fall back to the
+     * asset's post date, and to the current time if that is invalid too.
+     * @param mixed $date The stored date.
+     * @param string $fallback Date to use instead of an invalid one.
+     * @return string
+     */
+    private function normalize_history_date($date, $fallback) {
+        foreach ([$date, $fallback] as $candidate) {
+            $timestamp = is_string($candidate) && $candidate !== '' ? strtotime($candidate) : false;
+            // Zero dates parse to the year -1
+            if ($timestamp !== false && $timestamp > 0) {
+                return gmdate('Y-m-d H:i:s', $timestamp);
+            }
+        }
+        return current_time('mysql');
+    }
+
+    /**
+     * Writes an asset's current meta and category to the index table.
+     * @param int $post_id The ID of the asset post.
+     */
+    public function sync_asset_index($post_id) {
+        $post = get_post($post_id);
+        if ($post) {
+            $this->write_index_rows($this->get_assets_data([$post]));
+        }
+    }
+
+    /**
+     * Removes an asset from the index table.
+     * @param int $post_id The ID of the asset post.
+     */
+    public function delete_asset_index($post_id) {
+        global $wpdb;
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+        $wpdb->delete($this->get_index_table(), ['asset_id' => (int) $post_id], ['%d']);
+    }
+
+    /**
+     * Clears a deleted category from the index table.
+     * @param int $term_id The ID of the deleted term.
+     */
+    public function clear_index_category($term_id) {
+        global $wpdb;
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+        $wpdb->update($this->get_index_table(), ['category' => 0], ['category' => (int) $term_id], ['%d'], ['%d']);
+    }
+
+    /**
+     * Indexes one batch of assets in ID order. Call repeatedly with the returned cursor until it is 0.
+     *
+     * Includes assets of every status except auto-drafts, since the admin list shows drafts and trash too.
+     * The final call also removes index rows of assets that no longer exist.
+     * @param int $after_id Index assets with an ID greater than this.
+     * @param int $limit Number of assets per batch.
+     * @return array ['cursor' => last indexed ID, or 0 when done, 'indexed' => number of assets written,
+     *               'failed' => number of assets whose rows could not be written].
+     */
+    public function rebuild_asset_index($after_id = 0, $limit = 500) {
+        global $wpdb;
+
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+        $posts = $wpdb->get_results($wpdb->prepare(
+            "SELECT ID, post_title, post_modified FROM {$wpdb->posts}
+             WHERE post_type = %s AND post_status <> 'auto-draft' AND ID > %d
+             ORDER BY ID ASC LIMIT %d",
+            ASSET_MANAGER_MVC_POST_TYPE,
+            $after_id,
+            absint($limit)
+        ));
+
+        if (empty($posts)) {
+            $index_table = $this->get_index_table();
+            // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+            $wpdb->query(
+                "DELETE i FROM {$index_table} i LEFT JOIN {$wpdb->posts} p ON p.ID = i.asset_id WHERE p.ID IS NULL"
+            );
+            return ['cursor' => 0, 'indexed' => 0, 'failed' => 0];
+        }
+
+        $written = $this->write_index_rows($this->get_assets_data($posts));
+        $last = end($posts);
+        return [
+            'cursor' => (int) $last->ID,
+            'indexed' => $written ? count($posts) : 0,
+            'failed' => $written ? 0 : count($posts),
+        ];
+    }
+
+    /**
+     * Distinct non-empty values of an index column, for the admin list filters.
+     * @param string $column 'brand' or 'issued_to'.
+     * @param int $limit Maximum number of values.
+     * @return array
+     */
+    public function get_index_values($column, $limit = 500) {
+        global $wpdb;
+        if (!in_array($column, ['brand', 'issued_to'], true)) {
+            return [];
+        }
+        $index_table = $this->get_index_table();
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching, WordPress.DB.PreparedSQL.InterpolatedNotPrepared
+        return $wpdb->get_col($wpdb->prepare(
+            "SELECT DISTINCT {$column} FROM {$index_table} WHERE {$column} <> %s ORDER BY {$column} ASC LIMIT %d",
+            $column === 'issued_to' ? '0' : '',
+            $limit
+        ));
+    }
+
+    /**
+     * Adds the index table to the admin list query and applies filters and sorting against it.
+     * @param array $clauses Query clauses as passed to the posts_clauses filter.
+     * @param array $filters Filters keyed by index column: status, brand, issued_to, category.
+     * @param string $orderby Index column to sort by, or '' to keep the query's order.
+     * @param string $order 'ASC' or 'DESC'.
+     * @return array Modified clauses.
+     */
+    public function apply_index_clauses(array $clauses, array $filters, $orderby, $order) {
+        global $wpdb;
+        $index_table = $this->get_index_table();
+
+        // LEFT JOIN so assets not indexed yet still appear when no filter is active
+        $clauses['join'] .= " LEFT JOIN {$index_table} am_idx ON am_idx.asset_id = {$wpdb->posts}.ID";
+
+        foreach ($filters as $column => $value) {
+            if (in_array($column, ['issued_to', 'category'], true)) {
+                $clauses['where'] .= $wpdb->prepare(" AND am_idx.{$column} = %d", $value);
+            } elseif (in_array($column, ['status', 'brand'], true)) {
+                $clauses['where'] .= $wpdb->prepare(" AND am_idx.{$column} = %s", $value);
+            }
+        }
+
+        if (in_array($orderby, ['asset_tag', 'model', 'serial_number', 'brand', 'status'], true)) {
+            $order = strtoupper($order) === 'DESC' ? 'DESC' : 'ASC';
+            $clauses['orderby'] = "am_idx.{$orderby} {$order}, {$wpdb->posts}.ID {$order}";
+        }
+
+        return $clauses;
+    }
+
+    /**
+     * Extends the admin list search to asset tag and serial number prefixes.
+     * Requires the join added by apply_index_clauses().
+     * @param string $search Search SQL as passed to the posts_search filter, e.g. " AND ((...))".
+     * @param string $term The search term.
+     * @return string Modified search SQL.
+     */
+    public function apply_index_search($search, $term) {
+        global $wpdb;
+        $search = preg_replace('/^\\s*AND\\s*/', '', $search);
+        if ($search === '' || $term === '') {
+            return $search === '' ? '' : ' AND ' . $search;
+        }
+        $like = $wpdb->esc_like($term) . '%';
+        // Prefix matches can use the column indexes, unlike the leading-wildcard LIKE of the core search
+        $index_search = $wpdb->prepare('am_idx.asset_tag LIKE %s OR am_idx.serial_number LIKE %s', $like, $like);
+        return " AND ({$search} OR {$index_search})";
+    }
+
+    /**
+     * Writes index rows for assets loaded with get_assets_data(), using one REPLACE statement.
+     *
+     * A purchase date that is not a valid Y-m-d is indexed as NULL, since strict SQL modes
+     * would otherwise reject the whole statement. A failed statement is logged.
+     * @param array $rows Rows as returned by get_assets_data().
+     * @return bool Whether the rows were written.
+     */
+    private function write_index_rows(array $rows) {
+        global $wpdb;
+        if (empty($rows)) {
+            return true;
+        }
+
+        $placeholders = [];
+        $args = [];
+        foreach ($rows as $row) {
+            $meta = $row['meta'];
+            $date_purchased = (string) $meta['date_purchased'];
+            $date = \\DateTime::createFromFormat('Y-m-d', $date_purchased);
+            if (!$date || $date->format('Y-m-d') !== $date_purchased) {
+                $date_purchased = '';
+            }
+            $placeholders[] = "(%d, %s, %s, %s, %s, %s, %d, %d, NULLIF(%s, ''))";
+            array_push(
+                $args,
+                $row['ID'],
+                (string) $meta['asset_tag'],
+                (string) $meta['serial_number'],
+                (string) $meta['brand'],
+                (string) $meta['model'],
+                (string) $meta['status'],
+                absint($meta['issued_to']),
+                empty($row['category_ids']) ? 0 : (int) $row['category_ids'][0],
+                $date_purchased
+            );
+        }
+
+        $index_table = $this->get_index_table();
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching, WordPress.DB.PreparedSQL.InterpolatedNotPrepared
+        $written = $wpdb->query($wpdb->prepare(
+            "REPLACE INTO {$index_table} (asset_id, asset_tag, serial_number, brand, model, status, issued_to, category, date_purchased) VALUES "
+                . implode(', ', $placeholders),
+            $args
+        ));
+        if ($written === false) {
+            // phpcs:ignore WordPress.PHP.DevelopmentFunctions.error_log_error_log
+            error_log(sprintf(
+                'Asset Manager (MVC): could not index assets %d to %d: %s',
+                min(array_keys($rows)),
+                max(array_keys($rows)),
+                $wpdb->last_error
+            ));
+            return false;
+        }
+        return true;
+    }
+
+    /**
+     * Appends entries to the change feed, one per asset, with one INSERT.
+     * Written after the data change has been committed, and stamped with the database clock.
+     * @param int[] $post_ids IDs of the changed assets.
+     * @param string $action 'updated', 'published', 'unpublished' or 'deleted'.
+     */
+    public function log_changes(array $post_ids, $action) {
+        global $wpdb;
+        $post_ids = array_unique(array_filter(array_map('absint', $post_ids)));
+        if (empty($post_ids)) {
+            return;
+        }
+
+        $placeholders = [];
+        $args = [];
+        foreach ($post_ids as $post_id) {
+            $placeholders[] = '(%d, %s, UTC_TIMESTAMP())';
+            array_push($args, $post_id, $action);
+        }
+        $table = $this->get_changes_table();
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+        $wpdb->query($wpdb->prepare(
+            "INSERT INTO {$table} (asset_id, action, changed_at) VALUES " . implode(', ', $placeholders),
+            $args
+        ));
+    }
+
+    /**
+     * Logs an update for every asset in a category whose name changed or that is being deleted.
+     * Hooked to edited_{taxonomy} (term ID only) and delete_{taxonomy} (which passes the object IDs).
+     * @param int $term_id The term ID.
+     * @param int $tt_id Term taxonomy ID (unused).
+     * @param mixed $deleted_term The deleted term (unused).
+     * @param int[]|null $object_ids IDs of the objects in the term, when WordPress passes them.
+     */
+    public function log_term_change($term_id, $tt_id = 0, $deleted_term = null, $object_ids = null) {
+        if (!is_array($object_ids)) {
+            $object_ids = get_objects_in_term((int) $term_id, ASSET_MANAGER_MVC_TAXONOMY);
+        }
+        if (!is_wp_error($object_ids)) {
+            $this->log_changes($object_ids, 'updated');
+        }
+    }
+
+    /**
+     * Reads change feed entries after a sequence number, oldest first.
+     * Entries younger than the feed lag are held back; see $change_feed_lag.
+     * @param int $after_seq Return entries with a higher sequence number.
+     * @param int $limit Maximum number of entries.
+     * @return array Objects with seq, asset_id, action and changed_at (GMT).
+     */
+    public function get_changes_after($after_seq, $limit) {
+        global $wpdb;
+        $table = $this->get_changes_table();
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+        return $wpdb->get_results($wpdb->prepare(
+            "SELECT seq, asset_id, action, changed_at FROM {$table}
+             WHERE seq > %d AND changed_at <= UTC_TIMESTAMP() - INTERVAL %d SECOND
+             ORDER BY seq ASC LIMIT %d",
+            (int) $after_seq,
+            $this->change_feed_lag,
+            absint($limit)
+        ));
+    }
+
+    /**
+     * Highest sequence number a reader can currently see; the starting point for a client after a full sync.
+     * @return int
+     */
+    public function get_latest_change_seq() {
+        global $wpdb;
+        $table = $this->get_changes_table();
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+        $seq = (int) $wpdb->get_var($wpdb->prepare(
+            "SELECT MAX(seq) FROM {$table} WHERE changed_at <= UTC_TIMESTAMP() - INTERVAL %d SECOND",
+            $this->change_feed_lag
+        ));
+        return max($seq, $this->get_pruned_change_seq());
+    }
+
+    /**
+     * Highest sequence number removed by pruning. Cursors below it can no longer be served.
+     * @return int
+     */
+    public function get_pruned_change_seq() {
+        return (int) get_option($this->pruned_seq_option, 0);
+    }
+
+    /**
+     * Deletes change feed entries recorded before a point in time, in batches.
+     * @param string $before GMT datetime ('Y-m-d H:i:s').
+     * @return int Number of entries deleted.
+     */
+    public function prune_change_log($before) {
+        global $wpdb;
+        $table = $this->get_changes_table();
+
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+        $max_seq = (int) $wpdb->get_var($wpdb->prepare(
+            "SELECT MAX(seq) FROM {$table} WHERE changed_at < %s",
+            $before
+        ));
+        if (!$max_seq) {
+            return 0;
+        }
+
+        // Record the cut-off first, so no reader is served a cursor whose entries are half deleted
+        update_option($this->pruned_seq_option, max($max_seq, $this->get_pruned_change_seq()), false);
+        $deleted = 0;
+        do {
+            // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+            $batch = (int) $wpdb->query($wpdb->prepare(
+                "DELETE FROM {$table} WHERE seq <= %d ORDER BY seq LIMIT 10000",
+                $max_seq
+            ));
+            $deleted += $batch;
+        } while ($batch === 10000);
+        return $deleted;
+    }
+
+    /**
+     * Full name of the changes table.
+     * @return string
+     */
+    private function get_changes_table() {
+        global $wpdb;
+        return $wpdb->prefix . ASSET_MANAGER_MVC_CHANGES_TABLE;
+    }
+
+    /**
+     * Full name of the index table.
+     * @return string
+     */
+    private function get_index_table() {
+        global $wpdb;
+        return $wpdb->prefix . ASSET_MANAGER_MVC_INDEX_TABLE;
+    }
+
+    /**
+     * Full name of the history table.
+     * @return string
+     */
+    private function get_history_table() {
+        global $wpdb;
+        return $wpdb->prefix . ASSET_MANAGER_MVC_HISTORY_TABLE;
+    }
+
+    /**
+     * Searches users for the assignee picker by login, nicename or display name prefix, and by
+     * email prefix if emails are included. Loads only ID, display name and email, and skips the
+     * total count.
+     * @param string $term Search term.
+     * @param int $page 1-based page number.
+     * @param int $per_page Users per page.
+     * @param bool $with_email Whether to search and return email addresses.
+     * @return array ['users' => [['id', 'display_name'(, 'email')]], 'more' => bool].
+     */
+    public function search_users($term, $page = 1, $per_page = 20, $with_email = false) {
+        $search_columns = $with_email
+            ? ['user_login', 'user_email', 'user_nicename', 'display_name']
+            : ['user_login', 'user_nicename', 'display_name'];
+        $users = get_users([
+            // Trailing wildcard only, so the user_login and user_email indexes can be used
+            'search' => trim($term, '*') . '*',
+            'search_columns' => $search_columns,
+            'fields' => ['ID', 'display_name', 'user_email'],
+            'orderby' => 'display_name',
+            'order' => 'ASC',
+            'number' => $per_page + 1, // One extra row tells whether another page exists
+            'offset' => (max(1, (int) $page) - 1) * $per_page,
+            'count_total' => false,
+        ]);
+
+        $more = count($users) > $per_page;
+        $results = [];
+        foreach (array_slice($users, 0, $per_page) as $user) {
+            $result = ['id' => (int) $user->ID, 'display_name' => $user->display_name];
+            if ($with_email) {
+                $result['email'] = $user->user_email;
+            }
+            $results[] = $result;
+        }
+        return ['users' => $results, 'more' => $more];
+    }
+
+    /**
+     * Resolves user display names with a single batched query.
+     * @param int[] $user_ids User IDs; zeros and duplicates are ignored.
+     * @return array Display names keyed by user ID. Users that no longer exist are missing.
+     */
+    public function get_user_display_names(array $user_ids) {
+        $user_ids = array_unique(array_filter(array_map('absint', $user_ids)));
+        if (empty($user_ids)) {
+            return [];
+        }
+        $user_names = [];
+        $users = get_users(['include' => $user_ids, 'fields' => ['ID', 'display_name']]);
+        foreach ($users as $user) {
+            $user_names[(int) $user->ID] = $user->display_name;
+        }
+        return $user_names;
+    }
+
+
+    /**
+     * Retrieves data for the dashboard charts.
+     *
+     * Reads the persisted rollup maintained by save_asset_data(), so the cost does not depend
+     * on the number of assets. The rollup is rebuilt from scratch if it is missing.
+     * @return array Data for status, user, and category charts.
+     */
+    public function get_dashboard_data() {
+        return $this->format_dashboard_counts($this->get_dashboard_rollup());
+    }
+
+    /**
+     * Returns the persisted dashboard rollup, rebuilding it when it is missing or outdated.
+     * @return array Raw counts as returned by aggregate_dashboard_counts(), plus 'built_at'.
+     */
+    public function get_dashboard_rollup() {
+        $rollup = get_option(ASSET_MANAGER_MVC_ROLLUP_OPTION);
+        if (!is_array($rollup) || !isset($rollup['status'], $rollup['users'], $rollup['categories'])) {
+            $this->rebuild_dashboard_rollup();
+            $rollup = get_option(ASSET_MANAGER_MVC_ROLLUP_OPTION);
+        }
+        return $rollup;
+    }
+
+    /**
+     * Recomputes the dashboard rollup from scratch and stores it.
+     *
+     * Incremental updates are read-modify-write on an option, so concurrent saves can make the
+     * stored counts drift; this compares the stored rollup with a fresh aggregation and repairs it.
+     * @return bool True if the stored rollup differed from the fresh counts (or did not exist).
+     */
+    public function rebuild_dashboard_rollup() {
+        $stored = get_option(ASSET_MANAGER_MVC_ROLLUP_OPTION);
+        $fresh = $this->aggregate_dashboard_counts();
+
+        $drifted = true;
+        if (is_array($stored)) {
+            unset($stored['built_at']);
+            $drifted = $this->normalize_rollup($stored) !== $this->normalize_rollup($fresh);
+        }
+
+        $fresh['built_at'] = current_time('mysql');
+        update_option(ASSET_MANAGER_MVC_ROLLUP_OPTION, $fresh, false);
+        return $drifted;
+    }
+
+    /**
+     * Discards the stored rollup so the next read rebuilds it.
+     */
+    public function invalidate_dashboard_rollup() {
+        delete_option(ASSET_MANAGER_MVC_ROLLUP_OPTION);
+    }
+
+    /**
+     * Adds or removes one asset's current values to/from the dashboard rollup.
+     * Used when an asset enters or leaves the published state.
+     * @param int $post_id The ID of the asset post.
+     * @param bool $add True to count the asset, false to stop counting it.
+     */
+    public function update_dashboard_membership($post_id, $add) {
+        $snapshot = $this->get_dashboard_snapshot($post_id);
+        $empty = ['total' => null, 'status' => null, 'issued_to' => null, 'category' => null];
+        $snapshot['total'] = true;
+        if ($add) {
+            $this->apply_dashboard_delta($empty, $snapshot);
+        } else {
+            $this->apply_dashboard_delta($snapshot, $empty);
+        }
+    }
+
+    /**
+     * Reads the values of an asset that contribute to the dashboard rollup.
+     * @param int $post_id The ID of the asset post.
+     * @return array ['status' => string, 'issued_to' => int, 'category' => int[]]
+     */
+    private function get_dashboard_snapshot($post_id) {
+        $terms = wp_get_post_terms($post_id, ASSET_MANAGER_MVC_TAXONOMY, ['fields' => 'ids']);
+        return [
+            'status' => (string) get_post_meta($post_id, ASSET_MANAGER_MVC_META_PREFIX . 'status', true),
+            'issued_to' => absint(get_post_meta($post_id, ASSET_MANAGER_MVC_META_PREFIX . 'issued_to', true)),
+            'category' => $this->sorted_term_ids((!empty($terms) && !is_wp_error($terms)) ? $terms : []),
+        ];
+    }
+
+    /**
+     * Normalizes the category term IDs of an asset for the rollup, which counts an asset under each of them.
+     * @param array $term_ids Term IDs; 0 entries are ignored.
+     * @return int[] Sorted unique IDs, or [0] for an uncategorized asset, as aggregate_dashboard_counts() counts it.
+     */
+    private function sorted_term_ids(array $term_ids) {
+        $term_ids = array_values(array_unique(array_filter(array_map('absint', $term_ids))));
+        sort($term_ids);
+        return $term_ids ? $term_ids : [0];
+    }
+
+    /**
+     * Moves counts in the stored rollup from the "before" values to the "after" values.
+     * A null value means the asset was not counted for that dimension on that side.
+     * Does nothing if no rollup is stored yet; it will be built on the next read.
+     * @param array $before Values before the change, keyed by 'total', 'status', 'issued_to', 'category'.
+     *                      'category' is a list of term IDs, as returned by sorted_term_ids().
+     * @param array $after Values after the change, same keys.
+     */
+    private function apply_dashboard_delta(array $before, array $after) {
+        $this->apply_dashboard_deltas([[$before, $after]]);
+    }
+
+    /**
+     * Applies the changes of many assets to the stored rollup with a single option write.
+     * @param array $deltas List of [before, after] pairs, as taken by apply_dashboard_delta().
+     */
+    private function apply_dashboard_deltas(array $deltas) {
+        $rollup = get_option(ASSET_MANAGER_MVC_ROLLUP_OPTION);
+        if (empty($deltas) || !is_array($rollup) || !isset($rollup['status'], $rollup['users'], $rollup['categories'])) {
+            return;
+        }
+
+        $dimensions = ['status' => 'status', 'issued_to' => 'users', 'category' => 'categories'];
+        $changed = false;
+
+        foreach ($deltas as list($before, $after)) {
+            if (isset($before['total']) !== isset($after['total'])) {
+                $rollup['total'] = max(0, (int) $rollup['total'] + (isset($after['total']) ? 1 : -1));
+                $changed = true;
+            }
+
+            foreach ($dimensions as $key => $bucket) {
+                $old = array_key_exists($key, $before) ? $before[$key] : null;
+                $new = array_key_exists($key, $after) ? $after[$key] : null;
+                if ($old === $new) {
+                    continue;
+                }
+                // An asset is counted once under each of its categories
+                $old_keys = ($old === null) ? [] : (array) $old;
+                $new_keys = ($new === null) ? [] : (array) $new;
+                foreach ($old_keys as $old_key) {
+                    $count = isset($rollup[$bucket][$old_key]) ? (int) $rollup[$bucket][$old_key] - 1 : 0;
+                    if ($count > 0) {
+                        $rollup[$bucket][$old_key] = $count;
+                    } else {
+                        unset($rollup[$bucket][$old_key]);
+                    }
+                }
+                foreach ($new_keys as $new_key) {
+                    $rollup[$bucket][$new_key] = (isset($rollup[$bucket][$new_key]) ? (int) $rollup[$bucket][$new_key] : 0) + 1;
+                }
+                $changed = true;
+            }
+        }
+
+        if ($changed) {
+            update_option(ASSET_MANAGER_MVC_ROLLUP_OPTION, $rollup, false);
+        }
+    }
+
+    /**
+     * Normalizes a rollup for comparison: drops zero counts and sorts keys.
+     * @param array $rollup Raw counts.
+     * @return array
+     */
+    private function normalize_rollup(array $rollup) {
+        $normalized = ['total' => isset($rollup['total']) ? (int) $rollup['total'] : 0];
+        foreach (['status', 'users', 'categories'] as $bucket) {
+            $counts = isset($rollup[$bucket]) ? array_map('intval', (array) $rollup[$bucket]) : [];
+            $counts = array_filter($counts);
+            ksort($counts);
+            $normalized[$bucket] = $counts;
+        }
+        return $normalized;
+    }
+
+    /**
+     * Aggregates raw dashboard counts for all published assets.
+     * @return array ['total' => int, 'status' => [value => count], 'users' => [user_id => count], 'categories' => [term_id => count]].
+     *               User ID 0 means unassigned, term ID 0 means uncategorized.
+     */
+    private function aggregate_dashboard_counts() {
+        global $wpdb;
+
+        $total = $this->count_published_assets();
+
+        $status_counts = $this->count_assets_by_meta('status');
+
+        $user_counts = [];
+        foreach ($this->count_assets_by_meta('issued_to') as $user_id => $count) {
+            $user_id = absint($user_id);
+            $user_counts[$user_id] = (isset($user_counts[$user_id]) ? $user_counts[$user_id] : 0) + $count;
+        }
+
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+        $category_rows = $wpdb->get_results($wpdb->prepare(
+            "SELECT tt.term_id, COUNT(DISTINCT tr.object_id) AS total
+             FROM {$wpdb->term_relationships} tr
+             INNER JOIN {$wpdb->term_taxonomy} tt ON tt.term_taxonomy_id = tr.term_taxonomy_id AND tt.taxonomy = %s
+             INNER JOIN {$wpdb->posts} p ON p.ID = tr.object_id
+             WHERE p.post_type = %s AND p.post_status = 'publish'
+             GROUP BY tt.term_id",
+            ASSET_MANAGER_MVC_TAXONOMY,
+            ASSET_MANAGER_MVC_POST_TYPE
+        ), ARRAY_A);
+
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+        $categorized = (int) $wpdb->get_var($wpdb->prepare(
+            "SELECT COUNT(DISTINCT tr.object_id)
+             FROM {$wpdb->term_relationships} tr
+             INNER JOIN {$wpdb->term_taxonomy} tt ON tt.term_taxonomy_id = tr.term_taxonomy_id AND tt.taxonomy = %s
+             INNER JOIN {$wpdb->posts} p ON p.ID = tr.object_id
+             WHERE p.post_type = %s AND p.post_status = 'publish'",
+            ASSET_MANAGER_MVC_TAXONOMY,
+            ASSET_MANAGER_MVC_POST_TYPE
+        ));
+
+        $category_counts = [0 => max(0, $total - $categorized)];
+        foreach ((array) $category_rows as $row) {
+            $category_counts[absint($row['term_id'])] = (int) $row['total'];
+        }
+
+        return [
+            'total' => $total,
+            'status' => $status_counts,
+            'users' => $user_counts,
+            'categories' => $category_counts,
+        ];
+    }
+
+    /**
+     * Returns a version string for the published inventory, used as a cache key for rendered exports.
+     *
+     * Derived from the asset count, the latest post_modified_gmt and the last recorded meta/term
+     * change, so it changes whenever an asset is added, removed, edited or re-categorised.
+     * @return string
+     */
+    public function get_inventory_version() {
+        global $wpdb;
+
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+        $row = $wpdb->get_row($wpdb->prepare(
+            "SELECT COUNT(*) AS total, MAX(post_modified_gmt) AS modified FROM {$wpdb->posts} WHERE post_type = %s AND post_status = 'publish'",
+            ASSET_MANAGER_MVC_POST_TYPE
+        ));
+        $last_change = (string) get_option($this->last_change_option, '');
+        return md5(implode('|', [$row ? $row->total : 0, $row ? $row->modified : '', $last_change]));
+    }
+
+    /**
+     * Records that asset data changed without necessarily touching post_modified.
+     */
+    public function touch_inventory() {
+        update_option($this->last_change_option, (string) microtime(true), false);
+    }
+
+    /**
+     * Counts published assets.
+     * @return int
+     */
+    public function count_published_assets() {
+        global $wpdb;
+
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+        return (int) $wpdb->get_var($wpdb->prepare(
+            "SELECT COUNT(*) FROM {$wpdb->posts} WHERE post_type = %s AND post_status = 'publish'",
+            ASSET_MANAGER_MVC_POST_TYPE
+        ));
+    }
+
+    /**
+     * Counts published assets grouped by the value of one meta field.
+     * Assets without the meta row are counted under the empty string.
+     * @param string $field_key Field key without the meta prefix.
+     * @return array [meta_value => count]
+     */
+    private function count_assets_by_meta($field_key) {
+        global $wpdb;
+
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+        $rows = $wpdb->get_results($wpdb->prepare(
+            "SELECT COALESCE(pm.meta_value, '') AS value_key, COUNT(DISTINCT p.ID) AS total
+             FROM {$wpdb->posts} p
+             LEFT JOIN {$wpdb->postmeta} pm ON pm.post_id = p.ID AND pm.meta_key = %s
+             WHERE p.post_type = %s AND p.post_status = 'publish'
+             GROUP BY value_key",
+            ASSET_MANAGER_MVC_META_PREFIX . $field_key,
+            ASSET_MANAGER_MVC_POST_TYPE
+        ), ARRAY_A);
+
+        $counts = [];
+        foreach ((array) $rows as $row) {
+            $counts[(string) $row['value_key']] = (int) $row['total'];
+        }
+        return $counts;
+    }
+
+    /**
+     * Turns raw dashboard counts into the labelled arrays expected by the dashboard charts.
+     * User display names are resolved with a single batched user query.
+     * @param array $counts Raw counts as returned by aggregate_dashboard_counts().
+     * @return array Data for status, user, and category charts.
+     */
+    private function format_dashboard_counts(array $counts) {
+        $status_data = [];
+        $user_data = [];
+        $category_data_counts = [];
+
+        // Initialize status data
+        foreach ($this->status_options as $status_opt) {
+            $status_data[$status_opt] = 0;
+        }
+        $status_data[__('Unknown', 'asset-manager-mvc')] = 0;
+
+        foreach ($counts['status'] as $status_val => $count) {
+            $status_val = (string) $status_val;
+            if ($status_val === '') {
+                $display_status = 'Unassigned';
+            } elseif (in_array($status_val, $this->status_options, true)) {
+                $display_status = $status_val;
+            } else {
+                $display_status = __('Unknown', 'asset-manager-mvc');
+            }
+            $status_data[$display_status] += $count;
+        }
+
+        // Users
+        $user_names = $this->get_user_display_names(array_keys($counts['users']));
+        $user_data[__('Unassigned', 'asset-manager-mvc')] = 0;
+        foreach ($counts['users'] as $user_id => $count) {
+            $user_name_key = __('Unassigned', 'asset-manager-mvc');
+            if ($user_id) {
+                $user_name_key = isset($user_names[$user_id]) ? esc_html($user_names[$user_id]) : sprintf(__('Unknown User (ID: %d)', 'asset-manager-mvc'), $user_id);
+            }
+            if (!isset($user_data[$user_name_key])) $user_data[$user_name_key] = 0;
+            $user_data[$user_name_key] += $count;
+        }
+
+        // Categories
+        $term_names = [];
+        $all_categories = get_terms(['taxonomy' => ASSET_MANAGER_MVC_TAXONOMY, 'hide_empty' => false]);
+        if (is_array($all_categories)) {
+            foreach ($all_categories as $cat_term) {
+                if (is_object($cat_term) && property_exists($cat_term, 'name')) {
+                    $term_names[(int) $cat_term->term_id] = esc_html($cat_term->name);
+                    $category_data_counts[esc_html($cat_term->name)] = 0;
+                }
+            }
+        }
+        $category_data_counts[__('Uncategorized', 'asset-manager-mvc')] = 0;
+        foreach ($counts['categories'] as $term_id => $count) {
+            $category_name_key = isset($term_names[$term_id]) ? $term_names[$term_id] : __('Uncategorized', 'asset-manager-mvc');
+            $category_data_counts[$category_name_key] += $count;
+        }
+
+        return [
+            'status' => array_filter($status_data, function($count){ return $count >= 0; }),
+            'users' => array_filter($user_data, function($count){ return $count > 0; }),
+            'categories' => array_filter($category_data_counts, function($count){ return $count > 0; })
+        ];
+    }
+
+    /**
+     * Iterates over all published assets for export in fixed-size batches.
+     *
+     * Each batch is fetched with keyset pagination and its meta, categories and assignees are
+     * loaded with one query each, so memory use is bounded by the batch size.
+     * @param int $batch_size Number of assets per batch.
+     * @param array|null $cursor Position to resume after, as returned in 'cursor' of a batch.
+     * @param string $order 'title' (title, then ID) or 'id'. Ordering by ID walks the primary key and is cheapest.
+     * @return \\Generator Yields ['rows' => array, 'cursor' => array] per batch.
+     */
+    public function iterate_assets_for_export($batch_size = 200, $cursor = null, $order = 'title') {
+        do {
+            $posts = $this->get_asset_posts_after($cursor, $batch_size, $order);
+            if (empty($posts)) {
+                break;
+            }
+            $last = end($posts);
+            $cursor = ['title' => $last->post_title, 'modified' => $last->post_modified_gmt, 'id' => (int) $last->ID];
+            yield ['rows' => $this->get_assets_data($posts), 'cursor' => $cursor];
+        } while (count($posts) === $batch_size);
+    }
+
+    /**
+     * Fetches the next page of published assets after a cursor.
+     * @param array|null $cursor ['title' => string, 'modified' => string, 'id' => int] or null to start from the beginning.
+     *                           Only the keys used by $order are read.
+     * @param int $limit Maximum number of posts to return.
+     * @param string $order 'title', 'id' or 'modified' (post_modified_gmt, then ID).
+     * @param string $modified_after Optional GMT datetime ('Y-m-d H:i:s'); only assets modified later are returned.
+     * @param int[] $include Optional post IDs to restrict the result to.
+     * @return array Rows with ID, post_title, post_modified and post_modified_gmt.
+     */
+    public function get_asset_posts_after($cursor, $limit, $order = 'title', $modified_after = '', array $include = []) {
+        global $wpdb;
+
+        $sql = "SELECT ID, post_title, post_modified, post_modified_gmt FROM {$wpdb->posts} WHERE post_type = %s AND post_status = 'publish'";
+        $args = [ASSET_MANAGER_MVC_POST_TYPE];
+        $include = array_filter(array_map('absint', $include));
+        if ($include) {
+            $sql .= ' AND ID IN (' . implode(',', $include) . ')';
+        }
+        if ($modified_after !== '') {
+            $sql .= ' AND post_modified_gmt > %s';
+            $args[] = $modified_after;
+        }
+        if ($order === 'modified') {
+            if (is_array($cursor)) {
+                $sql .= ' AND (post_modified_gmt > %s OR (post_modified_gmt = %s AND ID > %d))';
+                array_push($args, $cursor['modified'], $cursor['modified'], $cursor['id']);
+            }
+            $sql .= ' ORDER BY post_modified_gmt ASC, ID ASC';
+        } elseif ($order === 'id') {
+            if (is_array($cursor)) {
+                $sql .= ' AND ID > %d';
+                $args[] = $cursor['id'];
+            }
+            $sql .= ' ORDER BY ID ASC';
+        } else {
+            if (is_array($cursor)) {
+                $sql .= ' AND (post_title > %s OR (post_title = %s AND ID > %d))';
+                array_push($args, $cursor['title'], $cursor['title'], $cursor['id']);
+            }
+            $sql .= ' ORDER BY post_title ASC, ID ASC';
+        }
+        $sql .= ' LIMIT %d';
+        $args[] = absint($limit);
+
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching, WordPress.DB.PreparedSQL.NotPrepared
+        return $wpdb->get_results($wpdb->prepare($sql, $args));
+    }
+
+    /**
+     * Loads meta, category names and assignee names for a set of asset posts.
+     *
+     * Uses one query for meta, one for terms and one for users regardless of the number of posts,
+     * and bypasses the object cache so repeated batches do not accumulate in memory.
+     * @param array $posts Post rows or objects with ID and post_title.
+     * @return array Rows keyed by post ID: ['ID', 'title', 'modified', 'meta' => [field => value], 'categories' => [names], 'category_ids' => [term IDs], 'issued_to_name'].
+     */
+    public function get_assets_data(array $posts) {
+        global $wpdb;
+
+        $rows = [];
+        foreach ($posts as $post) {
+            $post_id = (int) $post->ID;
+            $rows[$post_id] = [
+                'ID' => $post_id,
+                'title' => $post->post_title,
+                'modified' => isset($post->post_modified) ? $post->post_modified : '',
+                'meta' => array_fill_keys($this->fields, ''),
+                'categories' => [],
+                'category_ids' => [],
+                'issued_to_name' => '',
+            ];
+        }
+        if (empty($rows)) {
+            return $rows;
+        }
+
+        $ids_sql = implode(',', array_keys($rows));
+        $meta_keys = [];
+        foreach ($this->fields as $field_key) {
+            $meta_keys[] = ASSET_MANAGER_MVC_META_PREFIX . $field_key;
+        }
+        $key_placeholders = implode(',', array_fill(0, count($meta_keys), '%s'));
+
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching, WordPress.DB.PreparedSQL.InterpolatedNotPrepared
+        $meta_rows = $wpdb->get_results($wpdb->prepare(
+            "SELECT post_id, meta_key, meta_value FROM {$wpdb->postmeta} WHERE post_id IN ({$ids_sql}) AND meta_key IN ({$key_placeholders}) ORDER BY meta_id ASC",
+            $meta_keys
+        ));
+        $prefix_length = strlen(ASSET_MANAGER_MVC_META_PREFIX);
+        foreach ((array) $meta_rows as $meta_row) {
+            $field_key = substr($meta_row->meta_key, $prefix_length);
+            // Keep the first value, as get_post_meta($id, $key, true) does
+            if ($rows[$meta_row->post_id]['meta'][$field_key] === '') {
+                $rows[$meta_row->post_id]['meta'][$field_key] = $meta_row->meta_value;
+            }
+        }
+
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching, WordPress.DB.PreparedSQL.InterpolatedNotPrepared
+        $term_rows = $wpdb->get_results($wpdb->prepare(
+            "SELECT tr.object_id, t.term_id, t.name
+             FROM {$wpdb->term_relationships} tr
+             INNER JOIN {$wpdb->term_taxonomy} tt ON tt.term_taxonomy_id = tr.term_taxonomy_id
+             INNER JOIN {$wpdb->terms} t ON t.term_id = tt.term_id
+             WHERE tt.taxonomy = %s AND tr.object_id IN ({$ids_sql})
+             ORDER BY t.name ASC",
+            ASSET_MANAGER_MVC_TAXONOMY
+        ));
+        foreach ((array) $term_rows as $term_row) {
+            $rows[$term_row->object_id]['categories'][] = $term_row->name;
+            $rows[$term_row->object_id]['category_ids'][] = (int) $term_row->term_id;
+        }
+
+        $user_ids = array_unique(array_filter(array_map(function($row) {
+            return absint($row['meta']['issued_to']);
+        }, $rows)));
+        if (!empty($user_ids)) {
+            $user_names = [];
+            foreach (get_users(['include' => $user_ids, 'fields' => ['ID', 'display_name']]) as $user) {
+                $user_names[(int) $user->ID] = $user->display_name;
+            }
+            foreach ($rows as $post_id => $row) {
+                $user_id = absint($row['meta']['issued_to']);
+                if ($user_id) {
+                    $rows[$post_id]['issued_to_name'] = isset($user_names[$user_id]) ? $user_names[$user_id] : __('Unknown User', 'asset-manager-mvc');
+                }
+            }
+        }
+
+        return $rows;
+    }
+}
+"""
+
+# Model Class: includes/models/class-export-job-model.php
+export_job_model_php_content = """<?php
+// File: includes/models/class-export-job-model.php
+
+namespace AssetManagerMvc\\Models;
+
+if (!defined('ABSPATH')) exit;
+
+/**
+ * Export_Job_Model Class
+ *
+ * Persists background export jobs: their progress, checkpoint and output files.
+ * Each export kind (e.g. 'pdf') has at most one job at a time, stored in an option.
+ */
+class Export_Job_Model {
+
+    private $option_prefix = 'asset_manager_mvc_export_job_';
+
+    private $lock_prefix = 'asset_manager_mvc_export_lock_';
+
+    private $active_statuses = ['queued', 'running', 'merging'];
+
+    /**
+     * Retrieves the current job for an export kind.
+     * @param string $key The job key.
+     * @return array|null The job state, or null if there is none.
+     */
+    public function get_job($key) {
+        $job = get_option($this->option_prefix . $key);
+        return is_array($job) ? $job : null;
+    }
+
+    /**
+     * Whether a job still has work left.
+     * @param array $job The job state.
+     * @return bool
+     */
+    public function is_active(array $job) {
+        return in_array($job['status'], $this->active_statuses, true);
+    }
+
+    /**
+     * Returns the running job for an export kind, or queues a new one.
+     *
+     * Concurrent requests for the same export join the job that is already queued or running
+     * instead of starting a second one. A finished or failed job is replaced, and its files removed.
+     * @param string $key The job key.
+     * @param int $total Number of assets the job is expected to process (for progress only).
+     * @param string $version Inventory version the export is rendered from.
+     * @return array|null The job state, or null if another request is creating it right now.
+     */
+    public function start_or_join($key, $total, $version = '') {
+        $job = $this->get_job($key);
+        if ($job && $this->is_active($job)) {
+            return $job;
+        }
+
+        if (!$this->acquire_lock($key . '_start', 30)) {
+            return $this->get_job($key);
+        }
+
+        // Re-read under the lock: another request may have queued the job meanwhile
+        wp_cache_delete($this->option_prefix . $key, 'options');
+        $job = $this->get_job($key);
+        if (!$job || !$this->is_active($job)) {
+            if ($job) {
+                $this->delete_files($job, true);
+            }
+            $job = $this->save_job([
+                'id' => wp_generate_password(20, false),
+                'key' => $key,
+                'status' => 'queued',
+                'total' => (int) $total,
+                'version' => (string) $version,
+                'processed' => 0,
+                'cursor' => null,
+                'parts' => [],
+                'merge_part' => 0,
+                'merge_page' => 1,
+                'volumes' => [],
+                'file' => '',
+                'error' => '',
+                'requested_by' => get_current_user_id(),
+                'created_at' => current_time('mysql'),
+                'finished_at' => '',
+            ]);
+        }
+
+        $this->release_lock($key . '_start');
+        return $job;
+    }
+
+    /**
+     * Returns the finished job if its output was rendered from the given inventory version.
+     * @param string $key The job key.
+     * @param string $version Current inventory version.
+     * @return array|null The job state, or null if there is no usable cached output.
+     */
+    public function get_cached_job($key, $version) {
+        $job = $this->get_job($key);
+        if (!$job || $job['status'] !== 'done' || empty($job['version']) || $job['version'] !== $version) {
+            return null;
+        }
+        return is_readable($this->get_file_path($job, $job['file'])) ? $job : null;
+    }
+
+    /**
+     * Stores a job's state.
+     * @param array $job The job state.
+     * @return array The stored state.
+     */
+    public function save_job(array $job) {
+        $job['updated_at'] = current_time('mysql');
+        update_option($this->option_prefix . $job['key'], $job, false);
+        return $job;
+    }
+
+    /**
+     * Absolute path of a file belonging to a job. File names are prefixed with the random job ID.
+     * @param array $job The job state.
+     * @param string $name File name within the job, e.g. 'part-00001.pdf'.
+     * @return string
+     */
+    public function get_file_path(array $job, $name) {
+        return $this->get_export_dir() . $job['id'] . '-' . sanitize_file_name($name);
+    }
+
+    /**
+     * Deletes a job's part and volume files and, optionally, its finished file.
+     * @param array $job The job state.
+     * @param bool $include_final Whether to delete the finished export as well.
+     */
+    public function delete_files(array $job, $include_final) {
+        $names = isset($job['parts']) ? (array) $job['parts'] : [];
+        if (!empty($job['volumes'])) {
+            $names = array_merge($names, (array) $job['volumes']);
+        }
+        if ($include_final && !empty($job['file'])) {
+            $names[] = $job['file'];
+        }
+        foreach ($names as $name) {
+            $path = $this->get_file_path($job, $name);
+            if (file_exists($path)) {
+                wp_delete_file($path);
+            }
+        }
+    }
+
+    /**
+     * Directory for export output under uploads, created on first use and closed to direct access.
+     * Files are only served through the download handler, which checks capabilities.
+     * @return string Absolute path with trailing slash.
+     */
+    public function get_export_dir() {
+        $upload_dir = wp_upload_dir();
+        $dir = trailingslashit($upload_dir['basedir']) . 'asset-manager-mvc/exports/';
+        if (!is_dir($dir)) {
+            wp_mkdir_p($dir);
+            file_put_contents($dir . 'index.php', '<?php // Silence is golden.');
+            file_put_contents($dir . '.htaccess', "Deny from all\\n");
+        }
+        return $dir;
+    }
+
+    /**
+     * Writable temporary directory for mPDF.
+     * @return string
+     */
+    public function get_temp_dir() {
+        $dir = $this->get_export_dir() . 'tmp';
+        if (!is_dir($dir)) {
+            wp_mkdir_p($dir);
+        }
+        return $dir;
+    }
+
+    /**
+     * Acquires a named lock, modelled on WP_Upgrader::create_lock().
+     * @param string $name Lock name.
+     * @param int $ttl Seconds after which the lock is considered stale.
+     * @return bool Whether the lock was acquired.
+     */
+    public function acquire_lock($name, $ttl) {
+        global $wpdb;
+        $option = $this->lock_prefix . $name;
+
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+        $created = $wpdb->query($wpdb->prepare(
+            "INSERT IGNORE INTO {$wpdb->options} (option_name, option_value, autoload) VALUES (%s, %s, 'no')",
+            $option,
+            time()
+        ));
+        if (!$created) {
+            // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+            $locked_at = (int) $wpdb->get_var($wpdb->prepare(
+                "SELECT option_value FROM {$wpdb->options} WHERE option_name = %s",
+                $option
+            ));
+            if ($locked_at > time() - $ttl) {
+                return false;
+            }
+            // Stale lock: take it over
+            update_option($option, time(), false);
+        }
+        return true;
+    }
+
+    /**
+     * Releases a named lock.
+     * @param string $name Lock name.
+     */
+    public function release_lock($name) {
+        delete_option($this->lock_prefix . $name);
+    }
+}
+"""
+
+# Setup Controller: includes/controllers/class-setup-controller.php
+setup_controller_php_content = """<?php
+// File: includes/controllers/class-setup-controller.php
+
+namespace AssetManagerMvc\\Controllers;
+
+if (!defined('ABSPATH')) exit;
+
+/**
+ * Setup_Controller Class
+ *
+ * Handles plugin setup tasks like CPT and taxonomy registration.
+ */
+class Setup_Controller {
+
+    /**
+     * Registers WordPress hooks.
+     */
+    public function register_hooks() {
+        add_action('init', [$this, 'register_asset_post_type']);
+        add_action('init', [$this, 'register_asset_taxonomy']);
+        // add_action('init', [$this, 'register_shortcodes']); // Placeholder
     }
 
     /**
      * Plugin activation tasks.
      */
-    public function activate() {
-        // Ensure CPT and taxonomy are registered before flushing rewrite rules
-        $this->register_asset_post_type();
-        $this->register_asset_taxonomy();
-        // flush_rewrite_rules(); // Done in main plugin file's activation hook
+    public function activate() {
+        // Ensure CPT and taxonomy are registered before flushing rewrite rules
+        $this->register_asset_post_type();
+        $this->register_asset_taxonomy();
+        // flush_rewrite_rules(); // Done in main plugin file's activation hook
+
+        // Daily drift check for the dashboard rollup counters
+        if (!wp_next_scheduled(ASSET_MANAGER_MVC_ROLLUP_CRON_HOOK)) {
+            wp_schedule_event(time() + DAY_IN_SECONDS, 'daily', ASSET_MANAGER_MVC_ROLLUP_CRON_HOOK);
+        }
+    }
+
+    /**
+     * Registers the 'asset_mvc' custom post type.
+     */
+    public function register_asset_post_type() {
+        $labels = [
+            'name' => _x('Assets (MVC)', 'post type general name', 'asset-manager-mvc'),
+            'singular_name' => _x('Asset (MVC)', 'post type singular name', 'asset-manager-mvc'),
+            'menu_name' => _x('Assets (MVC)', 'admin menu', 'asset-manager-mvc'),
+            'name_admin_bar' => _x('Asset (MVC)', 'add new on admin bar', 'asset-manager-mvc'),
+            'add_new' => _x('Add New', 'asset', 'asset-manager-mvc'),
+            'add_new_item' => __('Add New Asset', 'asset-manager-mvc'),
+            'new_item' => __('New Asset', 'asset-manager-mvc'),
+            'edit_item' => __('Edit Asset', 'asset-manager-mvc'),
+            'view_item' => __('View Asset', 'asset-manager-mvc'),
+            'all_items' => __('All Assets', 'asset-manager-mvc'),
+            'search_items' => __('Search Assets', 'asset-manager-mvc'),
+            'parent_item_colon' => __('Parent Assets:', 'asset-manager-mvc'),
+            'not_found' => __('No assets found.', 'asset-manager-mvc'),
+            'not_found_in_trash' => __('No assets found in Trash.', 'asset-manager-mvc'),
+            'attributes' => __( 'Asset Attributes', 'asset-manager-mvc' ),
+        ];
+        $args = [
+            'labels' => $labels,
+            'public' => false, // Typically false for internal management CPTs
+            'show_ui' => true,
+            'show_in_menu' => true,
+            'query_var' => true,
+            'rewrite' => ['slug' => ASSET_MANAGER_MVC_POST_TYPE],
+            'capability_type' => 'post',
+            'has_archive' => false,
+            'hierarchical' => false,
+            'menu_position' => 20,
+            'supports' => ['title'], // Custom fields will handle other data
+            'menu_icon' => 'dashicons-archive',
+            'show_in_rest' => true, // For Gutenberg / Block Editor compatibility
+        ];
+        register_post_type(ASSET_MANAGER_MVC_POST_TYPE, $args);
+    }
+
+    /**
+     * Registers the 'asset_category_mvc' custom taxonomy.
+     */
+    public function register_asset_taxonomy() {
+        $labels = [
+            'name' => _x('Asset Categories (MVC)', 'taxonomy general name', 'asset-manager-mvc'),
+            'singular_name' => _x('Asset Category (MVC)', 'taxonomy singular name', 'asset-manager-mvc'),
+            'search_items' => __('Search Asset Categories', 'asset-manager-mvc'),
+            'all_items' => __('All Asset Categories', 'asset-manager-mvc'),
+            'parent_item' => __('Parent Asset Category', 'asset-manager-mvc'),
+            'parent_item_colon' => __('Parent Asset Category:', 'asset-manager-mvc'),
+            'edit_item' => __('Edit Asset Category', 'asset-manager-mvc'),
+            'update_item' => __('Update Asset Category', 'asset-manager-mvc'),
+            'add_new_item' => __('Add New Asset Category', 'asset-manager-mvc'),
+            'new_item_name' => __('New Asset Category Name', 'asset-manager-mvc'),
+            'menu_name' => __('Categories', 'asset-manager-mvc'),
+        ];
+        $args = [
+            'hierarchical' => true,
+            'labels' => $labels,
+            'show_ui' => true,
+            'show_admin_column' => true,
+            'query_var' => true,
+            'rewrite' => ['slug' => ASSET_MANAGER_MVC_TAXONOMY],
+            'show_in_rest' => true,
+        ];
+        register_taxonomy(ASSET_MANAGER_MVC_TAXONOMY, ASSET_MANAGER_MVC_POST_TYPE, $args);
+    }
+
+    // public function register_shortcodes() { /* Placeholder for future shortcodes */ }
+}
+"""
+
+# Asset Controller: includes/controllers/class-asset-controller.php
+asset_controller_php_content = """<?php
+// File: includes/controllers/class-asset-controller.php
+
+namespace AssetManagerMvc\\Controllers;
+
+use AssetManagerMvc\\Models\\Asset_Model;
+
+if (!defined('ABSPATH')) exit;
+
+/**
+ * Asset_Controller Class
+ *
+ * Handles asset creation, editing, display, and admin list customizations.
+ */
+class Asset_Controller {
+
+    /**
+     * Asset Model instance.
+     * @var Asset_Model
+     */
+    private $asset_model;
+
+    /**
+     * Column values for the rows on the current list table page, keyed by post ID.
+     * @var array
+     */
+    private $list_rows = [];
+
+    /**
+     * Maximum number of users returned per assignee search request.
+     * @var int
+     */
+    private $user_search_per_page = 20;
+
+    /**
+     * Minimum search term length before the assignee search queries users.
+     * @var int
+     */
+    private $user_search_min_chars = 2;
+
+    /**
+     * Constructor.
+     * @param Asset_Model $asset_model Instance of the Asset Model.
+     */
+    public function __construct(Asset_Model $asset_model) {
+        $this->asset_model = $asset_model;
+    }
+
+    /**
+     * Registers WordPress hooks.
+     */
+    public function register_hooks() {
+        add_action('add_meta_boxes', [$this, 'register_meta_boxes']);
+        add_action('save_post_' . ASSET_MANAGER_MVC_POST_TYPE, [$this, 'handle_save_asset'], 10, 2);
+        add_action('transition_post_status', [$this, 'handle_status_transition'], 10, 3);
+        add_action('before_delete_post', [$this, 'handle_before_delete_asset']);
+        add_action('delete_' . ASSET_MANAGER_MVC_TAXONOMY, [$this->asset_model, 'invalidate_dashboard_rollup']);
+        add_action('delete_' . ASSET_MANAGER_MVC_TAXONOMY, [$this->asset_model, 'touch_inventory']);
+        add_action('delete_' . ASSET_MANAGER_MVC_TAXONOMY, [$this->asset_model, 'clear_index_category']);
+        add_action('edited_' . ASSET_MANAGER_MVC_TAXONOMY, [$this->asset_model, 'touch_inventory']);
+        add_action('edited_' . ASSET_MANAGER_MVC_TAXONOMY, [$this->asset_model, 'log_term_change']);
+        add_action('delete_' . ASSET_MANAGER_MVC_TAXONOMY, [$this->asset_model, 'log_term_change'], 10, 4);
+        
+        add_filter('manage_' . ASSET_MANAGER_MVC_POST_TYPE . '_posts_columns', [$this, 'customize_admin_columns']);
+        add_filter('manage_edit-' . ASSET_MANAGER_MVC_POST_TYPE . '_sortable_columns', [$this, 'register_sortable_columns']);
+        add_action('restrict_manage_posts', [$this, 'render_list_filters']);
+        add_action('restrict_manage_posts', [$this, 'render_bulk_update_fields']);
+        add_filter('bulk_actions-edit-' . ASSET_MANAGER_MVC_POST_TYPE, [$this, 'register_bulk_actions']);
+        add_filter('handle_bulk_actions-edit-' . ASSET_MANAGER_MVC_POST_TYPE, [$this, 'handle_bulk_update'], 10, 3);
+        add_filter('removable_query_args', [$this, 'register_removable_query_args']);
+        add_filter('posts_clauses', [$this, 'filter_list_query_clauses'], 10, 2);
+        add_filter('posts_search', [$this, 'filter_list_query_search'], 10, 2);
+        add_filter('the_posts', [$this, 'prime_list_table_rows'], 10, 2);
+        add_action('manage_' . ASSET_MANAGER_MVC_POST_TYPE . '_posts_custom_column', [$this, 'render_custom_column_content'], 10, 2);
+        
+        add_action('admin_enqueue_scripts', [$this, 'enqueue_admin_assets']);
+        add_action('admin_notices', [$this, 'display_admin_notices']);
+        add_action('admin_notices', [$this, 'display_bulk_update_notice']);
+        add_action('wp_ajax_am_mvc_search_users', [$this, 'ajax_search_users']);
+    }
+
+    /**
+     * Enqueues admin scripts and styles.
+     */
+    public function enqueue_admin_assets($hook) {
+        global $post_type, $pagenow;
+
+        // The list table needs the user search too, for the bulk assignee field
+        $is_asset_cpt_screen = ($post_type === ASSET_MANAGER_MVC_POST_TYPE && in_array($pagenow, ['post.php', 'post-new.php', 'edit.php']));
+
+        if ($is_asset_cpt_screen) {
+            wp_enqueue_style(
+                'asset-manager-mvc-admin-css',
+                ASSET_MANAGER_MVC_URL . 'assets/css/asset-manager-admin.css',
+                [],
+                ASSET_MANAGER_MVC_VERSION
+            );
+            wp_enqueue_script(
+                'asset-manager-mvc-admin-js',
+                ASSET_MANAGER_MVC_URL . 'assets/js/asset-manager-admin.js',
+                ['jquery'],
+                ASSET_MANAGER_MVC_VERSION,
+                true
+            );
+            wp_localize_script('asset-manager-mvc-admin-js', 'assetManagerAdminData', [
+                'ajaxUrl' => admin_url('admin-ajax.php'),
+                'nonce' => wp_create_nonce('am_mvc_search_users_nonce'),
+                'minChars' => $this->user_search_min_chars,
+                'debounce' => 300,
+                'i18n' => [
+                    'noResults' => __('No users found.', 'asset-manager-mvc'),
+                    'more' => __('Show more users…', 'asset-manager-mvc'),
+                ],
+            ]);
+             // Add this to your asset-manager-admin.css:
+             // .asset-fields .required { color: red; margin-left: 2px; }
+        }
+    }
+
+    /**
+     * AJAX handler for the assignee picker: returns one page of users matching a search term.
+     */
+    public function ajax_search_users() {
+        check_ajax_referer('am_mvc_search_users_nonce', 'nonce');
+        $post_type = get_post_type_object(ASSET_MANAGER_MVC_POST_TYPE);
+        $can_list_users = current_user_can('list_users');
+        if (!$can_list_users && !($post_type && current_user_can($post_type->cap->edit_posts))) {
+            wp_send_json_error(['message' => __('You do not have sufficient permissions to search users.', 'asset-manager-mvc')], 403);
+        }
+
+        $term = isset($_GET['term']) ? trim(sanitize_text_field(wp_unslash($_GET['term']))) : '';
+        $page = isset($_GET['page']) ? max(1, absint($_GET['page'])) : 1;
+        if (mb_strlen($term) < $this->user_search_min_chars) {
+            wp_send_json_success(['users' => [], 'more' => false]);
+        }
+
+        // Editors may pick assignees, but only users who may list users see their email addresses
+        wp_send_json_success($this->asset_model->search_users($term, $page, $this->user_search_per_page, $can_list_users));
+    }
+
+    /**
+     * Registers meta boxes for the asset post type.
+     */
+    public function register_meta_boxes() {
+        add_meta_box(
+            ASSET_MANAGER_MVC_META_PREFIX . 'details',
+            __('Asset Details', 'asset-manager-mvc'),
+            [$this, 'render_asset_fields_meta_box_view'],
+            ASSET_MANAGER_MVC_POST_TYPE,
+            'normal',
+            'high'
+        );
+        add_meta_box(
+            ASSET_MANAGER_MVC_META_PREFIX . 'history',
+            __('Asset History', 'asset-manager-mvc'),
+            [$this, 'render_history_meta_box_view'],
+            ASSET_MANAGER_MVC_POST_TYPE,
+            'normal',
+            'default'
+        );
+    }
+
+    /**
+     * Renders the asset fields meta box by loading the view.
+     * @param \\WP_Post $post The current post object.
+     */
+    public function render_asset_fields_meta_box_view($post) {
+        wp_nonce_field(ASSET_MANAGER_MVC_META_PREFIX . 'save_details_nonce', ASSET_MANAGER_MVC_META_PREFIX . 'details_nonce');
+        
+        $data['meta_values'] = $this->asset_model->get_asset_meta($post->ID);
+        // Only the current assignee is preloaded; others are found through the AJAX user search
+        $issued_to = absint($data['meta_values']['issued_to']);
+        $data['issued_to_user'] = $issued_to ? (get_userdata($issued_to) ?: null) : null;
+        $data['categories'] = get_terms(['taxonomy' => ASSET_MANAGER_MVC_TAXONOMY, 'hide_empty' => false]);
+        $data['field_definitions'] = $this->asset_model->get_fields(); // e.g. ['asset_tag', 'model', ...]
+        $data['field_labels'] = $this->asset_model->get_field_labels();
+        $data['status_options'] = $this->asset_model->get_status_options();
+        $data['meta_prefix'] = ASSET_MANAGER_MVC_META_PREFIX;
+        $data['taxonomy_slug'] = ASSET_MANAGER_MVC_TAXONOMY;
+
+        // Load the view
+        $this->load_view('admin/asset-fields-meta-box', $data);
+    }
+
+    /**
+     * Renders the asset history meta box by loading the view.
+     * @param \\WP_Post $post The current post object.
+     */
+    public function render_history_meta_box_view($post) {
+        $per_page = 20;
+        $page = isset($_GET['history_page']) ? max(1, absint($_GET['history_page'])) : 1;
+        $history = $this->asset_model->get_asset_history($post->ID, $page, $per_page);
+
+        $data['history_entries'] = $history['entries'];
+        $data['history_page'] = $page;
+        $data['history_pages'] = (int) ceil($history['total'] / $per_page);
+        $data['user_names'] = $this->asset_model->get_user_display_names(wp_list_pluck($history['entries'], 'user'));
+        $data['date_format'] = get_option('date_format') . ' @ ' . get_option('time_format');
+        $this->load_view('admin/asset-history-meta-box', $data);
+    }
+
+    /**
+     * Handles saving asset meta data.
+     * @param int $post_id The ID of the post being saved.
+     * @param \\WP_Post $post The post object.
+     */
+    public function handle_save_asset($post_id, $post) {
+        // Verify nonce
+        if (!isset($_POST[ASSET_MANAGER_MVC_META_PREFIX . 'details_nonce']) || !wp_verify_nonce($_POST[ASSET_MANAGER_MVC_META_PREFIX . 'details_nonce'], ASSET_MANAGER_MVC_META_PREFIX . 'save_details_nonce')) {
+            return;
+        }
+        // Check user permissions
+        if (!current_user_can('edit_post', $post_id)) {
+            return;
+        }
+        // Ignore autosaves
+        if (defined('DOING_AUTOSAVE') && DOING_AUTOSAVE) {
+            return;
+        }
+        // Ensure it's our CPT
+        if ($post->post_type !== ASSET_MANAGER_MVC_POST_TYPE) {
+            return;
+        }
+
+        $errors = $this->asset_model->validate_asset_data($_POST);
+        
+        if (!empty($errors)) {
+            // Store errors in a transient to display after redirect
+            set_transient('asset_manager_errors_' . $post_id . '_' . get_current_user_id(), $errors, 45);
+            // Prevent WordPress from showing its default "Post updated" message
+            add_filter('redirect_post_location', function($location) use ($post_id) {
+                if (get_transient('asset_manager_errors_' . $post_id . '_' . get_current_user_id())) {
+                    // Remove the 'message' query arg from the redirect URL
+                    return remove_query_arg('message', $location);
+                }
+                return $location;
+            }, 99); // High priority to run late
+            return; // Stop further processing
+        }
+
+        // Save data using the model
+        $this->asset_model->save_asset_data($post_id, $_POST);
+
+        // Update post title if it's empty or default, based on asset tag
+        $post_obj = get_post($post_id);
+        if ($post_obj && (empty($post_obj->post_title) || $post_obj->post_title === __('Auto Draft') || $post_obj->post_title === '')) {
+            $asset_tag_val = get_post_meta($post_id, ASSET_MANAGER_MVC_META_PREFIX . 'asset_tag', true);
+            $new_title = !empty($asset_tag_val) ? sprintf(__('Asset: %s', 'asset-manager-mvc'), $asset_tag_val) : sprintf(__('Asset #%d', 'asset-manager-mvc'), $post_id);
+            
+            // Temporarily remove this action to prevent recursion
+            remove_action('save_post_' . ASSET_MANAGER_MVC_POST_TYPE, [$this, 'handle_save_asset'], 10);
+            wp_update_post(['ID' => $post_id, 'post_title' => $new_title]);
+            // Re-add the action
+            add_action('save_post_' . ASSET_MANAGER_MVC_POST_TYPE, [$this, 'handle_save_asset'], 10, 2);
+        }
+    }
+
+    /**
+     * Keeps the dashboard rollup in step when an asset enters or leaves the published state.
+     * Runs before save_post, so the counted values are those stored before the form is saved.
+     * @param string $new_status New post status.
+     * @param string $old_status Old post status.
+     * @param \\WP_Post $post The post object.
+     */
+    public function handle_status_transition($new_status, $old_status, $post) {
+        if ($post->post_type !== ASSET_MANAGER_MVC_POST_TYPE) {
+            return;
+        }
+        $was_published = ($old_status === 'publish');
+        $is_published = ($new_status === 'publish');
+        if ($was_published !== $is_published) {
+            $this->asset_model->update_dashboard_membership($post->ID, $is_published);
+            $this->asset_model->log_changes([$post->ID], $is_published ? 'published' : 'unpublished');
+        }
+    }
+
+    /**
+     * Removes a published asset from the dashboard rollup before it is deleted permanently.
+     * @param int $post_id The ID of the post being deleted.
+     */
+    public function handle_before_delete_asset($post_id) {
+        $post = get_post($post_id);
+        if (!$post || $post->post_type !== ASSET_MANAGER_MVC_POST_TYPE) {
+            return;
+        }
+        if ($post->post_status === 'publish') {
+            $this->asset_model->update_dashboard_membership($post_id, false);
+        }
+        $this->asset_model->delete_asset_history($post_id);
+        $this->asset_model->delete_asset_index($post_id);
+        $this->asset_model->log_changes([$post_id], 'deleted');
+    }
+
+    /**
+     * Displays admin notices for validation errors.
+     */
+    public function display_admin_notices() {
+        global $pagenow, $post;
+        if (($pagenow == 'post.php' || $pagenow == 'post-new.php') && isset($post->post_type) && $post->post_type == ASSET_MANAGER_MVC_POST_TYPE) {
+            $transient_key = 'asset_manager_errors_' . $post->ID . '_' . get_current_user_id();
+            $errors = get_transient($transient_key);
+
+            if (!empty($errors) && is_array($errors)) {
+                $data['errors'] = $errors;
+                $this->load_view('admin/notices/validation-errors', $data);
+                delete_transient($transient_key); // Clear after displaying
+            }
+        }
+    }
+
+    /**
+     * Customizes the columns in the admin list table for assets.
+     * @param array $columns Existing columns.
+     * @return array Modified columns.
+     */
+    public function customize_admin_columns($columns) {
+        // cb, title, date are standard
+        $new_columns = [
+            'cb' => $columns['cb'],
+            'title' => __('Title', 'asset-manager-mvc'),
+            'asset_tag' => __('Asset Tag', 'asset-manager-mvc'),
+            'model' => __('Model', 'asset-manager-mvc'),
+            'serial_number' => __('Serial Number', 'asset-manager-mvc'),
+            'brand' => __('Brand', 'asset-manager-mvc'),
+            ASSET_MANAGER_MVC_TAXONOMY => __('Category', 'asset-manager-mvc'), // Use taxonomy slug
+            'status' => __('Status', 'asset-manager-mvc'),
+            'issued_to' => __('Issued To', 'asset-manager-mvc'),
+            'date' => __('Date', 'asset-manager-mvc')
+        ];
+        return $new_columns;
+    }
+
+    /**
+     * Makes the indexed attribute columns sortable.
+     * @param array $columns Existing sortable columns.
+     * @return array Modified sortable columns.
+     */
+    public function register_sortable_columns($columns) {
+        foreach (['asset_tag', 'model', 'serial_number', 'brand', 'status'] as $column) {
+            $columns[$column] = $column;
+        }
+        return $columns;
+    }
+
+    /**
+     * Renders the status, brand, category and assignee filters above the asset list table.
+     * @param string $post_type The post type of the list table.
+     */
+    public function render_list_filters($post_type) {
+        if ($post_type !== ASSET_MANAGER_MVC_POST_TYPE) {
+            return;
+        }
+        $filters = $this->get_list_filters();
+
+        $data['status_options'] = $this->asset_model->get_status_options();
+        $data['brands'] = $this->asset_model->get_index_values('brand');
+        $data['categories'] = get_terms(['taxonomy' => ASSET_MANAGER_MVC_TAXONOMY, 'hide_empty' => false]);
+        $data['users'] = $this->asset_model->get_user_display_names($this->asset_model->get_index_values('issued_to'));
+        $data['selected'] = array_merge(['status' => '', 'brand' => '', 'category' => 0, 'issued_to' => 0], $filters);
+        $this->load_view('admin/asset-list-filters', $data);
+    }
+
+    /**
+     * Renders the fields used by the "Apply bulk changes" action next to the list filters.
+     * @param string $post_type The post type of the list table.
+     */
+    public function render_bulk_update_fields($post_type) {
+        if ($post_type !== ASSET_MANAGER_MVC_POST_TYPE || !current_user_can('edit_posts')) {
+            return;
+        }
+        $data['status_options'] = $this->asset_model->get_status_options();
+        $data['categories'] = get_terms(['taxonomy' => ASSET_MANAGER_MVC_TAXONOMY, 'hide_empty' => false]);
+        $this->load_view('admin/asset-bulk-update-fields', $data);
+    }
+
+    /**
+     * Adds the bulk update action to the asset list table.
+     * @param array $actions Existing bulk actions.
+     * @return array Modified bulk actions.
+     */
+    public function register_bulk_actions($actions) {
+        $actions['am_mvc_bulk_update'] = __('Apply bulk changes', 'asset-manager-mvc');
+        return $actions;
+    }
+
+    /**
+     * Applies the bulk change fields to the selected assets. The list table has already checked the bulk-posts nonce.
+     * @param string $redirect_url URL to redirect to afterwards.
+     * @param string $action The bulk action.
+     * @param int[] $post_ids Selected post IDs.
+     * @return string Redirect URL with the result counts.
+     */
+    public function handle_bulk_update($redirect_url, $action, $post_ids) {
+        if ($action !== 'am_mvc_bulk_update') {
+            return $redirect_url;
+        }
+
+        $changes = [];
+        if (isset($_REQUEST['bulk_status']) && $_REQUEST['bulk_status'] !== '') {
+            $changes['status'] = sanitize_text_field(wp_unslash($_REQUEST['bulk_status']));
+        }
+        if (isset($_REQUEST['bulk_issued_to']) && $_REQUEST['bulk_issued_to'] !== '') {
+            $changes['issued_to'] = absint($_REQUEST['bulk_issued_to']);
+        }
+        if (isset($_REQUEST['bulk_category']) && $_REQUEST['bulk_category'] !== '') {
+            $changes['category'] = absint($_REQUEST['bulk_category']);
+        }
+
+        $post_ids = array_map('absint', (array) $post_ids);
+        _prime_post_caches($post_ids, false, false);
+        $allowed_ids = array_filter($post_ids, function($post_id) {
+            return current_user_can('edit_post', $post_id);
+        });
+
+        $result = $this->asset_model->bulk_update($allowed_ids, $changes);
+        return add_query_arg([
+            'am_mvc_bulk_updated' => $result['updated'],
+            'am_mvc_bulk_skipped' => count($post_ids) - $result['updated'],
+        ], $redirect_url);
+    }
+
+    /**
+     * Lets WordPress strip the bulk update result arguments from the URL after displaying them.
+     * @param array $args Removable query args.
+     * @return array
+     */
+    public function register_removable_query_args($args) {
+        $args[] = 'am_mvc_bulk_updated';
+        $args[] = 'am_mvc_bulk_skipped';
+        return $args;
+    }
+
+    /**
+     * Displays the result of a bulk update on the asset list table.
+     */
+    public function display_bulk_update_notice() {
+        global $pagenow, $typenow;
+        if ($pagenow !== 'edit.php' || $typenow !== ASSET_MANAGER_MVC_POST_TYPE || !isset($_GET['am_mvc_bulk_updated'])) {
+            return;
+        }
+        $data['updated'] = absint($_GET['am_mvc_bulk_updated']);
+        $data['skipped'] = isset($_GET['am_mvc_bulk_skipped']) ? absint($_GET['am_mvc_bulk_skipped']) : 0;
+        $this->load_view('admin/notices/bulk-update', $data);
+    }
+
+    /**
+     * Filters and sorts the asset list table against the asset index table.
+     * @param array $clauses Query clauses.
+     * @param \\WP_Query $query The query.
+     * @return array Modified clauses.
+     */
+    public function filter_list_query_clauses($clauses, $query) {
+        if (!$this->is_list_query($query)) {
+            return $clauses;
+        }
+        return $this->asset_model->apply_index_clauses(
+            $clauses,
+            $this->get_list_filters(),
+            (string) $query->get('orderby'),
+            (string) $query->get('order')
+        );
+    }
+
+    /**
+     * Lets the asset list search match asset tag and serial number prefixes.
+     * @param string $search Search SQL.
+     * @param \\WP_Query $query The query.
+     * @return string Modified search SQL.
+     */
+    public function filter_list_query_search($search, $query) {
+        if ($search === '' || !$this->is_list_query($query)) {
+            return $search;
+        }
+        return $this->asset_model->apply_index_search($search, trim((string) $query->get('s')));
+    }
+
+    /**
+     * Whether a query is the main query of the asset list table.
+     * @param \\WP_Query $query The query.
+     * @return bool
+     */
+    private function is_list_query($query) {
+        global $pagenow;
+        return is_admin() && $pagenow === 'edit.php' && $query->is_main_query()
+            && $query->get('post_type') === ASSET_MANAGER_MVC_POST_TYPE;
+    }
+
+    /**
+     * Reads the active list table filters from the request.
+     * @return array Filter values keyed by index column. Inactive filters are omitted.
+     */
+    private function get_list_filters() {
+        $filters = [];
+        if (!empty($_GET['asset_status']) && in_array(wp_unslash($_GET['asset_status']), $this->asset_model->get_status_options(), true)) {
+            $filters['status'] = wp_unslash($_GET['asset_status']);
+        }
+        if (isset($_GET['asset_brand']) && $_GET['asset_brand'] !== '') {
+            $filters['brand'] = sanitize_text_field(wp_unslash($_GET['asset_brand']));
+        }
+        if (!empty($_GET['asset_cat'])) {
+            $filters['category'] = absint($_GET['asset_cat']);
+        }
+        if (!empty($_GET['asset_issued_to'])) {
+            $filters['issued_to'] = absint($_GET['asset_issued_to']);
+        }
+        return $filters;
+    }
+
+    /**
+     * Primes caches for the asset list table once per page and builds the column values for every row.
+     *
+     * Meta and terms for all posts on the page are loaded in one query each, and assigned users
+     * through cache_users(), so the column renderer never queries per row.
+     * @param \\WP_Post[] $posts Posts returned by the query.
+     * @param \\WP_Query $query The query.
+     * @return \\WP_Post[] The unchanged posts.
+     */
+    public function prime_list_table_rows($posts, $query) {
+        if (empty($posts) || !$this->is_list_query($query)) {
+            return $posts;
+        }
+
+        $post_ids = wp_list_pluck($posts, 'ID');
+        update_meta_cache('post', $post_ids);
+        update_object_term_cache($post_ids, ASSET_MANAGER_MVC_POST_TYPE);
+
+        $user_ids = [];
+        foreach ($post_ids as $post_id) {
+            $user_id = (int) get_post_meta($post_id, ASSET_MANAGER_MVC_META_PREFIX . 'issued_to', true);
+            if ($user_id) {
+                $user_ids[] = $user_id;
+            }
+        }
+        if ($user_ids) {
+            cache_users(array_unique($user_ids));
+        }
+
+        foreach ($post_ids as $post_id) {
+            $this->list_rows[$post_id] = $this->build_list_row($post_id);
+        }
+
+        return $posts;
+    }
+
+    /**
+     * Builds the column values for one row from the object caches.
+     * @param int $post_id The ID of the asset.
+     * @return array Column values keyed by column name.
+     */
+    private function build_list_row($post_id) {
+        $row = [];
+        foreach (['asset_tag', 'model', 'serial_number', 'brand', 'status'] as $field) {
+            $row[$field] = get_post_meta($post_id, ASSET_MANAGER_MVC_META_PREFIX . $field, true);
+        }
+
+        $terms = get_the_terms($post_id, ASSET_MANAGER_MVC_TAXONOMY);
+        $row[ASSET_MANAGER_MVC_TAXONOMY] = (!empty($terms) && !is_wp_error($terms))
+            ? implode(', ', wp_list_pluck($terms, 'name'))
+            : '';
+
+        $user_id = get_post_meta($post_id, ASSET_MANAGER_MVC_META_PREFIX . 'issued_to', true);
+        if ($user_id) {
+            $user = get_userdata($user_id);
+            $row['issued_to'] = $user ? $user->display_name : __('Unknown User', 'asset-manager-mvc');
+        } else {
+            $row['issued_to'] = '';
+        }
+
+        return $row;
+    }
+
+    /**
+     * Renders content for custom columns in the admin list table.
+     * @param string $column The name of the column.
+     * @param int $post_id The ID of the current post.
+     */
+    public function render_custom_column_content($column, $post_id) {
+        if (!isset($this->list_rows[$post_id])) {
+            // Row rendered outside the primed list query, e.g. after an inline edit
+            $this->list_rows[$post_id] = $this->build_list_row($post_id);
+        }
+        $row = $this->list_rows[$post_id];
+
+        switch ($column) {
+            case 'asset_tag':
+            case 'model':
+            case 'serial_number':
+            case 'brand':
+            case 'status':
+                echo esc_html($row[$column]);
+                break;
+            case ASSET_MANAGER_MVC_TAXONOMY: // Use taxonomy slug
+            case 'issued_to':
+                echo $row[$column] !== '' ? esc_html($row[$column]) : '—';
+                break;
+        }
+    }
+
+    /**
+     * Helper function to load a view file.
+     * @param string $view_name The name of the view file (without .php).
+     * @param array $data Data to pass to the view.
+     */
+    protected function load_view($view_name, $data = []) {
+        // Make data available to the view file
+        extract($data);
+        $file_path = ASSET_MANAGER_MVC_PATH . 'includes/views/' . $view_name . '.php';
+        if (file_exists($file_path)) {
+            include $file_path;
+        } else {
+            // Optionally, log an error or display a message if the view file is not found
+            echo "<p>Error: View file not found at {$file_path}</p>";
+        }
+    }
+}
+"""
+
+# Dashboard Controller: includes/controllers/class-dashboard-controller.php
+dashboard_controller_php_content = """<?php
+// File: includes/controllers/class-dashboard-controller.php
+
+namespace AssetManagerMvc\\Controllers;
+
+use AssetManagerMvc\\Models\\Asset_Model;
+
+if (!defined('ABSPATH')) exit;
+
+/**
+ * Dashboard_Controller Class
+ *
+ * Handles the display of the asset dashboard.
+ */
+class Dashboard_Controller {
+
+    private $asset_model;
+
+    public function __construct(Asset_Model $asset_model) {
+        $this->asset_model = $asset_model;
+    }
+
+    public function register_hooks() {
+        add_action('admin_menu', [$this, 'register_dashboard_page']);
+        add_action('admin_enqueue_scripts', [$this, 'enqueue_dashboard_assets']);
+        add_action('admin_post_am_mvc_rebuild_dashboard_action', [$this, 'handle_rebuild_counts']);
+        add_action(ASSET_MANAGER_MVC_ROLLUP_CRON_HOOK, [$this->asset_model, 'rebuild_dashboard_rollup']);
     }
 
-    /**
-     * Registers the 'asset_mvc' custom post type.
-     */
-    public function register_asset_post_type() {
-        $labels = [
-            'name' => _x('Assets (MVC)', 'post type general name', 'asset-manager-mvc'),
-            'singular_name' => _x('Asset (MVC)', 'post type singular name', 'asset-manager-mvc'),
-            'menu_name' => _x('Assets (MVC)', 'admin menu', 'asset-manager-mvc'),
-            'name_admin_bar' => _x('Asset (MVC)', 'add new on admin bar', 'asset-manager-mvc'),
-            'add_new' => _x('Add New', 'asset', 'asset-manager-mvc'),
-            'add_new_item' => __('Add New Asset', 'asset-manager-mvc'),
-            'new_item' => __('New Asset', 'asset-manager-mvc'),
-            'edit_item' => __('Edit Asset', 'asset-manager-mvc'),
-            'view_item' => __('View Asset', 'asset-manager-mvc'),
-            'all_items' => __('All Assets', 'asset-manager-mvc'),
-            'search_items' => __('Search Assets', 'asset-manager-mvc'),
-            'parent_item_colon' => __('Parent Assets:', 'asset-manager-mvc'),
-            'not_found' => __('No assets found.', 'asset-manager-mvc'),
-            'not_found_in_trash' => __('No assets found in Trash.', 'asset-manager-mvc'),
-            'attributes' => __( 'Asset Attributes', 'asset-manager-mvc' ),
-        ];
-        $args = [
-            'labels' => $labels,
-            'public' => false, // Typically false for internal management CPTs
-            'show_ui' => true,
-            'show_in_menu' => true,
-            'query_var' => true,
-            'rewrite' => ['slug' => ASSET_MANAGER_MVC_POST_TYPE],
-            'capability_type' => 'post',
-            'has_archive' => false,
-            'hierarchical' => false,
-            'menu_position' => 20,
-            'supports' => ['title'], // Custom fields will handle other data
-            'menu_icon' => 'dashicons-archive',
-            'show_in_rest' => true, // For Gutenberg / Block Editor compatibility
-        ];
-        register_post_type(ASSET_MANAGER_MVC_POST_TYPE, $args);
+    public function register_dashboard_page() {
+        add_submenu_page(
+            'edit.php?post_type=' . ASSET_MANAGER_MVC_POST_TYPE,
+            __('Asset Dashboard', 'asset-manager-mvc'),
+            __('Dashboard', 'asset-manager-mvc'),
+            'manage_options', // Capability
+            'asset_mvc_dashboard', // Menu slug
+            [$this, 'render_dashboard_page_view']
+        );
+    }
+
+    public function enqueue_dashboard_assets($hook) {
+        // Check if we are on the dashboard page
+        $current_screen = get_current_screen();
+        if ($current_screen && $current_screen->id === ASSET_MANAGER_MVC_POST_TYPE . '_page_asset_mvc_dashboard') {
+             wp_enqueue_style(
+                'asset-manager-mvc-admin-css', // Can reuse if styles are general
+                ASSET_MANAGER_MVC_URL . 'assets/css/asset-manager-admin.css',
+                [],
+                ASSET_MANAGER_MVC_VERSION
+            );
+            wp_enqueue_script('chart-js', 'https://cdn.jsdelivr.net/npm/chart.js', [], '4.4.1', true);
+            wp_enqueue_script(
+                'asset-dashboard-mvc-js',
+                ASSET_MANAGER_MVC_URL . 'assets/js/asset-dashboard.js', // Assuming you have this JS file
+                ['jquery', 'chart-js'],
+                ASSET_MANAGER_MVC_VERSION,
+                true
+            );
+
+            // Localize script with the precomputed rollup counts for charts
+            wp_localize_script('asset-dashboard-mvc-js', 'assetDashboardData', $this->asset_model->get_dashboard_data());
+        }
+    }
+
+    public function render_dashboard_page_view() {
+        // Chart data is already localized for JS; the view only needs the rollup summary.
+        $rollup = $this->asset_model->get_dashboard_rollup();
+        $data['total_assets'] = isset($rollup['total']) ? (int) $rollup['total'] : 0;
+        $data['built_at'] = isset($rollup['built_at']) ? $rollup['built_at'] : '';
+        $data['drift_repaired'] = isset($_GET['am_mvc_rebuilt']) ? sanitize_key($_GET['am_mvc_rebuilt']) : '';
+        $this->load_view('admin/dashboard-page', $data);
     }
 
     /**
-     * Registers the 'asset_category_mvc' custom taxonomy.
+     * Rebuilds the dashboard counts from scratch on request.
      */
-    public function register_asset_taxonomy() {
-        $labels = [
-            'name' => _x('Asset Categories (MVC)', 'taxonomy general name', 'asset-manager-mvc'),
-            'singular_name' => _x('Asset Category (MVC)', 'taxonomy singular name', 'asset-manager-mvc'),
-            'search_items' => __('Search Asset Categories', 'asset-manager-mvc'),
-            'all_items' => __('All Asset Categories', 'asset-manager-mvc'),
-            'parent_item' => __('Parent Asset Category', 'asset-manager-mvc'),
-            'parent_item_colon' => __('Parent Asset Category:', 'asset-manager-mvc'),
-            'edit_item' => __('Edit Asset Category', 'asset-manager-mvc'),
-            'update_item' => __('Update Asset Category', 'asset-manager-mvc'),
-            'add_new_item' => __('Add New Asset Category', 'asset-manager-mvc'),
-            'new_item_name' => __('New Asset Category Name', 'asset-manager-mvc'),
-            'menu_name' => __('Categories', 'asset-manager-mvc'),
-        ];
-        $args = [
-            'hierarchical' => true,
-            'labels' => $labels,
-            'show_ui' => true,
-            'show_admin_column' => true,
-            'query_var' => true,
-            'rewrite' => ['slug' => ASSET_MANAGER_MVC_TAXONOMY],
-            'show_in_rest' => true,
-        ];
-        register_taxonomy(ASSET_MANAGER_MVC_TAXONOMY, ASSET_MANAGER_MVC_POST_TYPE, $args);
+    public function handle_rebuild_counts() {
+        if (!isset($_POST['am_mvc_dashboard_nonce']) || !wp_verify_nonce($_POST['am_mvc_dashboard_nonce'], 'am_mvc_rebuild_dashboard_nonce')) {
+            wp_die(__('Security check failed.', 'asset-manager-mvc'), __('Error', 'asset-manager-mvc'), ['response' => 403]);
+        }
+        if (!current_user_can('manage_options')) {
+            wp_die(__('You do not have sufficient permissions to rebuild the dashboard.', 'asset-manager-mvc'), __('Error', 'asset-manager-mvc'), ['response' => 403]);
+        }
+
+        $drifted = $this->asset_model->rebuild_dashboard_rollup();
+        wp_safe_redirect(add_query_arg(
+            ['post_type' => ASSET_MANAGER_MVC_POST_TYPE, 'page' => 'asset_mvc_dashboard', 'am_mvc_rebuilt' => $drifted ? 'drift' : 'ok'],
+            admin_url('edit.php')
+        ));
+        exit;
     }
 
-    // public function register_shortcodes() { /* Placeholder for future shortcodes */ }
+    protected function load_view($view_name, $data = []) {
+        extract($data);
+        $file_path = ASSET_MANAGER_MVC_PATH . 'includes/views/' . $view_name . '.php';
+        if (file_exists($file_path)) {
+            include $file_path;
+        } else {
+            echo "<p>Error: View file not found at {$file_path}</p>";
+        }
+    }
 }
 """
 
-# Asset Controller: includes/controllers/class-asset-controller.php
-asset_controller_php_content = """<?php
-// File: includes/controllers/class-asset-controller.php
+# Export Controller: includes/controllers/class-export-controller.php
+export_controller_php_content = """<?php
+// File: includes/controllers/class-export-controller.php
 
 namespace AssetManagerMvc\\Controllers;
 
 use AssetManagerMvc\\Models\\Asset_Model;
+use AssetManagerMvc\\Models\\Export_Job_Model;
 
 if (!defined('ABSPATH')) exit;
 
 /**
- * Asset_Controller Class
+ * Export_Controller Class
  *
- * Handles asset creation, editing, display, and admin list customizations.
+ * Handles asset exporting functionality, e.g., to PDF.
+ * PDF exports run as background jobs processed by WP-Cron in time-boxed slices;
+ * CSV and NDJSON exports are streamed straight to the browser.
  */
-class Asset_Controller {
+class Export_Controller {
+
+    private $asset_model;
 
     /**
-     * Asset Model instance.
-     * @var Asset_Model
+     * Export Job Model instance.
+     * @var Export_Job_Model
      */
-    private $asset_model;
+    private $export_job_model;
 
     /**
-     * Constructor.
-     * @param Asset_Model $asset_model Instance of the Asset Model.
+     * Number of assets rendered per mPDF chunk.
+     * @var int
      */
-    public function __construct(Asset_Model $asset_model) {
-        $this->asset_model = $asset_model;
-    }
+    private $batch_size = 200;
 
     /**
-     * Registers WordPress hooks.
+     * Number of assets fetched per batch for CSV/NDJSON exports.
+     * @var int
      */
-    public function register_hooks() {
-        add_action('add_meta_boxes', [$this, 'register_meta_boxes']);
-        add_action('save_post_' . ASSET_MANAGER_MVC_POST_TYPE, [$this, 'handle_save_asset'], 10, 2);
-        
-        add_filter('manage_' . ASSET_MANAGER_MVC_POST_TYPE . '_posts_columns', [$this, 'customize_admin_columns']);
-        add_action('manage_' . ASSET_MANAGER_MVC_POST_TYPE . '_posts_custom_column', [$this, 'render_custom_column_content'], 10, 2);
-        
-        add_action('admin_enqueue_scripts', [$this, 'enqueue_admin_assets']);
-        add_action('admin_notices', [$this, 'display_admin_notices']);
-    }
+    private $data_batch_size = 1000;
 
     /**
-     * Enqueues admin scripts and styles.
+     * Streamed data export formats and their MIME types.
+     * @var array
      */
-    public function enqueue_admin_assets($hook) {
-        global $post_type, $pagenow;
+    private $data_formats = [
+        'csv' => 'text/csv',
+        'ndjson' => 'application/x-ndjson',
+    ];
+
+    /**
+     * Seconds of rendering per worker slice before checkpointing.
+     * @var int
+     */
+    private $slice_seconds = 20;
+
+    /**
+     * Pages imported per merge tick, and so the most pages in one volume of a merged export.
+     * @var int
+     */
+    private $merge_pages = 1000;
 
-        $is_asset_cpt_screen = ($post_type === ASSET_MANAGER_MVC_POST_TYPE && in_array($pagenow, ['post.php', 'post-new.php']));
+    /**
+     * Job key of the "all assets as PDF" export.
+     * @var string
+     */
+    private $pdf_job_key = 'pdf';
 
-        if ($is_asset_cpt_screen) {
+    public function __construct(Asset_Model $asset_model, Export_Job_Model $export_job_model) {
+        $this->asset_model = $asset_model;
+        $this->export_job_model = $export_job_model;
+    }
+
+    public function register_hooks() {
+        add_action('admin_menu', [$this, 'register_export_page']);
+        add_action('admin_enqueue_scripts', [$this, 'enqueue_export_assets']);
+        add_action('admin_post_am_mvc_export_assets_pdf_action', [$this, 'handle_pdf_export']);
+        add_action('admin_post_am_mvc_export_assets_data_action', [$this, 'handle_data_export']);
+        add_action('admin_post_am_mvc_download_export_action', [$this, 'handle_export_download']);
+        add_action('wp_ajax_am_mvc_export_job_status', [$this, 'ajax_export_job_status']);
+        add_action(ASSET_MANAGER_MVC_EXPORT_CRON_HOOK, [$this, 'process_export_job']);
+    }
+
+    public function register_export_page() {
+        add_submenu_page(
+            'edit.php?post_type=' . ASSET_MANAGER_MVC_POST_TYPE,
+            __('Export Assets', 'asset-manager-mvc'),
+            __('Export', 'asset-manager-mvc'),
+            'manage_options',
+            'export_assets_mvc', // Menu slug
+            [$this, 'render_export_page_view']
+        );
+    }
+
+    /**
+     * Enqueues the progress polling script on the export page.
+     */
+    public function enqueue_export_assets($hook) {
+        $current_screen = get_current_screen();
+        if ($current_screen && $current_screen->id === ASSET_MANAGER_MVC_POST_TYPE . '_page_export_assets_mvc') {
             wp_enqueue_style(
                 'asset-manager-mvc-admin-css',
                 ASSET_MANAGER_MVC_URL . 'assets/css/asset-manager-admin.css',
@@ -632,290 +3448,545 @@ class Asset_Controller {
                 ASSET_MANAGER_MVC_VERSION
             );
             wp_enqueue_script(
-                'asset-manager-mvc-admin-js',
-                ASSET_MANAGER_MVC_URL . 'assets/js/asset-manager-admin.js',
+                'asset-export-mvc-js',
+                ASSET_MANAGER_MVC_URL . 'assets/js/asset-export.js',
                 ['jquery'],
                 ASSET_MANAGER_MVC_VERSION,
                 true
             );
-             // Add this to your asset-manager-admin.css:
-             // .asset-fields .required { color: red; margin-left: 2px; }
+            wp_localize_script('asset-export-mvc-js', 'assetExportData', [
+                'ajaxUrl' => admin_url('admin-ajax.php'),
+                'nonce' => wp_create_nonce('am_mvc_export_job_status_nonce'),
+                'jobKey' => $this->pdf_job_key,
+                // Same strings as the export page view, which renders the initial status
+                'i18n' => [
+                    'processed' => __('Processed %1$d of %2$d assets…', 'asset-manager-mvc'),
+                    'merging' => __('Assembling the PDF…', 'asset-manager-mvc'),
+                    'done' => __('Export finished: %1$d of %2$d assets.', 'asset-manager-mvc'),
+                    'failed' => __('Export failed: %s', 'asset-manager-mvc'),
+                    'exportButton' => __('Export All Assets as PDF', 'asset-manager-mvc'),
+                ],
+            ]);
         }
     }
 
+    public function render_export_page_view() {
+        $data['job'] = $this->format_job_status($this->export_job_model->get_job($this->pdf_job_key));
+        $this->load_view('admin/export-page', $data);
+    }
+
     /**
-     * Registers meta boxes for the asset post type.
+     * Serves the cached PDF if the inventory has not changed since it was rendered; otherwise
+     * queues the PDF export job, or joins the one already running, and returns to the export page.
      */
-    public function register_meta_boxes() {
-        add_meta_box(
-            ASSET_MANAGER_MVC_META_PREFIX . 'details',
-            __('Asset Details', 'asset-manager-mvc'),
-            [$this, 'render_asset_fields_meta_box_view'],
-            ASSET_MANAGER_MVC_POST_TYPE,
-            'normal',
-            'high'
-        );
-        add_meta_box(
-            ASSET_MANAGER_MVC_META_PREFIX . 'history',
-            __('Asset History', 'asset-manager-mvc'),
-            [$this, 'render_history_meta_box_view'],
-            ASSET_MANAGER_MVC_POST_TYPE,
-            'normal',
-            'default'
-        );
+    public function handle_pdf_export() {
+        if (!isset($_POST['am_mvc_export_nonce']) || !wp_verify_nonce($_POST['am_mvc_export_nonce'], 'am_mvc_export_assets_pdf_nonce')) {
+            wp_die(__('Security check failed.', 'asset-manager-mvc'), __('Error', 'asset-manager-mvc'), ['response' => 403]);
+        }
+        if (!current_user_can('manage_options')) {
+            wp_die(__('You do not have sufficient permissions to export assets.', 'asset-manager-mvc'), __('Error', 'asset-manager-mvc'), ['response' => 403]);
+        }
+
+        if (!$this->load_pdf_library()) {
+            wp_die(
+                __('PDF Export library (mPDF) is missing or could not be loaded. Please ensure it is installed in the plugin\\'s vendor directory.', 'asset-manager-mvc'),
+                __('PDF Library Error', 'asset-manager-mvc'),
+                ['back_link' => true]
+            );
+            return;
+        }
+
+        $version = $this->asset_model->get_inventory_version();
+        $cached_job = $this->export_job_model->get_cached_job($this->pdf_job_key, $version);
+        if ($cached_job) {
+            $this->send_export_file($cached_job);
+        }
+
+        // Misses are coalesced: start_or_join() hands every concurrent request the same job
+        $job = $this->export_job_model->start_or_join($this->pdf_job_key, $this->asset_model->count_published_assets(), $version);
+        if ($job && $this->export_job_model->is_active($job)) {
+            $this->schedule_export_tick($this->pdf_job_key, 0);
+        }
+
+        wp_safe_redirect(add_query_arg(
+            ['post_type' => ASSET_MANAGER_MVC_POST_TYPE, 'page' => 'export_assets_mvc'],
+            admin_url('edit.php')
+        ));
+        exit;
+    }
+
+    /**
+     * Streams all published assets as CSV or NDJSON.
+     *
+     * Rows are written batch by batch straight to the output with fputcsv()/wp_json_encode()
+     * and flushed after each batch, so the full result set is never held in memory.
+     */
+    public function handle_data_export() {
+        if (!isset($_POST['am_mvc_export_data_nonce']) || !wp_verify_nonce($_POST['am_mvc_export_data_nonce'], 'am_mvc_export_assets_data_nonce')) {
+            wp_die(__('Security check failed.', 'asset-manager-mvc'), __('Error', 'asset-manager-mvc'), ['response' => 403]);
+        }
+        if (!current_user_can('manage_options')) {
+            wp_die(__('You do not have sufficient permissions to export assets.', 'asset-manager-mvc'), __('Error', 'asset-manager-mvc'), ['response' => 403]);
+        }
+        $format = isset($_POST['format']) ? sanitize_key($_POST['format']) : 'csv';
+        if (!isset($this->data_formats[$format])) {
+            wp_die(__('Unsupported export format.', 'asset-manager-mvc'), __('Error', 'asset-manager-mvc'), ['response' => 400, 'back_link' => true]);
+        }
+
+        if (function_exists('set_time_limit')) {
+            @set_time_limit(0);
+        }
+        // Write straight through to the client instead of collecting output in PHP buffers
+        while (ob_get_level() > 0) {
+            ob_end_clean();
+        }
+
+        nocache_headers();
+        header('Content-Type: ' . $this->data_formats[$format] . '; charset=utf-8');
+        header('Content-Disposition: attachment; filename="assets-mvc-' . date('Y-m-d') . '.' . $format . '"');
+        header('X-Accel-Buffering: no');
+
+        $fields = $this->asset_model->get_fields();
+        $output = fopen('php://output', 'w');
+        if ($format === 'csv') {
+            fputcsv($output, array_merge(['id', 'title'], $fields, ['issued_to_name', 'category']));
+        }
+
+        foreach ($this->asset_model->iterate_assets_for_export($this->data_batch_size, null, 'id') as $batch) {
+            foreach ($batch['rows'] as $asset) {
+                if ($format === 'csv') {
+                    $line = [$asset['ID'], $asset['title']];
+                    foreach ($fields as $field_key) {
+                        $line[] = $asset['meta'][$field_key];
+                    }
+                    $line[] = $asset['issued_to_name'];
+                    $line[] = implode(', ', $asset['categories']);
+                    fputcsv($output, array_map([$this, 'escape_csv_cell'], $line));
+                } else {
+                    $record = ['id' => $asset['ID'], 'title' => $asset['title']];
+                    foreach ($fields as $field_key) {
+                        $record[$field_key] = $field_key === 'issued_to' ? absint($asset['meta'][$field_key]) : $asset['meta'][$field_key];
+                    }
+                    $record['issued_to_name'] = $asset['issued_to_name'];
+                    $record['categories'] = $asset['categories'];
+                    fwrite($output, wp_json_encode($record, JSON_UNESCAPED_UNICODE | JSON_UNESCAPED_SLASHES) . "\\n");
+                }
+            }
+            unset($batch);
+            fflush($output);
+            flush();
+        }
+
+        fclose($output);
+        exit;
+    }
+
+    /**
+     * Neutralises spreadsheet formulas in a CSV cell.
+     * @param mixed $value Cell value.
+     * @return mixed
+     */
+    private function escape_csv_cell($value) {
+        if (is_string($value) && $value !== '' && in_array($value[0], ['=', '+', '-', '@'], true)) {
+            return "'" . $value;
+        }
+        return $value;
+    }
+
+    /**
+     * Returns the progress of an export job as JSON for the export page.
+     */
+    public function ajax_export_job_status() {
+        check_ajax_referer('am_mvc_export_job_status_nonce', 'nonce');
+        if (!current_user_can('manage_options')) {
+            wp_send_json_error(['message' => __('You do not have sufficient permissions to export assets.', 'asset-manager-mvc')], 403);
+        }
+
+        $job_key = isset($_GET['job']) ? sanitize_key($_GET['job']) : $this->pdf_job_key;
+        $job = $this->export_job_model->get_job($job_key);
+
+        // Nudge WP-Cron if the next slice is overdue, e.g. on low-traffic sites
+        if ($job && $this->export_job_model->is_active($job)) {
+            $next = wp_next_scheduled(ASSET_MANAGER_MVC_EXPORT_CRON_HOOK, [$job_key]);
+            if (!$next) {
+                $this->schedule_export_tick($job_key, 0);
+            } elseif ($next <= time()) {
+                spawn_cron();
+            }
+        }
+
+        wp_send_json_success($this->format_job_status($job));
     }
 
     /**
-     * Renders the asset fields meta box by loading the view.
-     * @param \\WP_Post $post The current post object.
+     * Streams a finished export file to the browser.
      */
-    public function render_asset_fields_meta_box_view($post) {
-        wp_nonce_field(ASSET_MANAGER_MVC_META_PREFIX . 'save_details_nonce', ASSET_MANAGER_MVC_META_PREFIX . 'details_nonce');
-        
-        $data['meta_values'] = $this->asset_model->get_asset_meta($post->ID);
-        $data['users'] = get_users(['orderby' => 'display_name']);
-        $data['categories'] = get_terms(['taxonomy' => ASSET_MANAGER_MVC_TAXONOMY, 'hide_empty' => false]);
-        $data['field_definitions'] = $this->asset_model->get_fields(); // e.g. ['asset_tag', 'model', ...]
-        $data['field_labels'] = $this->asset_model->get_field_labels();
-        $data['status_options'] = $this->asset_model->get_status_options();
-        $data['meta_prefix'] = ASSET_MANAGER_MVC_META_PREFIX;
-        $data['taxonomy_slug'] = ASSET_MANAGER_MVC_TAXONOMY;
+    public function handle_export_download() {
+        $job_key = isset($_GET['job']) ? sanitize_key($_GET['job']) : $this->pdf_job_key;
+        if (!isset($_GET['_wpnonce']) || !wp_verify_nonce($_GET['_wpnonce'], 'am_mvc_download_export_' . $job_key)) {
+            wp_die(__('Security check failed.', 'asset-manager-mvc'), __('Error', 'asset-manager-mvc'), ['response' => 403]);
+        }
+        if (!current_user_can('manage_options')) {
+            wp_die(__('You do not have sufficient permissions to export assets.', 'asset-manager-mvc'), __('Error', 'asset-manager-mvc'), ['response' => 403]);
+        }
 
-        // Load the view
-        $this->load_view('admin/asset-fields-meta-box', $data);
+        $job = $this->export_job_model->get_job($job_key);
+        $file_path = ($job && $job['status'] === 'done') ? $this->export_job_model->get_file_path($job, $job['file']) : '';
+        if (!$file_path || !is_readable($file_path)) {
+            wp_die(__('The export file is not available. Please run the export again.', 'asset-manager-mvc'), __('Error', 'asset-manager-mvc'), ['response' => 404, 'back_link' => true]);
+        }
+
+        $this->send_export_file($job);
     }
 
     /**
-     * Renders the asset history meta box by loading the view.
-     * @param \\WP_Post $post The current post object.
+     * Sends a finished export file, answering conditional requests with 304 Not Modified.
+     *
+     * The ETag is the inventory version the file was rendered from and Last-Modified is the
+     * file's mtime, so a client that already has this rendition does not download it again.
+     * @param array $job A finished job.
      */
-    public function render_history_meta_box_view($post) {
-        $data['history_entries'] = $this->asset_model->get_asset_history($post->ID);
-        $this->load_view('admin/asset-history-meta-box', $data);
+    private function send_export_file(array $job) {
+        $file_path = $this->export_job_model->get_file_path($job, $job['file']);
+        $modified = filemtime($file_path);
+        $etag = '"' . (!empty($job['version']) ? $job['version'] : md5($job['id'] . $modified)) . '"';
+
+        header('Cache-Control: private, no-cache');
+        header('ETag: ' . $etag);
+        header('Last-Modified: ' . gmdate('D, d M Y H:i:s', $modified) . ' GMT');
+
+        $if_none_match = isset($_SERVER['HTTP_IF_NONE_MATCH']) ? trim(wp_unslash($_SERVER['HTTP_IF_NONE_MATCH'])) : '';
+        $if_modified_since = isset($_SERVER['HTTP_IF_MODIFIED_SINCE']) ? strtotime(wp_unslash($_SERVER['HTTP_IF_MODIFIED_SINCE'])) : false;
+        $not_modified = ($if_none_match !== '')
+            ? in_array($etag, array_map('trim', explode(',', $if_none_match)), true)
+            : ($if_modified_since !== false && $if_modified_since >= $modified);
+        if ($not_modified) {
+            status_header(304);
+            exit;
+        }
+
+        // Exports too large for one PDF are a ZIP of PDF volumes
+        $extension = pathinfo($job['file'], PATHINFO_EXTENSION) === 'zip' ? 'zip' : 'pdf';
+        header('Content-Type: ' . ($extension === 'zip' ? 'application/zip' : 'application/pdf'));
+        header('Content-Disposition: attachment; filename="assets-mvc-' . gmdate('Y-m-d', $modified) . '.' . $extension . '"');
+        header('Content-Length: ' . filesize($file_path));
+        readfile($file_path);
+        exit;
     }
 
     /**
-     * Handles saving asset meta data.
-     * @param int $post_id The ID of the post being saved.
-     * @param \\WP_Post $post The post object.
+     * WP-Cron worker: processes one time-boxed slice of an export job.
+     *
+     * A slice renders as many batches as fit in $slice_seconds into a part file and checkpoints
+     * the cursor of the last asset written. Once all assets are rendered, the parts are merged
+     * into the final PDF, a bounded number of pages per slice. A watchdog event is scheduled
+     * first, so a slice that dies is retried.
+     * @param string $job_key The job to process.
      */
-    public function handle_save_asset($post_id, $post) {
-        // Verify nonce
-        if (!isset($_POST[ASSET_MANAGER_MVC_META_PREFIX . 'details_nonce']) || !wp_verify_nonce($_POST[ASSET_MANAGER_MVC_META_PREFIX . 'details_nonce'], ASSET_MANAGER_MVC_META_PREFIX . 'save_details_nonce')) {
-            return;
+    public function process_export_job($job_key) {
+        $job_key = sanitize_key($job_key);
+        if (!$this->export_job_model->acquire_lock($job_key, $this->slice_seconds * 3)) {
+            return; // Another worker is on this job
         }
-        // Check user permissions
-        if (!current_user_can('edit_post', $post_id)) {
+
+        $job = $this->export_job_model->get_job($job_key);
+        if (!$job || !$this->export_job_model->is_active($job) || !$this->load_pdf_library()) {
+            $this->export_job_model->release_lock($job_key);
             return;
         }
-        // Ignore autosaves
-        if (defined('DOING_AUTOSAVE') && DOING_AUTOSAVE) {
-            return;
+
+        $this->schedule_export_tick($job_key, $this->slice_seconds * 5, false);
+        if (function_exists('set_time_limit')) {
+            @set_time_limit($this->slice_seconds * 3);
         }
-        // Ensure it's our CPT
-        if ($post->post_type !== ASSET_MANAGER_MVC_POST_TYPE) {
-            return;
+
+        try {
+            if ($job['status'] === 'merging') {
+                $job = $this->merge_export_parts($job);
+            } else {
+                $job = $this->render_export_slice($job);
+            }
+        } catch (\\Throwable $e) {
+            $job['status'] = 'failed';
+            $job['error'] = $e->getMessage();
+            $this->export_job_model->delete_files($job, true);
         }
 
-        $errors = $this->asset_model->validate_asset_data($_POST);
-        
-        if (!empty($errors)) {
-            // Store errors in a transient to display after redirect
-            set_transient('asset_manager_errors_' . $post_id . '_' . get_current_user_id(), $errors, 45);
-            // Prevent WordPress from showing its default "Post updated" message
-            add_filter('redirect_post_location', function($location) use ($post_id) {
-                if (get_transient('asset_manager_errors_' . $post_id . '_' . get_current_user_id())) {
-                    // Remove the 'message' query arg from the redirect URL
-                    return remove_query_arg('message', $location);
-                }
-                return $location;
-            }, 99); // High priority to run late
-            return; // Stop further processing
+        $job = $this->export_job_model->save_job($job);
+        $this->export_job_model->release_lock($job_key);
+
+        if ($this->export_job_model->is_active($job)) {
+            $this->schedule_export_tick($job_key, 0);
+        } else {
+            wp_clear_scheduled_hook(ASSET_MANAGER_MVC_EXPORT_CRON_HOOK, [$job_key]);
         }
+    }
 
-        // Save data using the model
-        $this->asset_model->save_asset_data($post_id, $_POST);
+    /**
+     * Renders the next slice of assets into a new part file.
+     * @param array $job The job state.
+     * @return array Updated job state.
+     */
+    protected function render_export_slice(array $job) {
+        $deadline = microtime(true) + $this->slice_seconds;
+        $batches = $this->asset_model->iterate_assets_for_export($this->batch_size, $job['cursor']);
+        $is_first_part = empty($job['parts']);
+
+        $mpdf = $this->create_pdf_document();
+        $result = $this->write_pdf_chunks($mpdf, $this->take_batches_until($batches, $deadline), $is_first_part);
+
+        if ($result['rows'] > 0 || $is_first_part) {
+            $part_name = sprintf('part-%05d.pdf', count($job['parts']) + 1);
+            $mpdf->Output($this->export_job_model->get_file_path($job, $part_name), \\Mpdf\\Output\\Destination::FILE);
+            $job['parts'][] = $part_name;
+        }
+        unset($mpdf);
 
-        // Update post title if it's empty or default, based on asset tag
-        $post_obj = get_post($post_id);
-        if ($post_obj && (empty($post_obj->post_title) || $post_obj->post_title === __('Auto Draft') || $post_obj->post_title === '')) {
-            $asset_tag_val = get_post_meta($post_id, ASSET_MANAGER_MVC_META_PREFIX . 'asset_tag', true);
-            $new_title = !empty($asset_tag_val) ? sprintf(__('Asset: %s', 'asset-manager-mvc'), $asset_tag_val) : sprintf(__('Asset #%d', 'asset-manager-mvc'), $post_id);
-            
-            // Temporarily remove this action to prevent recursion
-            remove_action('save_post_' . ASSET_MANAGER_MVC_POST_TYPE, [$this, 'handle_save_asset'], 10);
-            wp_update_post(['ID' => $post_id, 'post_title' => $new_title]);
-            // Re-add the action
-            add_action('save_post_' . ASSET_MANAGER_MVC_POST_TYPE, [$this, 'handle_save_asset'], 10, 2);
+        $job['status'] = 'running';
+        $job['processed'] += $result['rows'];
+        if ($result['cursor'] !== null) {
+            $job['cursor'] = $result['cursor'];
+        }
+        if (!$batches->valid() || $result['rows'] === 0) {
+            $job['status'] = 'merging';
         }
+        return $job;
     }
 
     /**
-     * Displays admin notices for validation errors.
+     * Merges the next run of rendered pages into an output volume.
+     *
+     * FPDI imports pages into a document that is written out in one go, so a single merge of
+     * a large export would outlive the time limit and the worker lock. A tick therefore imports
+     * at most $merge_pages pages, or fewer once $slice_seconds are used up, into a new volume and
+     * checkpoints the part and page it stopped at. When all parts are merged, a single volume
+     * becomes the final PDF and several volumes are bundled into a ZIP.
+     * @param array $job The job state.
+     * @return array Updated job state.
      */
-    public function display_admin_notices() {
-        global $pagenow, $post;
-        if (($pagenow == 'post.php' || $pagenow == 'post-new.php') && isset($post->post_type) && $post->post_type == ASSET_MANAGER_MVC_POST_TYPE) {
-            $transient_key = 'asset_manager_errors_' . $post->ID . '_' . get_current_user_id();
-            $errors = get_transient($transient_key);
+    protected function merge_export_parts(array $job) {
+        $deadline = microtime(true) + $this->slice_seconds;
+        $part = isset($job['merge_part']) ? (int) $job['merge_part'] : 0;
+        $next_page = isset($job['merge_page']) ? (int) $job['merge_page'] : 1;
+        $volumes = isset($job['volumes']) ? (array) $job['volumes'] : [];
+
+        $mpdf = $this->create_pdf_document();
+        $imported = 0;
+        while ($part < count($job['parts']) && $imported < $this->merge_pages) {
+            $page_count = $mpdf->setSourceFile($this->export_job_model->get_file_path($job, $job['parts'][$part]));
+            for (; $next_page <= $page_count && $imported < $this->merge_pages; $next_page++) {
+                if ($imported > 0 && microtime(true) >= $deadline) {
+                    break 2;
+                }
+                if ($imported > 0) {
+                    $mpdf->AddPage();
+                }
+                $mpdf->useTemplate($mpdf->importPage($next_page));
+                $imported++;
+            }
+            if ($next_page > $page_count) {
+                $part++;
+                $next_page = 1;
+            }
+        }
 
-            if (!empty($errors) && is_array($errors)) {
-                $data['errors'] = $errors;
-                $this->load_view('admin/notices/validation-errors', $data);
-                delete_transient($transient_key); // Clear after displaying
+        if ($imported > 0) {
+            $volume_name = sprintf('volume-%03d.pdf', count($volumes) + 1);
+            $mpdf->Output($this->export_job_model->get_file_path($job, $volume_name), \\Mpdf\\Output\\Destination::FILE);
+            $volumes[] = $volume_name;
+        }
+        unset($mpdf);
+
+        $job['merge_part'] = $part;
+        $job['merge_page'] = $next_page;
+        $job['volumes'] = $volumes;
+        if ($part < count($job['parts'])) {
+            return $job;
+        }
+
+        if (count($volumes) === 1) {
+            $job['file'] = 'assets.pdf';
+            if (!rename($this->export_job_model->get_file_path($job, $volumes[0]), $this->export_job_model->get_file_path($job, $job['file']))) {
+                throw new \\RuntimeException(__('Could not write the export file.', 'asset-manager-mvc'));
             }
+            $job['volumes'] = [];
+        } else {
+            $job['file'] = 'assets.zip';
+            $this->bundle_export_volumes($job, $volumes);
         }
+        $this->export_job_model->delete_files($job, false);
+
+        $job['parts'] = [];
+        $job['volumes'] = [];
+        $job['status'] = 'done';
+        $job['finished_at'] = current_time('mysql');
+        return $job;
     }
 
     /**
-     * Customizes the columns in the admin list table for assets.
-     * @param array $columns Existing columns.
-     * @return array Modified columns.
+     * Stores the merged volumes of a large export in the job's ZIP file.
+     * @param array $job The job state, with 'file' set to the ZIP's name.
+     * @param array $volumes Volume file names in page order.
+     * @throws \\RuntimeException If the ZIP cannot be written.
      */
-    public function customize_admin_columns($columns) {
-        // cb, title, date are standard
-        $new_columns = [
-            'cb' => $columns['cb'],
-            'title' => __('Title', 'asset-manager-mvc'),
-            'asset_tag' => __('Asset Tag', 'asset-manager-mvc'),
-            'model' => __('Model', 'asset-manager-mvc'),
-            'serial_number' => __('Serial Number', 'asset-manager-mvc'),
-            'brand' => __('Brand', 'asset-manager-mvc'),
-            ASSET_MANAGER_MVC_TAXONOMY => __('Category', 'asset-manager-mvc'), // Use taxonomy slug
-            'status' => __('Status', 'asset-manager-mvc'),
-            'issued_to' => __('Issued To', 'asset-manager-mvc'),
-            'date' => __('Date', 'asset-manager-mvc')
-        ];
-        return $new_columns;
+    private function bundle_export_volumes(array $job, array $volumes) {
+        if (!class_exists('\\ZipArchive')) {
+            throw new \\RuntimeException(__('This export is too large for a single PDF and the ZipArchive extension is not available.', 'asset-manager-mvc'));
+        }
+        $zip = new \\ZipArchive();
+        if ($zip->open($this->export_job_model->get_file_path($job, $job['file']), \\ZipArchive::CREATE | \\ZipArchive::OVERWRITE) !== true) {
+            throw new \\RuntimeException(__('Could not create the export archive.', 'asset-manager-mvc'));
+        }
+        foreach ($volumes as $index => $volume_name) {
+            $entry = sprintf('assets-mvc-%03d.pdf', $index + 1);
+            $zip->addFile($this->export_job_model->get_file_path($job, $volume_name), $entry);
+            // PDFs are compressed already
+            $zip->setCompressionName($entry, \\ZipArchive::CM_STORE);
+        }
+        if (!$zip->close()) {
+            throw new \\RuntimeException(__('Could not create the export archive.', 'asset-manager-mvc'));
+        }
     }
 
     /**
-     * Renders content for custom columns in the admin list table.
-     * @param string $column The name of the column.
-     * @param int $post_id The ID of the current post.
+     * Passes batches through until the deadline has passed.
+     * @param \\Generator $batches Batches from Asset_Model::iterate_assets_for_export().
+     * @param float $deadline microtime(true) value after which no further batch is started.
+     * @return \\Generator
      */
-    public function render_custom_column_content($column, $post_id) {
-        switch ($column) {
-            case 'asset_tag':
-                echo esc_html(get_post_meta($post_id, ASSET_MANAGER_MVC_META_PREFIX . 'asset_tag', true));
-                break;
-            case 'model':
-                echo esc_html(get_post_meta($post_id, ASSET_MANAGER_MVC_META_PREFIX . 'model', true));
-                break;
-            case 'serial_number':
-                echo esc_html(get_post_meta($post_id, ASSET_MANAGER_MVC_META_PREFIX . 'serial_number', true));
-                break;
-            case 'brand':
-                echo esc_html(get_post_meta($post_id, ASSET_MANAGER_MVC_META_PREFIX . 'brand', true));
-                break;
-            case ASSET_MANAGER_MVC_TAXONOMY: // Use taxonomy slug
-                $terms = get_the_terms($post_id, ASSET_MANAGER_MVC_TAXONOMY);
-                if (!empty($terms) && !is_wp_error($terms)) {
-                    echo esc_html(implode(', ', wp_list_pluck($terms, 'name')));
-                } else {
-                    echo '—';
-                }
-                break;
-            case 'status':
-                echo esc_html(get_post_meta($post_id, ASSET_MANAGER_MVC_META_PREFIX . 'status', true));
-                break;
-            case 'issued_to':
-                $user_id = get_post_meta($post_id, ASSET_MANAGER_MVC_META_PREFIX . 'issued_to', true);
-                if ($user_id) {
-                    $user = get_userdata($user_id);
-                    echo esc_html($user ? $user->display_name : __('Unknown User', 'asset-manager-mvc'));
-                } else {
-                    echo '—';
-                }
-                break;
+    private function take_batches_until(\\Generator $batches, $deadline) {
+        while ($batches->valid()) {
+            yield $batches->current();
+            if (microtime(true) >= $deadline) {
+                return;
+            }
+            $batches->next();
         }
     }
 
     /**
-     * Helper function to load a view file.
-     * @param string $view_name The name of the view file (without .php).
-     * @param array $data Data to pass to the view.
+     * (Re)schedules the worker event for a job and kicks WP-Cron if it is due now.
+     * @param string $job_key The job key.
+     * @param int $delay Seconds from now.
+     * @param bool $spawn Whether to spawn WP-Cron immediately.
      */
-    protected function load_view($view_name, $data = []) {
-        // Make data available to the view file
-        extract($data);
-        $file_path = ASSET_MANAGER_MVC_PATH . 'includes/views/' . $view_name . '.php';
-        if (file_exists($file_path)) {
-            include $file_path;
-        } else {
-            // Optionally, log an error or display a message if the view file is not found
-            echo "<p>Error: View file not found at {$file_path}</p>";
+    private function schedule_export_tick($job_key, $delay, $spawn = true) {
+        wp_clear_scheduled_hook(ASSET_MANAGER_MVC_EXPORT_CRON_HOOK, [$job_key]);
+        wp_schedule_single_event(time() + $delay, ASSET_MANAGER_MVC_EXPORT_CRON_HOOK, [$job_key]);
+        if ($spawn && $delay === 0) {
+            spawn_cron();
         }
     }
-}
-"""
-
-# Dashboard Controller: includes/controllers/class-dashboard-controller.php
-dashboard_controller_php_content = """<?php
-// File: includes/controllers/class-dashboard-controller.php
-
-namespace AssetManagerMvc\\Controllers;
-
-use AssetManagerMvc\\Models\\Asset_Model;
-
-if (!defined('ABSPATH')) exit;
 
-/**
- * Dashboard_Controller Class
- *
- * Handles the display of the asset dashboard.
- */
-class Dashboard_Controller {
-
-    private $asset_model;
+    /**
+     * Builds the job summary shown on the export page and returned by the status endpoint.
+     * @param array|null $job The job state.
+     * @return array|null
+     */
+    private function format_job_status($job) {
+        if (!$job) {
+            return null;
+        }
+        $total = max(0, (int) $job['total']);
+        $processed = min((int) $job['processed'], $total);
+        return [
+            'status' => $job['status'],
+            'stale' => $job['status'] === 'done' && (empty($job['version']) || $job['version'] !== $this->asset_model->get_inventory_version()),
+            'processed' => $processed,
+            'total' => $total,
+            'percent' => $total > 0 ? (int) floor($processed * 100 / $total) : ($job['status'] === 'done' ? 100 : 0),
+            'error' => $job['error'],
+            'created_at' => $job['created_at'],
+            'finished_at' => isset($job['finished_at']) ? $job['finished_at'] : '',
+            'download_url' => $job['status'] === 'done' ? wp_nonce_url(
+                add_query_arg(['action' => 'am_mvc_download_export_action', 'job' => $job['key']], admin_url('admin-post.php')),
+                'am_mvc_download_export_' . $job['key']
+            ) : '',
+        ];
+    }
 
-    public function __construct(Asset_Model $asset_model) {
-        $this->asset_model = $asset_model;
+    /**
+     * Loads mPDF from the plugin's vendor directory if needed.
+     * @return bool Whether mPDF is available.
+     */
+    private function load_pdf_library() {
+        // Ensure mPDF is available (assuming it's in vendor directory)
+        $mpdf_autoloader = ASSET_MANAGER_MVC_PATH . 'vendor/autoload.php';
+        if (file_exists($mpdf_autoloader) && !class_exists('\\Mpdf\\Mpdf')) {
+            require_once $mpdf_autoloader;
+        }
+        return class_exists('\\Mpdf\\Mpdf');
     }
 
-    public function register_hooks() {
-        add_action('admin_menu', [$this, 'register_dashboard_page']);
-        add_action('admin_enqueue_scripts', [$this, 'enqueue_dashboard_assets']);
+    /**
+     * Creates an mPDF document configured for chunked table output.
+     * @return \\Mpdf\\Mpdf
+     */
+    protected function create_pdf_document() {
+        $mpdf = new \\Mpdf\\Mpdf([
+            'mode' => 'utf-8',
+            'format' => 'A4-L',
+            'tempDir' => $this->export_job_model->get_temp_dir(),
+            'simpleTables' => true, // Cell borders/padding from the table, much less memory per cell
+            'packTableData' => true,
+            'shrink_tables_to_fit' => 1, // Keep column widths identical across chunks
+        ]);
+        $mpdf->SetTitle(esc_attr__('Asset List', 'asset-manager-mvc'));
+        $mpdf->SetAuthor(esc_attr(get_bloginfo('name')));
+        return $mpdf;
     }
 
-    public function register_dashboard_page() {
-        add_submenu_page(
-            'edit.php?post_type=' . ASSET_MANAGER_MVC_POST_TYPE,
-            __('Asset Dashboard', 'asset-manager-mvc'),
-            __('Dashboard', 'asset-manager-mvc'),
-            'manage_options', // Capability
-            'asset_mvc_dashboard', // Menu slug
-            [$this, 'render_dashboard_page_view']
+    /**
+     * Writes the asset list to mPDF one batch at a time.
+     *
+     * The stylesheet is written once, then every batch becomes its own table with identical
+     * fixed column widths, so only one batch of HTML is held in memory.
+     * @param \\Mpdf\\Mpdf $mpdf The document to write to.
+     * @param iterable $batches Batches as yielded by Asset_Model::iterate_assets_for_export().
+     * @param bool $with_heading Whether to start with the document heading (first part only).
+     * @return array ['rows' => int, 'cursor' => array|null] Rows written and cursor of the last batch.
+     */
+    protected function write_pdf_chunks($mpdf, $batches, $with_heading = true) {
+        $mpdf->WriteHTML($this->render_view('pdf/asset-export-styles'), \\Mpdf\\HTMLParserMode::HEADER_CSS);
+        $mpdf->WriteHTML(
+            $with_heading ? $this->render_view('pdf/asset-export-header') : '',
+            \\Mpdf\\HTMLParserMode::HTML_BODY,
+            true,
+            false
         );
-    }
 
-    public function enqueue_dashboard_assets($hook) {
-        // Check if we are on the dashboard page
-        $current_screen = get_current_screen();
-        if ($current_screen && $current_screen->id === ASSET_MANAGER_MVC_POST_TYPE . '_page_asset_mvc_dashboard') {
-             wp_enqueue_style(
-                'asset-manager-mvc-admin-css', // Can reuse if styles are general
-                ASSET_MANAGER_MVC_URL . 'assets/css/asset-manager-admin.css',
-                [],
-                ASSET_MANAGER_MVC_VERSION
-            );
-            wp_enqueue_script('chart-js', 'https://cdn.jsdelivr.net/npm/chart.js', [], '4.4.1', true);
-            wp_enqueue_script(
-                'asset-dashboard-mvc-js',
-                ASSET_MANAGER_MVC_URL . 'assets/js/asset-dashboard.js', // Assuming you have this JS file
-                ['jquery', 'chart-js'],
-                ASSET_MANAGER_MVC_VERSION,
-                true
+        $cursor = null;
+        $rows_written = 0;
+        foreach ($batches as $batch) {
+            $mpdf->WriteHTML(
+                $this->render_view('pdf/asset-export-table', ['assets' => $batch['rows']]),
+                \\Mpdf\\HTMLParserMode::HTML_BODY,
+                false,
+                false
             );
+            $rows_written += count($batch['rows']);
+            $cursor = $batch['cursor'];
+            unset($batch);
+        }
 
-            // Localize script with data for charts
-            wp_localize_script('asset-dashboard-mvc-js', 'assetDashboardData', $this->asset_model->get_dashboard_data());
+        if ($with_heading && $rows_written === 0) {
+            $mpdf->WriteHTML($this->render_view('pdf/asset-export-table', ['assets' => []]), \\Mpdf\\HTMLParserMode::HTML_BODY, false, false);
         }
+        $mpdf->WriteHTML('', \\Mpdf\\HTMLParserMode::HTML_BODY, false, true);
+
+        return ['rows' => $rows_written, 'cursor' => $cursor];
     }
 
-    public function render_dashboard_page_view() {
-        // Data for the view is already localized for JS.
-        $this->load_view('admin/dashboard-page');
+    /**
+     * Renders a view into a string.
+     * @param string $view_name The name of the view file (without .php).
+     * @param array $data Data to pass to the view.
+     * @return string
+     */
+    protected function render_view($view_name, $data = []) {
+        ob_start();
+        $this->load_view($view_name, $data);
+        return ob_get_clean();
     }
 
     protected function load_view($view_name, $data = []) {
@@ -924,16 +3995,16 @@ class Dashboard_Controller {
         if (file_exists($file_path)) {
             include $file_path;
         } else {
-            echo "<p>Error: View file not found at {$file_path}</p>";
+             echo "<p>Error: View file not found at {$file_path}</p>";
         }
     }
 }
 """
 
-# Export Controller: includes/controllers/class-export-controller.php
-export_controller_php_content = """<?php
-// File: includes/controllers/class-export-controller.php
-
+# REST Controller: includes/controllers/class-rest-controller.php
+rest_controller_php_content = """<?php
+// File: includes/controllers/class-rest-controller.php
+
 namespace AssetManagerMvc\\Controllers;
 
 use AssetManagerMvc\\Models\\Asset_Model;
@@ -941,99 +4012,360 @@ use AssetManagerMvc\\Models\\Asset_Model;
 if (!defined('ABSPATH')) exit;
 
 /**
- * Export_Controller Class
+ * Rest_Controller Class
  *
- * Handles asset exporting functionality, e.g., to PDF.
+ * Serves assets with their fields, category and assignee names inline at
+ * GET /wp-json/asset-manager-mvc/v1/assets, so integrations do not need a request per asset,
+ * and the change feed at GET /wp-json/asset-manager-mvc/v1/changes for delta synchronization.
  */
-class Export_Controller {
+class Rest_Controller {
 
     private $asset_model;
 
+    private $default_per_page = 100;
+
+    private $max_per_page = 500;
+
+    private $default_change_limit = 500;
+
+    private $max_change_limit = 1000;
+
     public function __construct(Asset_Model $asset_model) {
         $this->asset_model = $asset_model;
     }
 
     public function register_hooks() {
-        add_action('admin_menu', [$this, 'register_export_page']);
-        add_action('admin_post_am_mvc_export_assets_pdf_action', [$this, 'handle_pdf_export']);
+        add_action('rest_api_init', [$this, 'register_routes']);
     }
 
-    public function register_export_page() {
-        add_submenu_page(
-            'edit.php?post_type=' . ASSET_MANAGER_MVC_POST_TYPE,
-            __('Export Assets', 'asset-manager-mvc'),
-            __('Export to PDF', 'asset-manager-mvc'),
-            'manage_options',
-            'export_assets_mvc', // Menu slug
-            [$this, 'render_export_page_view']
-        );
+    /**
+     * Registers the REST routes.
+     */
+    public function register_routes() {
+        register_rest_route(ASSET_MANAGER_MVC_REST_NAMESPACE, '/assets', [
+            'methods' => \\WP_REST_Server::READABLE,
+            'callback' => [$this, 'get_assets'],
+            'permission_callback' => [$this, 'check_read_permission'],
+            'args' => [
+                'per_page' => [
+                    'type' => 'integer',
+                    'default' => $this->default_per_page,
+                    'minimum' => 1,
+                    'maximum' => $this->max_per_page,
+                ],
+                'order' => [
+                    'type' => 'string',
+                    'default' => 'id',
+                    'enum' => ['id', 'modified'],
+                    'description' => __('Walk assets by ID, or by modification time (then ID).', 'asset-manager-mvc'),
+                ],
+                'cursor' => [
+                    'type' => 'string',
+                    'description' => __('Opaque cursor returned as next_cursor by the previous page.', 'asset-manager-mvc'),
+                ],
+                'modified_after' => [
+                    'type' => 'string',
+                    'format' => 'date-time',
+                    'description' => __('Only return assets modified after this time.', 'asset-manager-mvc'),
+                ],
+                'fields' => [
+                    'type' => 'string',
+                    'description' => __('Comma-separated list of fields to return; id is always included.', 'asset-manager-mvc'),
+                    'validate_callback' => [$this, 'validate_fields_param'],
+                ],
+                'include' => [
+                    'type' => 'array',
+                    'items' => ['type' => 'integer'],
+                    'maxItems' => $this->max_per_page,
+                    'default' => [],
+                    'description' => __('Only return these asset IDs, e.g. the ones reported by the change feed.', 'asset-manager-mvc'),
+                ],
+            ],
+        ]);
+
+        register_rest_route(ASSET_MANAGER_MVC_REST_NAMESPACE, '/changes', [
+            'methods' => \\WP_REST_Server::READABLE,
+            'callback' => [$this, 'get_changes'],
+            'permission_callback' => [$this, 'check_read_permission'],
+            'args' => [
+                'after' => [
+                    'type' => 'integer',
+                    'minimum' => 0,
+                    'description' => __('Sequence number of the last change already processed. Omit to get the current position only.', 'asset-manager-mvc'),
+                ],
+                'limit' => [
+                    'type' => 'integer',
+                    'default' => $this->default_change_limit,
+                    'minimum' => 1,
+                    'maximum' => $this->max_change_limit,
+                ],
+            ],
+        ]);
     }
 
-    public function render_export_page_view() {
-        $this->load_view('admin/export-page');
+    /**
+     * Reading assets is limited to users who can edit posts, as in the admin screens.
+     * @return bool|\\WP_Error
+     */
+    public function check_read_permission() {
+        if (current_user_can('edit_posts')) {
+            return true;
+        }
+        return new \\WP_Error('rest_forbidden', __('Sorry, you are not allowed to list assets.', 'asset-manager-mvc'), ['status' => rest_authorization_required_code()]);
     }
 
-    public function handle_pdf_export() {
-        if (!isset($_POST['am_mvc_export_nonce']) || !wp_verify_nonce($_POST['am_mvc_export_nonce'], 'am_mvc_export_assets_pdf_nonce')) {
-            wp_die(__('Security check failed.', 'asset-manager-mvc'), __('Error', 'asset-manager-mvc'), ['response' => 403]);
+    /**
+     * Rejects unknown names in the fields parameter.
+     * @param string $value The parameter value.
+     * @return bool|\\WP_Error
+     */
+    public function validate_fields_param($value) {
+        $unknown = array_diff($this->parse_fields($value), $this->get_item_fields());
+        if ($unknown) {
+            return new \\WP_Error('rest_invalid_param', sprintf(__('Unknown fields: %s', 'asset-manager-mvc'), implode(', ', $unknown)), ['status' => 400]);
         }
-        if (!current_user_can('manage_options')) {
-            wp_die(__('You do not have sufficient permissions to export assets.', 'asset-manager-mvc'), __('Error', 'asset-manager-mvc'), ['response' => 403]);
+        return true;
+    }
+
+    /**
+     * Returns one page of assets.
+     *
+     * The page is located with a keyset query that only reads IDs and modification times. Its ETag is
+     * derived from those, so a matching If-None-Match is answered with 304 before any meta, term or user
+     * data is loaded.
+     * @param \\WP_REST_Request $request The request.
+     * @return \\WP_REST_Response|\\WP_Error
+     */
+    public function get_assets(\\WP_REST_Request $request) {
+        $order = $request['order'];
+        $per_page = (int) $request['per_page'];
+        $fields = $request['fields'] ? array_unique(array_merge(['id'], $this->parse_fields($request['fields']))) : $this->get_item_fields();
+
+        $cursor = null;
+        if (!empty($request['cursor'])) {
+            $cursor = $this->decode_cursor($request['cursor'], $order);
+            if (!$cursor) {
+                return new \\WP_Error('rest_invalid_param', __('Invalid cursor.', 'asset-manager-mvc'), ['status' => 400]);
+            }
+        }
+        $modified_after = '';
+        if (!empty($request['modified_after'])) {
+            $timestamp = rest_parse_date($request['modified_after']);
+            if (!$timestamp) {
+                return new \\WP_Error('rest_invalid_param', __('Invalid modified_after date.', 'asset-manager-mvc'), ['status' => 400]);
+            }
+            $modified_after = gmdate('Y-m-d H:i:s', $timestamp);
         }
 
-        // Ensure mPDF is available (assuming it's in vendor directory)
-        $mpdf_autoloader = ASSET_MANAGER_MVC_PATH . 'vendor/autoload.php';
-        if (file_exists($mpdf_autoloader) && !class_exists('\\Mpdf\\Mpdf')) {
-            require_once $mpdf_autoloader;
+        // Fetch one extra row to know whether there is a next page without counting
+        $posts = $this->asset_model->get_asset_posts_after($cursor, $per_page + 1, $order, $modified_after, (array) $request['include']);
+        $has_more = count($posts) > $per_page;
+        $posts = array_slice($posts, 0, $per_page);
+
+        $etag = $this->build_etag($posts, $fields, $has_more);
+        if ($this->etag_matches($request->get_header('if_none_match'), $etag)) {
+            $response = new \\WP_REST_Response(null, 304);
+            $response->header('ETag', $etag);
+            return $response;
         }
-        if (!class_exists('\\Mpdf\\Mpdf')) {
-            wp_die(
-                __('PDF Export library (mPDF) is missing or could not be loaded. Please ensure it is installed in the plugin\\'s vendor directory.', 'asset-manager-mvc'),
-                __('PDF Library Error', 'asset-manager-mvc'),
-                ['back_link' => true]
-            );
-            return;
+
+        $items = [];
+        if (!array_diff($fields, ['id', 'title', 'modified'])) {
+            // Listing only: everything needed is in the post rows, so skip loading meta, terms and users
+            foreach ($posts as $post) {
+                $item = ['id' => (int) $post->ID, 'title' => $post->post_title, 'modified' => mysql_to_rfc3339($post->post_modified_gmt)];
+                $items[] = array_intersect_key($item, array_flip($fields));
+            }
+        } else {
+            $modified_gmt = wp_list_pluck($posts, 'post_modified_gmt', 'ID');
+            foreach ($this->asset_model->get_assets_data($posts) as $post_id => $row) {
+                $items[] = $this->prepare_item($row, $modified_gmt[$post_id], $fields);
+            }
         }
 
-        $assets_query = $this->asset_model->get_all_assets_for_export();
-        
-        // Prepare data for the PDF template view
-        $data_for_pdf_view = [
-            'assets_query' => $assets_query,
-            'asset_model' => $this->asset_model, // Pass model for field definitions if needed
-            'meta_prefix' => ASSET_MANAGER_MVC_META_PREFIX,
-            'taxonomy_slug' => ASSET_MANAGER_MVC_TAXONOMY
+        $next_cursor = null;
+        if ($has_more) {
+            $last = end($posts);
+            $next_cursor = $this->encode_cursor($order, $last);
+        }
+
+        $response = rest_ensure_response([
+            'items' => $items,
+            'next_cursor' => $next_cursor,
+        ]);
+        $response->header('ETag', $etag);
+        $response->header('Cache-Control', 'private, no-cache');
+        if ($next_cursor) {
+            // add_query_arg() does not encode values, and a '+' in a UTC offset would come back as a space
+            $next_url = add_query_arg(array_map('rawurlencode', array_filter([
+                'per_page' => $per_page,
+                'order' => $order,
+                'modified_after' => $modified_after ? mysql_to_rfc3339($modified_after) . 'Z' : null,
+                'fields' => $request['fields'],
+                'include' => $request['include'] ? implode(',', $request['include']) : null,
+                'cursor' => $next_cursor,
+            ])), rest_url(ASSET_MANAGER_MVC_REST_NAMESPACE . '/assets'));
+            $response->link_header('next', $next_url);
+        }
+        return $response;
+    }
+
+    /**
+     * Returns the changes recorded after a sequence number.
+     *
+     * A client first reads the current position (no 'after'), pulls the full list from /assets, then
+     * polls this endpoint with the last 'next_after' it processed and re-fetches the reported asset IDs
+     * through /assets?include=. Assets missing from that response are no longer published. A 410 means
+     * the cursor is older than the retained feed and the client has to start over.
+     * @param \\WP_REST_Request $request The request.
+     * @return \\WP_REST_Response|\\WP_Error
+     */
+    public function get_changes(\\WP_REST_Request $request) {
+        if (!isset($request['after'])) {
+            return rest_ensure_response([
+                'changes' => [],
+                'next_after' => $this->asset_model->get_latest_change_seq(),
+                'has_more' => false,
+            ]);
+        }
+
+        $after = (int) $request['after'];
+        if ($after < $this->asset_model->get_pruned_change_seq()) {
+            return new \\WP_Error('asset_manager_mvc_cursor_expired', __('Changes after this cursor are no longer available; resynchronize from /assets.', 'asset-manager-mvc'), ['status' => 410]);
+        }
+
+        $limit = (int) $request['limit'];
+        $rows = $this->asset_model->get_changes_after($after, $limit + 1);
+        $has_more = count($rows) > $limit;
+        $rows = array_slice($rows, 0, $limit);
+
+        $changes = [];
+        foreach ($rows as $row) {
+            $changes[] = [
+                'seq' => (int) $row->seq,
+                'id' => (int) $row->asset_id,
+                'action' => $row->action,
+                'changed_at' => mysql_to_rfc3339($row->changed_at),
+            ];
+        }
+
+        return rest_ensure_response([
+            'changes' => $changes,
+            'next_after' => $changes ? end($changes)['seq'] : $after,
+            'has_more' => $has_more,
+        ]);
+    }
+
+    /**
+     * Names of the fields an item can contain.
+     * @return string[]
+     */
+    private function get_item_fields() {
+        return array_merge(['id', 'title', 'modified'], $this->asset_model->get_fields(), ['issued_to_name', 'categories']);
+    }
+
+    /**
+     * Splits a comma-separated fields parameter.
+     * @param string $value The parameter value.
+     * @return string[]
+     */
+    private function parse_fields($value) {
+        return array_values(array_filter(array_map('trim', explode(',', (string) $value))));
+    }
+
+    /**
+     * Shapes one row from Asset_Model::get_assets_data() for the response, keeping only the requested fields.
+     * @param array $row The asset row.
+     * @param string $modified_gmt The post's post_modified_gmt.
+     * @param string[] $fields Requested fields.
+     * @return array
+     */
+    private function prepare_item(array $row, $modified_gmt, array $fields) {
+        $item = [
+            'id' => $row['ID'],
+            'title' => $row['title'],
+            'modified' => mysql_to_rfc3339($modified_gmt),
         ];
+        foreach ($row['meta'] as $field_key => $value) {
+            $item[$field_key] = ($field_key === 'issued_to') ? absint($value) : $value;
+        }
+        $item['issued_to_name'] = $row['issued_to_name'];
+        $item['categories'] = [];
+        foreach ($row['category_ids'] as $index => $term_id) {
+            $item['categories'][] = ['id' => $term_id, 'name' => $row['categories'][$index]];
+        }
+        return array_intersect_key($item, array_flip($fields));
+    }
 
-        // Get HTML content from a view file
-        ob_start();
-        $this->load_view('pdf/asset-export-template', $data_for_pdf_view);
-        $html = ob_get_clean();
-        
-        try {
-            $mpdf = new \\Mpdf\\Mpdf(['mode' => 'utf-8', 'format' => 'A4-L']);
-            $mpdf->SetTitle(esc_attr__('Asset List', 'asset-manager-mvc'));
-            $mpdf->SetAuthor(esc_attr(get_bloginfo('name')));
-            $mpdf->WriteHTML($html);
-            $mpdf->Output('assets-mvc-' . date('Y-m-d') . '.pdf', 'D'); // D for download
-            exit;
-        } catch (\\Mpdf\\MpdfException $e) {
-            wp_die(
-                sprintf(esc_html__('Error generating PDF: %s', 'asset-manager-mvc'), esc_html($e->getMessage())),
-                esc_html__('PDF Generation Error', 'asset-manager-mvc'),
-                ['back_link' => true]
-            );
+    /**
+     * Weak ETag for a page: changes when its set of assets or any of their modification times changes.
+     * Edits that do not touch post_modified (renaming a category or a user) are not reflected.
+     * @param array $posts Post rows of the page.
+     * @param string[] $fields Requested fields.
+     * @param bool $has_more Whether a next page exists.
+     * @return string
+     */
+    private function build_etag(array $posts, array $fields, $has_more) {
+        $parts = [ASSET_MANAGER_MVC_VERSION, implode(',', $fields), $has_more ? '1' : '0'];
+        foreach ($posts as $post) {
+            $parts[] = $post->ID . ':' . $post->post_modified_gmt;
         }
+        return 'W/"' . md5(implode('|', $parts)) . '"';
     }
 
-    protected function load_view($view_name, $data = []) {
-        extract($data);
-        $file_path = ASSET_MANAGER_MVC_PATH . 'includes/views/' . $view_name . '.php';
-        if (file_exists($file_path)) {
-            include $file_path;
-        } else {
-             echo "<p>Error: View file not found at {$file_path}</p>";
+    /**
+     * Whether an If-None-Match header matches an ETag, using weak comparison.
+     * @param string|null $header The header value.
+     * @param string $etag The current ETag.
+     * @return bool
+     */
+    private function etag_matches($header, $etag) {
+        if (empty($header)) {
+            return false;
+        }
+        $strip = function($tag) {
+            return preg_replace('/^W\\//', '', trim($tag));
+        };
+        foreach (explode(',', $header) as $candidate) {
+            if (trim($candidate) === '*' || $strip($candidate) === $strip($etag)) {
+                return true;
+            }
+        }
+        return false;
+    }
+
+    /**
+     * Encodes the position after a post as an opaque cursor.
+     * @param string $order 'id' or 'modified'.
+     * @param object $post Last post row of the page.
+     * @return string
+     */
+    private function encode_cursor($order, $post) {
+        $position = ['o' => $order, 'id' => (int) $post->ID];
+        if ($order === 'modified') {
+            $position['m'] = $post->post_modified_gmt;
+        }
+        return rtrim(strtr(base64_encode(wp_json_encode($position)), '+/', '-_'), '=');
+    }
+
+    /**
+     * Decodes a cursor created by encode_cursor() for the same order.
+     * @param string $cursor The cursor.
+     * @param string $order 'id' or 'modified'.
+     * @return array|null Cursor for Asset_Model::get_asset_posts_after(), or null if invalid.
+     */
+    private function decode_cursor($cursor, $order) {
+        $position = json_decode((string) base64_decode(strtr($cursor, '-_', '+/')), true);
+        if (!is_array($position) || !isset($position['o'], $position['id']) || $position['o'] !== $order) {
+            return null;
+        }
+        if ($order === 'modified') {
+            if (!isset($position['m']) || !preg_match('/^\\d{4}-\\d{2}-\\d{2} \\d{2}:\\d{2}:\\d{2}$/', $position['m'])) {
+                return null;
+            }
+            return ['modified' => $position['m'], 'id' => absint($position['id'])];
         }
+        return ['id' => absint($position['id'])];
     }
 }
 """
@@ -1044,7 +4376,7 @@ view_asset_fields_php_content = """<?php
 /**
  * Variables available:
  * @var array $meta_values Current meta values for the post.
- * @var array $users List of WP_User objects.
+ * @var \\WP_User|null $issued_to_user The currently assigned user, if any. Other users are searched via AJAX.
  * @var array $categories List of term objects for asset categories.
  * @var array $field_definitions Array of field keys (e.g., 'asset_tag', 'model').
  * @var array $field_labels Associative array of field_key => Label Text.
@@ -1066,13 +4398,17 @@ if (!defined('ABSPATH')) exit;
     <p>
         <label for="<?php echo esc_attr($field_id); ?>"><?php echo esc_html($label_text); ?>: <span class="required">*</span></label>
         <?php if ($field_key === 'issued_to') : ?>
+            <span class="asset-user-picker">
+                <input type="search" id="am-mvc-issued-to-search" class="widefat asset-user-search" data-target="#<?php echo esc_attr($field_id); ?>" placeholder="<?php esc_attr_e('Search users by name or email…', 'asset-manager-mvc'); ?>" autocomplete="off">
+                <ul class="asset-user-results" hidden></ul>
+            </span>
             <select id="<?php echo esc_attr($field_id); ?>" name="<?php echo esc_attr($field_name_attr); ?>" class="widefat" required>
                 <option value=""><?php esc_html_e('-- Select User --', 'asset-manager-mvc'); ?></option>
-                <?php foreach ($users as $user): ?>
-                    <option value="<?php echo esc_attr($user->ID); ?>" <?php selected($current_value, $user->ID); ?>>
-                        <?php echo esc_html($user->display_name . ' (' . $user->user_email . ')'); ?>
+                <?php if ($issued_to_user) : ?>
+                    <option value="<?php echo esc_attr($issued_to_user->ID); ?>" class="asset-user-picked" selected>
+                        <?php echo esc_html($issued_to_user->display_name . ' (' . $issued_to_user->user_email . ')'); ?>
                     </option>
-                <?php endforeach; ?>
+                <?php endif; ?>
             </select>
         <?php elseif ($field_key === 'status') : ?>
             <select id="<?php echo esc_attr($field_id); ?>" name="<?php echo esc_attr($field_name_attr); ?>" class="widefat" required>
@@ -1113,7 +4449,11 @@ view_asset_history_php_content = """<?php
 // File: includes/views/admin/asset-history-meta-box.php
 /**
  * Variables available:
- * @var array $history_entries Array of history log entries.
+ * @var array $history_entries History entries on the current page, newest first.
+ * @var int $history_page Current page number.
+ * @var int $history_pages Total number of pages.
+ * @var array $user_names Display names keyed by user ID.
+ * @var string $date_format Date and time format for the entry dates.
  */
 
 if (!defined('ABSPATH')) exit;
@@ -1126,13 +4466,10 @@ if (empty($history_entries)) {
 <ul class="asset-history">
     <?php foreach ($history_entries as $entry) :
         $user_info = '';
-        if (!empty($entry['user'])) {
-            $user_data = get_userdata($entry['user']);
-            if ($user_data) {
-                $user_info = ' (' . esc_html($user_data->display_name) . ')';
-            }
+        if (!empty($entry['user']) && isset($user_names[$entry['user']])) {
+            $user_info = ' (' . esc_html($user_names[$entry['user']]) . ')';
         }
-        $formatted_date = !empty($entry['date']) ? mysql2date(get_option('date_format') . ' @ ' . get_option('time_format'), $entry['date']) : __('Unknown Date', 'asset-manager-mvc');
+        $formatted_date = !empty($entry['date']) ? mysql2date($date_format, $entry['date']) : __('Unknown Date', 'asset-manager-mvc');
     ?>
     <li>
         <strong><?php echo esc_html($formatted_date) . esc_html($user_info); ?>:</strong>
@@ -1140,6 +4477,128 @@ if (empty($history_entries)) {
     </li>
     <?php endforeach; ?>
 </ul>
+<?php if ($history_pages > 1) : ?>
+<div class="asset-history-pagination">
+    <?php
+    echo paginate_links([
+        'base' => add_query_arg('history_page', '%#%'),
+        'format' => '',
+        'current' => $history_page,
+        'total' => $history_pages,
+        'add_fragment' => '#' . ASSET_MANAGER_MVC_META_PREFIX . 'history',
+    ]);
+    ?>
+</div>
+<?php endif; ?>
+"""
+
+# View: includes/views/admin/asset-list-filters.php
+view_asset_list_filters_php_content = """<?php
+// File: includes/views/admin/asset-list-filters.php
+/**
+ * Variables available:
+ * @var array $status_options Allowed status values.
+ * @var array $brands Distinct brands in the asset index.
+ * @var array $categories WP_Term objects for asset categories.
+ * @var array $users Display names of assigned users, keyed by user ID.
+ * @var array $selected Current filter values: status, brand, category, issued_to.
+ */
+
+if (!defined('ABSPATH')) exit;
+?>
+<label for="am-mvc-filter-status" class="screen-reader-text"><?php esc_html_e('Filter by status', 'asset-manager-mvc'); ?></label>
+<select name="asset_status" id="am-mvc-filter-status">
+    <option value=""><?php esc_html_e('All statuses', 'asset-manager-mvc'); ?></option>
+    <?php foreach ($status_options as $status) : ?>
+        <option value="<?php echo esc_attr($status); ?>" <?php selected($selected['status'], $status); ?>><?php echo esc_html($status); ?></option>
+    <?php endforeach; ?>
+</select>
+
+<label for="am-mvc-filter-brand" class="screen-reader-text"><?php esc_html_e('Filter by brand', 'asset-manager-mvc'); ?></label>
+<select name="asset_brand" id="am-mvc-filter-brand">
+    <option value=""><?php esc_html_e('All brands', 'asset-manager-mvc'); ?></option>
+    <?php foreach ($brands as $brand) : ?>
+        <option value="<?php echo esc_attr($brand); ?>" <?php selected($selected['brand'], $brand); ?>><?php echo esc_html($brand); ?></option>
+    <?php endforeach; ?>
+</select>
+
+<label for="am-mvc-filter-category" class="screen-reader-text"><?php esc_html_e('Filter by category', 'asset-manager-mvc'); ?></label>
+<select name="asset_cat" id="am-mvc-filter-category">
+    <option value="0"><?php esc_html_e('All categories', 'asset-manager-mvc'); ?></option>
+    <?php if (!is_wp_error($categories)) : foreach ($categories as $category) : ?>
+        <option value="<?php echo esc_attr($category->term_id); ?>" <?php selected($selected['category'], $category->term_id); ?>><?php echo esc_html($category->name); ?></option>
+    <?php endforeach; endif; ?>
+</select>
+
+<label for="am-mvc-filter-issued-to" class="screen-reader-text"><?php esc_html_e('Filter by assignee', 'asset-manager-mvc'); ?></label>
+<select name="asset_issued_to" id="am-mvc-filter-issued-to">
+    <option value="0"><?php esc_html_e('All assignees', 'asset-manager-mvc'); ?></option>
+    <?php foreach ($users as $user_id => $display_name) : ?>
+        <option value="<?php echo esc_attr($user_id); ?>" <?php selected($selected['issued_to'], $user_id); ?>><?php echo esc_html($display_name); ?></option>
+    <?php endforeach; ?>
+</select>
+"""
+
+# View: includes/views/admin/asset-bulk-update-fields.php
+view_asset_bulk_update_fields_php_content = """<?php
+// File: includes/views/admin/asset-bulk-update-fields.php
+/**
+ * Variables available:
+ * @var array $status_options Allowed status values.
+ * @var array $categories WP_Term objects for asset categories.
+ */
+
+if (!defined('ABSPATH')) exit;
+?>
+<span class="asset-bulk-update">
+    <label for="am-mvc-bulk-status" class="screen-reader-text"><?php esc_html_e('Bulk change status', 'asset-manager-mvc'); ?></label>
+    <select name="bulk_status" id="am-mvc-bulk-status">
+        <option value=""><?php esc_html_e('Status: no change', 'asset-manager-mvc'); ?></option>
+        <?php foreach ($status_options as $status) : ?>
+            <option value="<?php echo esc_attr($status); ?>"><?php echo esc_html($status); ?></option>
+        <?php endforeach; ?>
+    </select>
+
+    <label for="am-mvc-bulk-category" class="screen-reader-text"><?php esc_html_e('Bulk change category', 'asset-manager-mvc'); ?></label>
+    <select name="bulk_category" id="am-mvc-bulk-category">
+        <option value=""><?php esc_html_e('Category: no change', 'asset-manager-mvc'); ?></option>
+        <option value="0"><?php esc_html_e('None', 'asset-manager-mvc'); ?></option>
+        <?php if (!is_wp_error($categories)) : foreach ($categories as $category) : ?>
+            <option value="<?php echo esc_attr($category->term_id); ?>"><?php echo esc_html($category->name); ?></option>
+        <?php endforeach; endif; ?>
+    </select>
+
+    <span class="asset-user-picker">
+        <label for="am-mvc-bulk-issued-to-search" class="screen-reader-text"><?php esc_html_e('Find a user to assign', 'asset-manager-mvc'); ?></label>
+        <input type="search" id="am-mvc-bulk-issued-to-search" class="asset-user-search" data-target="#am-mvc-bulk-issued-to" placeholder="<?php esc_attr_e('Find assignee…', 'asset-manager-mvc'); ?>" autocomplete="off">
+        <ul class="asset-user-results" hidden></ul>
+    </span>
+    <label for="am-mvc-bulk-issued-to" class="screen-reader-text"><?php esc_html_e('Bulk change assignee', 'asset-manager-mvc'); ?></label>
+    <select name="bulk_issued_to" id="am-mvc-bulk-issued-to">
+        <option value=""><?php esc_html_e('Assignee: no change', 'asset-manager-mvc'); ?></option>
+        <option value="0"><?php esc_html_e('Unassigned', 'asset-manager-mvc'); ?></option>
+    </select>
+</span>
+"""
+
+# View: includes/views/admin/notices/bulk-update.php
+view_bulk_update_notice_php_content = """<?php
+// File: includes/views/admin/notices/bulk-update.php
+/**
+ * Variables available:
+ * @var int $updated Number of assets changed.
+ * @var int $skipped Number of selected assets left as they were (already matching, not editable or failed).
+ */
+if (!defined('ABSPATH')) exit;
+?>
+<div id="message" class="notice notice-success is-dismissible">
+    <p>
+        <?php echo esc_html(sprintf(_n('%s asset updated.', '%s assets updated.', $updated, 'asset-manager-mvc'), number_format_i18n($updated))); ?>
+        <?php if ($skipped) : ?>
+            <?php echo esc_html(sprintf(_n('%s asset left unchanged.', '%s assets left unchanged.', $skipped, 'asset-manager-mvc'), number_format_i18n($skipped))); ?>
+        <?php endif; ?>
+    </p>
+</div>
 """
 
 # View: includes/views/admin/notices/validation-errors.php
@@ -1171,11 +4630,32 @@ view_dashboard_page_php_content = """<?php
 /**
  * Data for charts is expected to be localized to asset-dashboard-mvc-js via wp_localize_script.
  * The JS file (assets/js/asset-dashboard.js) will handle chart rendering.
+ *
+ * Variables available:
+ * @var int $total_assets Number of published assets in the rollup.
+ * @var string $built_at MySQL datetime of the last full rebuild, or empty.
+ * @var string $drift_repaired 'drift' or 'ok' after a manual rebuild, otherwise empty.
  */
 if (!defined('ABSPATH')) exit;
 ?>
 <div class="wrap asset-manager-dashboard">
     <h1><?php esc_html_e('Asset Dashboard', 'asset-manager-mvc'); ?></h1>
+    <?php if ($drift_repaired === 'drift') : ?>
+        <div class="notice notice-warning is-dismissible"><p><?php esc_html_e('The stored counts were out of date and have been repaired.', 'asset-manager-mvc'); ?></p></div>
+    <?php elseif ($drift_repaired === 'ok') : ?>
+        <div class="notice notice-success is-dismissible"><p><?php esc_html_e('The stored counts were already up to date.', 'asset-manager-mvc'); ?></p></div>
+    <?php endif; ?>
+    <p class="dashboard-summary">
+        <?php printf(esc_html__('%d published assets.', 'asset-manager-mvc'), $total_assets); ?>
+        <?php if ($built_at) : ?>
+            <?php printf(esc_html__('Counts last rebuilt on %s.', 'asset-manager-mvc'), esc_html(mysql2date(get_option('date_format') . ' @ ' . get_option('time_format'), $built_at))); ?>
+        <?php endif; ?>
+    </p>
+    <form method="post" action="<?php echo esc_url(admin_url('admin-post.php')); ?>">
+        <input type="hidden" name="action" value="am_mvc_rebuild_dashboard_action">
+        <?php wp_nonce_field('am_mvc_rebuild_dashboard_nonce', 'am_mvc_dashboard_nonce'); ?>
+        <?php submit_button(__('Rebuild Counts', 'asset-manager-mvc'), 'secondary', 'submit', false); ?>
+    </form>
     <div class="dashboard-widgets-wrapper">
         <div class="dashboard-widget">
             <h2><?php esc_html_e('Assets by Status', 'asset-manager-mvc'); ?></h2>
@@ -1197,87 +4677,147 @@ if (!defined('ABSPATH')) exit;
 # View: includes/views/admin/export-page.php
 view_export_page_php_content = """<?php
 // File: includes/views/admin/export-page.php
+/**
+ * Variables available:
+ * @var array|null $job Status of the current PDF export job (see Export_Controller::format_job_status()).
+ *
+ * assets/js/asset-export.js polls the job status and updates #am-mvc-export-job while a job is active.
+ */
 if (!defined('ABSPATH')) exit;
+
+$is_active = $job && in_array($job['status'], ['queued', 'running', 'merging'], true);
 ?>
 <div class="wrap">
-    <h1><?php esc_html_e('Export Assets to PDF', 'asset-manager-mvc'); ?></h1>
-    <form method="post" action="<?php echo esc_url(admin_url('admin-post.php')); ?>">
+    <h1><?php esc_html_e('Export Assets', 'asset-manager-mvc'); ?></h1>
+
+    <h2><?php esc_html_e('PDF', 'asset-manager-mvc'); ?></h2>
+    <p><?php esc_html_e('The PDF is generated in the background. You can leave this page and come back to download it.', 'asset-manager-mvc'); ?></p>
+
+    <div id="am-mvc-export-job" class="asset-export-job" data-status="<?php echo esc_attr($job ? $job['status'] : ''); ?>" <?php echo $job ? '' : 'hidden'; ?>>
+        <progress class="asset-export-progress" max="100" value="<?php echo esc_attr($job ? $job['percent'] : 0); ?>"></progress>
+        <p class="asset-export-status">
+            <?php if ($job && $job['status'] === 'done') : ?>
+                <?php printf(esc_html__('Export finished: %1$d of %2$d assets.', 'asset-manager-mvc'), $job['processed'], $job['total']); ?>
+                <?php if ($job['stale']) : ?>
+                    <?php esc_html_e('Assets have changed since; exporting again will render a fresh PDF.', 'asset-manager-mvc'); ?>
+                <?php else : ?>
+                    <?php esc_html_e('Nothing has changed since; exporting again will reuse this PDF.', 'asset-manager-mvc'); ?>
+                <?php endif; ?>
+            <?php elseif ($job && $job['status'] === 'failed') : ?>
+                <?php printf(esc_html__('Export failed: %s', 'asset-manager-mvc'), esc_html($job['error'])); ?>
+            <?php elseif ($job && $job['status'] === 'merging') : ?>
+                <?php esc_html_e('Assembling the PDF…', 'asset-manager-mvc'); ?>
+            <?php elseif ($job) : ?>
+                <?php printf(esc_html__('Processed %1$d of %2$d assets…', 'asset-manager-mvc'), $job['processed'], $job['total']); ?>
+            <?php endif; ?>
+        </p>
+        <p class="asset-export-download" <?php echo ($job && $job['download_url']) ? '' : 'hidden'; ?>>
+            <a class="button button-primary" href="<?php echo esc_url($job ? $job['download_url'] : ''); ?>"><?php esc_html_e('Download PDF', 'asset-manager-mvc'); ?></a>
+        </p>
+    </div>
+
+    <form id="am-mvc-export-pdf-form" method="post" action="<?php echo esc_url(admin_url('admin-post.php')); ?>">
         <input type="hidden" name="action" value="am_mvc_export_assets_pdf_action">
         <?php wp_nonce_field('am_mvc_export_assets_pdf_nonce', 'am_mvc_export_nonce'); ?>
-        <?php submit_button(__('Export All Assets as PDF', 'asset-manager-mvc')); ?>
+        <?php submit_button($is_active ? __('Export in Progress…', 'asset-manager-mvc') : __('Export All Assets as PDF', 'asset-manager-mvc'), 'primary', 'submit', true, $is_active ? ['disabled' => 'disabled'] : null); ?>
+    </form>
+
+    <h2><?php esc_html_e('Data (CSV / NDJSON)', 'asset-manager-mvc'); ?></h2>
+    <p><?php esc_html_e('Downloads all assets immediately, one row per asset, for spreadsheets and scripts.', 'asset-manager-mvc'); ?></p>
+    <form method="post" action="<?php echo esc_url(admin_url('admin-post.php')); ?>">
+        <input type="hidden" name="action" value="am_mvc_export_assets_data_action">
+        <?php wp_nonce_field('am_mvc_export_assets_data_nonce', 'am_mvc_export_data_nonce'); ?>
+        <label for="am_mvc_export_format"><?php esc_html_e('Format:', 'asset-manager-mvc'); ?></label>
+        <select id="am_mvc_export_format" name="format">
+            <option value="csv"><?php esc_html_e('CSV', 'asset-manager-mvc'); ?></option>
+            <option value="ndjson"><?php esc_html_e('NDJSON (one JSON object per line)', 'asset-manager-mvc'); ?></option>
+        </select>
+        <?php submit_button(__('Download', 'asset-manager-mvc'), 'secondary', 'submit', false); ?>
     </form>
 </div>
 """
 
-# View: includes/views/pdf/asset-export-template.php
-view_pdf_template_php_content = """<?php
-// File: includes/views/pdf/asset-export-template.php
+# View: includes/views/pdf/asset-export-styles.php
+view_pdf_styles_php_content = """<?php
+// File: includes/views/pdf/asset-export-styles.php
 /**
- * Variables available:
- * @var \\WP_Query $assets_query The query object for assets.
- * @var \\AssetManagerMvc\\Models\\Asset_Model $asset_model Instance of Asset_Model.
- * @var string $meta_prefix The meta prefix.
- * @var string $taxonomy_slug The taxonomy slug.
+ * Stylesheet for the PDF export, written once with HTMLParserMode::HEADER_CSS.
+ * Column widths are fixed so the per-batch tables line up with each other.
  */
-if (!defined('ABSPATH')) exit; // Should not be accessed directly, but good practice.
-
-// This file generates HTML that will be converted to PDF by mPDF.
-// Basic styling is included here. More complex styling can be added.
+if (!defined('ABSPATH')) exit;
 ?>
-<style>
-    body { font-family: sans-serif; font-size: 10px; }
-    table { width: 100%; border-collapse: collapse; margin-bottom: 20px; }
-    th, td { border: 1px solid #ddd; padding: 6px; text-align: left; vertical-align: top; word-wrap: break-word; }
-    th { background-color: #f2f2f2; font-weight: bold; }
-    h1 { text-align: center; margin-bottom: 20px; font-size: 16px; }
-    .no-assets { text-align: center; font-style: italic; }
-</style>
+body { font-family: sans-serif; font-size: 10px; }
+table { width: 100%; border-collapse: collapse; margin: 0; }
+th, td { border: 1px solid #ddd; padding: 6px; text-align: left; vertical-align: top; word-wrap: break-word; }
+th { background-color: #f2f2f2; font-weight: bold; }
+h1 { text-align: center; margin-bottom: 20px; font-size: 16px; }
+.no-assets { text-align: center; font-style: italic; }
+.col-title { width: 11%; }
+.col-asset-tag { width: 8%; }
+.col-model { width: 9%; }
+.col-serial { width: 10%; }
+.col-brand { width: 8%; }
+.col-category { width: 9%; }
+.col-status { width: 7%; }
+.col-issued-to { width: 10%; }
+.col-date { width: 8%; }
+.col-description { width: 20%; }
+"""
 
+# View: includes/views/pdf/asset-export-header.php
+view_pdf_header_php_content = """<?php
+// File: includes/views/pdf/asset-export-header.php
+if (!defined('ABSPATH')) exit;
+?>
 <h1><?php esc_html_e('Asset List', 'asset-manager-mvc'); ?></h1>
+"""
 
+# View: includes/views/pdf/asset-export-table.php
+view_pdf_table_php_content = """<?php
+// File: includes/views/pdf/asset-export-table.php
+/**
+ * Renders one batch of assets as a table. The export writes one of these per batch.
+ *
+ * Variables available:
+ * @var array $assets Rows as returned by Asset_Model::get_assets_data().
+ */
+if (!defined('ABSPATH')) exit;
+?>
 <table>
     <thead>
         <tr>
-            <th><?php esc_html_e('Title', 'asset-manager-mvc'); ?></th>
-            <th><?php esc_html_e('Asset Tag', 'asset-manager-mvc'); ?></th>
-            <th><?php esc_html_e('Model', 'asset-manager-mvc'); ?></th>
-            <th><?php esc_html_e('Serial No.', 'asset-manager-mvc'); ?></th>
-            <th><?php esc_html_e('Brand', 'asset-manager-mvc'); ?></th>
-            <th><?php esc_html_e('Category', 'asset-manager-mvc'); ?></th>
-            <th><?php esc_html_e('Status', 'asset-manager-mvc'); ?></th>
-            <th><?php esc_html_e('Issued To', 'asset-manager-mvc'); ?></th>
-            <th><?php esc_html_e('Date Purchased', 'asset-manager-mvc'); ?></th>
-            <th><?php esc_html_e('Description', 'asset-manager-mvc'); ?></th>
+            <th class="col-title"><?php esc_html_e('Title', 'asset-manager-mvc'); ?></th>
+            <th class="col-asset-tag"><?php esc_html_e('Asset Tag', 'asset-manager-mvc'); ?></th>
+            <th class="col-model"><?php esc_html_e('Model', 'asset-manager-mvc'); ?></th>
+            <th class="col-serial"><?php esc_html_e('Serial No.', 'asset-manager-mvc'); ?></th>
+            <th class="col-brand"><?php esc_html_e('Brand', 'asset-manager-mvc'); ?></th>
+            <th class="col-category"><?php esc_html_e('Category', 'asset-manager-mvc'); ?></th>
+            <th class="col-status"><?php esc_html_e('Status', 'asset-manager-mvc'); ?></th>
+            <th class="col-issued-to"><?php esc_html_e('Issued To', 'asset-manager-mvc'); ?></th>
+            <th class="col-date"><?php esc_html_e('Date Purchased', 'asset-manager-mvc'); ?></th>
+            <th class="col-description"><?php esc_html_e('Description', 'asset-manager-mvc'); ?></th>
         </tr>
     </thead>
     <tbody>
-        <?php if ($assets_query->have_posts()) : ?>
-            <?php while ($assets_query->have_posts()) : $assets_query->the_post(); ?>
-                <?php
-                $post_id = get_the_ID();
-                $meta = $asset_model->get_asset_meta($post_id); // Get all meta using model method
-                $issued_to_name = '—';
-                if (!empty($meta['issued_to'])) {
-                    $user = get_userdata($meta['issued_to']);
-                    $issued_to_name = $user ? $user->display_name : __('Unknown User', 'asset-manager-mvc');
-                }
-                $categories = get_the_terms($post_id, $taxonomy_slug);
-                $category_name = (!empty($categories) && !is_wp_error($categories)) ? esc_html(implode(', ', wp_list_pluck($categories, 'name'))) : '—';
-                ?>
+        <?php if (!empty($assets)) : ?>
+            <?php foreach ($assets as $asset) :
+                $meta = $asset['meta'];
+                $issued_to_name = $asset['issued_to_name'] !== '' ? $asset['issued_to_name'] : '—';
+                $category_name = !empty($asset['categories']) ? implode(', ', $asset['categories']) : '—';
+            ?>
                 <tr>
-                    <td><?php echo esc_html(get_the_title()); ?></td>
-                    <td><?php echo esc_html($meta['asset_tag']); ?></td>
-                    <td><?php echo esc_html($meta['model']); ?></td>
-                    <td><?php echo esc_html($meta['serial_number']); ?></td>
-                    <td><?php echo esc_html($meta['brand']); ?></td>
-                    <td><?php echo $category_name; // Already escaped ?></td>
-                    <td><?php echo esc_html($meta['status']); ?></td>
-                    <td><?php echo esc_html($issued_to_name); ?></td>
-                    <td><?php echo esc_html($meta['date_purchased']); ?></td>
-                    <td><?php echo nl2br(esc_html($meta['description'])); ?></td>
+                    <td class="col-title"><?php echo esc_html($asset['title']); ?></td>
+                    <td class="col-asset-tag"><?php echo esc_html($meta['asset_tag']); ?></td>
+                    <td class="col-model"><?php echo esc_html($meta['model']); ?></td>
+                    <td class="col-serial"><?php echo esc_html($meta['serial_number']); ?></td>
+                    <td class="col-brand"><?php echo esc_html($meta['brand']); ?></td>
+                    <td class="col-category"><?php echo esc_html($category_name); ?></td>
+                    <td class="col-status"><?php echo esc_html($meta['status']); ?></td>
+                    <td class="col-issued-to"><?php echo esc_html($issued_to_name); ?></td>
+                    <td class="col-date"><?php echo esc_html($meta['date_purchased']); ?></td>
+                    <td class="col-description"><?php echo nl2br(esc_html($meta['description'])); ?></td>
                 </tr>
-            <?php endwhile; ?>
-            <?php wp_reset_postdata(); ?>
+            <?php endforeach; ?>
         <?php else : ?>
             <tr>
                 <td colspan="10" class="no-assets"><?php esc_html_e('No assets found.', 'asset-manager-mvc'); ?></td>
@@ -1296,6 +4836,50 @@ Asset Manager MVC Admin Styles
     margin-left: 2px;
 }
 
+.asset-user-picker {
+    display: block;
+    position: relative;
+}
+.asset-fields .asset-user-search {
+    margin-bottom: 4px;
+}
+.asset-user-results {
+    list-style: none;
+    margin: 0 0 4px;
+    padding: 0;
+    max-height: 220px;
+    overflow-y: auto;
+    border: 1px solid #c3c4c7;
+    background: #fff;
+}
+.asset-user-results li {
+    margin: 0;
+    padding: 6px 8px;
+    cursor: pointer;
+}
+.asset-user-results li:hover {
+    background: #f0f0f1;
+}
+.asset-user-results .asset-user-empty {
+    cursor: default;
+    color: #646970;
+}
+.asset-user-results .asset-user-more {
+    color: #2271b1;
+}
+
+.asset-bulk-update,
+.asset-bulk-update .asset-user-picker {
+    display: inline-block;
+}
+.asset-bulk-update .asset-user-results {
+    position: absolute;
+    z-index: 100;
+    top: 100%;
+    left: 0;
+    min-width: 260px;
+}
+
 .asset-manager-dashboard .dashboard-widgets-wrapper {
     display: flex;
     flex-wrap: wrap;
@@ -1336,14 +4920,129 @@ Asset Manager MVC Admin Styles
 .asset-history li:last-child {
     border-bottom: none;
 }
+
+.asset-history-pagination {
+    margin-top: 10px;
+}
+
+.asset-export-job {
+    max-width: 600px;
+    margin: 15px 0;
+}
+.asset-export-job .asset-export-progress {
+    width: 100%;
+}
 """
 
 placeholder_admin_js_content = """// Asset Manager MVC Admin JavaScript
 jQuery(document).ready(function($) {
-    // console.log('Asset Manager MVC Admin JS Loaded');
-    // Add any specific admin interactivity here, for example:
-    // - Date picker initialization if not using type="date"
-    // - Conditional logic for fields
+    if (typeof assetManagerAdminData === 'undefined') {
+        return;
+    }
+
+    // User typeahead (asset edit screen and bulk update): searches users on the server and
+    // puts the chosen one into the select named by the search box's data-target
+    $('.asset-user-search').each(function() {
+        const $search = $(this);
+        const $results = $search.siblings('.asset-user-results');
+        const $select = $($search.data('target'));
+        if (!$select.length) {
+            return;
+        }
+
+        let timer = null;
+        let request = null;
+        let term = '';
+        let page = 1;
+
+        const hideResults = function() {
+            $results.prop('hidden', true).empty();
+        };
+
+        // Email addresses are only sent to users who may list users
+        const userLabel = function(user) {
+            return user.email ? user.display_name + ' (' + user.email + ')' : user.display_name;
+        };
+
+        const renderUsers = function(users, more, append) {
+            if (!append) {
+                $results.empty();
+            }
+            $results.find('.asset-user-more').remove();
+            users.forEach(function(user) {
+                $('<li class="asset-user-result"></li>')
+                    .text(userLabel(user))
+                    .data('user', user)
+                    .appendTo($results);
+            });
+            if (!append && !users.length) {
+                $('<li class="asset-user-empty"></li>').text(assetManagerAdminData.i18n.noResults).appendTo($results);
+            }
+            if (more) {
+                $('<li class="asset-user-more"></li>').text(assetManagerAdminData.i18n.more).appendTo($results);
+            }
+            $results.prop('hidden', false);
+        };
+
+        const fetchUsers = function(append) {
+            if (request) {
+                request.abort(); // Only the response for the latest term matters
+            }
+            request = $.get(assetManagerAdminData.ajaxUrl, {
+                action: 'am_mvc_search_users',
+                nonce: assetManagerAdminData.nonce,
+                term: term,
+                page: page
+            }).done(function(response) {
+                if (response && response.success && response.data) {
+                    renderUsers(response.data.users, response.data.more, append);
+                }
+            }).always(function() {
+                request = null;
+            });
+        };
+
+        $search.on('input', function() {
+            clearTimeout(timer);
+            term = $.trim($search.val());
+            page = 1;
+            if (term.length < assetManagerAdminData.minChars) {
+                if (request) {
+                    request.abort();
+                }
+                hideResults();
+                return;
+            }
+            timer = setTimeout(function() {
+                fetchUsers(false);
+            }, assetManagerAdminData.debounce);
+        });
+
+        $search.on('keydown', function(event) {
+            if (event.key === 'Escape') {
+                hideResults();
+            } else if (event.key === 'Enter') {
+                event.preventDefault(); // Do not submit the surrounding form from the search box
+            }
+        });
+
+        $results.on('click', '.asset-user-result', function() {
+            const user = $(this).data('user');
+            $select.find('option.asset-user-picked').remove();
+            $('<option class="asset-user-picked"></option>')
+                .val(user.id)
+                .text(userLabel(user))
+                .appendTo($select);
+            $select.val(String(user.id)).trigger('change');
+            $search.val('');
+            hideResults();
+        });
+
+        $results.on('click', '.asset-user-more', function() {
+            page += 1;
+            fetchUsers(true);
+        });
+    });
 });
 """
 
@@ -1476,6 +5175,67 @@ jQuery(document).ready(function($) {
 });
 """
 
+placeholder_export_js_content = """// Asset Manager MVC Export JavaScript
+jQuery(document).ready(function($) {
+    if (typeof assetExportData === 'undefined') {
+        return;
+    }
+
+    const $job = $('#am-mvc-export-job');
+    const activeStatuses = ['queued', 'running', 'merging'];
+    if (!$job.length || activeStatuses.indexOf($job.data('status')) === -1) {
+        return;
+    }
+
+    const i18n = assetExportData.i18n;
+
+    // Fills in the %1$d / %2$d / %s placeholders of a translated string
+    const format = function(text, values) {
+        let next = 0;
+        return text.replace(/%(?:(\\d+)\\$)?[ds]/g, function(match, position) {
+            return String(values[position ? position - 1 : next++]);
+        });
+    };
+
+    // Polls the background export job until it finishes
+    const poll = function() {
+        $.get(assetExportData.ajaxUrl, {
+            action: 'am_mvc_export_job_status',
+            nonce: assetExportData.nonce,
+            job: assetExportData.jobKey
+        }).done(function(response) {
+            if (!response || !response.success || !response.data) {
+                return;
+            }
+            const job = response.data;
+            $job.find('.asset-export-progress').val(job.percent);
+
+            let message = format(i18n.processed, [job.processed, job.total]);
+            if (job.status === 'merging') {
+                message = i18n.merging;
+            } else if (job.status === 'done') {
+                message = format(i18n.done, [job.processed, job.total]);
+            } else if (job.status === 'failed') {
+                message = format(i18n.failed, [job.error]);
+            }
+            $job.find('.asset-export-status').text(message);
+
+            if (activeStatuses.indexOf(job.status) !== -1) {
+                setTimeout(poll, 3000);
+                return;
+            }
+            if (job.download_url) {
+                $job.find('.asset-export-download').prop('hidden', false).find('a').attr('href', job.download_url);
+            }
+            $('#am-mvc-export-pdf-form input[type=submit]').prop('disabled', false).val(i18n.exportButton);
+        }).fail(function() {
+            setTimeout(poll, 10000);
+        });
+    };
+    setTimeout(poll, 3000);
+});
+"""
+
 placeholder_pot_content = """# Copyright (C) YEAR THE PACKAGE'S COPYRIGHT HOLDER
 # This file is distributed under the same license as the PACKAGE package.
 # FIRST AUTHOR <EMAIL@ADDRESS>, YEAR.
@@ -1516,51 +5276,404 @@ msgstr ""
 
 # --- Script Logic ---
 
-def create_plugin_file(path, content):
-    """Creates a file with the given content, ensuring parent directories exist."""
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, 'w', encoding='utf-8') as f:
-        f.write(textwrap.dedent(content))
-    print(f"Created: {path}")
-
-def main():
-    plugin_base_dir = "asset-manager-mvc"
-    if os.path.exists(plugin_base_dir):
-        print(f"Directory '{plugin_base_dir}' already exists. Please remove or rename it before running this script.")
-        # For safety, we could add shutil.rmtree(plugin_base_dir) here, but it's better to let the user handle it.
-        # return
+MANIFEST_VERSION = 1
+DEFAULT_VENDOR_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'vendor')
+ZIP_COPY_CHUNK = 1 << 20
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)  # The earliest time a ZIP entry can hold
+CACHE_FORMAT = 1  # Bump when write_plugin_zip() changes the bytes it writes, so old cached archives are not reused
+CACHE_KEEP = 10  # Cached archives kept, most recently used first
+# ZipFile internals append_compressed_member() relies on; present from Python 3.6 through 3.13
+ZIPFILE_INTERNALS = ('_lock', '_seekable', '_writecheck', '_didModify', 'start_dir', 'fp', 'filelist', 'NameToInfo')
+# Deflating these again costs time and saves nothing, so they are stored
+PRECOMPRESSED_EXTENSIONS = frozenset(('.zip', '.gz', '.tgz', '.bz2', '.xz', '.7z', '.jpg', '.jpeg', '.png', '.gif', '.webp', '.woff', '.woff2'))
+LITE_PLUGIN_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'it-asset-manager-lite.php')
+LITE_ASSET_DIRS = ('css', 'js')  # Next to LITE_PLUGIN_FILE, bundled as they are
+
+# The values each flavour's sources are written with, which a --matrix variant can replace.
+# 'constants' is the prefix of the flavour's PHP constants and is not a variant value.
+FLAVOURS = {
+    'mvc': {'constants': 'ASSET_MANAGER_MVC', 'name': 'Asset Manager (MVC)', 'version': '1.9.0', 'text_domain': 'asset-manager-mvc',
+            'post_type': 'asset_mvc', 'taxonomy': 'asset_category_mvc', 'meta_prefix': '_asset_manager_mvc_'},
+    'lite': {'constants': 'ASSET_MANAGER', 'name': 'Asset Manager', 'version': '1.8.4', 'text_domain': 'asset-manager',
+             'post_type': 'asset', 'taxonomy': 'asset_category', 'meta_prefix': '_asset_manager_'},
+}
+VARIANT_VALUE_RES = {
+    'slug': re.compile(r'[a-z0-9][a-z0-9-]*'),  # Plugin directory and archive name; defaults to the text domain
+    'name': re.compile(r'(?:(?!\*/)[^\r\n])+'),  # Goes into the plugin header comment
+    'version': re.compile(r'[0-9A-Za-z][0-9A-Za-z.+-]*'),
+    'text_domain': re.compile(r'[a-z0-9][a-z0-9-]*'),
+    'post_type': re.compile(r'[a-z0-9_-]{1,20}'),  # register_post_type() limit
+    'taxonomy': re.compile(r'[a-z0-9_-]{1,32}'),  # register_taxonomy() limit
+    'meta_prefix': re.compile(r'[A-Za-z0-9_]+'),
+}
 
-    # Define file structure and content
-    files_to_create = {
+def render_plugin_file(content):
+    """Returns the bytes written for a template: dedented and UTF-8 encoded."""
+    return textwrap.dedent(content).encode('utf-8')
+
+def sha256_of_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def write_file_atomic(path, data):
+    """Writes through a temporary file, so an interrupted build never leaves a half-written file."""
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def load_manifest(path):
+    """Returns the manifest of the previous build, or an empty one if it is missing or unreadable."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if manifest.get('version') == MANIFEST_VERSION else {}
+
+def stat_or_none(path):
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+def tree_fingerprint(base_dir):
+    """Hash of every file's path, size and mtime under base_dir, including untracked files such as vendor/."""
+    entries = []
+    for root, dirs, files in os.walk(base_dir):
+        dirs.sort()
+        for file in sorted(files):
+            st = os.stat(os.path.join(root, file))
+            entries.append([os.path.relpath(os.path.join(root, file), base_dir), st.st_size, st.st_mtime_ns])
+    return hashlib.sha256(json.dumps(entries).encode('utf-8')).hexdigest()
+
+def sync_plugin_files(files_to_create, manifest_files, check=False):
+    """Brings the plugin files in line with the templates.
+
+    A file whose template hash, size and mtime match the manifest is skipped without rendering.
+    Anything else is rendered and compared by content hash, and only written if it differs.
+    In check mode every file is rendered and compared against the disk, and nothing is written.
+    Returns (new manifest entries, changes) where changes maps 'created', 'updated' and
+    'removed' to lists of paths.
+    """
+    entries = {}
+    changes = {'created': [], 'updated': [], 'removed': []}
+    for path, content in files_to_create.items():
+        source = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        previous = manifest_files.get(path)
+        st = stat_or_none(path)
+        if (not check and previous and st and previous['source'] == source
+                and previous['size'] == st.st_size and previous['mtime_ns'] == st.st_mtime_ns):
+            entries[path] = previous
+            continue
+
+        data = render_plugin_file(content)
+        digest = hashlib.sha256(data).hexdigest()
+        if st is None or st.st_size != len(data) or sha256_of_file(path) != digest:
+            changes['updated' if st else 'created'].append(path)
+            if not check:
+                write_file_atomic(path, data)
+                st = os.stat(path)
+        if st is not None:
+            entries[path] = {'source': source, 'sha256': digest, 'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+
+    # Files from earlier builds that no template produces any more; untracked files are left alone
+    for path in sorted(set(manifest_files) - set(files_to_create)):
+        if os.path.exists(path):
+            changes['removed'].append(path)
+            if not check:
+                os.remove(path)
+                remove_empty_dirs(os.path.dirname(path))
+    return entries, changes
+
+def remove_empty_dirs(directory):
+    while directory and os.path.isdir(directory) and not os.listdir(directory):
+        os.rmdir(directory)
+        directory = os.path.dirname(directory)
+
+def disk_members(directory, arc_prefix):
+    """Yields (arcname, path) for every file under directory, with arcnames under arc_prefix."""
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for file in sorted(files):
+            path = os.path.join(root, file)
+            yield f"{arc_prefix}/{os.path.relpath(path, directory).replace(os.sep, '/')}", path
+
+def add_vendor(files_to_create, disk_files, vendor_dir, arc_prefix, pdf_locales=None):
+    """Adds vendor_dir to a build as arc_prefix/.
+
+    With pdf_locales, a Composer vendor/ is cut down to what the PHP in files_to_create can
+    reach (see vendor_bundle), and the autoload.php generated for it joins files_to_create.
+    Without, or for a directory Composer did not build, it is bundled as it is.
+    """
+    if not pdf_locales or not vendor_bundle.is_composer_vendor(vendor_dir):
+        disk_files.extend(disk_members(vendor_dir, arc_prefix))
+        return
+    sources = [content for arcname, content in files_to_create.items() if arcname.endswith('.php')]
+    paths, autoloader = vendor_bundle.bundle_vendor(vendor_dir, sources, pdf_locales)
+    files_to_create[f"{arc_prefix}/autoload.php"] = autoloader
+    disk_files.extend((f"{arc_prefix}/{path}", os.path.join(vendor_dir, path)) for path in paths)
+
+def compress_blocks(blocks, deflate=True):
+    """Deflates an iterable of byte blocks as a raw ZIP member.
+
+    Returns (CRC, size, compress_type, data). When deflate is off or does not shrink the
+    input, the member is ZIP_STORED and data is None; the caller supplies the original bytes.
+    """
+    crc, size = 0, 0
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    parts = []
+    for block in blocks:
+        crc = zlib.crc32(block, crc)
+        size += len(block)
+        if deflate:
+            parts.append(compressor.compress(block))
+    if deflate:
+        parts.append(compressor.flush())
+        data = b''.join(parts)
+        if len(data) < size:
+            return crc, size, zipfile.ZIP_DEFLATED, data
+    return crc, size, zipfile.ZIP_STORED, None
+
+def compress_file(path):
+    """Worker: compress_blocks() for a file from disk; files in compressed formats are stored."""
+    with open(path, 'rb') as f:
+        deflate = os.path.splitext(path)[1].lower() not in PRECOMPRESSED_EXTENSIONS
+        return compress_blocks(iter(lambda: f.read(ZIP_COPY_CHUNK), b''), deflate)
+
+def append_compressed_member(zipf, zinfo, data=None, path=None):
+    """Appends a member whose CRC, sizes and compressed bytes are already known.
+
+    zipfile has no public call for this, so it follows what ZipFile.mkdir() does to append an
+    entry. The bytes come from data, or are copied in chunks from path for stored members.
+    A zipfile without the ZIPFILE_INTERNALS is refused rather than written to blindly.
+    """
+    missing = [name for name in ZIPFILE_INTERNALS if not hasattr(zipf, name)]
+    if missing:
+        raise RuntimeError(f"zipfile of Python {sys.version.split()[0]} lacks {', '.join(missing)}; "
+                           'build the plugin with Python 3.6 to 3.13')
+    with zipf._lock:
+        if zipf._seekable:
+            zipf.fp.seek(zipf.start_dir)
+        zinfo.header_offset = zipf.fp.tell()
+        zipf._writecheck(zinfo)
+        zipf._didModify = True
+        zipf.filelist.append(zinfo)
+        zipf.NameToInfo[zinfo.filename] = zinfo
+        zipf.fp.write(zinfo.FileHeader())
+        if data is not None:
+            zipf.fp.write(data)
+        else:
+            with open(path, 'rb') as src:
+                shutil.copyfileobj(src, zipf.fp, ZIP_COPY_CHUNK)
+        zipf.start_dir = zipf.fp.tell()
+
+def zip_date_time():
+    """Timestamp of every member: SOURCE_DATE_EPOCH when set, otherwise the ZIP epoch."""
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    return max(tuple(time.gmtime(int(epoch))[:6]), ZIP_EPOCH) if epoch else ZIP_EPOCH
+
+def plugin_members(files_to_create, disk_files=()):
+    """Maps arcnames to ('data', bytes) or ('file', path) in sorted order, with templates rendered.
+
+    When an arcname comes up twice, the first one wins, so templates take precedence over disk files.
+    """
+    members = {arcname: ('data', render_plugin_file(content)) for arcname, content in files_to_create.items()}
+    for arcname, path in disk_files:
+        members.setdefault(arcname, ('file', path))
+    return dict(sorted(members.items()))
+
+def payload_key(source):
+    """Identifies what a member holds, so members with the same contents share one compressed copy."""
+    kind, value = source
+    return (kind, hashlib.sha256(value).digest()) if kind == 'data' else (kind, os.path.abspath(value))
+
+def compress_payloads(member_maps, workers=None):
+    """Compresses every distinct payload in one or more member maps once.
+
+    Returns a dict of payload_key() to (crc, size, compress_type, data), where data is None for
+    stored files, which are copied from disk when written. Files are deflated in a process pool;
+    rendered data is small and is compressed in this process.
+    """
+    sources = {}
+    for members in member_maps:
+        for source in members.values():
+            sources.setdefault(payload_key(source), source)
+    compressed = {}
+    files = []
+    for key, (kind, value) in sources.items():
+        if kind == 'data':
+            crc, size, compress_type, data = compress_blocks([value])
+            compressed[key] = (crc, size, compress_type, value if data is None else data)
+        else:
+            files.append((key, value))
+    if files:
+        with Pool(min(workers or os.cpu_count() or 1, len(files))) as pool:
+            results = pool.imap(compress_file, [path for _, path in files], chunksize=4)
+            for (key, _), result in zip(files, results):
+                compressed[key] = result
+    return compressed
+
+def write_members(fileobj, members, compressed):
+    """Writes a ZIP of members to a path or a file-like object, which need not be seekable (e.g. stdout).
+
+    The payloads come already compressed from compress_payloads(), so the same compressed bytes
+    can go into any number of archives. The archive is reproducible: members are written in the
+    order given, and every member gets the same timestamp, 0644 permissions and Unix as the
+    creating system.
+    """
+    date_time = zip_date_time()
+    with zipfile.ZipFile(fileobj, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        for arcname, source in members.items():
+            crc, size, compress_type, data = compressed[payload_key(source)]
+            zinfo = zipfile.ZipInfo(arcname, date_time=date_time)
+            zinfo.create_system = 3  # Unix, whatever the build host
+            zinfo.external_attr = (stat.S_IFREG | 0o644) << 16
+            zinfo.compress_type = compress_type
+            zinfo.CRC = crc
+            zinfo.file_size = size
+            zinfo.compress_size = size if data is None else len(data)
+            append_compressed_member(zipf, zinfo, data, source[1] if data is None else None)
+
+def write_plugin_zip(fileobj, members, workers=None):
+    """Writes the plugin ZIP from plugin_members(), deflating files from disk (e.g. vendor/) in parallel."""
+    write_members(fileobj, members, compress_payloads([members], workers))
+
+class FileHashCache:
+    """SHA-256 of files, remembered by path, size and mtime so unchanged files are not re-read."""
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = load_manifest(path).get('files', {})
+        self.used = {}
+
+    def sha256(self, path):
+        st = os.stat(path)
+        key = os.path.abspath(path)
+        entry = self.entries.get(key)
+        if not entry or entry[0] != st.st_size or entry[1] != st.st_mtime_ns:
+            entry = [st.st_size, st.st_mtime_ns, sha256_of_file(path)]
+        self.used[key] = entry
+        return entry[2]
+
+    def save(self):
+        if self.used != self.entries:
+            write_file_atomic(self.path, json.dumps({'version': MANIFEST_VERSION, 'files': self.used}).encode('utf-8'))
+
+def zip_cache_key(members, file_hashes):
+    """Content address of an archive: every member's name and content hash, plus what shapes the bytes."""
+    digest = hashlib.sha256(f"{CACHE_FORMAT} {zip_date_time()} zlib {zlib.ZLIB_RUNTIME_VERSION}\n".encode('utf-8'))
+    for arcname, (kind, value) in members.items():
+        content_hash = hashlib.sha256(value).hexdigest() if kind == 'data' else file_hashes.sha256(value)
+        digest.update(f"{arcname}\0{content_hash}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+def cached_archive(cache_dir, members, file_hashes):
+    """Returns the cache path for an archive of members, and whether it is already there."""
+    path = os.path.join(cache_dir, f"{zip_cache_key(members, file_hashes)}.zip")
+    hit = os.path.exists(path)
+    if hit:
+        os.utime(path)  # Most recently used, for prune_cache()
+    return path, hit
+
+def prune_cache(cache_dir, keep=CACHE_KEEP):
+    archives = sorted((entry for entry in os.scandir(cache_dir) if entry.name.endswith('.zip')),
+                      key=lambda entry: entry.stat().st_mtime, reverse=True)
+    for entry in archives[keep:]:
+        os.remove(entry.path)
+
+def default_cache_dir():
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'asset-manager-mvc-build')
+
+def write_zip_file(zip_file_name, members, compressed):
+    tmp_name = f"{zip_file_name}.tmp"
+    write_members(tmp_name, members, compressed)
+    os.replace(tmp_name, zip_file_name)
+
+def copy_zip_file(source, zip_file_name):
+    tmp_name = f"{zip_file_name}.tmp"
+    shutil.copyfile(source, tmp_name)
+    os.replace(tmp_name, zip_file_name)
+
+def build_zip(zip_file_name, members, workers=None, cache_dir=None):
+    """Writes the ZIP of plugin_members() to a path, or to stdout for '-'.
+
+    With a cache_dir, archives are kept there under the hash of their contents, and an
+    unchanged build copies the cached archive instead of compressing again. Returns True
+    when the archive came from the cache.
+    """
+    source = None
+    hit = False
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        file_hashes = FileHashCache(os.path.join(cache_dir, 'file-hashes.json'))
+        source, hit = cached_archive(cache_dir, members, file_hashes)
+        file_hashes.save()
+        if not hit:
+            write_zip_file(source, members, compress_payloads([members], workers))
+            prune_cache(cache_dir)
+
+    if zip_file_name == '-':
+        if source:
+            with open(source, 'rb') as f:
+                shutil.copyfileobj(f, sys.stdout.buffer, ZIP_COPY_CHUNK)
+        else:
+            write_plugin_zip(sys.stdout.buffer, members, workers)
+        sys.stdout.buffer.flush()
+    elif source:
+        copy_zip_file(source, zip_file_name)
+    else:
+        write_zip_file(zip_file_name, members, compress_payloads([members], workers))
+    return hit
+
+def get_files_to_create(plugin_base_dir):
+    """Maps every output path (which is also its arcname in the ZIP) to its template."""
+    return {
         # Main plugin file
         f"{plugin_base_dir}/asset-manager.php": asset_manager_php_content,
 
         # Core
         f"{plugin_base_dir}/includes/core/class-plugin-core.php": plugin_core_php_content,
+        f"{plugin_base_dir}/includes/core/class-schema.php": schema_php_content,
+        f"{plugin_base_dir}/includes/core/class-cli-command.php": cli_command_php_content,
 
         # Models
         f"{plugin_base_dir}/includes/models/class-asset-model.php": asset_model_php_content,
+        f"{plugin_base_dir}/includes/models/class-export-job-model.php": export_job_model_php_content,
 
         # Controllers
         f"{plugin_base_dir}/includes/controllers/class-setup-controller.php": setup_controller_php_content,
         f"{plugin_base_dir}/includes/controllers/class-asset-controller.php": asset_controller_php_content,
         f"{plugin_base_dir}/includes/controllers/class-dashboard-controller.php": dashboard_controller_php_content,
         f"{plugin_base_dir}/includes/controllers/class-export-controller.php": export_controller_php_content,
+        f"{plugin_base_dir}/includes/controllers/class-rest-controller.php": rest_controller_php_content,
 
         # Views - Admin
+        f"{plugin_base_dir}/includes/views/admin/asset-bulk-update-fields.php": view_asset_bulk_update_fields_php_content,
         f"{plugin_base_dir}/includes/views/admin/asset-fields-meta-box.php": view_asset_fields_php_content,
         f"{plugin_base_dir}/includes/views/admin/asset-history-meta-box.php": view_asset_history_php_content,
+        f"{plugin_base_dir}/includes/views/admin/asset-list-filters.php": view_asset_list_filters_php_content,
         f"{plugin_base_dir}/includes/views/admin/dashboard-page.php": view_dashboard_page_php_content,
         f"{plugin_base_dir}/includes/views/admin/export-page.php": view_export_page_php_content,
+        f"{plugin_base_dir}/includes/views/admin/notices/bulk-update.php": view_bulk_update_notice_php_content,
         f"{plugin_base_dir}/includes/views/admin/notices/validation-errors.php": view_validation_errors_php_content,
 
         # Views - PDF
-        f"{plugin_base_dir}/includes/views/pdf/asset-export-template.php": view_pdf_template_php_content,
+        f"{plugin_base_dir}/includes/views/pdf/asset-export-styles.php": view_pdf_styles_php_content,
+        f"{plugin_base_dir}/includes/views/pdf/asset-export-header.php": view_pdf_header_php_content,
+        f"{plugin_base_dir}/includes/views/pdf/asset-export-table.php": view_pdf_table_php_content,
 
         # Assets (Placeholders)
         f"{plugin_base_dir}/assets/css/asset-manager-admin.css": placeholder_css_content,
         f"{plugin_base_dir}/assets/js/asset-manager-admin.js": placeholder_admin_js_content,
         f"{plugin_base_dir}/assets/js/asset-dashboard.js": placeholder_dashboard_js_content,
+        f"{plugin_base_dir}/assets/js/asset-export.js": placeholder_export_js_content,
 
         # Languages (Placeholder)
         f"{plugin_base_dir}/languages/asset-manager-mvc.pot": placeholder_pot_content,
@@ -1574,31 +5687,237 @@ def main():
         f"{plugin_base_dir}/includes/views/admin/index.php": "<?php // Silence is golden.",
         f"{plugin_base_dir}/includes/views/admin/notices/index.php": "<?php // Silence is golden.",
         f"{plugin_base_dir}/includes/views/pdf/index.php": "<?php // Silence is golden.",
+
+        # Vendor directory (usually for Composer dependencies like mPDF; its other contents are not managed here)
+        f"{plugin_base_dir}/vendor/index.php": "<?php // Silence is golden.",
     }
 
-    # Create all files
-    for path, content in files_to_create.items():
-        create_plugin_file(path, content)
-
-    # Create vendor directory (usually for Composer dependencies like mPDF)
-    os.makedirs(os.path.join(plugin_base_dir, "vendor"), exist_ok=True)
-    create_plugin_file(os.path.join(plugin_base_dir, "vendor", "index.php"), "<?php // Silence is golden.")
-    print(f"Created: {plugin_base_dir}/vendor/ (Note: mPDF should be installed here, typically via Composer)")
-
-
-    # Create ZIP file
-    zip_file_name = f"{plugin_base_dir}.zip"
-    with zipfile.ZipFile(zip_file_name, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for root, dirs, files in os.walk(plugin_base_dir):
-            for file in files:
-                file_path = os.path.join(root, file)
-                # Arcname is the path inside the zip file
-                arcname = os.path.relpath(file_path, os.path.join(plugin_base_dir, '..'))
-                zipf.write(file_path, arcname)
-    
-    print(f"Successfully created plugin structure in '{plugin_base_dir}'")
-    print(f"ZIP file created: {zip_file_name}")
-    print(f"Reminder: If you are not using Composer, you will need to manually add the mPDF library to the '{plugin_base_dir}/vendor/' directory and adjust the autoloader path in 'includes/controllers/class-export-controller.php' if necessary.")
+def load_matrix(path):
+    """Reads a --matrix file: a JSON list of variants, each a flavour and the values it replaces.
+
+    Raises ValueError for a malformed file or an invalid value.
+    """
+    with open(path, encoding='utf-8') as f:
+        entries = json.load(f)
+    if not isinstance(entries, list) or not entries:
+        raise ValueError("expected a non-empty JSON list of variants")
+    variants = []
+    for number, entry in enumerate(entries, 1):
+        if not isinstance(entry, dict):
+            raise ValueError(f"variant {number}: expected an object")
+        flavour = entry.get('flavour', 'mvc')
+        if flavour not in FLAVOURS:
+            raise ValueError(f"variant {number}: unknown flavour {flavour!r} (expected one of: {', '.join(FLAVOURS)})")
+        unknown = set(entry) - set(VARIANT_VALUE_RES) - {'flavour'}
+        if unknown:
+            raise ValueError(f"variant {number}: unknown keys: {', '.join(sorted(unknown))}")
+        variant = {key: value for key, value in FLAVOURS[flavour].items() if key != 'constants'}
+        variant.update(entry, flavour=flavour)
+        variant.setdefault('slug', variant['text_domain'])
+        for key, pattern in VARIANT_VALUE_RES.items():
+            if not isinstance(variant[key], str) or not pattern.fullmatch(variant[key]):
+                raise ValueError(f"variant {number}: invalid {key} {variant[key]!r}")
+        variants.append(variant)
+    names = [variant_zip_name(variant) for variant in variants]
+    shared = sorted({name for name in names if names.count(name) > 1})
+    if shared:
+        raise ValueError(f"variants would write the same archive: {', '.join(shared)}")
+    return variants
+
+def variant_zip_name(variant):
+    return f"{variant['slug']}-{variant['version']}.zip"
+
+def apply_variant(text, variant):
+    """Replaces the values a flavour's source is written with by the variant's.
+
+    Only the plugin header, the constants that hold the values, quoted text domain
+    literals and the POT header are touched; everything else reads the constants.
+    """
+    flavour = FLAVOURS[variant['flavour']]
+    constants = flavour['constants']
+    substitutions = (
+        (r"(Plugin Name: ).*", variant['name']),
+        (r"(\* Version: ).*", variant['version']),
+        (r"(Text Domain: ).*", variant['text_domain']),
+        (rf"(define\('{constants}_VERSION', ')[^']*", variant['version']),
+        (rf"(define\('{constants}_POST_TYPE', ')[^']*", variant['post_type']),
+        (rf"(define\('{constants}_TAXONOMY', ')[^']*", variant['taxonomy']),
+        (rf"(define\('{constants}_META_PREFIX', ')[^']*", variant['meta_prefix']),
+        (r'(Project-Id-Version: )[^"\\]*', f"{variant['text_domain']} {variant['version']}"),
+    )
+    for pattern, value in substitutions:
+        text = re.sub(pattern, lambda match: match.group(1) + value, text)
+    return text.replace(f"'{flavour['text_domain']}'", f"'{variant['text_domain']}'")
+
+def variant_members(variant, vendor_dir=None, pdf_locales=None):
+    """Members of a variant's archive, under a plugin directory named after its slug."""
+    slug = variant['slug']
+    disk_files = []
+    if variant['flavour'] == 'lite':
+        with open(LITE_PLUGIN_FILE, encoding='utf-8') as f:
+            sources = {f"{slug}/{os.path.basename(LITE_PLUGIN_FILE)}": apply_variant(f.read(), variant)}
+        for directory in LITE_ASSET_DIRS:
+            disk_files.extend(disk_members(os.path.join(os.path.dirname(LITE_PLUGIN_FILE), directory), f"{slug}/{directory}"))
+        if vendor_dir:
+            add_vendor(sources, disk_files, vendor_dir, f"{slug}/vendor", pdf_locales)
+        # The lite plugin is a finished file rather than a template, so it is not dedented
+        members = {arcname: ('data', text.encode('utf-8')) for arcname, text in sources.items()}
+        for arcname, path in disk_files:
+            members.setdefault(arcname, ('file', path))
+        return dict(sorted(members.items()))
+
+    pot_name = f"{slug}/languages/{FLAVOURS['mvc']['text_domain']}.pot"
+    files_to_create = {}
+    for arcname, content in get_files_to_create(slug).items():
+        if arcname == pot_name:
+            arcname = f"{slug}/languages/{variant['text_domain']}.pot"
+        files_to_create[arcname] = apply_variant(content, variant)
+    if vendor_dir:
+        add_vendor(files_to_create, disk_files, vendor_dir, f"{slug}/vendor", pdf_locales)
+    return plugin_members(files_to_create, disk_files)
+
+def build_matrix(variants, output_dir, vendor_dir=None, workers=None, cache_dir=None, pdf_locales=None):
+    """Builds every variant's ZIP into output_dir and returns (path, hit) pairs in variant order.
+
+    Variants that are not in the cache are built together: a payload they share, such as a
+    vendor file or a template none of the variant values touch, is compressed once, and its
+    compressed bytes are copied into every archive that holds it. The archives are then
+    written concurrently, in threads, since that is mostly copying bytes to disk.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        file_hashes = FileHashCache(os.path.join(cache_dir, 'file-hashes.json'))
+    results = []
+    pending = []
+    for variant in variants:
+        zip_file_name = os.path.join(output_dir, variant_zip_name(variant))
+        members = variant_members(variant, vendor_dir, pdf_locales)
+        source, hit = cached_archive(cache_dir, members, file_hashes) if cache_dir else (None, False)
+        results.append((zip_file_name, hit))
+        if hit:
+            copy_zip_file(source, zip_file_name)
+        else:
+            pending.append((zip_file_name, members, source))
+    if cache_dir:
+        file_hashes.save()
+
+    compressed = compress_payloads([members for _, members, _ in pending], workers)
+
+    def write_variant(zip_file_name, members, source):
+        write_zip_file(source or zip_file_name, members, compressed)
+        if source:
+            copy_zip_file(source, zip_file_name)
+
+    with ThreadPoolExecutor(max_workers=max(1, len(pending))) as executor:
+        for future in [executor.submit(write_variant, *build) for build in pending]:
+            future.result()
+    if cache_dir and pending:
+        prune_cache(cache_dir, max(CACHE_KEEP, len(variants)))
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the Asset Manager (MVC) plugin directory and ZIP.")
+    parser.add_argument('--check', action='store_true', help="Verify the plugin directory and ZIP against the templates without writing anything")
+    parser.add_argument('--force', action='store_true', help="Ignore the build manifest and compare every file")
+    parser.add_argument('--no-stage', action='store_true', help="Build the ZIP straight from the templates without writing the plugin directory")
+    parser.add_argument('--output', help="Where to write the ZIP, or - for stdout (default: asset-manager-mvc.zip)")
+    parser.add_argument('--vendor-dir', default=DEFAULT_VENDOR_DIR, help="Directory to bundle as the plugin's vendor/ (default: the Composer vendor/ next to this script)")
+    parser.add_argument('--no-vendor', action='store_true', help="Do not bundle a vendor directory")
+    parser.add_argument('--pdf-locales', default='en', help="Comma-separated locales whose mPDF fonts and data are bundled; the rest of vendor/ is cut down to the classes the plugin reaches (default: en)")
+    parser.add_argument('--full-vendor', action='store_true', help="Bundle the vendor directory as it is, with Composer's autoloader")
+    parser.add_argument('--cache-dir', default=default_cache_dir(), help="Content-addressed archive cache (default: ~/.cache/asset-manager-mvc-build)")
+    parser.add_argument('--no-cache', action='store_true', help="Always compress instead of using the archive cache")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Processes compressing vendor files (default: CPU count)")
+    parser.add_argument('--matrix', metavar='FILE', help="Build one ZIP per variant in a JSON file, e.g. [{\"version\": \"2.0.0\", \"text_domain\": \"acme-assets\"}, {\"flavour\": \"lite\"}], without staging")
+    parser.add_argument('--dist', default='dist', help="Where --matrix writes its ZIPs, as SLUG-VERSION.zip (default: dist)")
+    args = parser.parse_args(argv)
+    if args.check and args.no_stage:
+        parser.error("--check verifies the plugin directory, so it cannot be combined with --no-stage")
+    if args.matrix and (args.check or args.output):
+        parser.error("--matrix writes its ZIPs to --dist, so it cannot be combined with --check or --output")
+    cache_dir = None if args.no_cache else args.cache_dir
+    if args.no_vendor:
+        args.vendor_dir = None
+    elif args.vendor_dir and not os.path.isdir(args.vendor_dir):
+        if args.vendor_dir != DEFAULT_VENDOR_DIR:
+            parser.error(f"--vendor-dir {args.vendor_dir} is not a directory")
+        args.vendor_dir = None
+    pdf_locales = None if args.full_vendor else [locale.strip() for locale in args.pdf_locales.split(',') if locale.strip()]
+
+    if args.matrix:
+        try:
+            variants = load_matrix(args.matrix)
+        except (OSError, ValueError) as e:
+            parser.error(f"--matrix {args.matrix}: {e}")
+        started = time.monotonic()
+        for zip_file_name, hit in build_matrix(variants, args.dist, args.vendor_dir, args.workers, cache_dir, pdf_locales):
+            print(f"ZIP file {'copied from the cache' if hit else 'created'}: {zip_file_name}")
+        print(f"{len(variants)} variants built in {time.monotonic() - started:.1f}s")
+        return 0
+
+    plugin_base_dir = "asset-manager-mvc"
+    zip_file_name = args.output or f"{plugin_base_dir}.zip"
+    # Status goes to stderr when the ZIP itself goes to stdout
+    out = sys.stderr if zip_file_name == '-' else sys.stdout
+    files_to_create = get_files_to_create(plugin_base_dir)
+    disk_files = []
+    if args.vendor_dir:
+        add_vendor(files_to_create, disk_files, args.vendor_dir, f"{plugin_base_dir}/vendor", pdf_locales)
+
+    if args.no_stage:
+        started = time.monotonic()
+        hit = build_zip(zip_file_name, plugin_members(files_to_create, disk_files), args.workers, cache_dir)
+        print(f"ZIP file {'copied from the cache' if hit else 'created'} from {len(files_to_create)} templates and {len(disk_files)} vendor files in {time.monotonic() - started:.1f}s: {zip_file_name}", file=out)
+        return 0
+
+    # Kept next to the plugin directory, so it does not end up in the ZIP
+    manifest_path = f"{plugin_base_dir}.manifest.json"
+    manifest = {} if args.force else load_manifest(manifest_path)
+    entries, changes = sync_plugin_files(files_to_create, manifest.get('files', {}), check=args.check)
+    for kind in ('created', 'updated', 'removed'):
+        for path in changes[kind]:
+            print(f"{'Would be ' + kind if args.check else kind.capitalize()}: {path}", file=out)
+    unchanged = len(files_to_create) - len(changes['created']) - len(changes['updated'])
+    print(f"{len(changes['created'])} created, {len(changes['updated'])} updated, {len(changes['removed'])} removed, {unchanged} unchanged", file=out)
+
+    # The ZIP is rebuilt when any file under the plugin or vendor directory changed, tracked or not
+    fingerprint = ':'.join(tree_fingerprint(d) for d in (plugin_base_dir, args.vendor_dir) if d and os.path.isdir(d))
+    # Which vendor files are bundled also depends on --pdf-locales and --full-vendor
+    fingerprint += ':' + hashlib.sha256('\n'.join(arcname for arcname, _ in disk_files).encode('utf-8')).hexdigest()[:16]
+    zip_state = manifest.get('zip', {})
+    zip_stat = stat_or_none(zip_file_name) if zip_file_name != '-' else None
+    zip_current = (zip_stat is not None and not any(changes.values()) and zip_state.get('path') == zip_file_name
+                   and zip_state.get('fingerprint') == fingerprint
+                   and zip_state.get('size') == zip_stat.st_size and zip_state.get('mtime_ns') == zip_stat.st_mtime_ns)
+
+    if args.check:
+        if not zip_current:
+            print(f"ZIP file out of date: {zip_file_name}", file=out)
+        if any(changes.values()) or not zip_current:
+            return 1
+        print(f"'{plugin_base_dir}' and {zip_file_name} are up to date", file=out)
+        return 0
+
+    if zip_current:
+        print(f"ZIP file up to date: {zip_file_name}", file=out)
+    else:
+        # Templates come from memory; only untracked files in the staging directory are read back
+        disk_files.extend(disk_members(plugin_base_dir, plugin_base_dir))
+        started = time.monotonic()
+        hit = build_zip(zip_file_name, plugin_members(files_to_create, disk_files), args.workers, cache_dir)
+        print(f"ZIP file {'copied from the cache' if hit else 'created'} in {time.monotonic() - started:.1f}s: {zip_file_name}", file=out)
+
+    new_manifest = {'version': MANIFEST_VERSION, 'files': entries, 'zip': manifest.get('zip', {})}
+    if zip_file_name != '-':
+        zip_stat = os.stat(zip_file_name)
+        new_manifest['zip'] = {'path': zip_file_name, 'fingerprint': fingerprint, 'size': zip_stat.st_size, 'mtime_ns': zip_stat.st_mtime_ns}
+    if new_manifest != manifest:
+        write_file_atomic(manifest_path, json.dumps(new_manifest, indent=1, sort_keys=True).encode('utf-8'))
+
+    if not args.vendor_dir:
+        print(f"Reminder: If you are not using Composer, you will need to manually add the mPDF library to the '{plugin_base_dir}/vendor/' directory (or pass --vendor-dir) and adjust the autoloader path in 'includes/controllers/class-export-controller.php' if necessary.", file=out)
+    return 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
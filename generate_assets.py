@@ -0,0 +1,406 @@
+"""Generates a synthetic asset inventory for load testing the Asset Manager (MVC) plugin.
+
+Output is a bulk SQL dump (multi-row INSERTs into the WordPress tables and the plugin's
+history table), a WXR file for the WordPress importer, or both. Assets use the plugin's
+post type, taxonomy, meta prefix, fields and status options from asset_schema.py.
+
+The inventory is generated in fixed-size chunks. Each chunk is seeded from --seed and its
+index, so the output does not depend on the number of worker processes. Chunks are rendered
+in a process pool and written in order as they finish, so memory use stays flat for any --count.
+
+Usage:
+    python generate_assets.py --count 100000 --format sql --output dataset
+    mysql wordpress < dataset.sql
+    wp asset-mvc rebuild-index
+
+The SQL dump also creates the users that assets are assigned to (unless --user-ids is given),
+the categories, the term relationships and the history rows. The WXR file carries history as
+the legacy serialized meta, which the plugin moves into its history table after import. WXR
+cannot create users with fixed IDs, so for a WXR-only import pass --user-ids of existing users
+(and --user-names with their display names, so the "Issued To changed" notes name them).
+
+History notes are written the way Asset_Model writes them, HTML-escaped, and each asset's
+last note ends on its status and assignee.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from multiprocessing import Pool
+
+import asset_schema
+from wp_sql import HISTORY_COLUMNS, META_COLUMNS, POST_COLUMNS, RELATIONSHIP_COLUMNS, sql_inserts
+
+BRANDS = {
+    "Dell": ["Latitude 5440", "Latitude 7440", "OptiPlex 7010", "Precision 3581", "U2723QE"],
+    "HP": ["EliteBook 840", "ProBook 450", "EliteDesk 800", "Z2 G9", "E24 G5"],
+    "Lenovo": ["ThinkPad T14", "ThinkPad X1 Carbon", "ThinkCentre M70q", "ThinkVision T24i"],
+    "Apple": ["MacBook Air 13", "MacBook Pro 14", "iMac 24", "iPad Air", "iPhone 15"],
+    "Cisco": ["Catalyst 9200", "Meraki MR46", "IP Phone 8845"],
+    "Samsung": ["Galaxy S24", "Galaxy Tab S9", "ViewFinity S8"],
+    "Logitech": ["MX Keys", "MX Master 3S", "Rally Bar"],
+}
+SUPPLIERS = ["CDW", "Insight", "SHI", "Softchoice", "Connection", "Amazon Business", "Direct"]
+CATEGORIES = ["Laptops", "Desktops", "Monitors", "Phones", "Tablets", "Networking", "Peripherals",
+              "Printers", "Servers", "Conference Equipment", "Licenses", "Tools"]
+DEFAULT_STATUS_WEIGHTS = "Unassigned=15,Assigned=55,Returned=10,For Repair=5,Repairing=3,Archived=7,Disposed=5"
+ASSIGNED_STATUSES = ("Assigned", "For Repair", "Repairing")
+
+WXR_HEADER = """<?xml version="1.0" encoding="UTF-8" ?>
+<rss version="2.0"
+    xmlns:excerpt="http://wordpress.org/export/1.2/excerpt/"
+    xmlns:content="http://purl.org/rss/1.0/modules/content/"
+    xmlns:wfw="http://wellformedweb.org/CommentAPI/"
+    xmlns:dc="http://purl.org/dc/elements/1.1/"
+    xmlns:wp="http://wordpress.org/export/1.2/">
+<channel>
+    <title>Asset Manager synthetic inventory</title>
+    <link>{site_url}</link>
+    <description>Generated by generate_assets.py</description>
+    <language>en-US</language>
+    <wp:wxr_version>1.2</wp:wxr_version>
+    <wp:base_site_url>{site_url}</wp:base_site_url>
+    <wp:base_blog_url>{site_url}</wp:base_blog_url>
+"""
+WXR_FOOTER = "</channel>\n</rss>\n"
+
+# Set in each worker by init_worker()
+CONFIG = None
+
+
+def init_worker(config):
+    global CONFIG
+    CONFIG = config
+
+
+def parse_status_weights(text):
+    """Parses "Status=weight,..." into weights aligned with STATUS_OPTIONS."""
+    weights = dict.fromkeys(asset_schema.STATUS_OPTIONS, 0.0)
+    for part in filter(None, (p.strip() for p in text.split(","))):
+        status, _, weight = part.rpartition("=")
+        if status not in weights:
+            raise ValueError(f"Unknown status '{status}'. Valid: {', '.join(asset_schema.STATUS_OPTIONS)}")
+        weights[status] = float(weight)
+    if not any(weights.values()):
+        raise ValueError("At least one status needs a positive weight")
+    return [weights[status] for status in asset_schema.STATUS_OPTIONS]
+
+
+def cdata(value):
+    return "<![CDATA[" + str(value).replace("]]>", "]]]]><![CDATA[>") + "]]>"
+
+
+def user_name(user_id, config):
+    """The name Asset_Model::describe_user() puts into history notes for a user ID."""
+    if not user_id:
+        return "Unassigned"
+    if config["create_users"]:
+        return f"Load Test User {user_id}"
+    return config["user_names"].get(user_id, f"Unknown User (ID: {user_id})")
+
+
+def state_note(old, new, config):
+    """The history note for a change of (status, issued_to), as the plugin writes it."""
+    changes = []
+    if old[0] != new[0]:
+        changes.append(asset_schema.change_note(asset_schema.FIELD_LABELS["status"], old[0], new[0]))
+    if old[1] != new[1]:
+        changes.append(asset_schema.change_note(asset_schema.FIELD_LABELS["issued_to"],
+                                                user_name(old[1], config), user_name(new[1], config)))
+    return "; ".join(changes)
+
+
+def generate_asset(rng, post_id, config):
+    """Builds one asset: its post fields, meta values, category and history entries."""
+    brand = rng.choice(config["brands"])
+    model = rng.choice(BRANDS[brand])
+    status = rng.choices(asset_schema.STATUS_OPTIONS, cum_weights=config["status_cum_weights"])[0]
+    purchased = config["now"] - timedelta(days=rng.randrange(config["max_age_days"]))
+    users = config["user_ids"]
+    # Skew assignments so a few users hold many assets, as in real inventories
+    issued_to = users[min(int(rng.paretovariate(1.2)) - 1, len(users) - 1)] if status in ASSIGNED_STATUSES else 0
+
+    moments = []
+    moment = purchased
+    for _ in range(rng.randint(config["history_min"], config["history_max"])):
+        moment += timedelta(days=rng.randrange(1, 120), seconds=rng.randrange(86400))
+        if moment > config["now"]:
+            break
+        moments.append(moment)
+
+    # Walk from a new, unassigned asset through random states, ending on the asset's own
+    # status and assignee, so the last note agrees with the meta as it does in the plugin
+    history = []
+    state = ("Unassigned", 0)
+    for position, moment in enumerate(moments):
+        if position == len(moments) - 1:
+            new_state = (status, issued_to)
+        else:
+            new_status = rng.choice(asset_schema.STATUS_OPTIONS)
+            holder = state[1] or users[min(int(rng.paretovariate(1.2)) - 1, len(users) - 1)]
+            new_state = (new_status, holder if new_status in ASSIGNED_STATUSES else 0)
+        note = state_note(state, new_state, config)
+        if note:
+            history.append({"date": moment.strftime("%Y-%m-%d %H:%M:%S"), "user": rng.choice(users), "note": note})
+        state = new_state
+    if not moments and state != (status, issued_to):
+        # No time for a history; the asset got its state when it was purchased
+        history.append({"date": purchased.strftime("%Y-%m-%d %H:%M:%S"), "user": rng.choice(users),
+                        "note": state_note(state, (status, issued_to), config)})
+    if not history:
+        history.append({"date": purchased.strftime("%Y-%m-%d %H:%M:%S"), "user": rng.choice(users), "note": "Asset created."})
+
+    return {
+        "id": post_id,
+        "title": f"{brand} {model} #{post_id}",
+        "date": purchased.strftime("%Y-%m-%d %H:%M:%S"),
+        "modified": history[-1]["date"],
+        "category": rng.choice(config["term_ids"]),
+        "meta": {
+            "asset_tag": f"AT-{post_id:08d}",
+            "model": model,
+            "serial_number": f"{brand[:3].upper()}{rng.getrandbits(40):010X}",
+            "brand": brand,
+            "supplier": rng.choice(SUPPLIERS),
+            "date_purchased": purchased.strftime("%Y-%m-%d"),
+            "issued_to": issued_to,
+            "status": status,
+            # Asset_Model::validate_asset_data() requires a description
+            "description": rng.choice([f"{model}, standard issue.", "Includes charger and dock.", f"{brand} {model}, spare pool."]),
+        },
+        "history": history,
+    }
+
+
+def render_sql(assets, config):
+    prefix = config["table_prefix"]
+    posts, meta, relationships, history = [], [], [], []
+    for asset in assets:
+        posts.append((
+            asset["id"], config["author_id"], asset["date"], asset["date"], "", asset["title"], "", "publish",
+            "closed", "closed", "", f"asset-{asset['id']}", "", "", asset["modified"], asset["modified"], "", 0,
+            f"{config['site_url']}/?post_type={asset_schema.POST_TYPE}&p={asset['id']}", 0, asset_schema.POST_TYPE, "", 0,
+        ))
+        for field, value in asset["meta"].items():
+            meta.append((asset["id"], asset_schema.meta_key(field), str(value)))
+        relationships.append((asset["id"], asset["category"], 0))
+        for entry in asset["history"]:
+            history.append((asset["id"], entry["user"], entry["date"], entry["note"]))
+
+    batch = config["batch_rows"]
+    return "".join([
+        sql_inserts(f"{prefix}posts", POST_COLUMNS, posts, batch),
+        sql_inserts(f"{prefix}postmeta", META_COLUMNS, meta, batch),
+        sql_inserts(f"{prefix}term_relationships", RELATIONSHIP_COLUMNS, relationships, batch),
+        sql_inserts(f"{prefix}{asset_schema.HISTORY_TABLE}", HISTORY_COLUMNS, history, batch),
+    ])
+
+
+def render_wxr(assets, config):
+    items = []
+    for asset in assets:
+        meta_values = [(asset_schema.meta_key(field), value) for field, value in asset["meta"].items()]
+        meta_values.append((asset_schema.HISTORY_META_KEY, asset_schema.php_serialize(asset["history"])))
+        postmeta = "".join(
+            f"\t\t<wp:postmeta>\n\t\t\t<wp:meta_key>{cdata(key)}</wp:meta_key>\n\t\t\t<wp:meta_value>{cdata(value)}</wp:meta_value>\n\t\t</wp:postmeta>\n"
+            for key, value in meta_values
+        )
+        term = config["terms"][asset["category"]]
+        items.append(
+            "\t<item>\n"
+            f"\t\t<title>{cdata(asset['title'])}</title>\n"
+            f"\t\t<dc:creator>{cdata(config['author_login'])}</dc:creator>\n"
+            "\t\t<content:encoded><![CDATA[]]></content:encoded>\n"
+            f"\t\t<wp:post_id>{asset['id']}</wp:post_id>\n"
+            f"\t\t<wp:post_date>{cdata(asset['date'])}</wp:post_date>\n"
+            f"\t\t<wp:post_date_gmt>{cdata(asset['date'])}</wp:post_date_gmt>\n"
+            f"\t\t<wp:post_modified>{cdata(asset['modified'])}</wp:post_modified>\n"
+            f"\t\t<wp:post_modified_gmt>{cdata(asset['modified'])}</wp:post_modified_gmt>\n"
+            f"\t\t<wp:post_name>{cdata('asset-' + str(asset['id']))}</wp:post_name>\n"
+            "\t\t<wp:status><![CDATA[publish]]></wp:status>\n"
+            f"\t\t<wp:post_type>{cdata(asset_schema.POST_TYPE)}</wp:post_type>\n"
+            f"\t\t<category domain=\"{asset_schema.TAXONOMY}\" nicename=\"{term['slug']}\">{cdata(term['name'])}</category>\n"
+            f"{postmeta}"
+            "\t</item>\n"
+        )
+    return "".join(items)
+
+
+def render_chunk(index):
+    """Worker: generates one chunk of assets and renders it in every requested format."""
+    config = CONFIG
+    first = config["start_id"] + index * config["chunk_size"]
+    last = min(config["start_id"] + config["count"], first + config["chunk_size"])
+    rng = random.Random(f"{config['seed']}:{index}")
+    assets = [generate_asset(rng, post_id, config) for post_id in range(first, last)]
+    return (
+        render_sql(assets, config) if "sql" in config["formats"] else "",
+        render_wxr(assets, config) if "wxr" in config["formats"] else "",
+        len(assets),
+    )
+
+
+def sql_header(config):
+    """Users and categories, written once before the assets."""
+    prefix = config["table_prefix"]
+    parts = [
+        "-- Synthetic Asset Manager (MVC) inventory generated by generate_assets.py\n",
+        "SET autocommit = 0;\nSET unique_checks = 0;\nSET foreign_key_checks = 0;\nSET NAMES utf8mb4;\n\n",
+    ]
+    if config["create_users"]:
+        users, user_meta = [], []
+        for user_id in config["user_ids"]:
+            login = f"loadtest_user_{user_id}"
+            users.append((user_id, login, "", login, f"{login}@example.invalid", "", config["now_sql"], "", 0, f"Load Test User {user_id}"))
+            user_meta.append((user_id, f"{prefix}capabilities", asset_schema.php_serialize({"subscriber": True})))
+            user_meta.append((user_id, f"{prefix}user_level", "0"))
+        parts.append(sql_inserts(f"{prefix}users", ("ID", "user_login", "user_pass", "user_nicename", "user_email", "user_url",
+                                                    "user_registered", "user_activation_key", "user_status", "display_name"),
+                                 users, config["batch_rows"]))
+        parts.append(sql_inserts(f"{prefix}usermeta", ("user_id", "meta_key", "meta_value"), user_meta, config["batch_rows"]))
+
+    terms = [(term_id, term["name"], term["slug"], 0) for term_id, term in config["terms"].items()]
+    # term_taxonomy_id is kept equal to term_id, so relationships can use the term IDs directly
+    taxonomy = [(term_id, term_id, asset_schema.TAXONOMY, "", 0, 0) for term_id in config["terms"]]
+    parts.append(sql_inserts(f"{prefix}terms", ("term_id", "name", "slug", "term_group"), terms, config["batch_rows"]))
+    parts.append(sql_inserts(f"{prefix}term_taxonomy", ("term_taxonomy_id", "term_id", "taxonomy", "description", "parent", "count"),
+                             taxonomy, config["batch_rows"]))
+    return "".join(parts)
+
+
+def sql_footer(config):
+    """Fixes term counts and drops cached plugin state that the inserts made stale."""
+    prefix = config["table_prefix"]
+    term_ids = ",".join(str(term_id) for term_id in config["terms"])
+    return (
+        f"UPDATE `{prefix}term_taxonomy` tt SET tt.count = (SELECT COUNT(*) FROM `{prefix}term_relationships` tr "
+        f"WHERE tr.term_taxonomy_id = tt.term_taxonomy_id) WHERE tt.term_taxonomy_id IN ({term_ids});\n"
+        f"DELETE FROM `{prefix}options` WHERE option_name = '{asset_schema.ROLLUP_OPTION}';\n"
+        "COMMIT;\nSET unique_checks = 1;\nSET foreign_key_checks = 1;\n"
+        "-- Run `wp asset-mvc rebuild-index` afterwards to fill the list table index.\n"
+    )
+
+
+def wxr_header(config):
+    terms = "".join(
+        f"\t<wp:term>\n\t\t<wp:term_id>{term_id}</wp:term_id>\n\t\t<wp:term_taxonomy>{cdata(asset_schema.TAXONOMY)}</wp:term_taxonomy>\n"
+        f"\t\t<wp:term_slug>{cdata(term['slug'])}</wp:term_slug>\n\t\t<wp:term_name>{cdata(term['name'])}</wp:term_name>\n\t</wp:term>\n"
+        for term_id, term in config["terms"].items()
+    )
+    author = (
+        f"\t<wp:author>\n\t\t<wp:author_id>{config['author_id']}</wp:author_id>\n"
+        f"\t\t<wp:author_login>{cdata(config['author_login'])}</wp:author_login>\n\t</wp:author>\n"
+    )
+    return WXR_HEADER.format(site_url=config["site_url"]) + author + terms
+
+
+def open_output(path):
+    if path == "-":
+        return sys.stdout
+    return open(path, "w", encoding="utf-8", newline="\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic asset inventory as SQL and/or WXR.")
+    parser.add_argument("--count", type=int, default=1000, help="Number of assets (default: 1000)")
+    parser.add_argument("--format", choices=("sql", "wxr", "both"), default="sql", help="Output format (default: sql)")
+    parser.add_argument("--output", default="assets-dataset", help="Output path without extension, or - for stdout with a single format")
+    parser.add_argument("--table-prefix", default="wp_", help="WordPress table prefix (default: wp_)")
+    parser.add_argument("--site-url", default="http://localhost", help="Site URL used in GUIDs and the WXR header")
+    parser.add_argument("--start-id", type=int, default=1000000, help="First post ID (default: 1000000)")
+    parser.add_argument("--categories", type=int, default=len(CATEGORIES), help=f"Number of categories (default: {len(CATEGORIES)})")
+    parser.add_argument("--term-start-id", type=int, default=100000, help="First term ID (default: 100000)")
+    parser.add_argument("--users", type=int, default=200, help="Number of users to create and assign (default: 200)")
+    parser.add_argument("--user-start-id", type=int, default=100000, help="First generated user ID (default: 100000)")
+    parser.add_argument("--user-ids", help="Comma-separated IDs of existing users to assign instead of creating users")
+    parser.add_argument("--user-names", help="Comma-separated display names of the --user-ids users, used in history notes")
+    parser.add_argument("--author-id", type=int, default=1, help="post_author of the assets (default: 1)")
+    parser.add_argument("--author-login", default="admin", help="Login of the author in the WXR file (default: admin)")
+    parser.add_argument("--status-weights", default=DEFAULT_STATUS_WEIGHTS, help=f"Relative status frequencies (default: {DEFAULT_STATUS_WEIGHTS})")
+    parser.add_argument("--history-min", type=int, default=1, help="Minimum history entries per asset (default: 1)")
+    parser.add_argument("--history-max", type=int, default=8, help="Maximum history entries per asset (default: 8)")
+    parser.add_argument("--max-age-days", type=int, default=6 * 365, help="Oldest purchase date, in days before now (default: 2190)")
+    parser.add_argument("--seed", default="asset-manager", help="Random seed; the same seed gives the same output")
+    parser.add_argument("--now", help="Reference time for dates, 'YYYY-MM-DD HH:MM:SS' UTC (default: today at midnight)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=2000, help="Assets per work unit (default: 2000)")
+    parser.add_argument("--batch-rows", type=int, default=1000, help="Rows per INSERT statement (default: 1000)")
+    args = parser.parse_args(argv)
+
+    formats = ("sql", "wxr") if args.format == "both" else (args.format,)
+    if args.output == "-" and len(formats) > 1:
+        parser.error("--output - needs a single --format")
+    if args.count < 1 or args.categories < 1 or args.chunk_size < 1:
+        parser.error("--count, --categories and --chunk-size must be positive")
+    if args.history_min > args.history_max:
+        parser.error("--history-min cannot exceed --history-max")
+    try:
+        status_weights = parse_status_weights(args.status_weights)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.user_ids:
+        user_ids = [int(user_id) for user_id in args.user_ids.split(",") if user_id.strip()]
+    else:
+        user_ids = list(range(args.user_start_id, args.user_start_id + max(1, args.users)))
+    user_names = [name.strip() for name in args.user_names.split(",")] if args.user_names else []
+    if len(user_names) > len(user_ids) or (user_names and not args.user_ids):
+        parser.error("--user-names needs --user-ids and at most one name per ID")
+    names = [CATEGORIES[i % len(CATEGORIES)] + ("" if i < len(CATEGORIES) else f" {i // len(CATEGORIES) + 1}") for i in range(args.categories)]
+    terms = {args.term_start_id + i: {"name": name, "slug": name.lower().replace(" ", "-")} for i, name in enumerate(names)}
+    cum_weights, total = [], 0.0
+    for weight in status_weights:
+        total += weight
+        cum_weights.append(total)
+    try:
+        now = datetime.strptime(args.now, "%Y-%m-%d %H:%M:%S") if args.now else datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    except ValueError:
+        parser.error("--now must look like 2024-01-31 12:00:00")
+
+    config = {
+        "count": args.count, "formats": formats, "table_prefix": args.table_prefix, "site_url": args.site_url.rstrip("/"),
+        "start_id": args.start_id, "chunk_size": args.chunk_size, "batch_rows": args.batch_rows, "seed": args.seed,
+        "user_ids": user_ids, "create_users": not args.user_ids,
+        "user_names": dict(zip(user_ids, user_names)), "author_id": args.author_id, "author_login": args.author_login,
+        "terms": terms, "term_ids": list(terms), "brands": list(BRANDS), "status_cum_weights": cum_weights,
+        "history_min": args.history_min, "history_max": args.history_max, "max_age_days": max(1, args.max_age_days),
+        "now": now, "now_sql": now.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+    outputs = {fmt: open_output(args.output if args.output == "-" else f"{args.output}.{'sql' if fmt == 'sql' else 'xml'}") for fmt in formats}
+    if "sql" in outputs:
+        outputs["sql"].write(sql_header(config))
+    if "wxr" in outputs:
+        outputs["wxr"].write(wxr_header(config))
+
+    started = time.monotonic()
+    written = 0
+    chunks = range((args.count + args.chunk_size - 1) // args.chunk_size)
+    with Pool(max(1, args.workers), initializer=init_worker, initargs=(config,)) as pool:
+        # imap keeps chunk order and only holds finished chunks until they are written
+        for sql, wxr, count in pool.imap(render_chunk, chunks):
+            if "sql" in outputs:
+                outputs["sql"].write(sql)
+            if "wxr" in outputs:
+                outputs["wxr"].write(wxr)
+            written += count
+            print(f"\rGenerated {written}/{args.count} assets", end="", file=sys.stderr)
+
+    if "sql" in outputs:
+        outputs["sql"].write(sql_footer(config))
+    if "wxr" in outputs:
+        outputs["wxr"].write(WXR_FOOTER)
+    for fmt, stream in outputs.items():
+        if stream is not sys.stdout:
+            stream.close()
+            print(f"\nWrote {stream.name}", end="", file=sys.stderr)
+    elapsed = time.monotonic() - started
+    print(f"\nDone: {written} assets in {elapsed:.1f}s ({written / max(elapsed, 0.001):.0f} assets/s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,610 @@
+"""Turns a CSV or WXR asset inventory into bulk-load SQL for the Asset Manager (MVC) plugin.
+
+The WordPress importer inserts one post and one meta row at a time. This script writes the
+same data as multi-row INSERT statements, or as tab-separated files with a LOAD DATA script.
+The output covers posts, postmeta, term relationships and the plugin's history table.
+
+Records are validated with the rules of Asset_Model::validate_asset_data(). Accepted values
+are then sanitized the way save_asset_data() does. Invalid records are skipped and reported.
+
+Input:
+    CSV: a header row naming the columns, e.g. the plugin's own CSV export. Columns are matched
+         by field key or by field label ("asset_tag" or "Asset Tag"). "title" and "category" are
+         also read. Other columns, such as "id", are ignored. As in the export, the category
+         cell can list several names separated by ", ", and a value the export protected from
+         spreadsheet formulas ('=..., '+..., '-..., '@...) loses its leading quote.
+    WXR: a WordPress export. Items of the asset post type are read, together with their
+         categories and plugin meta. The legacy serialized history meta becomes rows of the
+         history table.
+
+Post IDs are precomputed: record n of the input gets --start-id + n. A skipped record leaves a
+gap, so IDs do not depend on the number of workers. New categories get term IDs from
+--term-start-id. Existing categories are matched by slug or name against --terms, which is the
+output of:
+    wp term list asset_category_mvc --fields=term_id,term_taxonomy_id,name,slug --format=csv
+
+The input is split into chunks of records in the main process, which only finds record
+boundaries. Parsing, validation and serialization of each chunk run in a process pool, and
+results are written in input order. Everything runs in one transaction. A post or term ID that
+is already taken fails its INSERT, the mysql client stops and nothing is committed.
+
+Usage:
+    python import_assets.py inventory.csv --start-id 200000 --output import
+    mysql wordpress < import.sql
+
+    python import_assets.py export.xml --start-id 200000 --format load-data --output import
+    cd import && mysql --local-infile=1 wordpress < load.sql
+
+    wp asset-mvc rebuild-index
+"""
+
+import argparse
+import csv
+import io
+import os
+import re
+import sys
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from multiprocessing import Pool
+
+import asset_schema
+from wp_sql import HISTORY_COLUMNS, META_COLUMNS, POST_COLUMNS, RELATIONSHIP_COLUMNS, sql_inserts
+
+POST_STATUSES = ("publish", "draft", "pending", "private")
+SQL_HEADER = "SET autocommit = 0;\nSET unique_checks = 0;\nSET foreign_key_checks = 0;\nSET NAMES utf8mb4;\n\n"
+IMPORT_NOTE = "Asset imported."
+
+SCRIPT_STYLE_RE = re.compile(r"<(script|style)[^>]*?>.*?</\1>", re.IGNORECASE | re.DOTALL)
+TAG_RE = re.compile(r"<[^>]*>")
+OCTET_RE = re.compile(r"%[a-f0-9]{2}", re.IGNORECASE)
+WHITESPACE_RE = re.compile(r"[\r\n\t ]+")
+INT_RE = re.compile(r"\s*[+-]?\d+")
+SLUG_RE = re.compile(r"[^a-z0-9]+")
+CATEGORY_SEPARATOR = ", "  # Export_Controller joins an asset's category names with it
+FORMULA_PREFIXES = ("=", "+", "-", "@")  # Export_Controller::escape_csv_cell() quotes cells starting with these
+TSV_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r", "\x00": "\\0"})
+
+# Set in each worker by init_worker()
+CONFIG = None
+
+
+def init_worker(config):
+    global CONFIG
+    CONFIG = config
+
+
+def sanitize_text(value, keep_newlines=False):
+    """Approximates WordPress' sanitize_text_field() (and sanitize_textarea_field() with keep_newlines)."""
+    value = TAG_RE.sub("", SCRIPT_STYLE_RE.sub("", value)).replace("<", "&lt;")
+    if not keep_newlines:
+        value = WHITESPACE_RE.sub(" ", value)
+    while OCTET_RE.search(value):
+        value = OCTET_RE.sub("", value)
+    return value.strip()
+
+
+def absint(value):
+    """PHP's absint(): the absolute value of the leading integer, or 0."""
+    match = INT_RE.match(value or "")
+    return abs(int(match.group())) if match else 0
+
+
+def slugify(name):
+    """A close-enough sanitize_title() for new category slugs."""
+    return SLUG_RE.sub("-", name.lower()).strip("-") or "category"
+
+
+def valid_date(value):
+    """True for a real calendar date written as YYYY-MM-DD, like DateTime::createFromFormat('Y-m-d') plus the round trip."""
+    try:
+        date = datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        return False
+    return f"{date.year:04d}-{date.month:02d}-{date.day:02d}" == value
+
+
+def validate_asset(values, categories):
+    """Asset_Model::validate_asset_data() for one record.
+
+    values maps field keys to raw strings; a field missing from the input is None. categories
+    is the list of category names. Returns the error messages, empty if the record is valid.
+    """
+    errors = []
+    labels = asset_schema.FIELD_LABELS
+    for field in asset_schema.FIELDS:
+        raw = values.get(field)
+        value = (raw or "").strip()
+        if field == "date_purchased":
+            if value in ("", "0"):
+                errors.append(f"The {labels[field]} field is required.")
+            elif not valid_date(value):
+                errors.append(f"The {labels[field]} field has an invalid date format. Please use YYYY-MM-DD.")
+        elif field == "status":
+            if value == "":
+                errors.append(f"The {labels[field]} field is required; please select a status.")
+            elif value not in asset_schema.STATUS_OPTIONS:
+                errors.append(f"Invalid value selected for the {labels[field]} field.")
+        elif value == "":
+            # As in the form, an assignee column that is present but empty is an error; 0 is "Unassigned"
+            if field == "issued_to" and raw == "":
+                errors.append(f"The {labels[field]} field is required; please select a user.")
+            elif field != "issued_to":
+                errors.append(f"The {labels[field]} field is required.")
+    if not [name for name in categories if name not in ("", "0")]:
+        errors.append(f"The {labels['asset_category']} field is required; please select a category.")
+    return errors
+
+
+def sanitize_asset(values):
+    """The stored meta values, as save_asset_data() sanitizes them."""
+    meta = {}
+    for field in asset_schema.FIELDS:
+        raw = values.get(field) or ""
+        if field == "description":
+            meta[field] = sanitize_text(raw, keep_newlines=True)
+        elif field == "issued_to":
+            meta[field] = str(absint(raw))
+        elif field in ("date_purchased", "status"):
+            meta[field] = raw.strip()
+        else:
+            meta[field] = sanitize_text(raw)
+    return meta
+
+
+def csv_columns(header):
+    """Maps CSV column positions to field keys, "title" and "category"."""
+    names = {key: key for key in (*asset_schema.FIELDS, "title", "category", "categories")}
+    names.update({label.lower(): key for key, label in asset_schema.FIELD_LABELS.items() if key != "asset_category"})
+    names[asset_schema.FIELD_LABELS["asset_category"].lower()] = "category"
+    names["categories"] = "category"
+    return {i: names[name.strip().lower()] for i, name in enumerate(header) if name.strip().lower() in names}
+
+
+def unguard_csv_cell(value):
+    """Undoes Export_Controller::escape_csv_cell(): drops the quote put before a leading =, +, - or @."""
+    if value[:1] == "'" and value[1:2] in FORMULA_PREFIXES:
+        return value[1:]
+    return value
+
+
+def parse_csv_record(text):
+    row = next(csv.reader(io.StringIO(text)), [])
+    record = {"values": {}, "categories": [], "title": "", "date": None, "status": "publish", "history": []}
+    for i, key in CONFIG["columns"].items():
+        value = unguard_csv_cell(row[i] if i < len(row) else "")
+        if key == "title":
+            record["title"] = value
+        elif key == "category":
+            names = (name.strip() for name in value.split(CATEGORY_SEPARATOR))
+            record["categories"] = [(name, "") for name in names if name]
+        else:
+            record["values"][key] = value
+    return record
+
+
+def parse_wxr_record(text):
+    """Parses one <item> of a WXR file; returns None for items that are not assets."""
+    item = ET.fromstring(CONFIG["rss_open"] + text + "</rss>").find("item") if CONFIG["rss_open"] else ET.fromstring(text)
+    record = {"values": {}, "categories": [], "title": "", "date": None, "status": "", "history": []}
+    post_type = ""
+    for child in item:
+        name = child.tag.rsplit("}", 1)[-1]
+        value = child.text or ""
+        if name == "post_type":
+            post_type = value
+        elif name == "status":
+            record["status"] = value
+        elif name == "title":
+            record["title"] = value
+        elif name == "post_date":
+            record["date"] = value
+        elif name == "category" and child.get("domain") == asset_schema.TAXONOMY and value.strip():
+            record["categories"].append((value.strip(), child.get("nicename", "")))
+        elif name == "postmeta":
+            key = meta_value = ""
+            for part in child:
+                part_name = part.tag.rsplit("}", 1)[-1]
+                if part_name == "meta_key":
+                    key = part.text or ""
+                elif part_name == "meta_value":
+                    meta_value = part.text or ""
+            if key.startswith(asset_schema.META_PREFIX) and key[len(asset_schema.META_PREFIX):] in asset_schema.FIELDS:
+                record["values"][key[len(asset_schema.META_PREFIX):]] = meta_value
+            elif key == asset_schema.HISTORY_META_KEY:
+                record["history"] = legacy_history(meta_value)
+    if post_type != asset_schema.POST_TYPE:
+        return None
+    return record
+
+
+def legacy_history(serialized):
+    """History rows (user_id, created_at, note) from the legacy serialized history meta."""
+    try:
+        entries = asset_schema.php_unserialize(serialized)
+    except (ValueError, IndexError):
+        return []
+    rows = []
+    for entry in (entries.values() if isinstance(entries, dict) else []):
+        if isinstance(entry, dict) and entry.get("date") and entry.get("note"):
+            rows.append((absint(str(entry.get("user", 0))), str(entry["date"]), str(entry["note"])))
+    return rows
+
+
+def tsv_rows(rows):
+    """Rows in LOAD DATA's default format: tab-separated, backslash-escaped, \\N for NULL."""
+    return "".join(
+        "\t".join("\\N" if v is None else str(v).translate(TSV_ESCAPES) for v in row) + "\n" for row in rows
+    )
+
+
+def process_chunk(task):
+    """Worker: parses, validates and serializes one chunk of records.
+
+    Returns the rendered posts, postmeta and history data, the (post_id, category, slug) of each
+    category of the imported assets for the main process to link, the number of imported assets and the errors.
+    """
+    first_record, texts = task
+    config = CONFIG
+    parse = parse_csv_record if config["input_format"] == "csv" else parse_wxr_record
+    posts, meta, history, categories, errors = [], [], [], [], []
+
+    for offset, text in enumerate(texts):
+        number = first_record + offset
+        try:
+            record = parse(text)
+        except (ET.ParseError, csv.Error) as e:
+            errors.append((number, [f"Could not parse the record: {e}"]))
+            continue
+        if record is None:
+            continue
+        if record["status"] not in POST_STATUSES:
+            errors.append((number, [f"Skipped post status '{record['status']}'."]))
+            continue
+        messages = validate_asset(record["values"], [name for name, _ in record["categories"]])
+        if messages:
+            errors.append((number, messages))
+            continue
+
+        post_id = config["start_id"] + number
+        values = sanitize_asset(record["values"])
+        title = sanitize_text(record["title"]) or f"Asset: {values['asset_tag']}"
+        date = record["date"] if record["date"] and valid_date(record["date"][:10]) else config["now_sql"]
+        modified = record["history"][-1][1] if record["history"] else date
+        posts.append((
+            post_id, config["author_id"], date, date, "", title, "", record["status"], "closed", "closed", "",
+            f"asset-{post_id}", "", "", modified, modified, "", 0,
+            f"{config['site_url']}/?post_type={asset_schema.POST_TYPE}&p={post_id}", 0, asset_schema.POST_TYPE, "", 0,
+        ))
+        for field, value in values.items():
+            meta.append((post_id, asset_schema.meta_key(field), value))
+        for user_id, created_at, note in record["history"] or [(config["author_id"], config["now_sql"], IMPORT_NOTE)]:
+            history.append((post_id, user_id, created_at, note))
+        categories.extend((post_id, name, slug) for name, slug in record["categories"])
+
+    prefix = config["table_prefix"]
+    if config["output_format"] == "sql":
+        batch = config["batch_rows"]
+        rendered = {
+            "posts": sql_inserts(f"{prefix}posts", POST_COLUMNS, posts, batch),
+            "postmeta": sql_inserts(f"{prefix}postmeta", META_COLUMNS, meta, batch),
+            "history": sql_inserts(f"{prefix}{asset_schema.HISTORY_TABLE}", HISTORY_COLUMNS, history, batch),
+        }
+    else:
+        rendered = {"posts": tsv_rows(posts), "postmeta": tsv_rows(meta), "history": tsv_rows(history)}
+    return rendered, categories, len(posts) + len(meta) + len(history), errors
+
+
+def csv_chunks(path, chunk_size, stats):
+    """Yields the header, then (first record number, record texts) chunks.
+
+    A record ends at a line break outside quotes, which holds when the record has an even
+    number of quote characters so far.
+    """
+    with open(path, "rb") as f:
+        chunk, record, quotes, number = [], [], 0, 0
+        header = None
+        for raw in f:
+            stats["bytes"] += len(raw)
+            line = raw.decode("utf-8", "replace")
+            record.append(line)
+            quotes += line.count('"')
+            if quotes % 2:
+                continue
+            text = "".join(record).lstrip("\ufeff") if header is None else "".join(record)
+            record, quotes = [], 0
+            if header is None:
+                header = next(csv.reader(io.StringIO(text)), [])
+                yield header
+                continue
+            if not text.strip():
+                continue
+            chunk.append(text)
+            if len(chunk) == chunk_size:
+                yield number, chunk
+                number += len(chunk)
+                chunk = []
+        if record:
+            chunk.append("".join(record))
+        if header is None:
+            yield []
+        if chunk:
+            yield number, chunk
+
+
+def wxr_chunks(path, chunk_size, stats):
+    """Yields the opening <rss> tag, then (first record number, item texts) chunks.
+
+    Items are cut at the <item> and </item> lines that WordPress' exporter writes.
+    """
+    with open(path, "rb") as f:
+        chunk, item, number = [], None, 0
+        head = []
+        rss_open = None
+        for raw in f:
+            stats["bytes"] += len(raw)
+            line = raw.decode("utf-8", "replace")
+            stripped = line.strip()
+            if item is None:
+                if stripped.startswith("<item>") or stripped == "<item":
+                    if rss_open is None:
+                        match = re.search(r"<rss\b[^>]*>", "".join(head))
+                        rss_open = match.group() if match else ""
+                        yield rss_open
+                    item = [line]
+                    if stripped.endswith("</item>"):
+                        chunk.append(line)
+                        item = None
+                elif rss_open is None:
+                    head.append(line)
+                continue
+            item.append(line)
+            if stripped.endswith("</item>"):
+                chunk.append("".join(item))
+                item = None
+                if len(chunk) == chunk_size:
+                    yield number, chunk
+                    number += len(chunk)
+                    chunk = []
+        if rss_open is None:
+            yield ""
+        if item:
+            chunk.append("".join(item))
+        if chunk:
+            yield number, chunk
+
+
+def load_term_map(path):
+    """Reads `wp term list --format=csv` output into slug and name lookups of term_taxonomy_id."""
+    by_slug, by_name = {}, {}
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        for row in csv.DictReader(f):
+            tt_id = int(row.get("term_taxonomy_id") or row["term_id"])
+            if row.get("slug"):
+                by_slug[row["slug"]] = tt_id
+            if row.get("name"):
+                by_name[row["name"].lower()] = tt_id
+    return by_slug, by_name
+
+
+class Categories:
+    """Resolves category names to term_taxonomy_ids, creating new terms as they are first seen."""
+
+    def __init__(self, by_slug, by_name, next_id):
+        self.by_slug = by_slug
+        self.by_name = by_name
+        self.next_id = next_id
+        self.new_terms = []
+        self.used = set()
+
+    def resolve(self, name, slug=""):
+        tt_id = self.by_slug.get(slug) if slug else None
+        if tt_id is None:
+            tt_id = self.by_name.get(name.lower())
+        if tt_id is None:
+            # A new term's term_taxonomy_id is kept equal to its term_id
+            tt_id = self.next_id
+            self.next_id += 1
+            base = slug = slug or slugify(name)
+            suffix = 2
+            while slug in self.by_slug:
+                slug = f"{base}-{suffix}"
+                suffix += 1
+            self.new_terms.append((tt_id, sanitize_text(name), slug))
+            self.by_slug[slug] = tt_id
+            self.by_name[name.lower()] = tt_id
+        self.used.add(tt_id)
+        return tt_id
+
+
+class SqlOutput:
+    """Writes everything as multi-row INSERT statements to one file (or stdout)."""
+
+    def __init__(self, path, config):
+        self.config = config
+        self.stream = sys.stdout if path == "-" else open(f"{path}.sql", "w", encoding="utf-8", newline="\n")
+        self.stream.write("-- Asset Manager (MVC) import generated by import_assets.py\n" + SQL_HEADER)
+
+    def write(self, kind, data):
+        self.stream.write(data)
+
+    def write_relationships(self, rows):
+        self.stream.write(sql_inserts(f"{self.config['table_prefix']}term_relationships", RELATIONSHIP_COLUMNS, rows, self.config["batch_rows"]))
+
+    def close(self, footer):
+        self.stream.write(footer)
+        if self.stream is not sys.stdout:
+            self.stream.close()
+        return getattr(self.stream, "name", "stdout")
+
+
+class LoadDataOutput:
+    """Writes one tab-separated file per table and a load.sql that loads them with LOAD DATA."""
+
+    FILES = {"posts": "posts.tsv", "postmeta": "postmeta.tsv", "relationships": "term_relationships.tsv", "history": "history.tsv"}
+
+    def __init__(self, path, config):
+        self.config = config
+        self.directory = path
+        os.makedirs(path, exist_ok=True)
+        self.streams = {kind: open(os.path.join(path, name), "w", encoding="utf-8", newline="\n") for kind, name in self.FILES.items()}
+
+    def write(self, kind, data):
+        self.streams[kind].write(data)
+
+    def write_relationships(self, rows):
+        self.streams["relationships"].write(tsv_rows(rows))
+
+    def close(self, footer):
+        for stream in self.streams.values():
+            stream.close()
+        prefix = self.config["table_prefix"]
+        tables = {
+            "posts": (f"{prefix}posts", POST_COLUMNS),
+            "postmeta": (f"{prefix}postmeta", META_COLUMNS),
+            "relationships": (f"{prefix}term_relationships", RELATIONSHIP_COLUMNS),
+            "history": (f"{prefix}{asset_schema.HISTORY_TABLE}", HISTORY_COLUMNS),
+        }
+        loads = "".join(
+            f"LOAD DATA LOCAL INFILE '{self.FILES[kind]}' INTO TABLE `{table}` CHARACTER SET utf8mb4\n"
+            "    FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' LINES TERMINATED BY '\\n'\n"
+            f"    ({', '.join(f'`{c}`' for c in columns)});\n"
+            for kind, (table, columns) in tables.items()
+        )
+        path = os.path.join(self.directory, "load.sql")
+        with open(path, "w", encoding="utf-8", newline="\n") as f:
+            f.write("-- Asset Manager (MVC) import generated by import_assets.py; run from this directory\n")
+            f.write(SQL_HEADER + loads + footer)
+        return path
+
+
+def sql_footer(config, categories, first_id, last_id):
+    """New terms, term counts, the change feed and cleanup of cached plugin state."""
+    prefix = config["table_prefix"]
+    parts = []
+    if categories.new_terms:
+        parts.append(sql_inserts(f"{prefix}terms", ("term_id", "name", "slug", "term_group"),
+                                 [(tt_id, name, slug, 0) for tt_id, name, slug in categories.new_terms], config["batch_rows"]))
+        parts.append(sql_inserts(f"{prefix}term_taxonomy", ("term_taxonomy_id", "term_id", "taxonomy", "description", "parent", "count"),
+                                 [(tt_id, tt_id, asset_schema.TAXONOMY, "", 0, 0) for tt_id, _, _ in categories.new_terms], config["batch_rows"]))
+    if categories.used:
+        tt_ids = ",".join(str(tt_id) for tt_id in sorted(categories.used))
+        parts.append(
+            f"UPDATE `{prefix}term_taxonomy` tt SET tt.count = (SELECT COUNT(*) FROM `{prefix}term_relationships` tr "
+            f"WHERE tr.term_taxonomy_id = tt.term_taxonomy_id) WHERE tt.term_taxonomy_id IN ({tt_ids});\n"
+        )
+    if last_id >= first_id:
+        # Sync clients pick the new assets up from the change feed
+        parts.append(
+            f"INSERT INTO `{prefix}{asset_schema.CHANGES_TABLE}` (asset_id, action, changed_at) SELECT ID, 'published', UTC_TIMESTAMP() "
+            f"FROM `{prefix}posts` WHERE post_type = '{asset_schema.POST_TYPE}' AND post_status = 'publish' AND ID BETWEEN {first_id} AND {last_id};\n"
+        )
+    parts.append(
+        f"DELETE FROM `{prefix}options` WHERE option_name = '{asset_schema.ROLLUP_OPTION}';\n"
+        "COMMIT;\nSET unique_checks = 1;\nSET foreign_key_checks = 1;\n"
+        "-- Run `wp asset-mvc rebuild-index` afterwards to fill the list table index.\n"
+    )
+    return "".join(parts)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert a CSV or WXR asset inventory into bulk-load SQL.")
+    parser.add_argument("input", help="CSV or WXR file")
+    parser.add_argument("--input-format", choices=("csv", "wxr"), help="Input format (default: from the file extension)")
+    parser.add_argument("--format", choices=("sql", "load-data"), default="sql", help="sql: INSERT statements; load-data: TSV files and load.sql")
+    parser.add_argument("--output", default="assets-import", help="Output path without extension (a directory for load-data), or - for SQL on stdout")
+    parser.add_argument("--start-id", type=int, required=True, help="Post ID of the first record; the range has to be free (SELECT MAX(ID) + 1 FROM wp_posts)")
+    parser.add_argument("--terms", help="CSV of existing categories from `wp term list ... --format=csv`")
+    parser.add_argument("--term-start-id", type=int, default=100000, help="First term ID for new categories; has to be free (default: 100000)")
+    parser.add_argument("--table-prefix", default="wp_", help="WordPress table prefix (default: wp_)")
+    parser.add_argument("--site-url", default="http://localhost", help="Site URL used in GUIDs")
+    parser.add_argument("--author-id", type=int, default=1, help="post_author and history user of imported assets (default: 1)")
+    parser.add_argument("--errors", help="Write skipped records and their errors to this CSV file")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=2000, help="Records per work unit (default: 2000)")
+    parser.add_argument("--batch-rows", type=int, default=1000, help="Rows per INSERT statement (default: 1000)")
+    args = parser.parse_args(argv)
+
+    input_format = args.input_format or ("csv" if args.input.lower().endswith(".csv") else "wxr")
+    if args.format == "load-data" and args.output == "-":
+        parser.error("--format load-data needs an output directory")
+    if args.start_id < 1 or args.chunk_size < 1 or args.batch_rows < 1:
+        parser.error("--start-id, --chunk-size and --batch-rows must be positive")
+
+    stats = {"bytes": 0}
+    try:
+        chunks = (csv_chunks if input_format == "csv" else wxr_chunks)(args.input, args.chunk_size, stats)
+        preamble = next(chunks)
+        categories = Categories(*(load_term_map(args.terms) if args.terms else ({}, {})), args.term_start_id)
+    except (OSError, KeyError, ValueError) as e:
+        print(f"Could not read the input: {e}", file=sys.stderr)
+        return 1
+
+    config = {
+        "input_format": input_format, "output_format": args.format, "start_id": args.start_id,
+        "table_prefix": args.table_prefix, "site_url": args.site_url.rstrip("/"), "author_id": args.author_id,
+        "batch_rows": args.batch_rows, "now_sql": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    if input_format == "csv":
+        config["columns"] = csv_columns(preamble)
+        missing = [field for field in asset_schema.FIELDS if field != "issued_to" and field not in config["columns"].values()]
+        if "category" not in config["columns"].values():
+            missing.append("category")
+        if missing:
+            print(f"The CSV header is missing columns: {', '.join(missing)}", file=sys.stderr)
+            return 1
+    else:
+        config["rss_open"] = preamble
+
+    output = (SqlOutput if args.format == "sql" else LoadDataOutput)(args.output, config)
+    error_writer = None
+    if args.errors:
+        error_file = open(args.errors, "w", newline="", encoding="utf-8")
+        error_writer = csv.writer(error_file)
+        error_writer.writerow(["record", "errors"])
+
+    started = time.monotonic()
+    imported = rows = skipped = 0
+    last_id = args.start_id - 1
+    progress = ""
+    with Pool(max(1, args.workers), initializer=init_worker, initargs=(config,)) as pool:
+        # imap keeps input order, so relationships and new term IDs come out the same on every run
+        for rendered, linked, row_count, errors in pool.imap(process_chunk, chunks):
+            for kind in ("posts", "postmeta", "history"):
+                output.write(kind, rendered[kind])
+            # Names that resolve to the same term are linked once
+            relationships = list(dict.fromkeys((post_id, categories.resolve(name, slug), 0) for post_id, name, slug in linked))
+            if relationships:
+                output.write_relationships(relationships)
+                last_id = max(last_id, relationships[-1][0])
+            imported += len({post_id for post_id, _, _ in linked})
+            rows += row_count + len(relationships)
+            for number, messages in errors:
+                skipped += 1
+                if error_writer:
+                    error_writer.writerow([number + 1, " ".join(messages)])
+                elif skipped <= 20:
+                    # Blank out the progress line, print the message on its own line and redraw below
+                    print(f"\r{' ' * len(progress)}\rRecord {number + 1} skipped: {' '.join(messages)}", file=sys.stderr)
+                    progress = ""
+            elapsed = max(time.monotonic() - started, 0.001)
+            progress = (f"Imported {imported} assets, skipped {skipped}; {imported / elapsed:.0f} assets/s, "
+                        f"{stats['bytes'] / elapsed / 1e6:.1f} MB/s")
+            print(f"\r{progress}", end="", file=sys.stderr)
+
+    written = output.close(sql_footer(config, categories, args.start_id, last_id))
+    if error_writer:
+        error_file.close()
+    elapsed = max(time.monotonic() - started, 0.001)
+    print(f"\nWrote {written}", file=sys.stderr)
+    print(f"Done: {imported} assets ({rows} rows, {len(categories.new_terms)} new categories) from "
+          f"{stats['bytes'] / 1e6:.1f} MB in {elapsed:.1f}s: {imported / elapsed:.0f} assets/s, "
+          f"{rows / elapsed:.0f} rows/s, {stats['bytes'] / elapsed / 1e6:.1f} MB/s", file=sys.stderr)
+    if skipped:
+        print(f"Skipped {skipped} invalid records" + (f"; see {args.errors}" if args.errors else ""), file=sys.stderr)
+    return 2 if skipped else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
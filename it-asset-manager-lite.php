@@ -15,6 +15,9 @@ define('ASSET_MANAGER_VERSION', '1.8.4'); // MODIFIED version - Added filters an
 define('ASSET_MANAGER_POST_TYPE', 'asset');
 define('ASSET_MANAGER_TAXONOMY', 'asset_category');
 define('ASSET_MANAGER_META_PREFIX', '_asset_manager_');
+define('ASSET_MANAGER_DB_VERSION', '1');
+define('ASSET_MANAGER_SEARCH_TABLE', 'asset_search_tokens'); // Without the $wpdb->prefix
+define('ASSET_MANAGER_SEARCH_CRON_HOOK', 'asset_manager_backfill_search_index');
 
 class Asset_Manager {
     // Auto-increment title for Asset post type in format 00001, 00002, ...
@@ -157,7 +160,16 @@ class Asset_Manager {
         add_action('init', [$this, 'register_asset_post_type']);
         add_action('init', [$this, 'register_asset_taxonomy']);
         add_action('init', [$this, 'register_shortcodes']); // Assumed to be implemented or placeholder
+
+        // Search index maintenance (also runs outside wp-admin: cron, REST, profile edits)
+        add_action(ASSET_MANAGER_SEARCH_CRON_HOOK, [$this, 'backfill_search_index']);
+        add_action('profile_update', [$this, 'reindex_assets_for_user'], 10, 2);
+        add_action('edited_' . ASSET_MANAGER_TAXONOMY, [$this, 'reindex_assets_for_term']);
+        add_action('delete_' . ASSET_MANAGER_TAXONOMY, [$this, 'reindex_assets_for_deleted_term'], 10, 4);
+        add_action('save_post_' . ASSET_MANAGER_POST_TYPE, [$this, 'reindex_saved_asset'], 20, 2); // After save_asset_meta
+        add_action('deleted_post', [$this, 'delete_asset_search_tokens']);
         if (is_admin()) {
+            add_action('admin_init', [$this, 'maybe_install_search_index']);
             add_action('add_meta_boxes', [$this, 'register_meta_boxes']);
             add_action('save_post_' . ASSET_MANAGER_POST_TYPE, [$this, 'save_asset_meta'], 10, 2);
             add_filter('manage_' . ASSET_MANAGER_POST_TYPE . '_posts_columns', [$this, 'custom_columns']);
@@ -196,6 +208,7 @@ class Asset_Manager {
     public function activate() {
         $this->register_asset_post_type();
         $this->register_asset_taxonomy();
+        $this->install_search_index();
         flush_rewrite_rules();
     }
 
@@ -732,6 +745,226 @@ class Asset_Manager {
 
     public function register_shortcodes() { /* Placeholder */ }
 
+    /**
+     * Creates or updates the search token table and queues a full backfill.
+     * Search falls back to the postmeta LIKE search until the backfill has finished.
+     */
+    private function install_search_index() {
+        global $wpdb;
+        require_once ABSPATH . 'wp-admin/includes/upgrade.php';
+
+        $table = $wpdb->prefix . ASSET_MANAGER_SEARCH_TABLE;
+        $charset_collate = $wpdb->get_charset_collate();
+
+        // The primary key starts with the token so that "token LIKE 'abc%'" is an index range scan
+        dbDelta("CREATE TABLE {$table} (
+  token varchar(64) NOT NULL,
+  asset_id bigint(20) unsigned NOT NULL,
+  PRIMARY KEY  (token,asset_id),
+  KEY asset_id (asset_id)
+) {$charset_collate};");
+
+        update_option('asset_manager_db_version', ASSET_MANAGER_DB_VERSION);
+        delete_option('asset_manager_search_index_ready');
+        wp_clear_scheduled_hook(ASSET_MANAGER_SEARCH_CRON_HOOK, [0]);
+        wp_schedule_single_event(time(), ASSET_MANAGER_SEARCH_CRON_HOOK, [0]);
+    }
+
+    /**
+     * Installs the search index after a plugin update, which does not run the activation hook.
+     */
+    public function maybe_install_search_index() {
+        if (get_option('asset_manager_db_version') !== ASSET_MANAGER_DB_VERSION) {
+            $this->install_search_index();
+        }
+    }
+
+    /**
+     * Whether every asset has been tokenized, so searches can rely on the token table alone.
+     */
+    private function is_search_index_ready() {
+        return get_option('asset_manager_search_index_ready') === ASSET_MANAGER_DB_VERSION;
+    }
+
+    /**
+     * Cron callback: tokenizes all assets in ID order, continuing after $after_id.
+     * Reschedules itself with its position until done, then marks the index as ready.
+     */
+    public function backfill_search_index($after_id = 0) {
+        global $wpdb;
+        $deadline = time() + 20;
+
+        do {
+            // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+            $post_ids = $wpdb->get_col($wpdb->prepare(
+                "SELECT ID FROM $wpdb->posts WHERE post_type = %s AND post_status <> 'auto-draft' AND ID > %d ORDER BY ID ASC LIMIT 200",
+                ASSET_MANAGER_POST_TYPE,
+                $after_id
+            ));
+            if (empty($post_ids)) {
+                update_option('asset_manager_search_index_ready', ASSET_MANAGER_DB_VERSION);
+                return;
+            }
+            $this->index_assets_for_search($post_ids);
+            $after_id = (int) end($post_ids);
+        } while (time() < $deadline);
+
+        wp_schedule_single_event(time(), ASSET_MANAGER_SEARCH_CRON_HOOK, [$after_id]);
+    }
+
+    /**
+     * Replaces the search tokens of the given assets.
+     * Posts, meta, categories and assignees are loaded once per batch of 200 assets, and the
+     * tokens of a batch are written with one DELETE and one multi-row INSERT.
+     */
+    public function index_assets_for_search(array $post_ids) {
+        global $wpdb;
+        $table = $wpdb->prefix . ASSET_MANAGER_SEARCH_TABLE;
+        $post_ids = array_values(array_unique(array_filter(array_map('absint', $post_ids))));
+
+        foreach (array_chunk($post_ids, 200) as $chunk) {
+            $ids_sql = implode(',', $chunk);
+            // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+            $titles = $wpdb->get_results($wpdb->prepare(
+                "SELECT ID, post_title FROM $wpdb->posts WHERE ID IN ($ids_sql) AND post_type = %s",
+                ASSET_MANAGER_POST_TYPE
+            ), OBJECT_K);
+
+            update_meta_cache('post', $chunk);
+            update_object_term_cache($chunk, ASSET_MANAGER_POST_TYPE);
+            $user_ids = [];
+            foreach ($chunk as $post_id) {
+                $user_ids[] = absint(get_post_meta($post_id, ASSET_MANAGER_META_PREFIX . 'issued_to', true));
+            }
+            $user_ids = array_unique(array_filter($user_ids));
+            if (!empty($user_ids)) {
+                cache_users($user_ids);
+            }
+
+            $placeholders = [];
+            $values = [];
+            foreach ($chunk as $post_id) {
+                if (!isset($titles[$post_id])) {
+                    continue; // Deleted or not an asset
+                }
+                foreach ($this->get_asset_search_tokens($post_id, $titles[$post_id]->post_title) as $token) {
+                    $placeholders[] = '(%s, %d)';
+                    $values[] = $token;
+                    $values[] = $post_id;
+                }
+            }
+
+            // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+            $wpdb->query("DELETE FROM $table WHERE asset_id IN ($ids_sql)");
+            if (!empty($placeholders)) {
+                // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+                $wpdb->query($wpdb->prepare(
+                    "INSERT IGNORE INTO $table (token, asset_id) VALUES " . implode(', ', $placeholders),
+                    $values
+                ));
+            }
+        }
+    }
+
+    /**
+     * Collects the search tokens of one asset from the object caches primed by index_assets_for_search().
+     * Covers the title, the identifying meta fields, the category names and the assignee's display name.
+     */
+    private function get_asset_search_tokens($post_id, $title) {
+        $texts = [$title];
+        foreach (['asset_tag', 'serial_number', 'model', 'brand', 'location', 'status', 'date_purchased'] as $field_key) {
+            $texts[] = (string) get_post_meta($post_id, ASSET_MANAGER_META_PREFIX . $field_key, true);
+        }
+
+        $terms = get_the_terms($post_id, ASSET_MANAGER_TAXONOMY);
+        if (!empty($terms) && !is_wp_error($terms)) {
+            $texts = array_merge($texts, wp_list_pluck($terms, 'name'));
+        }
+
+        $user_id = absint(get_post_meta($post_id, ASSET_MANAGER_META_PREFIX . 'issued_to', true));
+        if ($user_id) {
+            $user = get_userdata($user_id);
+            if ($user) {
+                $texts[] = $user->display_name;
+            }
+        }
+
+        return $this->tokenize_search_text(implode(' ', $texts));
+    }
+
+    /**
+     * Splits text into lowercase letter/digit runs of at most 64 characters, e.g. "HP-EliteBook 840" => hp, elitebook, 840.
+     * The same rules are applied to stored values and to search terms.
+     */
+    private function tokenize_search_text($text) {
+        $text = function_exists('mb_strtolower') ? mb_strtolower($text, 'UTF-8') : strtolower($text);
+        $words = preg_split('/[^\p{L}\p{N}]+/u', $text, -1, PREG_SPLIT_NO_EMPTY);
+        if (!is_array($words)) {
+            return []; // Invalid UTF-8
+        }
+
+        $tokens = [];
+        foreach ($words as $word) {
+            $token = function_exists('mb_substr') ? mb_substr($word, 0, 64, 'UTF-8') : substr($word, 0, 64);
+            $tokens[$token] = true;
+        }
+        return array_keys($tokens);
+    }
+
+    /**
+     * Re-tokenizes an asset after any save, including quick edit and REST updates.
+     */
+    public function reindex_saved_asset($post_id, $post) {
+        if ($post->post_status === 'auto-draft') {
+            return;
+        }
+        $this->index_assets_for_search([$post_id]);
+    }
+
+    /**
+     * Removes a deleted asset's search tokens.
+     */
+    public function delete_asset_search_tokens($post_id) {
+        global $wpdb;
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+        $wpdb->delete($wpdb->prefix . ASSET_MANAGER_SEARCH_TABLE, ['asset_id' => (int) $post_id], ['%d']);
+    }
+
+    /**
+     * Re-tokenizes the assets issued to a user whose display name changed.
+     */
+    public function reindex_assets_for_user($user_id, $old_user_data = null) {
+        global $wpdb;
+        $user = get_userdata($user_id);
+        if (!$user || ($old_user_data && $old_user_data->display_name === $user->display_name)) {
+            return;
+        }
+        // phpcs:ignore WordPress.DB.DirectDatabaseQuery.DirectQuery, WordPress.DB.DirectDatabaseQuery.NoCaching
+        $post_ids = $wpdb->get_col($wpdb->prepare(
+            "SELECT post_id FROM $wpdb->postmeta WHERE meta_key = %s AND meta_value = %s",
+            ASSET_MANAGER_META_PREFIX . 'issued_to',
+            (string) $user_id
+        ));
+        $this->index_assets_for_search($post_ids);
+    }
+
+    /**
+     * Re-tokenizes the assets in a renamed category.
+     */
+    public function reindex_assets_for_term($term_id) {
+        $post_ids = get_objects_in_term($term_id, ASSET_MANAGER_TAXONOMY);
+        if (!is_wp_error($post_ids)) {
+            $this->index_assets_for_search($post_ids);
+        }
+    }
+
+    /**
+     * Re-tokenizes the assets of a deleted category, after their relationships are gone.
+     */
+    public function reindex_assets_for_deleted_term($term_id, $tt_id, $deleted_term, $object_ids) {
+        $this->index_assets_for_search((array) $object_ids);
+    }
+
     /**
      * Adds Category and Brand filters to the Asset list table.
      */
@@ -839,7 +1072,18 @@ class Asset_Manager {
 
         // Ensure it's the main query, on the edit.php admin page, for our CPT, and a search is being performed.
         if (is_admin() && $query->is_main_query() && $pagenow === 'edit.php' && $post_type === ASSET_MANAGER_POST_TYPE && !empty($search_term)) {
-            
+
+            // Prefer the token index: one index range scan per search word instead of scanning postmeta
+            if ($this->is_search_index_ready()) {
+                $search_tokens = array_slice($this->tokenize_search_text($search_term), 0, 8);
+                if (!empty($search_tokens)) {
+                    $query->set('asset_manager_search_tokens', $search_tokens);
+                    add_filter('posts_search', [$this, 'asset_search_index_clause'], 10, 2);
+                    return;
+                }
+            }
+
+            // Fallback while the index is being built: postmeta LIKE search
             // Meta keys to search (excluding description, issued_to for direct meta search here)
             // issued_to would require searching user names then mapping to IDs - more complex for this direct meta search.
             // description is usually longer, title search is often enough.
@@ -921,6 +1165,28 @@ class Asset_Manager {
         }
     }
 
+    /**
+     * Replaces the default search clause with token lookups: every search word must prefix-match a token of the asset.
+     */
+    public function asset_search_index_clause($search, $query) {
+        global $wpdb;
+        $search_tokens = $query->get('asset_manager_search_tokens');
+
+        if (is_admin() && $query->is_main_query() && !empty($search_tokens)) {
+            $table = $wpdb->prefix . ASSET_MANAGER_SEARCH_TABLE;
+            $conditions = [];
+            foreach ($search_tokens as $token) {
+                $conditions[] = $wpdb->prepare(
+                    "$wpdb->posts.ID IN (SELECT asset_id FROM $table WHERE token LIKE %s)",
+                    $wpdb->esc_like($token) . '%'
+                );
+            }
+            $search = ' AND (' . implode(' AND ', $conditions) . ')';
+            remove_filter('posts_search', [$this, 'asset_search_index_clause'], 10);
+        }
+        return $search;
+    }
+
     public function asset_search_join_clause($join, $query) {
         global $wpdb;
         if (is_admin() && $query->is_main_query() && $query->get('asset_manager_search_meta_query_args')) {
@@ -0,0 +1,329 @@
+"""Mirrors the assets of a WordPress site running Asset Manager (MVC) into a local SQLite database.
+
+Reporting and audit jobs can then query the local copy instead of the production site.
+
+Each run has two phases:
+1. List asset IDs and modification times through the plugin's REST route
+   (GET /wp-json/asset-manager-mvc/v1/assets?fields=id,modified). The listing walks the
+   keyset cursor page by page, starting just before the last modification time already
+   synced. Listing pages are cached with their ETag, so an unchanged page costs a 304.
+2. Fetch the full rows of new or changed assets with ?include=, several requests at a
+   time over a bounded pool of keep-alive connections. Rows are written to SQLite with
+   executemany as the pages arrive.
+
+Deletions do not show up in a listing by modification time, so incremental runs first read
+the plugin's change feed (GET .../changes?after=N) from the position stored by the last run.
+Assets the feed reports as deleted or unpublished are fetched again with the changed ones,
+and those the site no longer returns are removed. A full run (the first one, --full, or one
+whose feed position has expired) instead removes every local asset the listing lacks.
+
+The resume points only move forward after a run completes. An interrupted run therefore
+lists the same window again, but it skips assets that were already stored.
+
+Usage:
+    python sync_assets.py --url https://example.com --user admin --app-password "xxxx xxxx ..." [--db assets.sqlite]
+
+The user needs the edit_posts capability. Use a WordPress application password. The
+credentials can also be set through ASSET_SYNC_USER and ASSET_SYNC_APP_PASSWORD.
+"""
+
+import argparse
+import asyncio
+import base64
+import http.client
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from urllib.parse import urlencode, urlsplit
+
+import asset_schema
+
+ASSETS_ROUTE = f"/wp-json/{asset_schema.REST_NAMESPACE}/assets"
+CHANGES_ROUTE = f"/wp-json/{asset_schema.REST_NAMESPACE}/changes"
+CHANGES_PAGE_SIZE = 1000  # Maximum limit of the changes route
+REMOVAL_ACTIONS = ("deleted", "unpublished")
+LIST_PAGE_SIZE = 500  # Maximum per_page of the REST route
+MODIFIED_FORMAT = "%Y-%m-%dT%H:%M:%S"
+RESUME_OVERLAP = timedelta(seconds=1)  # modified_after is exclusive and has one-second resolution
+
+COLUMNS = ("id", "title", "modified") + asset_schema.FIELDS + ("issued_to_name", "categories")
+
+
+class SyncError(Exception):
+    """Raised when the site returns something the sync cannot continue from."""
+
+
+class FeedExpired(SyncError):
+    """Raised on HTTP 410: the change feed no longer reaches back to the stored position."""
+
+
+class RestClient:
+    """Minimal JSON-over-HTTP client, safe to use from several threads.
+
+    Each thread keeps its own persistent connection, so the number of open connections
+    is bounded by the number of worker threads.
+    """
+
+    def __init__(self, base_url, user=None, password=None, timeout=30):
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https") or not parts.netloc:
+            raise SyncError(f"Invalid site URL: {base_url}")
+        self.scheme = parts.scheme
+        self.netloc = parts.netloc
+        self.path_prefix = parts.path.rstrip("/")
+        self.timeout = timeout
+        self.headers = {"Accept": "application/json", "Connection": "keep-alive"}
+        if user and password:
+            token = base64.b64encode(f"{user}:{password}".encode("utf-8")).decode("ascii")
+            self.headers["Authorization"] = f"Basic {token}"
+        self._local = threading.local()
+
+    def _connection(self, fresh=False):
+        conn = getattr(self._local, "conn", None)
+        if conn is None or fresh:
+            if conn is not None:
+                conn.close()
+            conn_class = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+            conn = conn_class(self.netloc, timeout=self.timeout)
+            self._local.conn = conn
+        return conn
+
+    def url(self, path, params):
+        """Returns the request target (path and query) for a route."""
+        return f"{self.path_prefix}{path}?{urlencode(params)}" if params else f"{self.path_prefix}{path}"
+
+    def get(self, target, etag=None):
+        """Sends a GET request and returns (status, etag, body bytes).
+
+        A connection the server has closed while idle is reopened once.
+        """
+        headers = dict(self.headers)
+        if etag:
+            headers["If-None-Match"] = etag
+        for attempt in (1, 2):
+            conn = self._connection(fresh=(attempt == 2))
+            try:
+                conn.request("GET", target, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                if attempt == 2:
+                    raise
+        if response.status == 410:
+            raise FeedExpired(f"GET {target} failed with HTTP 410")
+        if response.status not in (200, 304):
+            raise SyncError(f"GET {target} failed with HTTP {response.status}: {body[:200].decode('utf-8', 'replace')}")
+        return response.status, response.getheader("ETag"), body
+
+
+def open_database(path):
+    """Opens the local database in WAL mode and creates the tables if needed."""
+    db = sqlite3.connect(path)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")  # Safe with WAL; a crash can only lose the last commits
+    field_columns = ", ".join(
+        f"{field} INTEGER NOT NULL DEFAULT 0" if field == "issued_to" else f"{field} TEXT NOT NULL DEFAULT ''"
+        for field in asset_schema.FIELDS
+    )
+    db.executescript(f"""
+        CREATE TABLE IF NOT EXISTS assets (
+            id INTEGER PRIMARY KEY,
+            title TEXT NOT NULL DEFAULT '',
+            modified TEXT NOT NULL DEFAULT '',
+            {field_columns},
+            issued_to_name TEXT NOT NULL DEFAULT '',
+            categories TEXT NOT NULL DEFAULT '[]'
+        );
+        CREATE INDEX IF NOT EXISTS assets_modified ON assets (modified);
+        CREATE TABLE IF NOT EXISTS sync_state (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+        CREATE TABLE IF NOT EXISTS http_cache (url TEXT PRIMARY KEY, etag TEXT NOT NULL, body BLOB NOT NULL);
+    """)
+    return db
+
+
+def get_state(db, name, default=None):
+    row = db.execute("SELECT value FROM sync_state WHERE name = ?", (name,)).fetchone()
+    return row[0] if row else default
+
+
+def set_state(db, name, value):
+    db.execute("INSERT INTO sync_state (name, value) VALUES (?, ?) ON CONFLICT(name) DO UPDATE SET value = excluded.value", (name, value))
+
+
+def store_assets(db, items):
+    """Upserts full asset rows from the REST route with one executemany."""
+    rows = []
+    for item in items:
+        row = [item.get(column, "") for column in COLUMNS]
+        row[COLUMNS.index("issued_to")] = int(item.get("issued_to") or 0)
+        row[COLUMNS.index("categories")] = json.dumps(item.get("categories", []), ensure_ascii=False)
+        rows.append(row)
+    placeholders = ", ".join("?" for _ in COLUMNS)
+    updates = ", ".join(f"{column} = excluded.{column}" for column in COLUMNS[1:])
+    with db:
+        db.executemany(f"INSERT INTO assets ({', '.join(COLUMNS)}) VALUES ({placeholders}) ON CONFLICT(id) DO UPDATE SET {updates}", rows)
+
+
+def delete_assets(db, ids):
+    with db:
+        db.executemany("DELETE FROM assets WHERE id = ?", [(asset_id,) for asset_id in ids])
+
+
+async def read_changes(client, pool, after):
+    """Walks the change feed from a position; returns (IDs deleted or unpublished, new position).
+
+    Without a position, only the current one is read, as the starting point for the next run.
+    """
+    loop = asyncio.get_running_loop()
+    removed = set()
+    params = {} if after is None else {"after": after, "limit": CHANGES_PAGE_SIZE}
+    while True:
+        _, _, body = await loop.run_in_executor(pool, client.get, client.url(CHANGES_ROUTE, params))
+        page = json.loads(body)
+        removed.update(int(change["id"]) for change in page["changes"] if change["action"] in REMOVAL_ACTIONS)
+        if not page.get("has_more"):
+            return removed, int(page["next_after"])
+        params["after"] = page["next_after"]
+
+
+async def list_assets(client, pool, db, modified_after, stats):
+    """Walks the modified-ordered listing and returns {id: modified} for every asset in it.
+
+    Pages are requested with the cached ETag of the same URL; a 304 reuses the cached body.
+    """
+    loop = asyncio.get_running_loop()
+    listed = {}
+    params = {"fields": "id,modified", "order": "modified", "per_page": LIST_PAGE_SIZE}
+    if modified_after:
+        params["modified_after"] = modified_after + "Z"
+
+    while True:
+        target = client.url(ASSETS_ROUTE, params)
+        cached = db.execute("SELECT etag, body FROM http_cache WHERE url = ?", (target,)).fetchone()
+        status, etag, body = await loop.run_in_executor(pool, client.get, target, cached[0] if cached else None)
+        if status == 304 and cached:
+            body = cached[1]
+            stats["not_modified"] += 1
+        elif etag:
+            with db:
+                db.execute("INSERT INTO http_cache (url, etag, body) VALUES (?, ?, ?) ON CONFLICT(url) DO UPDATE SET etag = excluded.etag, body = excluded.body", (target, etag, body))
+        stats["list_pages"] += 1
+        stats["cache_urls"].add(target)
+
+        page = json.loads(body)
+        for item in page["items"]:
+            listed[int(item["id"])] = item["modified"]
+        if not page.get("next_cursor"):
+            return listed
+        params["cursor"] = page["next_cursor"]
+
+
+async def fetch_assets(client, pool, db, ids, batch_size, stats):
+    """Fetches full rows for the given IDs in concurrent batches and stores each batch as it arrives.
+
+    IDs the site does not return any more (unpublished or deleted since listing) are removed locally.
+    """
+    loop = asyncio.get_running_loop()
+    batches = [ids[i:i + batch_size] for i in range(0, len(ids), batch_size)]
+    requests = [
+        loop.run_in_executor(pool, client.get, client.url(ASSETS_ROUTE, {"include": ",".join(map(str, batch)), "per_page": len(batch)}))
+        for batch in batches
+    ]
+    returned = set()
+    for request in asyncio.as_completed(requests):
+        _, _, body = await request
+        items = json.loads(body)["items"]
+        store_assets(db, items)
+        returned.update(int(item["id"]) for item in items)
+        stats["stored"] += len(items)
+        stats["fetch_requests"] += 1
+
+    missing = [asset_id for asset_id in ids if asset_id not in returned]
+    delete_assets(db, missing)
+    return missing
+
+
+async def sync(args):
+    db = open_database(args.db)
+    client = RestClient(args.url, args.user, args.app_password, args.timeout)
+    stats = {"list_pages": 0, "not_modified": 0, "fetch_requests": 0, "stored": 0, "removed": 0, "cache_urls": set()}
+    started = time.monotonic()
+
+    full = args.full or get_state(db, "change_seq") is None
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        # Read the feed before listing, so changes made while this run lists are in the next one
+        removed = set()
+        try:
+            removed, change_seq = await read_changes(client, pool, None if full else int(get_state(db, "change_seq")))
+        except FeedExpired:
+            print("The change feed has expired since the last run; resynchronizing in full", file=sys.stderr)
+            full = True
+            _, change_seq = await read_changes(client, pool, None)
+
+        last_modified = None if full else get_state(db, "last_modified")
+        modified_after = None
+        if last_modified:
+            modified_after = (datetime.strptime(last_modified, MODIFIED_FORMAT) - RESUME_OVERLAP).strftime(MODIFIED_FORMAT)
+        listed = await list_assets(client, pool, db, modified_after, stats)
+
+        local = dict(db.execute("SELECT id, modified FROM assets").fetchall())
+        changed = {asset_id for asset_id, modified in listed.items() if local.get(asset_id) != modified}
+        # Reported removals are fetched again: the site returns them if they are back, and
+        # fetch_assets() removes the rest
+        changed.update(asset_id for asset_id in removed if asset_id in local)
+        if changed:
+            missing = await fetch_assets(client, pool, db, sorted(changed), args.batch_size, stats)
+            stats["removed"] += len(missing)
+
+    if full:
+        gone = [asset_id for asset_id in local if asset_id not in listed]
+        delete_assets(db, gone)
+        stats["removed"] += len(gone)
+
+    with db:
+        if listed:
+            set_state(db, "last_modified", max([last_modified or ""] + list(listed.values())))
+        set_state(db, "change_seq", str(change_seq))
+        # Forget cached pages this run did not ask for; their URLs will not come up again
+        db.execute("CREATE TEMP TABLE used_urls (url TEXT PRIMARY KEY)")
+        db.executemany("INSERT INTO used_urls (url) VALUES (?)", [(url,) for url in stats["cache_urls"]])
+        db.execute("DELETE FROM http_cache WHERE url NOT IN (SELECT url FROM used_urls)")
+        db.execute("DROP TABLE used_urls")
+    db.close()
+
+    elapsed = time.monotonic() - started
+    print(f"Listed {len(listed)} assets in {stats['list_pages']} pages ({stats['not_modified']} not modified)")
+    print(f"Stored {stats['stored']} new or changed assets in {stats['fetch_requests']} requests, removed {stats['removed']}")
+    print(f"Finished in {elapsed:.1f}s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mirror Asset Manager (MVC) assets into a local SQLite database.")
+    parser.add_argument("--url", required=True, help="Site URL, e.g. https://example.com")
+    parser.add_argument("--user", default=os.environ.get("ASSET_SYNC_USER"), help="WordPress user name")
+    parser.add_argument("--app-password", default=os.environ.get("ASSET_SYNC_APP_PASSWORD"), help="Application password of the user")
+    parser.add_argument("--db", default="assets.sqlite", help="SQLite database file (default: assets.sqlite)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent requests / open connections (default: 4)")
+    parser.add_argument("--batch-size", type=int, default=100, help="Assets per fetch request, at most 500 (default: 100)")
+    parser.add_argument("--timeout", type=float, default=30, help="Request timeout in seconds (default: 30)")
+    parser.add_argument("--full", action="store_true", help="Ignore the resume points and remove local assets the site no longer lists")
+    args = parser.parse_args(argv)
+    args.concurrency = max(1, args.concurrency)
+    args.batch_size = min(max(1, args.batch_size), LIST_PAGE_SIZE)
+
+    try:
+        asyncio.run(sync(args))
+    except (SyncError, OSError, ValueError, KeyError) as e:
+        print(f"Sync failed: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+import json
+
+import analyze_assets
+import asset_schema
+import generate_assets
+
+
+def test_parse_note_reads_escaped_notes():
+    # As stored by Asset_Model: sprintf(esc_html__(...)) with esc_html() on every value
+    note = ("Status changed from &quot;Assigned&quot; to &quot;Returned&quot;; "
+            "Issued To changed from &quot;O&#039;Brien &amp; Sons&quot; to &quot;Unassigned&quot;")
+    assert list(analyze_assets.parse_note(note)) == [
+        (0, "Assigned", "Returned"),
+        (1, "O'Brien & Sons", "Unassigned"),
+    ]
+
+
+def test_parse_note_matches_change_note():
+    note = "; ".join([
+        asset_schema.change_note("Status", "Unassigned", "For Repair"),
+        asset_schema.change_note("Issued To", "Unassigned", 'Ann "AJ" <Jones>'),
+    ])
+    assert list(analyze_assets.parse_note(note)) == [
+        (0, "Unassigned", "For Repair"),
+        (1, "Unassigned", 'Ann "AJ" <Jones>'),
+    ]
+
+
+def test_parse_note_ignores_other_notes():
+    assert list(analyze_assets.parse_note("Asset created.")) == []
+    assert list(analyze_assets.parse_note("Serial Number changed from &quot;A&quot; to &quot;B&quot;")) == []
+
+
+def test_legacy_history_events():
+    serialized = asset_schema.php_serialize([
+        {"date": "2024-01-02 03:04:05", "user": 1, "note": asset_schema.change_note("Status", "Unassigned", "Assigned")},
+        {"date": "", "user": 1, "note": "ignored"},
+    ])
+    assert analyze_assets.legacy_history_events(7, serialized) == [(7, "2024-01-02 03:04:05", 0, "Unassigned", "Assigned")]
+    assert analyze_assets.legacy_history_events(7, "a:1:{broken") == []
+
+
+def test_parse_insert_history_rows():
+    note = asset_schema.change_note("Status", "Assigned", "Returned")
+    values = f"(1,5,2,'2024-01-02 03:04:05','{note}'),\n(2,6,2,'2024-02-03 04:05:06','It\\'s (a), note')\n;"
+    assets, meta, events = analyze_assets.parse_insert(("history", analyze_assets.DEFAULT_COLUMNS["history"], values))
+    assert (assets, meta) == ([], [])
+    assert events == [(5, "2024-01-02 03:04:05", 0, "Assigned", "Returned")]
+
+
+def test_parse_insert_posts_and_meta():
+    columns = ("meta_id", "post_id", "meta_key", "meta_value")
+    key = asset_schema.meta_key("status")
+    values = f"(1,10,'{key}','For Repair'),(2,10,'other','x'),(3,11,'{key}',NULL);"
+    assert analyze_assets.parse_insert(("postmeta", columns, values)) == ([], [(10, "status", "For Repair"), (11, "status", "")], [])
+
+    columns = ("ID", "post_date", "post_status", "post_type")
+    values = f"(10,'2024-01-01 00:00:00','publish','{asset_schema.POST_TYPE}'),(11,'2024-01-01 00:00:00','draft','{asset_schema.POST_TYPE}');"
+    assert analyze_assets.parse_insert(("posts", columns, values)) == ([(10, "2024-01-01 00:00:00")], [], [])
+
+
+def test_wxr_chunks_cut_between_items(tmp_path, monkeypatch):
+    item = (
+        "<item><title>A</title><wp:post_id>{id}</wp:post_id><wp:post_date>2024-01-01 00:00:00</wp:post_date>"
+        f"<wp:status>publish</wp:status><wp:post_type>{asset_schema.POST_TYPE}</wp:post_type>"
+        f"<wp:postmeta><wp:meta_key>{asset_schema.meta_key('status')}</wp:meta_key>"
+        "<wp:meta_value><![CDATA[Assigned]]></wp:meta_value></wp:postmeta></item>\n"
+    )
+    path = tmp_path / "export.xml"
+    path.write_text(
+        '<?xml version="1.0" encoding="UTF-8" ?>\n<rss version="2.0" xmlns:wp="http://wordpress.org/export/1.2/">\n'
+        "<channel>\n<title>Site</title>\n" + "".join(item.format(id=i) for i in range(1, 51)) + "</channel>\n</rss>\n"
+    )
+    monkeypatch.setattr(analyze_assets, "WXR_CHUNK_BYTES", 700)
+    chunks = list(analyze_assets.wxr_chunks(str(path)))
+    assert len(chunks) > 1
+    parsed = [analyze_assets.parse_wxr_chunk(chunk) for chunk in chunks]
+    assert [asset for assets, _, _ in parsed for asset in assets] == [(i, "2024-01-01 00:00:00") for i in range(1, 51)]
+    assert sum(len(meta) for _, meta, _ in parsed) == 50
+
+
+def test_status_report_ignores_assets_without_a_date(tmp_path, capsys):
+    output = tmp_path / "assets"
+    assert generate_assets.main(["--count", "50", "--format", "wxr", "--output", str(output), "--workers", "1", "--now", "2024-06-01 00:00:00"]) == 0
+    path = tmp_path / "assets.xml"
+    text = path.read_text(encoding="utf-8")
+    start = text.index("<wp:post_date>")
+    path.write_text(text[:start] + text[text.index("</wp:post_date>", start) + len("</wp:post_date>"):], encoding="utf-8")
+    capsys.readouterr()
+
+    assert analyze_assets.main([str(path), "--report", "status", "--json", "--workers", "1"]) == 0
+    report = json.loads(capsys.readouterr().out)["status"]
+    assert sum(report["counts"][-1]) == 50
@@ -0,0 +1,65 @@
+import io
+import zipfile
+
+import pytest
+
+import create_plugin_zip
+
+
+class Unseekable(io.RawIOBase):
+    """A write-only stream such as a pipe: no seek() and no tell()."""
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.buffer += data
+        return len(data)
+
+
+@pytest.fixture
+def members(tmp_path):
+    stored = tmp_path / "logo.png"
+    stored.write_bytes(bytes(range(256)) * 64)
+    deflated = tmp_path / "Mpdf.php"
+    deflated.write_bytes(b"<?php\nclass Mpdf {}\n" * 500)
+    files = {"plugin/plugin.php": "<?php\n// Plugin\n", "plugin/readme.txt": "Readme\n" * 100}
+    return create_plugin_zip.plugin_members(files, [("plugin/assets/logo.png", str(stored)), ("plugin/vendor/Mpdf.php", str(deflated))])
+
+
+def build(fileobj, members):
+    create_plugin_zip.write_plugin_zip(fileobj, members, workers=1)
+
+
+def test_seekable_and_unseekable_builds_are_valid_and_identical(tmp_path, members, monkeypatch):
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    path = tmp_path / "plugin.zip"
+    build(str(path), members)
+    stream = Unseekable()
+    build(stream, members)
+
+    for data in (path.read_bytes(), bytes(stream.buffer)):
+        with zipfile.ZipFile(io.BytesIO(data)) as zipf:
+            assert zipf.testzip() is None
+            assert zipf.namelist() == list(members)
+            assert zipf.read("plugin/plugin.php") == b"<?php\n// Plugin\n"
+            assert zipf.getinfo("plugin/assets/logo.png").compress_type == zipfile.ZIP_STORED
+            assert zipf.getinfo("plugin/vendor/Mpdf.php").compress_type == zipfile.ZIP_DEFLATED
+            assert zipf.read("plugin/vendor/Mpdf.php") == b"<?php\nclass Mpdf {}\n" * 500
+    assert bytes(stream.buffer) == path.read_bytes()
+
+
+def test_second_build_is_byte_identical(tmp_path, members):
+    first, second = tmp_path / "first.zip", tmp_path / "second.zip"
+    build(str(first), members)
+    build(str(second), members)
+    assert first.read_bytes() == second.read_bytes()
+
+
+def test_refuses_zipfile_without_internals(members, monkeypatch):
+    monkeypatch.setattr(create_plugin_zip, "ZIPFILE_INTERNALS", create_plugin_zip.ZIPFILE_INTERNALS + ("_no_such_attribute",))
+    with pytest.raises(RuntimeError, match="_no_such_attribute"):
+        build(io.BytesIO(), members)
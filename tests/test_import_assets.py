@@ -0,0 +1,83 @@
+import csv
+
+import pytest
+
+import asset_schema
+import import_assets
+
+
+def valid_values(**overrides):
+    values = {
+        "asset_tag": "AT-1", "model": "T14", "serial_number": "SN1", "brand": "Lenovo", "supplier": "Acme",
+        "date_purchased": "2024-02-29", "issued_to": "0", "status": "Assigned", "description": "Spare",
+    }
+    values.update(overrides)
+    return values
+
+
+def test_validate_asset_accepts_a_complete_record():
+    assert import_assets.validate_asset(valid_values(), ["Laptops"]) == []
+
+
+@pytest.mark.parametrize("overrides, message", [
+    ({"date_purchased": ""}, "The Date Purchased field is required."),
+    ({"date_purchased": "0"}, "The Date Purchased field is required."),
+    ({"date_purchased": "2023-02-29"}, "The Date Purchased field has an invalid date format. Please use YYYY-MM-DD."),
+    ({"date_purchased": "2024-2-1"}, "The Date Purchased field has an invalid date format. Please use YYYY-MM-DD."),
+    ({"status": " "}, "The Status field is required; please select a status."),
+    ({"status": "Lost"}, "Invalid value selected for the Status field."),
+    ({"issued_to": ""}, "The Issued To field is required; please select a user."),
+    ({"brand": "  "}, "The Brand field is required."),
+    ({"model": None}, "The Model field is required."),
+])
+def test_validate_asset_reports_invalid_fields(overrides, message):
+    assert import_assets.validate_asset(valid_values(**overrides), ["Laptops"]) == [message]
+
+
+def test_validate_asset_allows_zero_values_and_a_missing_assignee():
+    assert import_assets.validate_asset(valid_values(issued_to=None, supplier="0"), ["Laptops"]) == []
+
+
+@pytest.mark.parametrize("categories", [[], [""], ["0"]])
+def test_validate_asset_requires_a_category(categories):
+    assert import_assets.validate_asset(valid_values(), categories) == ["The Category field is required; please select a category."]
+
+
+def test_sanitize_asset():
+    meta = import_assets.sanitize_asset(valid_values(
+        asset_tag=" AT-1 <b>x</b> ", model="T14\tGen  2", brand="Len%20ovo<script>alert(1)</script>",
+        issued_to="-42abc", status=" Assigned ", date_purchased=" 2024-02-29", description="Line 1\n<i>Line 2</i> <",
+    ))
+    assert meta == {
+        "asset_tag": "AT-1 x", "model": "T14 Gen 2", "serial_number": "SN1", "brand": "Lenovo", "supplier": "Acme",
+        "date_purchased": "2024-02-29", "issued_to": "42", "status": "Assigned", "description": "Line 1\nLine 2 &lt;",
+    }
+
+
+def test_sanitize_asset_fills_missing_fields():
+    meta = import_assets.sanitize_asset({})
+    assert list(meta) == list(asset_schema.FIELDS)
+    assert meta["issued_to"] == "0" and meta["description"] == ""
+
+
+def test_plugin_csv_export_round_trip(tmp_path, capsys):
+    # As Export_Controller writes it: all categories in one cell, formula-like cells quoted
+    path = tmp_path / "export.csv"
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "title"] + list(asset_schema.FIELDS) + ["issued_to_name", "category"])
+        values = valid_values(serial_number="'-0042", description="'=SUM(A1)")
+        writer.writerow(["7", "'@Desk laptop"] + [values[field] for field in asset_schema.FIELDS] + ["", "Laptops, Spares, laptops"])
+    output = tmp_path / "import"
+
+    assert import_assets.main([str(path), "--start-id", "500", "--format", "load-data", "--output", str(output), "--workers", "1"]) == 0
+
+    meta = {key: value for _, key, value in csv.reader(open(output / "postmeta.tsv", encoding="utf-8"), delimiter="\t")}
+    assert meta[asset_schema.meta_key("serial_number")] == "-0042"
+    assert meta[asset_schema.meta_key("description")] == "=SUM(A1)"
+    assert "\t@Desk laptop\t" in (output / "posts.tsv").read_text(encoding="utf-8")
+    # "laptops" matches the "Laptops" term by name
+    assert (output / "term_relationships.tsv").read_text(encoding="utf-8") == "500\t100000\t0\n500\t100001\t0\n"
+    load = (output / "load.sql").read_text(encoding="utf-8")
+    assert "(100000,'Laptops','laptops',0),\n(100001,'Spares','spares',0);" in load
+    assert "Done: 1 assets" in capsys.readouterr().err
@@ -0,0 +1,191 @@
+import hashlib
+import json
+import sqlite3
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+import asset_schema
+import sync_assets
+
+
+class StubSite:
+    """The plugin's /assets and /changes routes over an in-memory set of published assets."""
+
+    def __init__(self):
+        self.assets = {}
+        self.changes = []  # (seq, id, action)
+        self.pruned_seq = 0
+        self.requests = []  # (path, query, status)
+
+    def publish(self, asset_id, modified, title=None):
+        row = {field: 0 if field == "issued_to" else "" for field in asset_schema.FIELDS}
+        row.update(id=asset_id, title=title or f"Asset {asset_id}", modified=modified, issued_to_name="", categories=["Laptops"])
+        self.assets[asset_id] = row
+        self.record(asset_id, "updated")
+
+    def remove(self, asset_id, action):
+        del self.assets[asset_id]
+        self.record(asset_id, action)
+
+    def record(self, asset_id, action):
+        seq = self.changes[-1][0] + 1 if self.changes else 1
+        self.changes.append((seq, asset_id, action))
+
+    def assets_page(self, query):
+        if "include" in query:
+            ids = [int(asset_id) for asset_id in query["include"].split(",")]
+            return {"items": [self.assets[asset_id] for asset_id in ids if asset_id in self.assets]}
+        rows = sorted(self.assets.values(), key=lambda row: (row["modified"], row["id"]))
+        if "modified_after" in query:
+            rows = [row for row in rows if row["modified"] > query["modified_after"].rstrip("Z")]
+        if "cursor" in query:
+            modified, asset_id = query["cursor"].split("|")
+            rows = [row for row in rows if (row["modified"], row["id"]) > (modified, int(asset_id))]
+        page = rows[:int(query["per_page"])]
+        more = len(rows) > len(page)
+        return {
+            "items": [{"id": row["id"], "modified": row["modified"]} for row in page],
+            "next_cursor": f"{page[-1]['modified']}|{page[-1]['id']}" if more else None,
+        }
+
+    def changes_page(self, query):
+        latest = self.changes[-1][0] if self.changes else 0
+        if "after" not in query:
+            return 200, {"changes": [], "next_after": latest, "has_more": False}
+        after = int(query["after"])
+        if after < self.pruned_seq:
+            return 410, {"code": "asset_manager_mvc_cursor_expired"}
+        changes = [change for change in self.changes if change[0] > after]
+        page = changes[:int(query["limit"])]
+        return 200, {
+            "changes": [{"seq": seq, "id": asset_id, "action": action, "changed_at": ""} for seq, asset_id, action in page],
+            "next_after": page[-1][0] if page else after,
+            "has_more": len(changes) > len(page),
+        }
+
+
+@pytest.fixture
+def site():
+    stub = StubSite()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # Keep-alive, as the client expects
+
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            query = {name: values[0] for name, values in parse_qs(parts.query).items()}
+            if parts.path == sync_assets.ASSETS_ROUTE:
+                status, payload = 200, stub.assets_page(query)
+            elif parts.path == sync_assets.CHANGES_ROUTE:
+                status, payload = stub.changes_page(query)
+            else:
+                status, payload = 404, {"code": "rest_no_route"}
+            body = json.dumps(payload).encode("utf-8")
+            etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+            if status == 200 and self.headers.get("If-None-Match") == etag:
+                status, body = 304, b""
+            stub.requests.append((parts.path, query, status))
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            if status in (200, 304):
+                self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    stub.url = f"http://127.0.0.1:{server.server_address[1]}"
+    for asset_id in range(1, 6):
+        stub.publish(asset_id, f"2026-01-01T00:00:0{asset_id}")
+    yield stub
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def run(site, tmp_path, monkeypatch):
+    monkeypatch.setattr(sync_assets, "LIST_PAGE_SIZE", 2)  # Walk the cursor over several pages
+    db_path = str(tmp_path / "assets.sqlite")
+
+    def run(*args):
+        site.requests.clear()
+        assert sync_assets.main(["--url", site.url, "--db", db_path, "--batch-size", "2", *args]) == 0
+        with sqlite3.connect(db_path) as db:
+            return dict(db.execute("SELECT id, title FROM assets").fetchall())
+
+    return run
+
+
+def fetched_ids(site):
+    return sorted(
+        int(asset_id)
+        for path, query, _ in site.requests
+        if path == sync_assets.ASSETS_ROUTE and "include" in query
+        for asset_id in query["include"].split(",")
+    )
+
+
+def test_initial_sync_mirrors_every_published_asset(site, run):
+    assert run() == {asset_id: f"Asset {asset_id}" for asset_id in range(1, 6)}
+    listing = [query for path, query, _ in site.requests if path == sync_assets.ASSETS_ROUTE and "include" not in query]
+    assert len(listing) == 3
+    assert fetched_ids(site) == [1, 2, 3, 4, 5]
+
+
+def test_incremental_run_fetches_only_new_and_changed_assets(site, run):
+    run()
+    site.publish(3, "2026-01-01T00:01:00", title="Renamed")
+    site.publish(6, "2026-01-01T00:01:00")
+
+    local = run()
+
+    assert fetched_ids(site) == [3, 6]
+    assert local[3] == "Renamed" and local[6] == "Asset 6"
+    assert all("modified_after" in query for path, query, _ in site.requests if path == sync_assets.ASSETS_ROUTE and "include" not in query)
+
+
+def test_unchanged_listing_pages_are_revalidated_with_etags(site, run, capsys):
+    run()
+    run()
+    capsys.readouterr()
+
+    run()
+
+    statuses = [status for path, query, status in site.requests if path == sync_assets.ASSETS_ROUTE]
+    assert statuses and set(statuses) == {304}
+    assert fetched_ids(site) == []
+    assert f"({len(statuses)} not modified)" in capsys.readouterr().out
+
+
+def test_incremental_run_removes_deleted_and_unpublished_assets(site, run):
+    run()
+    site.remove(2, "deleted")
+    site.remove(4, "unpublished")
+    site.remove(5, "unpublished")
+    site.publish(5, "2026-01-01T00:00:05")  # Back with an unchanged modification time
+
+    local = run()
+
+    assert sorted(local) == [1, 3, 5]
+    assert fetched_ids(site) == [2, 4, 5]
+
+
+def test_expired_change_feed_falls_back_to_a_full_resync(site, run, capsys):
+    run()
+    site.remove(1, "deleted")
+    site.pruned_seq = site.changes[-1][0]
+    capsys.readouterr()
+
+    local = run()
+
+    assert sorted(local) == [2, 3, 4, 5]
+    assert "expired" in capsys.readouterr().err
+    assert not any("modified_after" in query for path, query, _ in site.requests if path == sync_assets.ASSETS_ROUTE)
@@ -0,0 +1,122 @@
+import os
+
+import pytest
+
+import create_plugin_zip
+import vendor_bundle
+
+VENDOR_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "vendor")
+MPDF_DIR = os.path.join(VENDOR_DIR, "mpdf", "mpdf")
+
+SOURCE = r"""<?php
+namespace Acme\Pdf;
+
+use Vendor\Pkg\{One, Two as Deux};
+use Vendor\Long\Name as Short;
+use function Vendor\helper;
+
+// class Commented extends Hidden\Comment {}
+/* new Gone\Away(); */
+# class HashComment {}
+final class Report extends Base implements \Countable
+{
+    public function run($items) {
+        $fn = function () use ($items) { return new One(); };
+        $tag = 'Mpdf\Tag\\';
+        $name = "Plain\\Quoted";
+        $text = <<<EOT
+class FakeHeredoc {}
+new Heredoc\Only();
+EOT;
+        $raw = <<<'NOW'
+class FakeNowdoc {}
+NOW;
+        Short::make(new Deux(), namespace\Local::X, $this->method(), static::class);
+    }
+}
+interface Shape {}
+"""
+
+
+@pytest.fixture(scope="module")
+def scanned():
+    return vendor_bundle.scan_php(SOURCE)
+
+
+def test_scan_php_declarations_are_namespaced(scanned):
+    declared, _, _ = scanned
+    assert declared == ["Acme\\Pdf\\Report", "Acme\\Pdf\\Shape"]
+
+
+def test_scan_php_resolves_imports_and_aliases(scanned):
+    _, names, _ = scanned
+    assert {"vendor\\pkg\\one", "vendor\\pkg\\two", "vendor\\long\\name"} <= names
+    assert {"countable", "acme\\pdf\\base", "acme\\pdf\\local"} <= names
+    # use function imports no class, and the closure's use is not an import
+    assert "vendor\\helper" not in names and "acme\\pdf\\items" not in names
+
+
+def test_scan_php_reads_strings_but_not_comments_or_heredocs(scanned):
+    _, names, prefixes = scanned
+    assert "plain\\quoted" in names
+    assert prefixes == {"mpdf\\tag\\"}
+    assert not [name for name in names if name.split("\\")[-1] in (
+        "commented", "comment", "away", "hashcomment", "fakeheredoc", "only", "fakenowdoc"
+    )]
+
+
+def test_scan_php_braced_namespaces():
+    declared, names, _ = vendor_bundle.scan_php(
+        "<?php\nnamespace A { class X {} }\nnamespace B { class Y extends X {} }\nnamespace { class Z {} }\n"
+    )
+    assert declared == ["A\\X", "B\\Y", "Z"]
+    assert "b\\x" in names
+
+
+@pytest.fixture(scope="module")
+def plugin_sources():
+    files = create_plugin_zip.get_files_to_create("asset-manager-mvc")
+    return [content for arcname, content in files.items() if arcname.endswith(".php")]
+
+
+@pytest.fixture(scope="module")
+def bundle(plugin_sources):
+    paths, autoloader = vendor_bundle.bundle_vendor(VENDOR_DIR, plugin_sources, ["en"])
+    classes = vendor_bundle.reachable_classes(os.path.abspath(VENDOR_DIR), plugin_sources)
+    return set(paths), set(classes), autoloader
+
+
+def test_bundle_keeps_the_classes_mpdf_needs(bundle):
+    paths, classes, autoloader = bundle
+    assert "Mpdf\\Mpdf" in classes
+    assert "mpdf/mpdf/src/Mpdf.php" in paths
+    assert "'Mpdf\\\\Mpdf' => '/mpdf/mpdf/src/Mpdf.php'," in autoloader
+    # Only named as 'Mpdf\Tag\' . $tag in Tag.php
+    assert {"Mpdf\\Tag\\Dd", "Mpdf\\Tag\\Bdo", "Mpdf\\Tag\\Address"} <= classes
+    # Imported by FpdiTrait and Mpdf with use
+    assert {"setasign\\Fpdi\\PdfParser\\Type\\PdfArray", "setasign\\Fpdi\\PdfParser\\CrossReference\\CrossReferenceException"} <= classes
+    assert {"Psr\\Log\\NullLogger", "Psr\\Log\\LoggerInterface"} <= classes
+
+
+def test_bundle_files_exist_and_match_the_classmap(bundle):
+    paths, classes, autoloader = bundle
+    assert all(os.path.isfile(os.path.join(VENDOR_DIR, path)) for path in paths)
+    assert autoloader.count("' => '/") >= len(classes)
+    assert "mpdf/mpdf/LICENSE.txt" in paths
+
+
+def test_bundle_keeps_the_default_fonts(bundle):
+    paths, _, _ = bundle
+    for suffix in ("", "-Bold", "-Oblique", "-BoldOblique"):
+        assert f"mpdf/mpdf/ttfonts/DejaVuSansCondensed{suffix}.ttf" in paths
+
+
+def test_mpdf_data_files_follow_the_locales():
+    english = set(vendor_bundle.mpdf_data_files(MPDF_DIR, ["en"]))
+    assert "data/patterns/en.php" in english and "data/patterns/de.php" not in english
+    assert not [path for path in english if path.startswith("data/collations/")]
+    assert "data/linebrdictT.dat" not in english and "data/CJKdata.php" not in english
+
+    thai = set(vendor_bundle.mpdf_data_files(MPDF_DIR, ["th_TH", "de-DE"]))
+    assert {"data/linebrdictT.dat", "data/patterns/de.php", "data/patterns/en.php"} <= thai
+    assert "data/CJKdata.php" in vendor_bundle.mpdf_data_files(MPDF_DIR, ["ja"])
@@ -0,0 +1,367 @@
+"""Tree-shakes the Composer vendor/ directory bundled with the plugins.
+
+The plugins only use mPDF, by way of a handful of classes. Shipping the whole tree costs
+most of the ZIP: every collation, hyphenation and line-break table, 78 fonts, and
+Composer's PSR-4 ClassLoader, which probes the filesystem for every class it loads.
+
+bundle_vendor() keeps only:
+- the class files reachable from the plugin's PHP, found by following every class name
+  that each file mentions, including names spelled out in strings
+- Composer's autoload "files", and everything they reach
+- for mPDF, the data files and fonts needed for a set of locales
+- the license files of the packages that have anything left
+
+Those are loaded by a generated vendor/autoload.php with an authoritative classmap, so a
+class that is not bundled is never looked for on disk. Over-approximating is deliberate:
+a name that might be a class keeps that class.
+"""
+
+import functools
+import os
+import re
+
+MPDF_PACKAGE = "mpdf/mpdf"
+# mPDF's default SHYlang; its hyphenation patterns are loaded whatever the document language
+MPDF_DEFAULT_HYPHENATION = "en"
+# Otl.php loads data/linebrdict{T,L,K}.dat for the Thai, Lao and Khmer shapers, if present
+MPDF_LINEBREAK_LANGUAGES = {"T": ("th", "tha"), "L": ("lo", "lao"), "K": ("km", "khm")}
+# data/CJKdata.php is only read for the Adobe CJK fonts, which these languages select
+MPDF_CJK_LANGUAGES = frozenset(("zh", "zho", "ja", "jpn", "ko", "kor"))
+LICENSE_PREFIXES = ("license", "licence", "copying", "credits", "notice")
+
+PHP_TOKEN_RE = re.compile(r"""
+    (?P<comment>//[^\n]*|\#(?!\[)[^\n]*|/\*.*?\*/)
+  | (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+  | (?P<heredoc><<<[ \t]*(?P<quote>["']?)(?P<label>\w+)(?P=quote)\r?\n.*?\n[ \t]*(?P=label)\b)
+  | (?P<skip><\?php|\$\w+|(?:->|\?->|::)\s*\w+)
+  | (?P<name>\\?[A-Za-z_\x80-\uffff][\w\x80-\uffff]*(?:\\[A-Za-z_\x80-\uffff][\w\x80-\uffff]*)*)
+  | (?P<punct>[{};,])
+""", re.S | re.X)
+CLASS_NAME_RE = re.compile(r"\\?[A-Za-z_]\w*(?:\\[A-Za-z_]\w*)*\\?")
+DECLARATION_KEYWORDS = frozenset(("class", "interface", "trait", "enum"))
+COMPOSER_ENTRY_RE = re.compile(r"^\s*'((?:[^'\\]|\\.)*)' => (.*),$", re.M)
+COMPOSER_PATH_RE = re.compile(r"\$vendorDir \. '([^']*)'")
+
+
+def php_unescape(literal):
+    """Contents of a PHP string literal, with only the escapes a class name can contain undone."""
+    return literal[1:-1].replace("\\\\", "\\").replace("\\'", "'")
+
+
+def scan_php(text):
+    """Returns the classes a PHP file declares and the names it might refer to as classes.
+
+    Declared classes are fully qualified. References are sets of lowercase candidate names
+    (PHP class names are case-insensitive), plus namespace prefixes from strings like
+    'Mpdf\\Tag\\' that code appends a class name to.
+    """
+    declared = []
+    names = set()
+    prefixes = set()
+    namespace = ""
+    imports = {}
+    depth = 0
+    namespace_depth = 0
+    statement = None  # Tokens of a namespace or use statement being read
+    previous = None
+
+    def resolve(name):
+        if name.startswith("\\"):
+            return {name[1:].lower()}
+        first, _, rest = name.partition("\\")
+        if first.lower() == "namespace" and rest:
+            return {f"{namespace}\\{rest}".lower().lstrip("\\")}
+        if first.lower() in imports:
+            return {(imports[first.lower()] + ("\\" + rest if rest else "")).lower()}
+        # Unqualified names are relative to the namespace; global is kept too, as functions fall back to it
+        return {f"{namespace}\\{name}".lower().lstrip("\\"), name.lower()}
+
+    for match in PHP_TOKEN_RE.finditer(text):
+        kind = match.lastgroup
+        if kind in ("comment", "skip"):
+            continue
+        if kind in ("string", "heredoc"):
+            if kind == "string":
+                value = php_unescape(match.group())
+                if CLASS_NAME_RE.fullmatch(value) and "\\" in value.strip("\\"):
+                    value = value.lstrip("\\").lower()
+                    if value.endswith("\\"):
+                        prefixes.add(value)
+                    else:
+                        names.add(value)
+            previous = None
+            continue
+        token = match.group()
+        if statement is not None:
+            if token in (";", "{") and statement[0] == "namespace":
+                namespace = "\\".join(t for t in statement[1:] if t != ",").lstrip("\\")
+                namespace_depth = depth + (token == "{")
+                imports = {}
+                statement = None
+            elif token == ";" and statement[0] == "use":
+                add_imports(statement[1:], imports)
+                statement = None
+            else:
+                statement.append(token)
+                continue
+        if token == "{":
+            depth += 1
+        elif token == "}":
+            depth -= 1
+            if depth < namespace_depth:
+                namespace_depth = depth
+                namespace = ""
+        elif kind == "name":
+            lowered = token.lower()
+            if lowered == "namespace" and previous in (None, ";", "{", "}"):
+                statement = ["namespace"]
+            elif lowered == "use" and depth == namespace_depth:
+                statement = ["use"]
+            elif previous in DECLARATION_KEYWORDS:
+                declared.append(f"{namespace}\\{token}".lstrip("\\"))
+            elif lowered not in DECLARATION_KEYWORDS:
+                names.update(resolve(token))
+            previous = lowered
+            continue
+        previous = token
+    return declared, names, prefixes
+
+
+def add_imports(tokens, imports):
+    """Adds the aliases of a top-level use statement (without 'use' and ';') to imports."""
+    if tokens and tokens[0].lower() in ("function", "const"):
+        return
+    group_prefix = ""
+    name = None
+    alias_next = False
+    for token in tokens + [","]:
+        if token == "{":
+            group_prefix = name.lstrip("\\") + "\\"
+            name = None
+        elif token in (",", "}"):
+            if name:
+                full = group_prefix + name.lstrip("\\")
+                imports.setdefault(full.rsplit("\\", 1)[-1].lower(), full)
+            name = None
+            if token == "}":
+                group_prefix = ""
+        elif token.lower() == "as":
+            alias_next = True
+        elif alias_next:
+            imports[token.lower()] = group_prefix + name.lstrip("\\")
+            name = None
+            alias_next = False
+        else:
+            name = token
+
+
+def read_composer_map(vendor_dir, name):
+    """Entries of one of Composer's generated vendor/composer/autoload_*.php arrays.
+
+    Returns (key, [paths relative to vendor_dir]) pairs.
+    """
+    path = os.path.join(vendor_dir, "composer", name)
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    return [(php_unescape(f"'{key}'"), [p.lstrip("/") for p in COMPOSER_PATH_RE.findall(value)])
+            for key, value in COMPOSER_ENTRY_RE.findall(text)]
+
+
+def is_composer_vendor(vendor_dir):
+    return os.path.exists(os.path.join(vendor_dir, "composer", "autoload_real.php"))
+
+
+@functools.lru_cache(maxsize=None)
+def scan_vendor(vendor_dir):
+    """Scans a Composer vendor/ directory like `composer dump-autoload --classmap-authoritative`.
+
+    Returns (classmap, references, autoload_files): classmap maps lowercase class names to
+    (class name, path relative to vendor_dir); references maps each of those paths to what
+    scan_php() found in it; autoload_files are Composer's (identifier, path) "files" entries.
+    """
+    class_paths = {}
+    for _, paths in read_composer_map(vendor_dir, "autoload_classmap.php"):
+        class_paths.update((path, None) for path in paths)
+    for map_name in ("autoload_psr4.php", "autoload_namespaces.php"):
+        for _, directories in read_composer_map(vendor_dir, map_name):
+            for directory in directories:
+                for root, dirs, files in os.walk(os.path.join(vendor_dir, directory)):
+                    dirs.sort()
+                    for file_name in sorted(files):
+                        if file_name.endswith(".php"):
+                            class_paths[os.path.relpath(os.path.join(root, file_name), vendor_dir)] = None
+    autoload_files = [(identifier, paths[0]) for identifier, paths in read_composer_map(vendor_dir, "autoload_files.php")]
+    class_paths.update((path, None) for _, path in autoload_files)
+
+    classmap = {}
+    references = {}
+    for path in class_paths:
+        with open(os.path.join(vendor_dir, path), encoding="utf-8", errors="replace") as f:
+            declared, names, prefixes = scan_php(f.read())
+        references[path] = (names, prefixes)
+        for class_name in declared:
+            classmap.setdefault(class_name.lower(), (class_name, path))
+    return classmap, references, autoload_files
+
+
+def reachable_classes(vendor_dir, root_sources):
+    """Class names reachable from root_sources and Composer's autoload files, sorted."""
+    classmap, references, autoload_files = scan_vendor(vendor_dir)
+    pending = [scan_php(source)[1:] for source in root_sources]
+    pending.extend(references[path] for _, path in autoload_files)
+    seen_paths = set()
+    reached = set()
+    while pending:
+        names, prefixes = pending.pop()
+        found = {name for name in names if name in classmap}
+        if prefixes:
+            found.update(key for key in classmap if key.startswith(tuple(prefixes)))
+        for key in found - reached:
+            reached.add(key)
+            path = classmap[key][1]
+            if path not in seen_paths:
+                seen_paths.add(path)
+                pending.append(references[path])
+    return sorted(classmap[key][0] for key in reached)
+
+
+@functools.lru_cache(maxsize=None)
+def mpdf_fonts(mpdf_dir):
+    """Reads mPDF's font configuration.
+
+    Returns (files, generic, language_fonts): the font files of each family in 'fontdata',
+    with any 'sip-ext' family added; the first of 'sans_fonts', 'serif_fonts' and 'mono_fonts',
+    which generic CSS families and the default body font resolve to; and the families
+    LanguageToFont::getLanguageOptions() can pick for each language code.
+    """
+    with open(os.path.join(mpdf_dir, "src", "Config", "FontVariables.php"), encoding="utf-8") as f:
+        font_variables = f.read()
+    fontdata = font_variables[font_variables.index("'fontdata' =>"):font_variables.index("'sans_fonts' =>")]
+    files = {}
+    for family, body in re.findall(r'"([\w-]+)" => \[(.*?)\]', fontdata, re.S):
+        files[family] = re.findall(r"'(?:R|B|I|BI)' => \"([^\"]+)\"", body)
+        files[family].extend(re.findall(r"'sip-ext' => '([\w-]+)'", body))
+    generic = [re.search(rf"'{key}' => \['([\w-]+)'", font_variables).group(1) for key in ("sans_fonts", "serif_fonts", "mono_fonts")]
+
+    with open(os.path.join(mpdf_dir, "src", "Language", "LanguageToFont.php"), encoding="utf-8") as f:
+        language_to_font = f.read()
+    switch = language_to_font[language_to_font.index("switch ($lang)"):language_to_font.index("return [$coreSuitable")]
+    language_fonts = {}
+    labels = []
+    closed = False
+    for label, family in re.findall(r"case '(\w+)':|\$unifont = '([\w-]+)'|\bbreak;", switch):
+        if label:
+            if closed:
+                labels = []
+                closed = False
+            labels.append(label)
+        elif family:
+            for code in labels:
+                language_fonts.setdefault(code, set()).add(family)
+        else:
+            closed = True
+    return files, generic, language_fonts
+
+
+def mpdf_data_files(mpdf_dir, locales):
+    """Files of the mPDF package outside its classes to keep for locales, relative to mpdf_dir."""
+    languages = {re.split(r"[-_]", locale)[0].lower() for locale in locales}
+    font_files, generic, language_fonts = mpdf_fonts(mpdf_dir)
+    families = set(generic)
+    for language in languages:
+        families.update(language_fonts.get(language, ()))
+    fonts = set()
+    while families:
+        family = families.pop()
+        for name in font_files.get(family, ()):
+            if name in font_files:
+                families.add(name)  # A 'sip-ext' family
+            else:
+                fonts.add(name)
+
+    kept = []
+    for directory in ("data", "ttfonts"):
+        for root, dirs, files in os.walk(os.path.join(mpdf_dir, directory)):
+            dirs.sort()
+            for file_name in sorted(files):
+                path = os.path.relpath(os.path.join(root, file_name), mpdf_dir).replace(os.sep, "/")
+                stem = os.path.splitext(file_name)[0]
+                if directory == "ttfonts":
+                    # Font files as configured, and the readme and license texts next to them
+                    keep = file_name in fonts or file_name.endswith(".txt")
+                elif path.startswith("data/collations/"):
+                    keep = False  # Only read by CreateIndex() when an index collation is set
+                elif path.startswith("data/patterns/"):
+                    keep = file_name == "dictionary.txt" or stem in languages | {MPDF_DEFAULT_HYPHENATION}
+                elif stem.startswith("linebrdict"):
+                    keep = bool(languages.intersection(MPDF_LINEBREAK_LANGUAGES.get(stem[-1], ())))
+                elif path == "data/CJKdata.php":
+                    keep = bool(languages & MPDF_CJK_LANGUAGES)
+                else:
+                    keep = True
+                if keep:
+                    kept.append(path)
+    return kept
+
+
+def render_autoloader(class_paths, autoload_files):
+    """vendor/autoload.php for the bundle: a classmap autoloader, then Composer's autoload files.
+
+    Files are guarded like Composer's own loader does, so they are not loaded twice when
+    another plugin's Composer autoloader has already loaded them.
+    """
+    def php_string(value):
+        return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+    classmap = "".join(f"        {php_string(name)} => {php_string('/' + path)},\n" for name, path in class_paths)
+    files = "".join(f"    {php_string(identifier)} => {php_string('/' + path)},\n" for identifier, path in autoload_files)
+    return (
+        "<?php\n"
+        "// Generated by create_plugin_zip.py: vendor/ holds only the classes listed here, so the\n"
+        "// classmap is authoritative and no other class is looked for on disk.\n"
+        "\n"
+        "spl_autoload_register(static function ($class) {\n"
+        "    static $classmap = [\n"
+        f"{classmap}"
+        "    ];\n"
+        "    if (isset($classmap[$class])) {\n"
+        "        require __DIR__ . $classmap[$class];\n"
+        "    }\n"
+        "});\n"
+        "\n"
+        "foreach ([\n"
+        f"{files}"
+        "] as $file_identifier => $file) {\n"
+        "    if (empty($GLOBALS['__composer_autoload_files'][$file_identifier])) {\n"
+        "        $GLOBALS['__composer_autoload_files'][$file_identifier] = true;\n"
+        "        require __DIR__ . $file;\n"
+        "    }\n"
+        "}\n"
+    )
+
+
+def bundle_vendor(vendor_dir, root_sources, locales):
+    """Works out the tree-shaken bundle of a Composer vendor/ directory.
+
+    root_sources are the plugin's PHP sources. Returns (paths, autoloader): the files to
+    bundle, relative to vendor_dir and sorted, and the source of the vendor/autoload.php
+    that replaces Composer's.
+    """
+    vendor_dir = os.path.abspath(vendor_dir)
+    classmap, _, autoload_files = scan_vendor(vendor_dir)
+    class_paths = [classmap[name.lower()] for name in reachable_classes(vendor_dir, root_sources)]
+    class_paths = [(name, path.replace(os.sep, "/")) for name, path in class_paths]
+    kept = {path for _, path in class_paths} | {path for _, path in autoload_files}
+
+    mpdf_dir = os.path.join(vendor_dir, *MPDF_PACKAGE.split("/"))
+    if any(path.startswith(MPDF_PACKAGE + "/") for path in kept):
+        kept.update(f"{MPDF_PACKAGE}/{path}" for path in mpdf_data_files(mpdf_dir, locales))
+
+    for package in {"/".join(path.split("/")[:2]) for path in kept}:
+        package_dir = os.path.join(vendor_dir, *package.split("/"))
+        for entry in os.scandir(package_dir):
+            if entry.is_file() and entry.name.lower().startswith(LICENSE_PREFIXES):
+                kept.add(f"{package}/{entry.name}")
+    return sorted(kept), render_autoloader(class_paths, autoload_files)
@@ -0,0 +1,41 @@
+"""Bulk SQL for the WordPress tables, shared by generate_assets.py and import_assets.py.
+
+Values are written as MySQL string literals with the escapes mysqldump uses, so the output
+loads with the mysql client and can be read back by analyze_assets.py.
+"""
+
+import re
+
+# Column order of wp_posts, as mysqldump writes it
+POST_COLUMNS = (
+    "ID", "post_author", "post_date", "post_date_gmt", "post_content", "post_title", "post_excerpt", "post_status",
+    "comment_status", "ping_status", "post_password", "post_name", "to_ping", "pinged", "post_modified",
+    "post_modified_gmt", "post_content_filtered", "post_parent", "guid", "menu_order", "post_type",
+    "post_mime_type", "comment_count",
+)
+META_COLUMNS = ("post_id", "meta_key", "meta_value")
+RELATIONSHIP_COLUMNS = ("object_id", "term_taxonomy_id", "term_order")
+HISTORY_COLUMNS = ("asset_id", "user_id", "created_at", "note")
+
+SQL_SPECIAL_RE = re.compile(r"[\\'\n\r\x00\x1a]")
+
+
+def sql_quote(value):
+    """Quotes a value as a MySQL string literal (or a bare number for ints)."""
+    if isinstance(value, int):
+        return str(value)
+    if not SQL_SPECIAL_RE.search(value):
+        return f"'{value}'"
+    value = (value.replace("\\", "\\\\").replace("'", "\\'").replace("\n", "\\n")
+             .replace("\r", "\\r").replace("\x00", "\\0").replace("\x1a", "\\Z"))
+    return f"'{value}'"
+
+
+def sql_inserts(table, columns, rows, batch_rows):
+    """Renders rows as multi-row INSERT statements of at most batch_rows rows each."""
+    statements = []
+    head = f"INSERT INTO `{table}` ({', '.join(f'`{c}`' for c in columns)}) VALUES\n"
+    for start in range(0, len(rows), batch_rows):
+        values = ",\n".join("(" + ",".join(sql_quote(v) for v in row) + ")" for row in rows[start:start + batch_rows])
+        statements.append(head + values + ";\n")
+    return "".join(statements)